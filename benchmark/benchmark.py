@@ -23,10 +23,13 @@
 from enum import Enum, auto, unique
 from typing import Dict, Type
 
-from bip_utils import Bip39SeedGenerator
-from tests import (BenchmarkTestsBase, Ed25519Blake2bTests, Ed25519KholawTests,
-                   Ed25519Tests, MoneroTests, Nist256p1Tests, Secp256k1Tests,
-                   SubstrateTests)
+from bip_utils import Bip39SeedGenerator, Instrumentation
+from tests import (AddrClassifierTests, AddrEncoderTests, AddrToAddressTests,
+                   AlgoAddrTests, BchAddrConvTests, BenchmarkTestsBase,
+                   Ed25519Blake2bTests, Ed25519KholawTests, Ed25519Tests,
+                   EthAddrTests, HashTests, MoneroTests, NanoAddrTests,
+                   Nist256p1Tests, Secp256k1Tests, SubstrateTests,
+                   ThreadsScalingTests, XmrAddrTests)
 
 
 # Test types
@@ -39,6 +42,16 @@ class TestTypes(Enum):
     ED25519_KHOLAW = auto()
     SUBSTRATE = auto()
     MONERO = auto()
+    ADDR_TO_ADDRESS = auto()
+    ADDR_ENCODER = auto()
+    ADDR_CLASSIFIER = auto()
+    ETH_ADDR = auto()
+    XMR_ADDR = auto()
+    NANO_ADDR = auto()
+    ALGO_ADDR = auto()
+    BCH_ADDR_CONV = auto()
+    HASH = auto()
+    THREADS_SCALING = auto()
 
 
 # Tests constants
@@ -52,6 +65,16 @@ class TestsConsts:
         TestTypes.ED25519_KHOLAW: Ed25519KholawTests,
         TestTypes.SUBSTRATE: SubstrateTests,
         TestTypes.MONERO: MoneroTests,
+        TestTypes.ADDR_TO_ADDRESS: AddrToAddressTests,
+        TestTypes.ADDR_ENCODER: AddrEncoderTests,
+        TestTypes.ADDR_CLASSIFIER: AddrClassifierTests,
+        TestTypes.ETH_ADDR: EthAddrTests,
+        TestTypes.XMR_ADDR: XmrAddrTests,
+        TestTypes.NANO_ADDR: NanoAddrTests,
+        TestTypes.ALGO_ADDR: AlgoAddrTests,
+        TestTypes.BCH_ADDR_CONV: BchAddrConvTests,
+        TestTypes.HASH: HashTests,
+        TestTypes.THREADS_SCALING: ThreadsScalingTests,
     }
 
 
@@ -61,6 +84,14 @@ class TestsConf:
     TEST_ITR_NUM: int = 3000
     TEST_CACHE_NUM: int = 50
     TEST_TYPE: TestTypes = TestTypes.SECP256K1
+    INSTRUMENTATION: bool = False
+
+
+# Print the operations breakdown recorded by instrumentation
+def print_operations_breakdown(snapshot: Dict[str, Dict[str, float]]) -> None:
+    print("\nOperations breakdown (times are inclusive of nested operations):")
+    for op_name, stats in sorted(snapshot.items(), key=lambda item: item[1]["time"], reverse=True):
+        print(f"  {op_name}: {stats['count']:.0f} calls, {1000.0 * stats['time']:.0f}ms")
 
 
 # Main function
@@ -71,7 +102,8 @@ def main() -> None:
     print(f"  - Test type: {TestsConf.TEST_TYPE}")
     print(f"  - Number of tests: {TestsConf.TEST_NUM}")
     print(f"  - Number of iterations for each test: {TestsConf.TEST_ITR_NUM}")
-    print(f"  - Number of iterations for caching: {TestsConf.TEST_CACHE_NUM}\n")
+    print(f"  - Number of iterations for caching: {TestsConf.TEST_CACHE_NUM}")
+    print(f"  - Instrumentation: {TestsConf.INSTRUMENTATION}\n")
 
     # Generate a seed
     mnemonic = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon "\
@@ -85,11 +117,18 @@ def main() -> None:
     tests = tests_cls(TestsConf.TEST_NUM,
                       TestsConf.TEST_ITR_NUM,
                       TestsConf.TEST_CACHE_NUM)
-    tests.RunTests(seed_bytes)
+    if TestsConf.INSTRUMENTATION:
+        with Instrumentation.Session() as session:
+            tests.RunTests(seed_bytes)
+    else:
+        tests.RunTests(seed_bytes)
 
     # Print average time
     print("\nBenchmark completed.")
-    print(f"Average time: {tests.GetAverageTime():.0f}ms\n")
+    print(f"Average time: {tests.GetAverageTime():.0f}ms")
+    if TestsConf.INSTRUMENTATION:
+        print_operations_breakdown(session.Snapshot())
+    print("")
 
 
 # Execute main
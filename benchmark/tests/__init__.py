@@ -1,8 +1,17 @@
+from tests.addr_classifier_tests import AddrClassifierTests
+from tests.addr_encoding_tests import AddrEncoderTests, AddrToAddressTests
+from tests.algo_addr_tests import AlgoAddrTests
+from tests.bch_addr_conv_tests import BchAddrConvTests
 from tests.benchmark_tests_base import BenchmarkTestsBase
 from tests.ed25519_blake2b_tests import Ed25519Blake2bTests
 from tests.ed25519_kholaw_tests import Ed25519KholawTests
 from tests.ed25519_tests import Ed25519Tests
+from tests.eth_addr_tests import EthAddrTests
+from tests.hash_tests import HashTests
 from tests.monero_tests import MoneroTests
+from tests.nano_addr_tests import NanoAddrTests
 from tests.nist256p1_tests import Nist256p1Tests
 from tests.secp256k1_tests import Secp256k1Tests
 from tests.substrate_tests import SubstrateTests
+from tests.threads_scaling_tests import ThreadsScalingTests
+from tests.xmr_addr_tests import XmrAddrTests
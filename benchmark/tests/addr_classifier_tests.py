@@ -0,0 +1,59 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import itertools
+from typing import List
+
+from bip_utils import AddrClassifier, Bip44, Bip44AddrEncoder, Bip44Changes, Bip44Coins
+from tests.benchmark_tests_base import BenchmarkTestsBase
+
+
+# Address classifier tests class (AddrClassifier.ValidateMany)
+class AddrClassifierTests(BenchmarkTestsBase):
+
+    m_addr_classifier: AddrClassifier
+    m_addrs: List[str]
+
+    # Run tests
+    def RunTests(self,
+                 seed_bytes: bytes) -> None:
+        # Build the classifier and a mixed corpus (valid and corrupted addresses) before starting the timers
+        self.m_addr_classifier = AddrClassifier()
+        self.m_addrs = []
+        for coin in Bip44Coins:
+            bip44_chg_ctx = Bip44.FromSeed(seed_bytes, coin).Purpose().Coin().Account(0).Change(Bip44Changes.CHAIN_EXT)
+            try:
+                addr_encoder = Bip44AddrEncoder(bip44_chg_ctx.CoinConf())
+            except ValueError:
+                # Cardano Shelley and Monero
+                continue
+            for i in range(self.m_test_cache_num):
+                addr = addr_encoder.Encode(bip44_chg_ctx.AddressIndex(i).PublicKey().Bip32Key())
+                self.m_addrs.append(addr if i % 2 == 0 else addr[:-1])
+
+        super().RunTests(seed_bytes)
+
+    # Run test
+    def _RunTest(self,
+                 seed_bytes: bytes) -> None:
+        addrs_num = len(self.m_addrs) * (self.m_test_itr_num // self.m_test_cache_num)
+        for _ in self.m_addr_classifier.ValidateMany(itertools.islice(itertools.cycle(self.m_addrs), addrs_num)):
+            pass
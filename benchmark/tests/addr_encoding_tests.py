@@ -0,0 +1,73 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+# Imports
+from typing import List, Tuple
+
+from bip_utils import Bip32PublicKey, Bip44, Bip44AddrEncoder, Bip44Changes, Bip44Coins, Bip44PublicKey
+from bip_utils.bip.conf.common import BipCoinConf
+from tests.benchmark_tests_base import BenchmarkTestsBase
+
+
+# Address encoding tests base class
+class AddrEncodingTestsBase(BenchmarkTestsBase):
+
+    m_coins_keys: List[Tuple[BipCoinConf, List[Bip32PublicKey]]]
+
+    # Run tests
+    def RunTests(self,
+                 seed_bytes: bytes) -> None:
+        # Derive the keys of all coins before starting the timers
+        self.m_coins_keys = []
+        for coin in Bip44Coins:
+            bip44_chg_ctx = Bip44.FromSeed(seed_bytes, coin).Purpose().Coin().Account(0).Change(Bip44Changes.CHAIN_EXT)
+            try:
+                Bip44AddrEncoder(bip44_chg_ctx.CoinConf())
+            except ValueError:
+                # Cardano Shelley and Monero
+                continue
+            self.m_coins_keys.append(
+                (bip44_chg_ctx.CoinConf(),
+                 [bip44_chg_ctx.AddressIndex(i).PublicKey().Bip32Key() for i in range(self.m_test_cache_num)])
+            )
+
+        super().RunTests(seed_bytes)
+
+
+# Address encoding tests class (Bip44PublicKey.ToAddress)
+class AddrToAddressTests(AddrEncodingTestsBase):
+    # Run test
+    def _RunTest(self,
+                 seed_bytes: bytes) -> None:
+        for i in range(0, self.m_test_itr_num // self.m_test_cache_num):
+            for coin_conf, pub_keys in self.m_coins_keys:
+                for pub_key in pub_keys:
+                    Bip44PublicKey(pub_key, coin_conf).ToAddress()
+
+
+# Address encoding tests class (Bip44AddrEncoder.EncodeMany)
+class AddrEncoderTests(AddrEncodingTestsBase):
+    # Run test
+    def _RunTest(self,
+                 seed_bytes: bytes) -> None:
+        for i in range(0, self.m_test_itr_num // self.m_test_cache_num):
+            for coin_conf, pub_keys in self.m_coins_keys:
+                Bip44AddrEncoder(coin_conf).EncodeMany(pub_keys)
@@ -0,0 +1,54 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+from typing import List
+
+from bip_utils import BchAddrConverter, Bip44, Bip44Changes, Bip44Coins
+from tests.benchmark_tests_base import BenchmarkTestsBase
+
+
+# Bitcoin Cash address conversion tests class (BchAddrConverter.ConvertMany and BchAddrConverter.ToLegacyMany)
+class BchAddrConvTests(BenchmarkTestsBase):
+
+    m_addrs: List[str]
+
+    # Run tests
+    def RunTests(self,
+                 seed_bytes: bytes) -> None:
+        # Compute the addresses before starting the timers
+        bip44_chg_ctx = (Bip44.FromSeed(seed_bytes, Bip44Coins.BITCOIN_CASH)
+                         .Purpose()
+                         .Coin()
+                         .Account(0)
+                         .Change(Bip44Changes.CHAIN_EXT))
+        self.m_addrs = [
+            bip44_chg_ctx.AddressIndex(i).PublicKey().ToAddress()
+            for i in range(self.m_test_cache_num)
+        ]
+
+        super().RunTests(seed_bytes)
+
+    # Run test
+    def _RunTest(self,
+                 seed_bytes: bytes) -> None:
+        for i in range(0, self.m_test_itr_num // self.m_test_cache_num):
+            legacy_addrs = list(BchAddrConverter.ToLegacyMany(self.m_addrs))
+            list(BchAddrConverter.ConvertMany(self.m_addrs + legacy_addrs, "ecash"))
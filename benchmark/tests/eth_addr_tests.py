@@ -0,0 +1,53 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+from typing import List
+
+from bip_utils import Bip44, Bip44Changes, Bip44Coins, EthAddrDecoder, EthAddrEncoder, Secp256k1PublicKey
+from tests.benchmark_tests_base import BenchmarkTestsBase
+
+
+# Ethereum address tests class (EthAddrEncoder.EncodeKeyMany and EthAddrDecoder.IsValidMany)
+class EthAddrTests(BenchmarkTestsBase):
+
+    m_pub_keys: List[Secp256k1PublicKey]
+
+    # Run tests
+    def RunTests(self,
+                 seed_bytes: bytes) -> None:
+        # Derive the keys before starting the timers
+        bip44_chg_ctx = (Bip44.FromSeed(seed_bytes, Bip44Coins.ETHEREUM)
+                         .Purpose()
+                         .Coin()
+                         .Account(0)
+                         .Change(Bip44Changes.CHAIN_EXT))
+        self.m_pub_keys = [
+            bip44_chg_ctx.AddressIndex(i).PublicKey().Bip32Key().KeyObject()
+            for i in range(self.m_test_cache_num)
+        ]
+
+        super().RunTests(seed_bytes)
+
+    # Run test
+    def _RunTest(self,
+                 seed_bytes: bytes) -> None:
+        for i in range(0, self.m_test_itr_num // self.m_test_cache_num):
+            EthAddrDecoder.IsValidMany(EthAddrEncoder.EncodeKeyMany(self.m_pub_keys))
@@ -0,0 +1,75 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import os
+from typing import Callable, Dict, List
+
+from codetiming import Timer
+
+from bip_utils import (
+    Blake2b256, DoubleSha256, Hash160, HashBackendRegistry, Kekkak256, Ripemd160, Sha3_256, Sha256, Sha512, Sha512_256
+)
+from tests.benchmark_tests_base import BenchmarkTestsBase
+
+
+# Hash tests class (QuickDigestMany of each algorithm for different input sizes)
+class HashTests(BenchmarkTestsBase):
+
+    # Input sizes in bytes
+    INPUT_SIZES: List[int] = [32, 64, 1024]
+    # Algorithms to test
+    ALGOS: Dict[str, Callable[[List[bytes]], List[bytes]]] = {
+        "BLAKE2b-256": Blake2b256.QuickDigestMany,
+        "Double SHA256": DoubleSha256.QuickDigestMany,
+        "HASH160": Hash160.QuickDigestMany,
+        "Keccak-256": Kekkak256.QuickDigestMany,
+        "RIPEMD160": Ripemd160.QuickDigestMany,
+        "SHA256": Sha256.QuickDigestMany,
+        "SHA3-256": Sha3_256.QuickDigestMany,
+        "SHA512": Sha512.QuickDigestMany,
+        "SHA512/256": Sha512_256.QuickDigestMany,
+    }
+
+    m_data: Dict[int, List[bytes]]
+
+    # Run tests
+    def RunTests(self,
+                 seed_bytes: bytes) -> None:
+        # Print the selected backends
+        for algo_name, backend_name in HashBackendRegistry.Backends().items():
+            print(f"Backend for {algo_name}: {backend_name}")
+        print("")
+
+        # Generate the data before starting the timers
+        self.m_data = {
+            input_size: [os.urandom(input_size) for _ in range(self.m_test_itr_num)]
+            for input_size in self.INPUT_SIZES
+        }
+
+        super().RunTests(seed_bytes)
+
+    # Run test
+    def _RunTest(self,
+                 seed_bytes: bytes) -> None:
+        for algo_name, quick_digest_many in self.ALGOS.items():
+            for input_size, data in self.m_data.items():
+                with Timer(text=f"  {algo_name} ({input_size} bytes) - Elapsed time: {{milliseconds:.1f}}ms"):
+                    quick_digest_many(data)
@@ -0,0 +1,90 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+# Imports
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
+
+from bip_utils import Ed25519PrivateKey, Pbkdf2HmacSha512, Scrypt, Secp256k1PrivateKey
+from tests.benchmark_tests_base import BenchmarkTestsBase
+
+
+# Threads scaling tests class (throughput of the operations that release the GIL for different numbers of threads)
+class ThreadsScalingTests(BenchmarkTestsBase):
+
+    # Numbers of threads to test
+    THREADS_NUM: List[int] = [1, 2, 4, 8]
+    # Operations to test: function and divider of the number of iterations (for slow operations)
+    OPERATIONS: Dict[str, Tuple[Callable[[bytes], Any], int]] = {
+        "secp256k1 public key (coincurve)": (
+            lambda data: Secp256k1PrivateKey.FromBytes(data).PublicKey().RawCompressed(), 1
+        ),
+        "ed25519 public key (PyNaCl)": (
+            lambda data: Ed25519PrivateKey.FromBytes(data).PublicKey().RawCompressed(), 1
+        ),
+        "PBKDF2-HMAC-SHA512 2048 rounds (hashlib)": (
+            lambda data: Pbkdf2HmacSha512.DeriveKey(data, b"mnemonic", 2048), 10
+        ),
+        "Scrypt N=16384 r=8 p=1 (pycryptodome)": (
+            lambda data: Scrypt.DeriveKey(data, b"salt", 64, 16384, 8, 1), 300
+        ),
+    }
+
+    m_data: List[bytes]
+
+    # Run tests
+    def RunTests(self,
+                 seed_bytes: bytes) -> None:
+        # Generate the data before starting the timers
+        self.m_data = [os.urandom(32) for _ in range(self.m_test_itr_num)]
+
+        super().RunTests(seed_bytes)
+
+    # Run test
+    def _RunTest(self,
+                 seed_bytes: bytes) -> None:
+        for op_name, (op_fct, itr_div) in self.OPERATIONS.items():
+            data = self.m_data[:max(self.m_test_itr_num // itr_div, 1)]
+
+            base_throughput = 0.0
+            for threads_num in self.THREADS_NUM:
+                throughput = self.__Throughput(op_fct, data, threads_num)
+                base_throughput = base_throughput or throughput
+                print(f"  {op_name} - {threads_num} thread(s): {throughput:.0f} op/s "
+                      f"(speedup: {throughput / base_throughput:.2f}x)")
+
+    # Get the throughput (operations per second) of an operation executed by the specified number of threads
+    @staticmethod
+    def __Throughput(op_fct: Callable[[bytes], Any],
+                     data: List[bytes],
+                     threads_num: int) -> float:
+        # Each thread processes a contiguous part of the data
+        part_len = (len(data) + threads_num - 1) // threads_num
+        parts = [data[i:i + part_len] for i in range(0, len(data), part_len)]
+
+        with ThreadPoolExecutor(max_workers=threads_num) as executor:
+            start_time = time.perf_counter()
+            list(executor.map(lambda part: [op_fct(elem) for elem in part], parts))
+            elapsed_time = time.perf_counter() - start_time
+
+        return len(data) / elapsed_time
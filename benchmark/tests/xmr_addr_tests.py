@@ -0,0 +1,60 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+from typing import List, Tuple
+
+from bip_utils import Monero, MoneroCoins, MoneroConf, XmrAddrCodec
+from tests.benchmark_tests_base import BenchmarkTestsBase
+
+
+# Monero address tests class (XmrAddrCodec batch methods)
+class XmrAddrTests(BenchmarkTestsBase):
+
+    m_pub_keys: Tuple[bytes, bytes]
+    m_subaddrs: List[str]
+    m_payment_ids: List[bytes]
+
+    # Run tests
+    def RunTests(self,
+                 seed_bytes: bytes) -> None:
+        # Compute the subaddresses (index 0 is the primary address) before starting the timers
+        monero_ctx = Monero.FromSeed(seed_bytes, MoneroCoins.MONERO_MAINNET)
+        self.m_pub_keys = (monero_ctx.PublicSpendKey().RawCompressed().ToBytes(),
+                           monero_ctx.PublicViewKey().RawCompressed().ToBytes())
+        self.m_subaddrs = [monero_ctx.Subaddress(i + 1) for i in range(self.m_test_cache_num)]
+        self.m_payment_ids = [i.to_bytes(8, "big") for i in range(self.m_test_cache_num)]
+
+        super().RunTests(seed_bytes)
+
+    # Run test
+    def _RunTest(self,
+                 seed_bytes: bytes) -> None:
+        subaddr_codec = XmrAddrCodec(MoneroConf.MainNet.SubaddrNetVersion())
+        int_addr_codec = XmrAddrCodec(MoneroConf.MainNet.IntegratedAddrNetVersion())
+
+        for i in range(0, self.m_test_itr_num // self.m_test_cache_num):
+            # Subaddresses
+            pub_keys = subaddr_codec.DecodeMany(self.m_subaddrs)
+            subaddr_codec.EncodeMany((pub_key[:32], pub_key[32:]) for pub_key in pub_keys)
+            # Integrated addresses
+            int_addr_codec.DecodeIntegratedMany(
+                int_addr_codec.EncodeIntegratedMany(self.m_pub_keys[0], self.m_pub_keys[1], self.m_payment_ids)
+            )
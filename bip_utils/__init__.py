@@ -5,25 +5,29 @@ from bip_utils._version import __version__
 from bip_utils.addr import (
     AdaByronAddrDecoder, AdaByronAddrTypes, AdaByronIcarusAddr, AdaByronIcarusAddrEncoder, AdaByronLegacyAddr,
     AdaByronLegacyAddrEncoder, AdaShelleyAddr, AdaShelleyAddrDecoder, AdaShelleyAddrEncoder, AdaShelleyAddrNetworkTags,
-    AdaShelleyRewardAddr, AdaShelleyRewardAddrDecoder, AdaShelleyRewardAddrEncoder, AdaShelleyStakingAddr,
-    AdaShelleyStakingAddrDecoder, AdaShelleyStakingAddrEncoder, AlgoAddr, AlgoAddrDecoder, AlgoAddrEncoder, AtomAddr,
-    AtomAddrDecoder, AtomAddrEncoder, AvaxPChainAddr, AvaxPChainAddrDecoder, AvaxPChainAddrEncoder, AvaxXChainAddr,
-    AvaxXChainAddrDecoder, AvaxXChainAddrEncoder, BchAddrConverter, BchP2PKHAddr, BchP2PKHAddrDecoder,
-    BchP2PKHAddrEncoder, BchP2SHAddr, BchP2SHAddrDecoder, BchP2SHAddrEncoder, EgldAddr, EgldAddrDecoder,
-    EgldAddrEncoder, EosAddr, EosAddrDecoder, EosAddrEncoder, ErgoNetworkTypes, ErgoP2PKHAddr, ErgoP2PKHAddrDecoder,
-    ErgoP2PKHAddrEncoder, EthAddr, EthAddrDecoder, EthAddrEncoder, FilSecp256k1Addr, FilSecp256k1AddrDecoder,
-    FilSecp256k1AddrEncoder, IcxAddr, IcxAddrDecoder, IcxAddrEncoder, NanoAddr, NanoAddrDecoder, NanoAddrEncoder,
-    NearAddr, NearAddrDecoder, NearAddrEncoder, NeoAddr, NeoAddrDecoder, NeoAddrEncoder, OkexAddr, OkexAddrDecoder,
-    OkexAddrEncoder, OneAddr, OneAddrDecoder, OneAddrEncoder, P2PKHAddr, P2PKHAddrDecoder, P2PKHAddrEncoder,
-    P2PKHPubKeyModes, P2SHAddr, P2SHAddrDecoder, P2SHAddrEncoder, P2TRAddr, P2TRAddrDecoder, P2TRAddrEncoder,
-    P2WPKHAddr, P2WPKHAddrDecoder, P2WPKHAddrEncoder, SolAddr, SolAddrDecoder, SolAddrEncoder, SubstrateEd25519Addr,
-    SubstrateEd25519AddrDecoder, SubstrateEd25519AddrEncoder, SubstrateSr25519Addr, SubstrateSr25519AddrDecoder,
-    SubstrateSr25519AddrEncoder, TrxAddr, TrxAddrDecoder, TrxAddrEncoder, XlmAddr, XlmAddrDecoder, XlmAddrEncoder,
-    XlmAddrTypes, XmrAddr, XmrAddrDecoder, XmrAddrEncoder, XmrIntegratedAddr, XmrIntegratedAddrDecoder,
-    XmrIntegratedAddrEncoder, XrpAddr, XrpAddrDecoder, XrpAddrEncoder, XtzAddr, XtzAddrDecoder, XtzAddrEncoder,
-    XtzAddrPrefixes, ZilAddr, ZilAddrDecoder, ZilAddrEncoder
+    AdaShelleyEnterpriseAddrDecoder, AdaShelleyEnterpriseAddrEncoder, AdaShelleyRewardAddr, AdaShelleyRewardAddrDecoder,
+    AdaShelleyRewardAddrEncoder, AdaShelleyStakingAddr, AdaShelleyStakingAddrDecoder, AdaShelleyStakingAddrEncoder,
+    AlgoAddr, AlgoAddrDecoder, AlgoAddrEncoder, AtomAddr, AtomAddrDecoder, AtomAddrEncoder, AvaxPChainAddr,
+    AvaxPChainAddrDecoder, AvaxPChainAddrEncoder, AvaxXChainAddr, AvaxXChainAddrDecoder, AvaxXChainAddrEncoder,
+    BchAddrConverter, BchAddrConverterResult, BchP2PKHAddr, BchP2PKHAddrDecoder, BchP2PKHAddrEncoder, BchP2SHAddr,
+    BchP2SHAddrDecoder, BchP2SHAddrEncoder, EgldAddr, EgldAddrDecoder, EgldAddrEncoder, EosAddr, EosAddrDecoder,
+    EosAddrEncoder, ErgoNetworkTypes, ErgoP2PKHAddr, ErgoP2PKHAddrDecoder, ErgoP2PKHAddrEncoder, EthAddr,
+    EthAddrDecoder, EthAddrEncoder, FilSecp256k1Addr, FilSecp256k1AddrDecoder, FilSecp256k1AddrEncoder, IcxAddr,
+    IcxAddrDecoder, IcxAddrEncoder, NanoAddr, NanoAddrDecoder, NanoAddrEncoder, NearAddr, NearAddrDecoder,
+    NearAddrEncoder, NeoAddr, NeoAddrDecoder, NeoAddrEncoder, OkexAddr, OkexAddrDecoder, OkexAddrEncoder, OneAddr,
+    OneAddrDecoder, OneAddrEncoder, P2PKHAddr, P2PKHAddrDecoder, P2PKHAddrEncoder, P2PKHPubKeyModes, P2SHAddr,
+    P2SHAddrDecoder, P2SHAddrEncoder, P2TRAddr, P2TRAddrDecoder, P2TRAddrEncoder, P2WPKHAddr, P2WPKHAddrDecoder,
+    P2WPKHAddrEncoder, SolAddr, SolAddrDecoder, SolAddrEncoder, SubstrateEd25519Addr, SubstrateEd25519AddrDecoder,
+    SubstrateEd25519AddrEncoder, SubstrateSr25519Addr, SubstrateSr25519AddrDecoder, SubstrateSr25519AddrEncoder,
+    TrxAddr, TrxAddrDecoder, TrxAddrEncoder, XlmAddr, XlmAddrDecoder, XlmAddrEncoder, XlmAddrTypes, XmrAddr,
+    XmrAddrCodec, XmrAddrDecoder, XmrAddrEncoder, XmrIntegratedAddr, XmrIntegratedAddrDecoder, XmrIntegratedAddrEncoder,
+    XrpAddr, XrpAddrDecoder, XrpAddrEncoder, XtzAddr, XtzAddrDecoder, XtzAddrEncoder, XtzAddrPrefixes, ZilAddr,
+    ZilAddrDecoder, ZilAddrEncoder
 )
 
+# Address classification
+from bip_utils.addr_classifier import AddrClassifier, AddrClassifierResult
+
 # Algorand mnemonic
 from bip_utils.algorand.mnemonic import (
     AlgorandEntropyBitLen, AlgorandEntropyGenerator, AlgorandLanguages, AlgorandMnemonic, AlgorandMnemonicDecoder,
@@ -52,17 +56,24 @@ from bip_utils.bip.bip32 import (
 )
 
 # BIP38
-from bip_utils.bip.bip38 import Bip38Decrypter, Bip38EcKeysGenerator, Bip38Encrypter, Bip38PubKeyModes
+from bip_utils.bip.bip38 import (
+    Bip38Decrypter, Bip38EcKeysGenerator, Bip38Encrypter, Bip38MaskCandidates, Bip38MutationCandidates,
+    Bip38MutationRules, Bip38PassphraseRecovery, Bip38PubKeyModes, Bip38RecoveryResult, Bip38WordlistCandidates,
+    IBip38CandidatesGenerator
+)
 
 # BIP39
 from bip_utils.bip.bip39 import (
     Bip39EntropyBitLen, Bip39EntropyGenerator, Bip39Languages, Bip39Mnemonic, Bip39MnemonicDecoder,
-    Bip39MnemonicEncoder, Bip39MnemonicGenerator, Bip39MnemonicValidator, Bip39SeedGenerator, Bip39WordsNum
+    Bip39MnemonicEncoder, Bip39MnemonicGenerator, Bip39MnemonicRecovery, Bip39MnemonicValidator, Bip39SeedGenerator,
+    Bip39WordsNum
 )
 from bip_utils.bip.bip44 import Bip44
 
 # BIP44/49/84
-from bip_utils.bip.bip44_base import Bip44Changes, Bip44DepthError, Bip44Levels, Bip44PrivateKey, Bip44PublicKey
+from bip_utils.bip.bip44_base import (
+    Bip44AddrEncoder, Bip44Changes, Bip44DepthError, Bip44KeysBatch, Bip44Levels, Bip44PrivateKey, Bip44PublicKey
+)
 from bip_utils.bip.bip49 import Bip49
 from bip_utils.bip.bip84 import Bip84
 from bip_utils.bip.bip86 import Bip86
@@ -75,11 +86,14 @@ from bip_utils.bip.conf.bip86 import Bip86Coins, Bip86Conf, Bip86ConfGetter
 
 # Cardano
 from bip_utils.cardano.bip32 import CardanoByronLegacyBip32, CardanoIcarusBip32
-from bip_utils.cardano.byron import CardanoByronLegacy
+from bip_utils.cardano.byron import CardanoByronLegacy, CardanoByronLegacyScanner
 from bip_utils.cardano.cip1852 import Cip1852
 from bip_utils.cardano.cip1852.conf import Cip1852Coins, Cip1852Conf, Cip1852ConfGetter
 from bip_utils.cardano.mnemonic import CardanoByronLegacySeedGenerator, CardanoIcarusSeedGenerator
-from bip_utils.cardano.shelley import CardanoShelley, CardanoShelleyPrivateKeys, CardanoShelleyPublicKeys
+from bip_utils.cardano.shelley import (
+    CardanoShelley, CardanoShelleyAddrGenerator, CardanoShelleyAddrs, CardanoShelleyPrivateKeys,
+    CardanoShelleyPublicKeys
+)
 
 # Generic coins configuration
 from bip_utils.coin_conf import CoinsConf
@@ -105,8 +119,8 @@ from bip_utils.electrum.mnemonic_v1 import (
 )
 from bip_utils.electrum.mnemonic_v2 import (
     ElectrumV2EntropyBitLen, ElectrumV2EntropyGenerator, ElectrumV2Languages, ElectrumV2Mnemonic,
-    ElectrumV2MnemonicDecoder, ElectrumV2MnemonicEncoder, ElectrumV2MnemonicGenerator, ElectrumV2MnemonicTypes,
-    ElectrumV2MnemonicValidator, ElectrumV2SeedGenerator, ElectrumV2WordsNum
+    ElectrumV2MnemonicDecoder, ElectrumV2MnemonicEncoder, ElectrumV2MnemonicGenerator, ElectrumV2MnemonicRecovery,
+    ElectrumV2MnemonicTypes, ElectrumV2MnemonicValidator, ElectrumV2SeedGenerator, ElectrumV2WordsNum
 )
 
 # Monero
@@ -118,8 +132,8 @@ from bip_utils.monero.conf import MoneroCoins, MoneroConf
 # Monero mnemonic
 from bip_utils.monero.mnemonic import (
     MoneroEntropyBitLen, MoneroEntropyGenerator, MoneroLanguages, MoneroMnemonic, MoneroMnemonicDecoder,
-    MoneroMnemonicEncoder, MoneroMnemonicGenerator, MoneroMnemonicNoChecksumEncoder, MoneroMnemonicValidator,
-    MoneroMnemonicWithChecksumEncoder, MoneroSeedGenerator, MoneroWordsNum
+    MoneroMnemonicEncoder, MoneroMnemonicGenerator, MoneroMnemonicNoChecksumEncoder, MoneroMnemonicRecovery,
+    MoneroMnemonicValidator, MoneroMnemonicWithChecksumEncoder, MoneroSeedGenerator, MoneroWordsNum
 )
 
 # SLIP32
@@ -131,12 +145,12 @@ from bip_utils.slip.slip32 import (
 from bip_utils.solana import SplToken
 
 # SS58
-from bip_utils.ss58 import SS58ChecksumError, SS58Decoder, SS58Encoder
+from bip_utils.ss58 import SS58ChecksumError, SS58Codec, SS58Decoder, SS58Encoder
 
 # Substrate
 from bip_utils.substrate import (
-    Substrate, SubstrateKeyError, SubstratePath, SubstratePathElem, SubstratePathError, SubstratePathParser,
-    SubstratePrivateKey, SubstratePublicKey
+    Substrate, SubstrateAddrConverter, SubstrateKeyError, SubstratePath, SubstratePathElem, SubstratePathError,
+    SubstratePathParser, SubstratePrivateKey, SubstratePublicKey
 )
 
 # Substrate configuration
@@ -154,11 +168,13 @@ from bip_utils.substrate.scale import (
 # Utils
 from bip_utils.utils.crypto import (
     AesEcbDecrypter, AesEcbEncrypter, Blake2b, Blake2b160, Blake2b224, Blake2b256, ChaCha20Poly1305, Crc32,
-    DoubleSha256, Hash160, HmacSha256, HmacSha512, Kekkak256, Pbkdf2HmacSha512, Ripemd160, Scrypt, Sha3_256, Sha256,
-    Sha512, Sha512_256, XModemCrc
+    DoubleSha256, Hash160, HashBackendConst, HashBackendRegistry, HmacSha256, HmacSha512, Kekkak256, Pbkdf2HmacSha512,
+    Ripemd160, Scrypt, Sha3_256, Sha256, Sha512, Sha512_256, XModemCrc
+)
+from bip_utils.utils.misc import (
+    AlgoUtils, BitUtils, BytesUtils, DataBytes, Instrumentation, InstrumentationSession, IntegerUtils, StringUtils
 )
-from bip_utils.utils.misc import AlgoUtils, BitUtils, BytesUtils, DataBytes, IntegerUtils, StringUtils
-from bip_utils.utils.mnemonic import MnemonicChecksumError
+from bip_utils.utils.mnemonic import MnemonicChecksumError, MnemonicRecoveryResult
 
 # WIF
 from bip_utils.wif import WifDecoder, WifEncoder, WifPubKeyModes
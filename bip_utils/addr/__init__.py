@@ -3,9 +3,9 @@ from bip_utils.addr.ada_byron_addr import (
     AdaByronLegacyAddrEncoder
 )
 from bip_utils.addr.ada_shelley_addr import (
-    AdaShelleyAddr, AdaShelleyAddrDecoder, AdaShelleyAddrEncoder, AdaShelleyAddrNetworkTags, AdaShelleyRewardAddr,
-    AdaShelleyRewardAddrDecoder, AdaShelleyRewardAddrEncoder, AdaShelleyStakingAddr, AdaShelleyStakingAddrDecoder,
-    AdaShelleyStakingAddrEncoder
+    AdaShelleyAddr, AdaShelleyAddrDecoder, AdaShelleyAddrEncoder, AdaShelleyAddrNetworkTags,
+    AdaShelleyEnterpriseAddrDecoder, AdaShelleyEnterpriseAddrEncoder, AdaShelleyRewardAddr, AdaShelleyRewardAddrDecoder,
+    AdaShelleyRewardAddrEncoder, AdaShelleyStakingAddr, AdaShelleyStakingAddrDecoder, AdaShelleyStakingAddrEncoder
 )
 from bip_utils.addr.algo_addr import AlgoAddr, AlgoAddrDecoder, AlgoAddrEncoder
 from bip_utils.addr.atom_addr import AtomAddr, AtomAddrDecoder, AtomAddrEncoder
@@ -13,7 +13,7 @@ from bip_utils.addr.avax_addr import (
     AvaxPChainAddr, AvaxPChainAddrDecoder, AvaxPChainAddrEncoder, AvaxXChainAddr, AvaxXChainAddrDecoder,
     AvaxXChainAddrEncoder
 )
-from bip_utils.addr.bch_addr_converter import BchAddrConverter
+from bip_utils.addr.bch_addr_converter import BchAddrConverter, BchAddrConverterResult
 from bip_utils.addr.egld_addr import EgldAddr, EgldAddrDecoder, EgldAddrEncoder
 from bip_utils.addr.eos_addr import EosAddr, EosAddrDecoder, EosAddrEncoder
 from bip_utils.addr.ergo_addr import ErgoNetworkTypes, ErgoP2PKHAddr, ErgoP2PKHAddrDecoder, ErgoP2PKHAddrEncoder
@@ -43,7 +43,8 @@ from bip_utils.addr.substrate_addr import (
 from bip_utils.addr.trx_addr import TrxAddr, TrxAddrDecoder, TrxAddrEncoder
 from bip_utils.addr.xlm_addr import XlmAddr, XlmAddrDecoder, XlmAddrEncoder, XlmAddrTypes
 from bip_utils.addr.xmr_addr import (
-    XmrAddr, XmrAddrDecoder, XmrAddrEncoder, XmrIntegratedAddr, XmrIntegratedAddrDecoder, XmrIntegratedAddrEncoder
+    XmrAddr, XmrAddrCodec, XmrAddrDecoder, XmrAddrEncoder, XmrIntegratedAddr, XmrIntegratedAddrDecoder,
+    XmrIntegratedAddrEncoder
 )
 from bip_utils.addr.xrp_addr import XrpAddr, XrpAddrDecoder, XrpAddrEncoder
 from bip_utils.addr.xtz_addr import XtzAddr, XtzAddrDecoder, XtzAddrEncoder, XtzAddrPrefixes
@@ -218,8 +218,12 @@ class _AdaByronAddrPayload(NamedTuple):
         Raises:
             ValueError: If the serialization is not valid
         """
-        addr_payload = cbor2.loads(ser_payload_bytes)
-        if (len(addr_payload) != 3
+        try:
+            addr_payload = cbor2.loads(ser_payload_bytes)
+        except cbor2.CBORError as ex:
+            raise ValueError("Invalid address payload encoding") from ex
+        if (not isinstance(addr_payload, list)
+                or len(addr_payload) != 3
                 or not isinstance(addr_payload[0], bytes)
                 or not isinstance(addr_payload[1], dict)
                 or not isinstance(addr_payload[2], int)):
@@ -294,8 +298,12 @@ class _AdaByronAddr(NamedTuple):
         Raises:
             ValueError: If the serialization is not valid
         """
-        addr_bytes = cbor2.loads(ser_addr_bytes)
-        if (len(addr_bytes) != 2
+        try:
+            addr_bytes = cbor2.loads(ser_addr_bytes)
+        except cbor2.CBORError as ex:
+            raise ValueError("Invalid address encoding") from ex
+        if (not isinstance(addr_bytes, list)
+                or len(addr_bytes) != 2
                 or not isinstance(addr_bytes[0], cbor2.CBORTag)
                 or not isinstance(addr_bytes[1], int)):
             raise ValueError("Invalid address encoding")
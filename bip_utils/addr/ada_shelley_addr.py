@@ -51,6 +51,7 @@ class AdaShelleyAddrHeaderTypes(IntEnum):
     """Enumerative for Cardano Shelley header types."""
 
     PAYMENT = 0x00
+    ENTERPRISE = 0x06
     REWARD = 0x0E
 
 
@@ -192,6 +193,93 @@ class AdaShelleyAddrEncoder(IAddrEncoder):
                                     prefix_byte + pub_key_hash + pub_skey_hash)
 
 
+class AdaShelleyEnterpriseAddrDecoder(IAddrDecoder):
+    """
+    Cardano Shelley enterprise address decoder class.
+    It allows the Cardano Shelley enterprise address decoding (i.e. addresses without staking rights).
+    """
+
+    @staticmethod
+    def DecodeAddr(addr: str,
+                   **kwargs: Any) -> bytes:
+        """
+        Decode a Cardano Shelley enterprise address to bytes.
+
+        Args:
+            addr (str): Address string
+            **kwargs  : Not used
+
+        Other Parameters:
+            net_tag (AdaShelleyAddrNetworkTags): Expected network tag (default: main net)
+
+        Returns:
+            bytes: Public key hash bytes
+
+        Raises:
+            ValueError: If the address encoding is not valid
+            TypeError: If the network tag is not a AdaShelleyAddrNetworkTags enum
+        """
+        net_tag = kwargs.get("net_tag", AdaShelleyAddrNetworkTags.MAINNET)
+        if not isinstance(net_tag, AdaShelleyAddrNetworkTags):
+            raise TypeError("Address type is not an enumerative of AdaShelleyAddrNetworkTags")
+
+        # Decode bech32
+        try:
+            addr_dec_bytes = Bech32Decoder.Decode(AdaShelleyAddrConst.NETWORK_TAG_TO_ADDR_HRP[net_tag],
+                                                  addr)
+        except Bech32ChecksumError as ex:
+            raise ValueError("Invalid bech32 checksum") from ex
+        else:
+            AddrDecUtils.ValidateLength(addr_dec_bytes,
+                                        Blake2b224.DigestSize() + 1)
+            # Validate and remove prefix
+            prefix_byte = _AdaShelleyAddrUtils.EncodePrefix(AdaShelleyAddrHeaderTypes.ENTERPRISE,
+                                                            net_tag)
+            return AddrDecUtils.ValidateAndRemovePrefix(addr_dec_bytes, prefix_byte)
+
+
+class AdaShelleyEnterpriseAddrEncoder(IAddrEncoder):
+    """
+    Cardano Shelley enterprise address encoder class.
+    It allows the Cardano Shelley enterprise address encoding (i.e. addresses without staking rights).
+    """
+
+    @staticmethod
+    def EncodeKey(pub_key: Union[bytes, IPublicKey],
+                  **kwargs: Any) -> str:
+        """
+        Encode a public key to Cardano Shelley enterprise address.
+
+        Args:
+            pub_key (bytes or IPublicKey): Public key bytes or object
+
+        Other Parameters:
+            net_tag (AdaShelleyAddrNetworkTags): Network tag (default: main net)
+
+        Returns:
+            str: Address string
+
+        Raises:
+            ValueError: If the public key is not valid
+            TypeError: If the public key is not ed25519 or the network tag is not a AdaShelleyAddrNetworkTags enum
+        """
+        net_tag = kwargs.get("net_tag", AdaShelleyAddrNetworkTags.MAINNET)
+        if not isinstance(net_tag, AdaShelleyAddrNetworkTags):
+            raise TypeError("Address type is not an enumerative of AdaShelleyAddrNetworkTags")
+
+        pub_key_obj = AddrKeyValidator.ValidateAndGetEd25519Key(pub_key)
+
+        # Compute key hash
+        pub_key_hash = _AdaShelleyAddrUtils.KeyHash(pub_key_obj.RawCompressed().ToBytes()[1:])
+        # Get prefix byte
+        prefix_byte = _AdaShelleyAddrUtils.EncodePrefix(AdaShelleyAddrHeaderTypes.ENTERPRISE,
+                                                        net_tag)
+
+        # Encode to bech32
+        return Bech32Encoder.Encode(AdaShelleyAddrConst.NETWORK_TAG_TO_ADDR_HRP[net_tag],
+                                    prefix_byte + pub_key_hash)
+
+
 class AdaShelleyStakingAddrDecoder(IAddrDecoder):
     """
     Cardano Shelley staking address decoder class.
@@ -21,7 +21,7 @@
 """Module for Algorand address encoding/decoding."""
 
 # Imports
-from typing import Any, Union
+from typing import Any, Iterable, List, Union
 
 from bip_utils.addr.addr_dec_utils import AddrDecUtils
 from bip_utils.addr.addr_key_validator import AddrKeyValidator
@@ -55,22 +55,13 @@ class _AlgoAddrUtils:
         """
         return Sha512_256.QuickDigest(pub_key_bytes)[-1 * AlgoAddrConst.CHECKSUM_BYTE_LEN:]
 
-
-class AlgoAddrDecoder(IAddrDecoder):
-    """
-    Algorand address decoder class.
-    It allows the Algorand address decoding.
-    """
-
     @staticmethod
-    def DecodeAddr(addr: str,
-                   **kwargs: Any) -> bytes:
+    def AddressToBytes(addr: str) -> bytes:
         """
-        Decode an Algorand address to bytes.
+        Decode an Algorand address to public key bytes.
 
         Args:
             addr (str): Address string
-            **kwargs  : Not used
 
         Returns:
             bytes: Public key bytes
@@ -95,6 +86,94 @@ class AlgoAddrDecoder(IAddrDecoder):
 
         return pub_key_bytes
 
+    @staticmethod
+    def KeyToAddress(pub_key: Union[bytes, IPublicKey]) -> str:
+        """
+        Encode a public key to Algorand address.
+
+        Args:
+            pub_key (bytes or IPublicKey): Public key bytes or object
+
+        Returns:
+            str: Address string
+
+        Raises:
+            ValueError: If the public key is not valid
+            TypeError: If the public key is not ed25519
+        """
+        pub_key_obj = AddrKeyValidator.ValidateAndGetEd25519Key(pub_key)
+        pub_key_bytes = pub_key_obj.RawCompressed().ToBytes()[1:]
+
+        # Compute checksum
+        checksum_bytes = _AlgoAddrUtils.ComputeChecksum(pub_key_bytes)
+        # Encode to base32
+        return Base32Encoder.EncodeNoPadding(pub_key_bytes + checksum_bytes)
+
+
+class AlgoAddrDecoder(IAddrDecoder):
+    """
+    Algorand address decoder class.
+    It allows the Algorand address decoding.
+    """
+
+    @staticmethod
+    def DecodeAddr(addr: str,
+                   **kwargs: Any) -> bytes:
+        """
+        Decode an Algorand address to bytes.
+
+        Args:
+            addr (str): Address string
+            **kwargs  : Not used
+
+        Returns:
+            bytes: Public key bytes
+
+        Raises:
+            ValueError: If the address encoding is not valid
+        """
+        return _AlgoAddrUtils.AddressToBytes(addr)
+
+    @staticmethod
+    def DecodeAddrMany(addrs: Iterable[str],
+                       **kwargs: Any) -> List[bytes]:
+        """
+        Decode many Algorand addresses to bytes.
+
+        Args:
+            addrs (Iterable[str]): Address strings
+            **kwargs             : Not used
+
+        Returns:
+            list[bytes]: Public keys bytes, in the same order of the addresses
+
+        Raises:
+            ValueError: If the encoding of one of the addresses is not valid
+        """
+        return [_AlgoAddrUtils.AddressToBytes(addr) for addr in addrs]
+
+    @staticmethod
+    def IsValidMany(addrs: Iterable[str],
+                    **kwargs: Any) -> List[bool]:
+        """
+        Get if many Algorand addresses are valid.
+
+        Args:
+            addrs (Iterable[str]): Address strings
+            **kwargs             : Not used
+
+        Returns:
+            list[bool]: True if the address is valid, false otherwise, in the same order of the addresses
+        """
+        results = []
+        for addr in addrs:
+            try:
+                _AlgoAddrUtils.AddressToBytes(addr)
+                results.append(True)
+            except ValueError:
+                results.append(False)
+        return results
+
 
 class AlgoAddrEncoder(IAddrEncoder):
     """
@@ -119,13 +198,26 @@ class AlgoAddrEncoder(IAddrEncoder):
             ValueError: If the public key is not valid
             TypeError: If the public key is not ed25519
         """
-        pub_key_obj = AddrKeyValidator.ValidateAndGetEd25519Key(pub_key)
-        pub_key_bytes = pub_key_obj.RawCompressed().ToBytes()[1:]
+        return _AlgoAddrUtils.KeyToAddress(pub_key)
 
-        # Compute checksum
-        checksum_bytes = _AlgoAddrUtils.ComputeChecksum(pub_key_bytes)
-        # Encode to base32
-        return Base32Encoder.EncodeNoPadding(pub_key_bytes + checksum_bytes)
+    @staticmethod
+    def EncodeKeyMany(pub_keys: Iterable[Union[bytes, IPublicKey]],
+                      **kwargs: Any) -> List[str]:
+        """
+        Encode many public keys to Algorand addresses.
+
+        Args:
+            pub_keys (Iterable): Public keys bytes or objects
+            **kwargs           : Not used
+
+        Returns:
+            list[str]: Address strings, in the same order of the public keys
+
+        Raises:
+            ValueError: If one of the public keys is not valid
+            TypeError: If one of the public keys is not ed25519
+        """
+        return [_AlgoAddrUtils.KeyToAddress(pub_key) for pub_key in pub_keys]
 
 
 # Deprecated: only for compatibility, Encoder class shall be used instead
@@ -21,15 +21,227 @@
 """Module for converting Bitcoin Cash addresses."""
 
 # Imports
-from typing import Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
-from bip_utils.bech32 import BchBech32Decoder, BchBech32Encoder
+from bip_utils.base58 import Base58ChecksumError, Base58Decoder, Base58Encoder
+from bip_utils.bech32 import BchBech32Decoder, BchBech32Encoder, Bech32ChecksumError
+from bip_utils.coin_conf import CoinConf, CoinsConf
+from bip_utils.utils.misc import ParallelUtils
+
+
+class BchAddrConverterConst:
+    """Class container for Bitcoin Cash address converter constants."""
+
+    # Separator between HRP and data in Bitcoin Cash addresses
+    SEPARATOR: str = ":"
+    # Legacy address data length in bytes (i.e. net version and hash160)
+    LEGACY_BYTE_LEN: int = 21
+    # Default number of addresses converted by a worker at once
+    DEF_CHUNK_SIZE: int = 1024
+
+    # Coins using Bitcoin Cash addresses, used for mapping net versions between formats
+    COIN_CONFS: Tuple[CoinConf, ...] = (
+        CoinsConf.BitcoinCashMainNet,
+        CoinsConf.BitcoinCashTestNet,
+        CoinsConf.BitcoinCashSlpMainNet,
+        CoinsConf.BitcoinCashSlpTestNet,
+        CoinsConf.EcashMainNet,
+        CoinsConf.EcashTestNet,
+    )
+    # Bitcoin Cash net versions, indexed by legacy net version
+    LEGACY_TO_BCH_NET_VER: Dict[bytes, bytes] = {
+        coin_conf.ParamByKey(f"{addr_type}_legacy_net_ver"): coin_conf.ParamByKey(f"{addr_type}_std_net_ver")
+        for coin_conf in COIN_CONFS for addr_type in ("p2pkh", "p2sh")
+    }
+    # Legacy net versions, indexed by Bitcoin Cash HRP and net version
+    BCH_TO_LEGACY_NET_VER: Dict[Tuple[str, bytes], bytes] = {
+        (coin_conf.ParamByKey(f"{addr_type}_std_hrp"), coin_conf.ParamByKey(f"{addr_type}_std_net_ver")):
+            coin_conf.ParamByKey(f"{addr_type}_legacy_net_ver")
+        for coin_conf in COIN_CONFS for addr_type in ("p2pkh", "p2sh")
+    }
+
+
+class BchAddrConverterResult(NamedTuple):
+    """Bitcoin Cash address conversion result."""
+
+    address: str
+    converted_address: Optional[str]
+    error: Optional[str]
+
+
+class _BchAddrConverterUtils:
+    """Class container for Bitcoin Cash address converter utility functions."""
+
+    @staticmethod
+    def DecodeLegacy(address: str) -> Tuple[bytes, bytes]:
+        """
+        Decode a legacy address.
+
+        Args:
+            address (str): Legacy address
+
+        Returns:
+            tuple[bytes, bytes]: Net version (index 0) and data (index 1)
+
+        Raises:
+            Base58ChecksumError: If the address checksum is not valid
+            ValueError: If the address string is not valid
+        """
+        addr_bytes = Base58Decoder.CheckDecode(address)
+        if len(addr_bytes) != BchAddrConverterConst.LEGACY_BYTE_LEN:
+            raise ValueError(f"Invalid legacy address length ({len(addr_bytes)})")
+        return addr_bytes[:1], addr_bytes[1:]
+
+    @staticmethod
+    def ToBch(address: str,
+              hrp: str,
+              net_ver: Optional[bytes]) -> str:
+        """
+        Convert a Bitcoin Cash or legacy address to a Bitcoin Cash address.
+
+        Args:
+            address (str)            : Bitcoin Cash or legacy address
+            hrp (str)                : New HRP
+            net_ver (bytes, optional): New net version (if None, the one of the address type will be used)
+
+        Returns:
+            str: Converted address string
+
+        Raises:
+            Base58ChecksumError: If the legacy address checksum is not valid
+            Bech32ChecksumError: If the Bitcoin Cash address checksum is not valid
+            ValueError: If the address string is not valid
+        """
+        sep_pos = address.find(BchAddrConverterConst.SEPARATOR)
+        if sep_pos != -1:
+            curr_net_ver, data = BchBech32Decoder.Decode(address[:sep_pos], address)
+        else:
+            legacy_net_ver, data = _BchAddrConverterUtils.DecodeLegacy(address)
+            curr_net_ver = net_ver or _BchAddrConverterUtils.GetNetVer(BchAddrConverterConst.LEGACY_TO_BCH_NET_VER,
+                                                                       legacy_net_ver)
+
+        return BchBech32Encoder.Encode(hrp, net_ver or curr_net_ver, data)
+
+    @staticmethod
+    def ToLegacy(address: str,
+                 net_ver: Optional[bytes]) -> str:
+        """
+        Convert a Bitcoin Cash or legacy address to a legacy address.
+
+        Args:
+            address (str)            : Bitcoin Cash or legacy address
+            net_ver (bytes, optional): New net version (if None, the one of the address type will be used)
+
+        Returns:
+            str: Converted address string
+
+        Raises:
+            Base58ChecksumError: If the legacy address checksum is not valid
+            Bech32ChecksumError: If the Bitcoin Cash address checksum is not valid
+            ValueError: If the address string is not valid
+        """
+        sep_pos = address.find(BchAddrConverterConst.SEPARATOR)
+        if sep_pos != -1:
+            hrp = address[:sep_pos]
+            curr_net_ver, data = BchBech32Decoder.Decode(hrp, address)
+            if len(data) != BchAddrConverterConst.LEGACY_BYTE_LEN - 1:
+                raise ValueError(f"Address data cannot be converted to legacy format (length {len(data)})")
+            curr_net_ver = net_ver or _BchAddrConverterUtils.GetNetVer(BchAddrConverterConst.BCH_TO_LEGACY_NET_VER,
+                                                                       (hrp, curr_net_ver))
+        else:
+            curr_net_ver, data = _BchAddrConverterUtils.DecodeLegacy(address)
+            # Just check that the address type is known
+            if net_ver is None:
+                _BchAddrConverterUtils.GetNetVer(BchAddrConverterConst.LEGACY_TO_BCH_NET_VER, curr_net_ver)
+
+        return Base58Encoder.CheckEncode((net_ver or curr_net_ver) + data)
+
+    @staticmethod
+    def GetNetVer(net_vers: Dict[Any, bytes],
+                  key: Any) -> bytes:
+        """
+        Get a net version from a mapping.
+
+        Args:
+            net_vers (dict): Net versions mapping
+            key (any)      : Key
+
+        Returns:
+            bytes: Net version
+
+        Raises:
+            ValueError: If the key is not present in the mapping
+        """
+        try:
+            return net_vers[key]
+        except KeyError as ex:
+            raise ValueError("Unknown address type, the net version shall be specified") from ex
+
+    @staticmethod
+    def ToBchChunk(hrp: str,
+                   net_ver: Optional[bytes],
+                   addresses: List[str]) -> List[BchAddrConverterResult]:
+        """
+        Convert a chunk of addresses to Bitcoin Cash addresses.
+
+        Args:
+            hrp (str)                : New HRP
+            net_ver (bytes, optional): New net version
+            addresses (list[str])    : Addresses
+
+        Returns:
+            list[BchAddrConverterResult]: Conversion results
+        """
+        return _BchAddrConverterUtils.ConvertChunk(_BchAddrConverterUtils.ToBch, addresses, hrp, net_ver)
+
+    @staticmethod
+    def ToLegacyChunk(net_ver: Optional[bytes],
+                      addresses: List[str]) -> List[BchAddrConverterResult]:
+        """
+        Convert a chunk of addresses to legacy addresses.
+
+        Args:
+            net_ver (bytes, optional): New net version
+            addresses (list[str])    : Addresses
+
+        Returns:
+            list[BchAddrConverterResult]: Conversion results
+        """
+        return _BchAddrConverterUtils.ConvertChunk(_BchAddrConverterUtils.ToLegacy, addresses, net_ver)
+
+    @staticmethod
+    def ConvertChunk(conv_fct: Callable[..., str],
+                     addresses: List[str],
+                     *args: Any) -> List[BchAddrConverterResult]:
+        """
+        Convert a chunk of addresses, reporting the error of the ones that cannot be converted.
+        Blank addresses (e.g. the trailing newline of a file) are skipped.
+
+        Args:
+            conv_fct (function)  : Conversion function, i.e. conv_fct(address, *args)
+            addresses (list[str]): Addresses
+            *args                : Arguments passed to the conversion function after the address
+
+        Returns:
+            list[BchAddrConverterResult]: Conversion results
+        """
+        results = []
+        for address in addresses:
+            address = address.strip()
+            if not address:
+                continue
+            try:
+                results.append(BchAddrConverterResult(address, conv_fct(address, *args), None))
+            except (Base58ChecksumError, Bech32ChecksumError, ValueError) as ex:
+                results.append(BchAddrConverterResult(address, None, str(ex)))
+        return results
 
 
 class BchAddrConverter:
     """
     Bitcoin Cash address converter class.
-    It allows to convert a Bitcoin Cash address by changing its HRP and net version.
+    It allows to convert a Bitcoin Cash address by changing its HRP and net version, and to convert addresses
+    from/to the legacy format.
     """
 
     @staticmethod
@@ -38,9 +250,11 @@ class BchAddrConverter:
                 net_ver: Optional[bytes] = None) -> str:
         """
         Convert a Bitcoin Cash address by changing its HRP and net version.
+        Legacy addresses are also accepted, in this case the net version is got from the legacy one if not
+        specified.
 
         Args:
-            address (str)            : Bitcoin Cash address
+            address (str)            : Bitcoin Cash or legacy address
             hrp (str)                : New HRP
             net_ver (bytes, optional): New net version (if None, the old one will be used)
 
@@ -48,11 +262,108 @@ class BchAddrConverter:
             str: Converted address string
 
         Raises:
+            Base58ChecksumError: If the legacy address checksum is not valid
             Bech32ChecksumError: If the address checksum is not valid
             ValueError: If the address string is not valid
         """
+        return _BchAddrConverterUtils.ToBch(address, hrp, net_ver)
 
-        # Decode address
-        curr_net_ver, data = BchBech32Decoder.Decode(address[:address.find(":")], address)
-        # Encode again with new HRP and net version
-        return BchBech32Encoder.Encode(hrp, net_ver or curr_net_ver, data)
+    @staticmethod
+    def ConvertMany(addresses: Iterable[str],
+                    hrp: str,
+                    net_ver: Optional[bytes] = None,
+                    workers: Optional[int] = 1,
+                    chunk_size: int = BchAddrConverterConst.DEF_CHUNK_SIZE) -> Iterator[BchAddrConverterResult]:
+        """
+        Convert many Bitcoin Cash or legacy addresses by changing their HRP and net version.
+        Addresses are read and converted lazily, in the same order. Leading and trailing whitespaces are ignored
+        and blank addresses are skipped, so the lines of a file can be passed directly.
+        An address that cannot be converted does not stop the conversion, its result reports the error instead.
+
+        Args:
+            addresses (iterable[str]) : Bitcoin Cash or legacy addresses
+            hrp (str)                 : New HRP
+            net_ver (bytes, optional) : New net version (if None, the old one will be used)
+            workers (int, optional)   : Number of worker processes (default: 1, i.e. in the current process),
+                                        None for CPU count
+            chunk_size (int, optional): Number of addresses converted by a worker at once
+
+        Returns:
+            Iterator[BchAddrConverterResult]: Iterator of conversion results
+
+        Raises:
+            ValueError: If the parameters are not valid
+        """
+        workers = ParallelUtils.WorkersNum(workers)
+        chunks = ParallelUtils.Chunks(addresses, chunk_size)
+        return BchAddrConverter.__ConvertChunks(chunks, workers, _BchAddrConverterUtils.ToBchChunk, hrp, net_ver)
+
+    @staticmethod
+    def ToLegacy(address: str,
+                 net_ver: Optional[bytes] = None) -> str:
+        """
+        Convert a Bitcoin Cash address to legacy format.
+        If the net version is not specified, it is got from the address HRP and type for the known coins
+        (Bitcoin Cash, Bitcoin Cash SLP and eCash). Legacy addresses are also accepted.
+
+        Args:
+            address (str)            : Bitcoin Cash or legacy address
+            net_ver (bytes, optional): Legacy net version (if None, the one of the address type will be used)
+
+        Returns:
+            str: Converted address string
+
+        Raises:
+            Base58ChecksumError: If the legacy address checksum is not valid
+            Bech32ChecksumError: If the address checksum is not valid
+            ValueError: If the address string is not valid or the net version cannot be determined
+        """
+        return _BchAddrConverterUtils.ToLegacy(address, net_ver)
+
+    @staticmethod
+    def ToLegacyMany(addresses: Iterable[str],
+                     net_ver: Optional[bytes] = None,
+                     workers: Optional[int] = 1,
+                     chunk_size: int = BchAddrConverterConst.DEF_CHUNK_SIZE) -> Iterator[BchAddrConverterResult]:
+        """
+        Convert many Bitcoin Cash addresses to legacy format.
+        Addresses are read and converted lazily, in the same order. Leading and trailing whitespaces are ignored
+        and blank addresses are skipped, so the lines of a file can be passed directly.
+        An address that cannot be converted does not stop the conversion, its result reports the error instead.
+
+        Args:
+            addresses (iterable[str]) : Bitcoin Cash or legacy addresses
+            net_ver (bytes, optional) : Legacy net version (if None, the one of the address type will be used)
+            workers (int, optional)   : Number of worker processes (default: 1, i.e. in the current process),
+                                        None for CPU count
+            chunk_size (int, optional): Number of addresses converted by a worker at once
+
+        Returns:
+            Iterator[BchAddrConverterResult]: Iterator of conversion results
+
+        Raises:
+            ValueError: If the parameters are not valid
+        """
+        workers = ParallelUtils.WorkersNum(workers)
+        chunks = ParallelUtils.Chunks(addresses, chunk_size)
+        return BchAddrConverter.__ConvertChunks(chunks, workers, _BchAddrConverterUtils.ToLegacyChunk, net_ver)
+
+    @staticmethod
+    def __ConvertChunks(chunks: Iterator[List[str]],
+                        workers: int,
+                        conv_fct: Callable[..., List[BchAddrConverterResult]],
+                        *args: Any) -> Iterator[BchAddrConverterResult]:
+        """
+        Convert chunks of addresses.
+
+        Args:
+            chunks (Iterator[list[str]]): Chunks of addresses
+            workers (int)               : Number of worker processes
+            conv_fct (function)         : Conversion function of a chunk
+            *args                       : Arguments passed to the conversion function before the chunk
+
+        Returns:
+            Iterator[BchAddrConverterResult]: Iterator of conversion results
+        """
+        for _, results in ParallelUtils.MapChunks(conv_fct, chunks, workers, *args):
+            yield from results
@@ -21,7 +21,8 @@
 """Module for Ethereum address encoding/decoding."""
 
 # Imports
-from typing import Any, Union
+import binascii
+from typing import Any, Iterable, List, Tuple, Union
 
 from bip_utils.addr.addr_dec_utils import AddrDecUtils
 from bip_utils.addr.addr_key_validator import AddrKeyValidator
@@ -40,6 +41,13 @@ class EthAddrConst:
     START_BYTE: int = 24
     # Address length
     ADDR_LEN: int = 40
+    # Case masks for checksum encoding, indexed by digest byte (0x20 for each nibble greater than or equal to 8)
+    CHKSUM_CASE_MASKS: Tuple[bytes, ...] = tuple(
+        bytes([0x20 if (b >> 4) >= 8 else 0x00, 0x20 if (b & 0x0F) >= 8 else 0x00])
+        for b in range(256)
+    )
+    # Mask of the bit set only in the letters of lowercase hex characters (0x40), for all the address characters
+    CHKSUM_LETTERS_MASK: int = int.from_bytes(b"\x40" * ADDR_LEN, "big")
 
 
 class _EthAddrUtils:
@@ -51,18 +59,86 @@ class _EthAddrUtils:
         Checksum encode the specified address.
 
         Args:
-            addr (str): Address string
+            addr (str): Address string (hex characters, without prefix)
 
         Returns:
             str: Checksum encoded address
         """
+        return _EthAddrUtils.ChecksumEncodeBytes(addr.lower().encode())
+
+    @staticmethod
+    def ChecksumEncodeBytes(addr_low: bytes) -> str:
+        """
+        Checksum encode the specified address.
+        The case of all characters is set at once: letters are uppercased by clearing their 0x20 bit where the
+        corresponding digest nibble is greater than or equal to 8 (digits are left untouched).
+
+        Args:
+            addr_low (bytes): Address bytes (lowercase hex characters, without prefix)
 
-        # Compute address digest
-        addr_hex_digest = BytesUtils.ToHexString(Kekkak256.QuickDigest(addr.lower()))
-        # Encode it
-        enc_addr = [c.upper() if (int(addr_hex_digest[i], 16) >= 8) else c.lower() for i, c in enumerate(addr)]
+        Returns:
+            str: Checksum encoded address
+        """
 
-        return "".join(enc_addr)
+        # Compute address digest and get the case mask of each character
+        addr_digest = Kekkak256.QuickDigest(addr_low)
+        case_mask = int.from_bytes(
+            b"".join(map(EthAddrConst.CHKSUM_CASE_MASKS.__getitem__, addr_digest[:EthAddrConst.ADDR_LEN // 2])),
+            "big"
+        )
+        # Apply it to letters only
+        addr_int = int.from_bytes(addr_low, "big")
+        addr_int ^= case_mask & ((addr_int & EthAddrConst.CHKSUM_LETTERS_MASK) >> 1)
+
+        return addr_int.to_bytes(EthAddrConst.ADDR_LEN, "big").decode()
+
+    @staticmethod
+    def AddressToBytes(addr: str,
+                       skip_chksum_enc: bool) -> bytes:
+        """
+        Decode an address to bytes.
+
+        Args:
+            addr (str)            : Address string
+            skip_chksum_enc (bool): True to skip checksum encoding verification, false otherwise
+
+        Returns:
+            bytes: Public key hash bytes
+
+        Raises:
+            ValueError: If the address encoding is not valid
+        """
+
+        # Validate and remove prefix
+        addr_no_prefix = AddrDecUtils.ValidateAndRemovePrefix(addr,
+                                                              CoinsConf.Ethereum.ParamByKey("addr_prefix"))
+        # Validate length
+        AddrDecUtils.ValidateLength(addr_no_prefix, EthAddrConst.ADDR_LEN)
+        # Decode it (this also validates the characters)
+        addr_bytes = BytesUtils.FromHexString(addr_no_prefix)
+        # Check checksum encoding
+        if not skip_chksum_enc and addr_no_prefix != _EthAddrUtils.ChecksumEncode(addr_no_prefix):
+            raise ValueError("Invalid checksum encode")
+
+        return addr_bytes
+
+    @staticmethod
+    def KeyToAddress(pub_key_bytes: bytes,
+                     skip_chksum_enc: bool) -> str:
+        """
+        Compute the address (without prefix) of the specified public key.
+
+        Args:
+            pub_key_bytes (bytes) : Uncompressed public key bytes, without the first byte (i.e. 0x04)
+            skip_chksum_enc (bool): True to skip checksum encoding, false otherwise
+
+        Returns:
+            str: Address string
+        """
+        addr_low = binascii.hexlify(Kekkak256.QuickDigest(pub_key_bytes)[EthAddrConst.START_BYTE // 2:])
+        return (_EthAddrUtils.ChecksumEncodeBytes(addr_low)
+                if not skip_chksum_enc
+                else addr_low.decode())
 
 
 class EthAddrDecoder(IAddrDecoder):
@@ -89,18 +165,54 @@ class EthAddrDecoder(IAddrDecoder):
         Raises:
             ValueError: If the address encoding is not valid
         """
+        return _EthAddrUtils.AddressToBytes(addr, kwargs.get("skip_chksum_enc", False))
+
+    @staticmethod
+    def DecodeAddrMany(addrs: Iterable[str],
+                       **kwargs: Any) -> List[bytes]:
+        """
+        Decode many Ethereum addresses to bytes.
+
+        Args:
+            addrs (Iterable[str]): Address strings
+
+        Other Parameters:
+            skip_chksum_enc (bool, optional): True to skip checksum encoding verification, false otherwise (default)
+
+        Returns:
+            list[bytes]: Public key hash bytes, in the same order of the addresses
+
+        Raises:
+            ValueError: If the encoding of one of the addresses is not valid
+        """
         skip_chksum_enc = kwargs.get("skip_chksum_enc", False)
+        return [_EthAddrUtils.AddressToBytes(addr, skip_chksum_enc) for addr in addrs]
 
-        # Validate and remove prefix
-        addr_no_prefix = AddrDecUtils.ValidateAndRemovePrefix(addr,
-                                                              CoinsConf.Ethereum.ParamByKey("addr_prefix"))
-        # Validate length
-        AddrDecUtils.ValidateLength(addr_no_prefix, EthAddrConst.ADDR_LEN)
-        # Check checksum encoding
-        if not skip_chksum_enc and addr_no_prefix != _EthAddrUtils.ChecksumEncode(addr_no_prefix):
-            raise ValueError("Invalid checksum encode")
+    @staticmethod
+    def IsValidMany(addrs: Iterable[str],
+                    **kwargs: Any) -> List[bool]:
+        """
+        Get if many Ethereum addresses are valid.
 
-        return BytesUtils.FromHexString(addr_no_prefix)
+        Args:
+            addrs (Iterable[str]): Address strings
+
+        Other Parameters:
+            skip_chksum_enc (bool, optional): True to skip checksum encoding verification, false otherwise (default)
+
+        Returns:
+            list[bool]: True if the address is valid, false otherwise, in the same order of the addresses
+        """
+        skip_chksum_enc = kwargs.get("skip_chksum_enc", False)
+
+        results = []
+        for addr in addrs:
+            try:
+                _EthAddrUtils.AddressToBytes(addr, skip_chksum_enc)
+                results.append(True)
+            except ValueError:
+                results.append(False)
+        return results
 
 
 class EthAddrEncoder(IAddrEncoder):
@@ -128,16 +240,43 @@ class EthAddrEncoder(IAddrEncoder):
             ValueError: If the public key is not valid
             TypeError: If the public key is not secp256k1
         """
-        skip_chksum_enc = kwargs.get("skip_chksum_enc", False)
-
         pub_key_obj = AddrKeyValidator.ValidateAndGetSecp256k1Key(pub_key)
 
         # First byte of the uncompressed key (i.e. 0x04) is not needed
-        kekkak_hex = BytesUtils.ToHexString(Kekkak256.QuickDigest(pub_key_obj.RawUncompressed().ToBytes()[1:]))
-        addr = kekkak_hex[EthAddrConst.START_BYTE:]
-        return CoinsConf.Ethereum.ParamByKey("addr_prefix") + (_EthAddrUtils.ChecksumEncode(addr)
-                                                               if not skip_chksum_enc
-                                                               else addr)
+        return CoinsConf.Ethereum.ParamByKey("addr_prefix") + _EthAddrUtils.KeyToAddress(
+            pub_key_obj.RawUncompressed().ToBytes()[1:],
+            kwargs.get("skip_chksum_enc", False)
+        )
+
+    @staticmethod
+    def EncodeKeyMany(pub_keys: Iterable[Union[bytes, IPublicKey]],
+                      **kwargs: Any) -> List[str]:
+        """
+        Encode many public keys to Ethereum addresses.
+
+        Args:
+            pub_keys (Iterable): Public keys bytes or objects
+
+        Other Parameters:
+            skip_chksum_enc (bool, optional): True to skip checksum encoding, false otherwise (default)
+
+        Returns:
+            list[str]: Address strings, in the same order of the public keys
+
+        Raised:
+            ValueError: If one of the public keys is not valid
+            TypeError: If one of the public keys is not secp256k1
+        """
+        skip_chksum_enc = kwargs.get("skip_chksum_enc", False)
+        addr_prefix = CoinsConf.Ethereum.ParamByKey("addr_prefix")
+
+        return [
+            addr_prefix + _EthAddrUtils.KeyToAddress(
+                AddrKeyValidator.ValidateAndGetSecp256k1Key(pub_key).RawUncompressed().ToBytes()[1:],
+                skip_chksum_enc
+            )
+            for pub_key in pub_keys
+        ]
 
 
 # Deprecated: only for compatibility, Encoder class shall be used instead
@@ -87,6 +87,8 @@ class _FilAddrUtils:
 
         # Validate and remove prefix
         addr_no_prefix = AddrDecUtils.ValidateAndRemovePrefix(addr, CoinsConf.Filecoin.ParamByKey("addr_prefix"))
+        if len(addr_no_prefix) == 0:
+            raise ValueError("Invalid address length (no address type)")
         # Check address type
         addr_type_got = ord(addr_no_prefix[0]) - ord("0")
         if addr_type != addr_type_got:
@@ -21,7 +21,7 @@
 """Module for Nano address encoding/decoding."""
 
 # Imports
-from typing import Any, Union
+from typing import Any, Iterable, List, Union
 
 from bip_utils.addr.addr_dec_utils import AddrDecUtils
 from bip_utils.addr.addr_key_validator import AddrKeyValidator
@@ -60,22 +60,15 @@ class _NanoAddrUtils:
         """
         return BytesUtils.Reverse(Blake2b40.QuickDigest(pub_key_bytes))
 
-
-class NanoAddrDecoder(IAddrDecoder):
-    """
-    Nano address decoder class.
-    It allows the Nano address decoding.
-    """
-
     @staticmethod
-    def DecodeAddr(addr: str,
-                   **kwargs: Any) -> bytes:
+    def AddressToBytes(addr: str,
+                       addr_prefix: str) -> bytes:
         """
-        Decode a Nano address to bytes.
+        Decode a Nano address to public key bytes.
 
         Args:
-            addr (str): Address string
-            **kwargs  : Not used
+            addr (str)       : Address string
+            addr_prefix (str): Address prefix
 
         Returns:
             bytes: Public key bytes
@@ -85,8 +78,7 @@ class NanoAddrDecoder(IAddrDecoder):
         """
 
         # Validate and remove prefix
-        addr_no_prefix = AddrDecUtils.ValidateAndRemovePrefix(addr,
-                                                              CoinsConf.Nano.ParamByKey("addr_prefix"))
+        addr_no_prefix = AddrDecUtils.ValidateAndRemovePrefix(addr, addr_prefix)
         # Decode from base32
         addr_dec_bytes = Base32Decoder.Decode(NanoAddrConst.PAYLOAD_PAD_ENC + addr_no_prefix,
                                               NanoAddrConst.BASE32_ALPHABET)
@@ -107,6 +99,103 @@ class NanoAddrDecoder(IAddrDecoder):
 
         return pub_key_bytes
 
+    @staticmethod
+    def KeyToAddress(pub_key: Union[bytes, IPublicKey],
+                     addr_prefix: str) -> str:
+        """
+        Encode a public key to Nano address.
+
+        Args:
+            pub_key (bytes or IPublicKey): Public key bytes or object
+            addr_prefix (str)            : Address prefix
+
+        Returns:
+            str: Address string
+
+        Raises:
+            ValueError: If the public key is not valid
+            TypeError: If the public key is not ed25519-blake2b
+        """
+        pub_key_obj = AddrKeyValidator.ValidateAndGetEd25519Blake2bKey(pub_key)
+        pub_key_bytes = pub_key_obj.RawCompressed().ToBytes()[1:]
+
+        # Compute checksum
+        checksum_bytes = _NanoAddrUtils.ComputeChecksum(pub_key_bytes)
+        # Encode to base32 (the padded payload is a multiple of 5 bytes, so no padding characters are needed)
+        payload_bytes = NanoAddrConst.PAYLOAD_PAD_DEC + pub_key_bytes + checksum_bytes
+        b32_enc = Base32Encoder.EncodeNoPadding(payload_bytes, NanoAddrConst.BASE32_ALPHABET)
+
+        # Add prefix
+        return addr_prefix + b32_enc[len(NanoAddrConst.PAYLOAD_PAD_ENC):]
+
+
+class NanoAddrDecoder(IAddrDecoder):
+    """
+    Nano address decoder class.
+    It allows the Nano address decoding.
+    """
+
+    @staticmethod
+    def DecodeAddr(addr: str,
+                   **kwargs: Any) -> bytes:
+        """
+        Decode a Nano address to bytes.
+
+        Args:
+            addr (str): Address string
+            **kwargs  : Not used
+
+        Returns:
+            bytes: Public key bytes
+
+        Raises:
+            ValueError: If the address encoding is not valid
+        """
+        return _NanoAddrUtils.AddressToBytes(addr, CoinsConf.Nano.ParamByKey("addr_prefix"))
+
+    @staticmethod
+    def DecodeAddrMany(addrs: Iterable[str],
+                       **kwargs: Any) -> List[bytes]:
+        """
+        Decode many Nano addresses to bytes.
+
+        Args:
+            addrs (Iterable[str]): Address strings
+            **kwargs             : Not used
+
+        Returns:
+            list[bytes]: Public keys bytes, in the same order of the addresses
+
+        Raises:
+            ValueError: If the encoding of one of the addresses is not valid
+        """
+        addr_prefix = CoinsConf.Nano.ParamByKey("addr_prefix")
+        return [_NanoAddrUtils.AddressToBytes(addr, addr_prefix) for addr in addrs]
+
+    @staticmethod
+    def IsValidMany(addrs: Iterable[str],
+                    **kwargs: Any) -> List[bool]:
+        """
+        Get if many Nano addresses are valid.
+
+        Args:
+            addrs (Iterable[str]): Address strings
+            **kwargs             : Not used
+
+        Returns:
+            list[bool]: True if the address is valid, false otherwise, in the same order of the addresses
+        """
+        addr_prefix = CoinsConf.Nano.ParamByKey("addr_prefix")
+
+        results = []
+        for addr in addrs:
+            try:
+                _NanoAddrUtils.AddressToBytes(addr, addr_prefix)
+                results.append(True)
+            except ValueError:
+                results.append(False)
+        return results
+
 
 class NanoAddrEncoder(IAddrEncoder):
     """
@@ -131,17 +220,27 @@ class NanoAddrEncoder(IAddrEncoder):
             ValueError: If the public key is not valid
             TypeError: If the public key is not ed25519-blake2b
         """
-        pub_key_obj = AddrKeyValidator.ValidateAndGetEd25519Blake2bKey(pub_key)
-        pub_key_bytes = pub_key_obj.RawCompressed().ToBytes()[1:]
+        return _NanoAddrUtils.KeyToAddress(pub_key, CoinsConf.Nano.ParamByKey("addr_prefix"))
 
-        # Compute checksum
-        checksum_bytes = _NanoAddrUtils.ComputeChecksum(pub_key_bytes)
-        # Encode to base32
-        payload_bytes = NanoAddrConst.PAYLOAD_PAD_DEC + pub_key_bytes + checksum_bytes
-        b32_enc = Base32Encoder.EncodeNoPadding(payload_bytes, NanoAddrConst.BASE32_ALPHABET)
+    @staticmethod
+    def EncodeKeyMany(pub_keys: Iterable[Union[bytes, IPublicKey]],
+                      **kwargs: Any) -> List[str]:
+        """
+        Encode many public keys to Nano addresses.
 
-        # Add prefix
-        return CoinsConf.Nano.ParamByKey("addr_prefix") + b32_enc[len(NanoAddrConst.PAYLOAD_PAD_ENC):]
+        Args:
+            pub_keys (Iterable): Public keys bytes or objects
+            **kwargs           : Not used
+
+        Returns:
+            list[str]: Address strings, in the same order of the public keys
+
+        Raises:
+            ValueError: If one of the public keys is not valid
+            TypeError: If one of the public keys is not ed25519-blake2b
+        """
+        addr_prefix = CoinsConf.Nano.ParamByKey("addr_prefix")
+        return [_NanoAddrUtils.KeyToAddress(pub_key, addr_prefix) for pub_key in pub_keys]
 
 
 # Deprecated: only for compatibility, Encoder class shall be used instead
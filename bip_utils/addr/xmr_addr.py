@@ -21,7 +21,7 @@
 """Module for Monero address encoding/decoding."""
 
 # Imports
-from typing import Any, Optional, Union
+from typing import Any, Iterable, List, Optional, Tuple, Union
 
 from bip_utils.addr.addr_dec_utils import AddrDecUtils
 from bip_utils.addr.addr_key_validator import AddrKeyValidator
@@ -77,15 +77,7 @@ class _XmrAddrUtils:
             ValueError: If the address encoding is not valid
         """
 
-        # Decode from base58 XMR
-        addr_dec_bytes = Base58XmrDecoder.Decode(addr)
-        # Validate, remove prefix and split
-        payload_bytes, checksum_bytes = AddrDecUtils.SplitPartsByChecksum(addr_dec_bytes,
-                                                                          XmrAddrConst.CHECKSUM_BYTE_LEN)
-        # Validate checksum
-        AddrDecUtils.ValidateChecksum(payload_bytes, checksum_bytes, _XmrAddrUtils.ComputeChecksum)
-        # Validate and remove prefix
-        payload_bytes = AddrDecUtils.ValidateAndRemovePrefix(payload_bytes, net_ver_bytes)
+        payload_bytes = _XmrAddrUtils.DecodePayload(addr, net_ver_bytes)
 
         try:
             # Validate length without payment ID
@@ -106,6 +98,50 @@ class _XmrAddrUtils:
                 raise ValueError(f"Invalid payment ID (expected {BytesUtils.ToHexString(payment_id_bytes)}, "
                                  f"got {BytesUtils.ToHexString(payment_id_got_bytes)})") from ex
 
+        return _XmrAddrUtils.ValidatePubKeys(payload_bytes)
+
+    @staticmethod
+    def DecodePayload(addr: str,
+                      net_ver_bytes: bytes) -> bytes:
+        """
+        Decode a Monero address and get its payload, i.e. the public keys and the payment ID (if any).
+
+        Args:
+            addr (str)           : Address string
+            net_ver_bytes (bytes): Net version
+
+        Returns:
+            bytes: Payload bytes without net version
+
+        Raises:
+            ValueError: If the address encoding is not valid
+        """
+
+        # Decode from base58 XMR
+        addr_dec_bytes = Base58XmrDecoder.Decode(addr)
+        # Validate, remove prefix and split
+        payload_bytes, checksum_bytes = AddrDecUtils.SplitPartsByChecksum(addr_dec_bytes,
+                                                                          XmrAddrConst.CHECKSUM_BYTE_LEN)
+        # Validate checksum
+        AddrDecUtils.ValidateChecksum(payload_bytes, checksum_bytes, _XmrAddrUtils.ComputeChecksum)
+        # Validate and remove prefix
+        return AddrDecUtils.ValidateAndRemovePrefix(payload_bytes, net_ver_bytes)
+
+    @staticmethod
+    def ValidatePubKeys(payload_bytes: bytes) -> bytes:
+        """
+        Validate the public keys at the beginning of the payload.
+
+        Args:
+            payload_bytes (bytes): Payload bytes without net version
+
+        Returns:
+            bytes: Public spend (first) and view (second) keys joined together
+
+        Raises:
+            ValueError: If the public keys are not valid
+        """
+
         # Validate public spend key
         pub_spend_key_bytes = payload_bytes[:Ed25519MoneroPublicKey.CompressedLength()]
         AddrDecUtils.ValidatePubKey(pub_spend_key_bytes, Ed25519MoneroPublicKey)
@@ -144,11 +180,22 @@ class _XmrAddrUtils:
         pub_spend_key_obj = AddrKeyValidator.ValidateAndGetEd25519MoneroKey(pub_skey)
         pub_view_key_obj = AddrKeyValidator.ValidateAndGetEd25519MoneroKey(pub_vkey)
 
-        payload_bytes = (net_ver_bytes
-                         + pub_spend_key_obj.RawCompressed().ToBytes()
-                         + pub_view_key_obj.RawCompressed().ToBytes()
-                         + payment_id_bytes)
+        return _XmrAddrUtils.EncodePayload(net_ver_bytes
+                                           + pub_spend_key_obj.RawCompressed().ToBytes()
+                                           + pub_view_key_obj.RawCompressed().ToBytes()
+                                           + payment_id_bytes)
+
+    @staticmethod
+    def EncodePayload(payload_bytes: bytes) -> str:
+        """
+        Encode a payload to Monero address by adding its checksum.
 
+        Args:
+            payload_bytes (bytes): Payload bytes, including net version
+
+        Returns:
+            str: Address string
+        """
         return Base58XmrEncoder.Encode(payload_bytes + _XmrAddrUtils.ComputeChecksum(payload_bytes))
 
 
@@ -277,6 +324,177 @@ class XmrIntegratedAddrEncoder(IAddrEncoder):
         return _XmrAddrUtils.EncodeKey(pub_key, pub_vkey, net_ver, payment_id)
 
 
+class XmrAddrCodec:
+    """
+    Monero address codec class.
+    It encodes and decodes many Monero addresses of the same net version, i.e. standard addresses, subaddresses or
+    integrated addresses depending on the net version.
+    """
+
+    m_net_ver: bytes
+
+    def __init__(self,
+                 net_ver: bytes) -> None:
+        """
+        Construct class.
+
+        Args:
+            net_ver (bytes): Net version
+        """
+        self.m_net_ver = net_ver
+
+    def NetVersion(self) -> bytes:
+        """
+        Get the net version.
+
+        Returns:
+            bytes: Net version
+        """
+        return self.m_net_ver
+
+    def Encode(self,
+               pub_skey: Union[bytes, IPublicKey],
+               pub_vkey: Union[bytes, IPublicKey],
+               payment_id: Optional[bytes] = None) -> str:
+        """
+        Encode public keys to Monero address.
+
+        Args:
+            pub_skey (bytes or IPublicKey): Public spend key bytes or object
+            pub_vkey (bytes or IPublicKey): Public view key bytes or object
+            payment_id (bytes, optional)  : Payment ID (only for integrated addresses)
+
+        Returns:
+            str: Address string
+
+        Raises:
+            ValueError: If the public keys or the payment ID are not valid
+            TypeError: If the public keys are not ed25519-monero
+        """
+        return _XmrAddrUtils.EncodeKey(pub_skey, pub_vkey, self.m_net_ver, payment_id)
+
+    def EncodeMany(self,
+                   pub_keys: Iterable[Tuple[Union[bytes, IPublicKey], Union[bytes, IPublicKey]]]) -> List[str]:
+        """
+        Encode many public keys to Monero addresses (e.g. subaddresses).
+
+        Args:
+            pub_keys (iterable[tuple]): Public spend (first) and view (second) keys bytes or objects
+
+        Returns:
+            list[str]: Address strings
+
+        Raises:
+            ValueError: If the public keys are not valid
+            TypeError: If the public keys are not ed25519-monero
+        """
+        return [self.Encode(pub_skey, pub_vkey) for pub_skey, pub_vkey in pub_keys]
+
+    def EncodeIntegratedMany(self,
+                             pub_skey: Union[bytes, IPublicKey],
+                             pub_vkey: Union[bytes, IPublicKey],
+                             payment_ids: Iterable[bytes]) -> List[str]:
+        """
+        Encode public keys to many Monero integrated addresses, one for each payment ID.
+        Public keys are validated only once.
+
+        Args:
+            pub_skey (bytes or IPublicKey): Public spend key bytes or object
+            pub_vkey (bytes or IPublicKey): Public view key bytes or object
+            payment_ids (iterable[bytes]) : Payment IDs
+
+        Returns:
+            list[str]: Address strings
+
+        Raises:
+            ValueError: If the public keys or a payment ID are not valid
+            TypeError: If the public keys are not ed25519-monero
+        """
+        payload_bytes = (self.m_net_ver
+                         + AddrKeyValidator.ValidateAndGetEd25519MoneroKey(pub_skey).RawCompressed().ToBytes()
+                         + AddrKeyValidator.ValidateAndGetEd25519MoneroKey(pub_vkey).RawCompressed().ToBytes())
+
+        addrs = []
+        for payment_id in payment_ids:
+            if len(payment_id) != XmrAddrConst.PAYMENT_ID_BYTE_LEN:
+                raise ValueError("Invalid payment ID length")
+            addrs.append(_XmrAddrUtils.EncodePayload(payload_bytes + payment_id))
+        return addrs
+
+    def Decode(self,
+               addr: str,
+               payment_id: Optional[bytes] = None) -> bytes:
+        """
+        Decode a Monero address to bytes.
+
+        Args:
+            addr (str)                  : Address string
+            payment_id (bytes, optional): Expected payment ID (only for integrated addresses)
+
+        Returns:
+            bytes: Public spend (first) and view (second) keys joined together
+
+        Raises:
+            ValueError: If the address encoding is not valid
+        """
+        return _XmrAddrUtils.DecodeAddr(addr, self.m_net_ver, payment_id)
+
+    def DecodeMany(self,
+                   addrs: Iterable[str]) -> List[bytes]:
+        """
+        Decode many Monero addresses (e.g. subaddresses) to bytes.
+
+        Args:
+            addrs (iterable[str]): Address strings
+
+        Returns:
+            list[bytes]: Public spend (first) and view (second) keys joined together, for each address
+
+        Raises:
+            ValueError: If an address encoding is not valid
+        """
+        return [self.Decode(addr) for addr in addrs]
+
+    def DecodeIntegrated(self,
+                         addr: str) -> Tuple[bytes, bytes]:
+        """
+        Decode a Monero integrated address to bytes, getting also its payment ID.
+
+        Args:
+            addr (str): Address string
+
+        Returns:
+            tuple[bytes, bytes]: Public spend and view keys joined together (index 0), payment ID (index 1)
+
+        Raises:
+            ValueError: If the address encoding is not valid
+        """
+        payload_bytes = _XmrAddrUtils.DecodePayload(addr, self.m_net_ver)
+        AddrDecUtils.ValidateLength(
+            payload_bytes,
+            (Ed25519MoneroPublicKey.CompressedLength() * 2) + XmrAddrConst.PAYMENT_ID_BYTE_LEN
+        )
+        return (_XmrAddrUtils.ValidatePubKeys(payload_bytes),
+                payload_bytes[-XmrAddrConst.PAYMENT_ID_BYTE_LEN:])
+
+    def DecodeIntegratedMany(self,
+                             addrs: Iterable[str]) -> List[Tuple[bytes, bytes]]:
+        """
+        Decode many Monero integrated addresses to bytes, getting also their payment IDs.
+
+        Args:
+            addrs (iterable[str]): Address strings
+
+        Returns:
+            list[tuple[bytes, bytes]]: Public spend and view keys joined together (index 0), payment ID (index 1),
+                                       for each address
+
+        Raises:
+            ValueError: If an address encoding is not valid
+        """
+        return [self.DecodeIntegrated(addr) for addr in addrs]
+
+
 # Deprecated: only for compatibility, Encoder classes shall be used instead
 XmrAddr = XmrAddrEncoder
 XmrIntegratedAddr = XmrIntegratedAddrEncoder
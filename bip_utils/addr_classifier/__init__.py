@@ -0,0 +1 @@
+from bip_utils.addr_classifier.addr_classifier import AddrClassifier, AddrClassifierConst, AddrClassifierResult
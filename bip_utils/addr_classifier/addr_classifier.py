@@ -0,0 +1,675 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Module for classifying and validating addresses of any supported coin.
+An index over the coins configurations is built once, so that each address is only passed to the decoders that can
+accept it (e.g. by HRP, prefix or net version) and each decoder is called once for all the coins sharing it.
+"""
+
+# Imports
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Type
+
+from bip_utils.addr import (
+    AdaByronAddrDecoder, AdaByronIcarusAddrEncoder, AdaShelleyAddrDecoder, AdaShelleyAddrEncoder, AlgoAddrDecoder,
+    AlgoAddrEncoder, AtomAddrDecoder, AtomAddrEncoder, AvaxPChainAddrDecoder, AvaxPChainAddrEncoder,
+    AvaxXChainAddrDecoder, AvaxXChainAddrEncoder, BchP2PKHAddrDecoder, BchP2PKHAddrEncoder, BchP2SHAddrDecoder,
+    BchP2SHAddrEncoder, EgldAddrDecoder, EgldAddrEncoder, EosAddrDecoder, EosAddrEncoder, ErgoP2PKHAddrDecoder,
+    ErgoP2PKHAddrEncoder, EthAddrDecoder, EthAddrEncoder, FilSecp256k1AddrDecoder, FilSecp256k1AddrEncoder,
+    IAddrEncoder, IcxAddrDecoder, IcxAddrEncoder, NanoAddrDecoder, NanoAddrEncoder, NearAddrDecoder, NearAddrEncoder,
+    NeoAddrDecoder, NeoAddrEncoder, OkexAddrDecoder, OkexAddrEncoder, OneAddrDecoder, OneAddrEncoder, P2PKHAddrDecoder,
+    P2PKHAddrEncoder, P2SHAddrDecoder, P2SHAddrEncoder, P2TRAddrDecoder, P2TRAddrEncoder, P2WPKHAddrDecoder,
+    P2WPKHAddrEncoder, SolAddrDecoder, SolAddrEncoder, SubstrateEd25519AddrDecoder, SubstrateEd25519AddrEncoder,
+    SubstrateSr25519AddrDecoder, TrxAddrDecoder, TrxAddrEncoder, XlmAddrDecoder, XlmAddrEncoder, XmrAddrDecoder,
+    XmrAddrEncoder, XrpAddrDecoder, XrpAddrEncoder, XtzAddrDecoder, XtzAddrEncoder, ZilAddrDecoder, ZilAddrEncoder
+)
+from bip_utils.addr.iaddr_decoder import IAddrDecoder
+from bip_utils.base58 import Base58Alphabets, Base58ChecksumError, Base58Decoder, Base58XmrDecoder
+from bip_utils.bip.bip44_base import Bip44AddrEncoder
+from bip_utils.bip.conf.bip44 import Bip44Coins, Bip44ConfGetter
+from bip_utils.bip.conf.bip49 import Bip49Coins, Bip49ConfGetter
+from bip_utils.bip.conf.bip84 import Bip84Coins, Bip84ConfGetter
+from bip_utils.bip.conf.bip86 import Bip86Coins, Bip86ConfGetter
+from bip_utils.bip.conf.common import BipCoinConf, BipCoinFctCallsConf
+from bip_utils.cardano.cip1852.conf import Cip1852Coins, Cip1852ConfGetter
+from bip_utils.coin_conf import CoinsConf
+from bip_utils.monero.conf import MoneroCoins, MoneroConfGetter
+from bip_utils.ss58 import SS58ChecksumError, SS58Decoder
+from bip_utils.substrate.conf import SubstrateCoins, SubstrateConfGetter
+from bip_utils.utils.crypto import Hash160
+from bip_utils.utils.misc import ParallelUtils
+
+
+class AddrClassifierConst:
+    """Class container for address classifier constants."""
+
+    # Default number of addresses sent to a worker at once
+    DEF_CHUNK_SIZE: int = 4096
+    # Seed for computing sample addresses
+    SAMPLE_SEED_BYTES: bytes = b"\x00" * 32
+
+    # Coins supported by default
+    DEF_COINS_TYPES: Tuple[Type[Enum], ...] = (
+        Bip44Coins, Bip49Coins, Bip84Coins, Bip86Coins, Cip1852Coins, SubstrateCoins, MoneroCoins,
+    )
+
+    # Address encoder to address decoder
+    ADDR_ENC_TO_DEC: Dict[Type[IAddrEncoder], Type[IAddrDecoder]] = {
+        AdaByronIcarusAddrEncoder: AdaByronAddrDecoder,
+        AdaShelleyAddrEncoder: AdaShelleyAddrDecoder,
+        AlgoAddrEncoder: AlgoAddrDecoder,
+        AtomAddrEncoder: AtomAddrDecoder,
+        AvaxPChainAddrEncoder: AvaxPChainAddrDecoder,
+        AvaxXChainAddrEncoder: AvaxXChainAddrDecoder,
+        BchP2PKHAddrEncoder: BchP2PKHAddrDecoder,
+        BchP2SHAddrEncoder: BchP2SHAddrDecoder,
+        EgldAddrEncoder: EgldAddrDecoder,
+        EosAddrEncoder: EosAddrDecoder,
+        ErgoP2PKHAddrEncoder: ErgoP2PKHAddrDecoder,
+        EthAddrEncoder: EthAddrDecoder,
+        FilSecp256k1AddrEncoder: FilSecp256k1AddrDecoder,
+        IcxAddrEncoder: IcxAddrDecoder,
+        NanoAddrEncoder: NanoAddrDecoder,
+        NearAddrEncoder: NearAddrDecoder,
+        NeoAddrEncoder: NeoAddrDecoder,
+        OkexAddrEncoder: OkexAddrDecoder,
+        OneAddrEncoder: OneAddrDecoder,
+        P2PKHAddrEncoder: P2PKHAddrDecoder,
+        P2SHAddrEncoder: P2SHAddrDecoder,
+        P2TRAddrEncoder: P2TRAddrDecoder,
+        P2WPKHAddrEncoder: P2WPKHAddrDecoder,
+        SolAddrEncoder: SolAddrDecoder,
+        SubstrateEd25519AddrEncoder: SubstrateEd25519AddrDecoder,
+        TrxAddrEncoder: TrxAddrDecoder,
+        XlmAddrEncoder: XlmAddrDecoder,
+        XrpAddrEncoder: XrpAddrDecoder,
+        XtzAddrEncoder: XtzAddrDecoder,
+        ZilAddrEncoder: ZilAddrDecoder,
+    }
+
+    # Decoders of addresses starting with a HRP, with their separator
+    HRP_DECODERS_SEP: Dict[Type[IAddrDecoder], str] = {
+        AdaShelleyAddrDecoder: "1",
+        AtomAddrDecoder: "1",
+        AvaxPChainAddrDecoder: "1",
+        AvaxXChainAddrDecoder: "1",
+        BchP2PKHAddrDecoder: ":",
+        BchP2SHAddrDecoder: ":",
+        EgldAddrDecoder: "1",
+        OkexAddrDecoder: "1",
+        OneAddrDecoder: "1",
+        P2TRAddrDecoder: "1",
+        P2WPKHAddrDecoder: "1",
+        ZilAddrDecoder: "1",
+    }
+
+    # Decoders of addresses starting with a fixed prefix, with their prefix
+    PREFIX_DECODERS: Dict[Type[IAddrDecoder], str] = {
+        EosAddrDecoder: CoinsConf.Eos.ParamByKey("addr_prefix"),
+        EthAddrDecoder: CoinsConf.Ethereum.ParamByKey("addr_prefix"),
+        FilSecp256k1AddrDecoder: CoinsConf.Filecoin.ParamByKey("addr_prefix"),
+        IcxAddrDecoder: CoinsConf.Icon.ParamByKey("addr_prefix"),
+        NanoAddrDecoder: CoinsConf.Nano.ParamByKey("addr_prefix"),
+    }
+
+    # Decoders of Base58Check addresses made of net version and a Hash160 digest
+    NET_VER_DECODERS: Tuple[Type[IAddrDecoder], ...] = (P2PKHAddrDecoder, P2SHAddrDecoder)
+    # Decoders of SS58 addresses
+    SS58_DECODERS: Tuple[Type[IAddrDecoder], ...] = (SubstrateEd25519AddrDecoder, SubstrateSr25519AddrDecoder)
+    # Decoders of Monero addresses
+    XMR_DECODERS: Tuple[Type[IAddrDecoder], ...] = (XmrAddrDecoder,)
+
+
+class AddrClassifierResult(NamedTuple):
+    """Address classifier result."""
+
+    address: str
+    coins: Tuple[Enum, ...]
+
+
+class _AddrDecoderGroup(NamedTuple):
+    """Address decoder group, i.e. the coins sharing the same decoder and parameters."""
+
+    decoder_cls: Type[IAddrDecoder]
+    decoder_params: Dict[str, Any]
+    coins: List[Enum]
+
+
+class _AddrClassifierIndex:
+    """
+    Address classifier index class.
+    It maps the address features to the decoder groups that can accept it.
+    """
+
+    m_hrp_index: Dict[str, Dict[str, List[_AddrDecoderGroup]]]
+    m_prefix_index: Dict[int, Dict[str, List[_AddrDecoderGroup]]]
+    m_net_ver_index: Dict[Base58Alphabets, Dict[int, Dict[bytes, List[_AddrDecoderGroup]]]]
+    m_ss58_index: Dict[int, List[_AddrDecoderGroup]]
+    m_xmr_index: Dict[int, Dict[bytes, List[_AddrDecoderGroup]]]
+    m_generic_groups: List[_AddrDecoderGroup]
+
+    def __init__(self) -> None:
+        """Construct class."""
+        self.m_hrp_index = {}
+        self.m_prefix_index = {}
+        self.m_net_ver_index = {}
+        self.m_ss58_index = {}
+        self.m_xmr_index = {}
+        self.m_generic_groups = []
+
+    def AddHrpGroup(self,
+                    group: _AddrDecoderGroup,
+                    sep: str,
+                    hrp: str) -> None:
+        """
+        Add a group of addresses starting with a HRP.
+
+        Args:
+            group (_AddrDecoderGroup object): Decoder group
+            sep (str)                       : HRP separator
+            hrp (str)                       : HRP
+        """
+        self.m_hrp_index.setdefault(sep, {}).setdefault(hrp.lower(), []).append(group)
+
+    def AddPrefixGroup(self,
+                       group: _AddrDecoderGroup,
+                       prefix: str) -> None:
+        """
+        Add a group of addresses starting with a fixed prefix.
+
+        Args:
+            group (_AddrDecoderGroup object): Decoder group
+            prefix (str)                    : Prefix
+        """
+        self.m_prefix_index.setdefault(len(prefix), {}).setdefault(prefix, []).append(group)
+
+    def AddNetVersionGroup(self,
+                           group: _AddrDecoderGroup,
+                           alph_idx: Base58Alphabets,
+                           net_ver: bytes) -> None:
+        """
+        Add a group of Base58Check addresses made of net version and a Hash160 digest.
+
+        Args:
+            group (_AddrDecoderGroup object): Decoder group
+            alph_idx (Base58Alphabets)      : Base58 alphabet
+            net_ver (bytes)                 : Net version
+        """
+        self.m_net_ver_index.setdefault(alph_idx, {}).setdefault(len(net_ver), {}).setdefault(net_ver, []).append(group)
+
+    def AddSS58Group(self,
+                     group: _AddrDecoderGroup,
+                     ss58_format: int) -> None:
+        """
+        Add a group of SS58 addresses.
+
+        Args:
+            group (_AddrDecoderGroup object): Decoder group
+            ss58_format (int)               : SS58 format
+        """
+        self.m_ss58_index.setdefault(ss58_format, []).append(group)
+
+    def AddXmrGroup(self,
+                    group: _AddrDecoderGroup,
+                    net_ver: bytes) -> None:
+        """
+        Add a group of Monero addresses.
+
+        Args:
+            group (_AddrDecoderGroup object): Decoder group
+            net_ver (bytes)                 : Net version
+        """
+        self.m_xmr_index.setdefault(len(net_ver), {}).setdefault(net_ver, []).append(group)
+
+    def AddGenericGroup(self,
+                        group: _AddrDecoderGroup) -> None:
+        """
+        Add a group of addresses that can only be checked by decoding them.
+
+        Args:
+            group (_AddrDecoderGroup object): Decoder group
+        """
+        self.m_generic_groups.append(group)
+
+    def Classify(self,
+                 addr: str) -> Tuple[Enum, ...]:
+        """
+        Get the coins an address is valid for.
+
+        Args:
+            addr (str): Address string
+
+        Returns:
+            tuple[Enum]: Coins
+        """
+        coins: List[Enum] = []
+
+        # Net version groups are fully validated by the index, so there is no need to call the decoder again
+        for groups in self.__NetVersionGroups(addr):
+            for group in groups:
+                coins.extend(group.coins)
+
+        for groups in self.__HrpGroups(addr):
+            self.__DecodeGroups(addr, groups, coins)
+        for groups in self.__PrefixGroups(addr):
+            self.__DecodeGroups(addr, groups, coins)
+        for groups in self.__SS58Groups(addr):
+            self.__DecodeGroups(addr, groups, coins)
+        for groups in self.__XmrGroups(addr):
+            self.__DecodeGroups(addr, groups, coins)
+        self.__DecodeGroups(addr, self.m_generic_groups, coins)
+
+        return tuple(coins)
+
+    def __HrpGroups(self,
+                    addr: str) -> Iterator[List[_AddrDecoderGroup]]:
+        """
+        Get the groups matching the HRP of an address.
+
+        Args:
+            addr (str): Address string
+
+        Returns:
+            Iterator[list[_AddrDecoderGroup]]: Iterator of groups
+        """
+        for sep, hrp_groups in self.m_hrp_index.items():
+            sep_pos = addr.rfind(sep)
+            if sep_pos > 0:
+                groups = hrp_groups.get(addr[:sep_pos].lower())
+                if groups is not None:
+                    yield groups
+
+    def __PrefixGroups(self,
+                       addr: str) -> Iterator[List[_AddrDecoderGroup]]:
+        """
+        Get the groups matching the prefix of an address.
+
+        Args:
+            addr (str): Address string
+
+        Returns:
+            Iterator[list[_AddrDecoderGroup]]: Iterator of groups
+        """
+        for prefix_len, prefix_groups in self.m_prefix_index.items():
+            groups = prefix_groups.get(addr[:prefix_len])
+            if groups is not None:
+                yield groups
+
+    def __NetVersionGroups(self,
+                           addr: str) -> Iterator[List[_AddrDecoderGroup]]:
+        """
+        Get the groups matching the net version of an address.
+        The address is decoded only once for each alphabet.
+
+        Args:
+            addr (str): Address string
+
+        Returns:
+            Iterator[list[_AddrDecoderGroup]]: Iterator of groups
+        """
+        for alph_idx, net_ver_len_groups in self.m_net_ver_index.items():
+            try:
+                addr_dec_bytes = Base58Decoder.CheckDecode(addr, alph_idx)
+            except (Base58ChecksumError, ValueError):
+                continue
+
+            net_ver_len = len(addr_dec_bytes) - Hash160.DigestSize()
+            net_ver_groups = net_ver_len_groups.get(net_ver_len)
+            if net_ver_groups is not None:
+                groups = net_ver_groups.get(addr_dec_bytes[:net_ver_len])
+                if groups is not None:
+                    yield groups
+
+    def __SS58Groups(self,
+                     addr: str) -> Iterator[List[_AddrDecoderGroup]]:
+        """
+        Get the groups matching the SS58 format of an address.
+        The address is decoded only once for all formats.
+
+        Args:
+            addr (str): Address string
+
+        Returns:
+            Iterator[list[_AddrDecoderGroup]]: Iterator of groups
+        """
+        if not self.m_ss58_index:
+            return
+        try:
+            ss58_format, _ = SS58Decoder.Decode(addr)
+        except (SS58ChecksumError, ValueError):
+            return
+
+        groups = self.m_ss58_index.get(ss58_format)
+        if groups is not None:
+            yield groups
+
+    def __XmrGroups(self,
+                    addr: str) -> Iterator[List[_AddrDecoderGroup]]:
+        """
+        Get the groups matching the net version of a Monero address.
+        The address is decoded only once for all net versions.
+
+        Args:
+            addr (str): Address string
+
+        Returns:
+            Iterator[list[_AddrDecoderGroup]]: Iterator of groups
+        """
+        if not self.m_xmr_index:
+            return
+        try:
+            addr_dec_bytes = Base58XmrDecoder.Decode(addr)
+        except ValueError:
+            return
+
+        for net_ver_len, net_ver_groups in self.m_xmr_index.items():
+            groups = net_ver_groups.get(addr_dec_bytes[:net_ver_len])
+            if groups is not None:
+                yield groups
+
+    @staticmethod
+    def __DecodeGroups(addr: str,
+                       groups: List[_AddrDecoderGroup],
+                       coins: List[Enum]) -> None:
+        """
+        Decode an address with the decoders of the specified groups and add the coins of the valid ones.
+
+        Args:
+            addr (str)                     : Address string
+            groups (list[_AddrDecoderGroup]): Decoder groups
+            coins (list[Enum])             : Coins list to be extended
+        """
+        for group in groups:
+            try:
+                group.decoder_cls.DecodeAddr(addr, **group.decoder_params)
+            except (TypeError, ValueError):
+                continue
+            coins.extend(group.coins)
+
+
+class _AddrClassifierUtils:
+    """Class container for address classifier utility functions."""
+
+    @staticmethod
+    def CoinDecoders(coin: Enum) -> List[Tuple[Type[IAddrDecoder], Dict[str, Any], Optional[BipCoinConf]]]:
+        """
+        Get the address decoders of a coin.
+
+        Args:
+            coin (Enum): Coin
+
+        Returns:
+            list[tuple[IAddrDecoder class, dict, BipCoinConf]]: Decoder class (index 0), decoder parameters (index 1)
+                                                                and coin configuration for sample addresses (index 2)
+
+        Raises:
+            TypeError: If coin type is not supported
+            ValueError: If the coin addresses cannot be classified
+        """
+        if isinstance(coin, SubstrateCoins):
+            return [(SubstrateSr25519AddrDecoder, SubstrateConfGetter.GetConfig(coin).AddrParams(), None)]
+        if isinstance(coin, MoneroCoins):
+            monero_conf = MoneroConfGetter.GetConfig(coin)
+            return [
+                (XmrAddrDecoder, {"net_ver": monero_conf.AddrNetVersion()}, None),
+                (XmrAddrDecoder, {"net_ver": monero_conf.SubaddrNetVersion()}, None),
+            ]
+
+        coin_conf = _AddrClassifierUtils.__BipCoinConf(coin)
+        if coin_conf.AddrClass() is XmrAddrEncoder:
+            raise ValueError("Monero addresses shall be classified using MoneroCoins")
+        # Function calls (e.g. chain code) and other encoding-only parameters are not needed for decoding
+        decoder_params = {
+            param_name: param_val
+            for param_name, param_val in coin_conf.AddrParams().items()
+            if not isinstance(param_val, BipCoinFctCallsConf) and param_name != "pub_key_mode"
+        }
+        return [(AddrClassifierConst.ADDR_ENC_TO_DEC[coin_conf.AddrClass()], decoder_params, coin_conf)]
+
+    @staticmethod
+    def SampleAddress(coin_conf: BipCoinConf) -> str:
+        """
+        Compute a sample address of a coin, to get its fixed parts.
+
+        Args:
+            coin_conf (BipCoinConf object): BipCoinConf object
+
+        Returns:
+            str: Sample address
+        """
+        pub_key = coin_conf.Bip32Class().FromSeed(AddrClassifierConst.SAMPLE_SEED_BYTES).PublicKey()
+        if coin_conf.AddrClass() is AdaShelleyAddrEncoder:
+            pub_key_bytes = pub_key.RawCompressed().ToBytes()
+            return AdaShelleyAddrEncoder.EncodeKey(pub_key_bytes, pub_skey=pub_key_bytes, **coin_conf.AddrParams())
+        return Bip44AddrEncoder(coin_conf).Encode(pub_key)
+
+    @staticmethod
+    def ClassifyAddresses(index: _AddrClassifierIndex,
+                          addresses: List[str]) -> List[AddrClassifierResult]:
+        """
+        Classify a chunk of addresses.
+
+        Args:
+            index (_AddrClassifierIndex object): Classifier index
+            addresses (list[str])              : Addresses
+
+        Returns:
+            list[AddrClassifierResult]: Results, in the same order of the addresses
+        """
+        return [AddrClassifierResult(addr, index.Classify(addr)) for addr in addresses]
+
+    @staticmethod
+    def __BipCoinConf(coin: Enum) -> BipCoinConf:
+        """
+        Get the configuration of a BIP coin.
+
+        Args:
+            coin (Enum): Coin
+
+        Returns:
+            BipCoinConf object: BipCoinConf object
+
+        Raises:
+            TypeError: If coin type is not supported
+        """
+        if isinstance(coin, Bip44Coins):
+            return Bip44ConfGetter.GetConfig(coin)
+        if isinstance(coin, Bip49Coins):
+            return Bip49ConfGetter.GetConfig(coin)
+        if isinstance(coin, Bip84Coins):
+            return Bip84ConfGetter.GetConfig(coin)
+        if isinstance(coin, Bip86Coins):
+            return Bip86ConfGetter.GetConfig(coin)
+        if isinstance(coin, Cip1852Coins):
+            return Cip1852ConfGetter.GetConfig(coin)
+        raise TypeError(f"Coin type {type(coin)} is not supported")
+
+
+class AddrClassifier:
+    """
+    Address classifier class.
+    It finds the coins an address is valid for, by passing it only to the decoders that can accept it.
+    Each decoder is called once for all the coins sharing the same address format (e.g. all the Ethereum-like coins).
+    """
+
+    m_coins: Tuple[Enum, ...]
+    m_index: _AddrClassifierIndex
+
+    def __init__(self,
+                 coins: Optional[Iterable[Enum]] = None) -> None:
+        """
+        Construct class.
+
+        Args:
+            coins (Iterable[Enum], optional): Coins to be classified (default: all the coins of Bip44Coins, Bip49Coins,
+                                              Bip84Coins, Bip86Coins, Cip1852Coins, SubstrateCoins and MoneroCoins,
+                                              except the Monero ones in Bip44Coins)
+
+        Raises:
+            TypeError: If one of the coins type is not supported
+            ValueError: If the addresses of one of the coins cannot be classified
+        """
+        if coins is None:
+            coins = [
+                coin
+                for coins_type in AddrClassifierConst.DEF_COINS_TYPES
+                for coin in coins_type
+                if coin not in (Bip44Coins.MONERO_ED25519_SLIP, Bip44Coins.MONERO_SECP256K1)
+            ]
+
+        self.m_coins = tuple(coins)
+        self.m_index = self.__BuildIndex(self.m_coins)
+
+    def Coins(self) -> Tuple[Enum, ...]:
+        """
+        Get the classified coins.
+
+        Returns:
+            tuple[Enum]: Coins
+        """
+        return self.m_coins
+
+    def Classify(self,
+                 address: str) -> AddrClassifierResult:
+        """
+        Classify a single address.
+
+        Args:
+            address (str): Address string
+
+        Returns:
+            AddrClassifierResult object: Result, whose coins are empty if the address is not valid for any coin
+        """
+        return AddrClassifierResult(address, self.m_index.Classify(address))
+
+    def Validate(self,
+                 address: str,
+                 coin: Enum) -> bool:
+        """
+        Get if an address is valid for the specified coin.
+
+        Args:
+            address (str): Address string
+            coin (Enum)  : Coin
+
+        Returns:
+            bool: True if valid, false otherwise
+
+        Raises:
+            ValueError: If the coin is not classified
+        """
+        if coin not in self.m_coins:
+            raise ValueError(f"Coin {coin} is not classified")
+        return coin in self.m_index.Classify(address)
+
+    def ValidateMany(self,
+                     addresses: Iterable[str],
+                     workers: Optional[int] = None,
+                     chunk_size: int = AddrClassifierConst.DEF_CHUNK_SIZE) -> Iterator[AddrClassifierResult]:
+        """
+        Classify many addresses, in the same order.
+        Addresses are stripped (so lines of a file can be passed directly) and empty lines are skipped.
+
+        Args:
+            addresses (Iterable[str])  : Addresses (e.g. a file object)
+            workers (int, optional)    : Number of worker processes (default: CPU count),
+                                         1 for classifying addresses in the current process
+            chunk_size (int, optional) : Number of addresses sent to a worker at once
+
+        Returns:
+            Iterator[AddrClassifierResult]: Iterator of results
+
+        Raises:
+            ValueError: If the parameters are not valid
+        """
+        workers = ParallelUtils.WorkersNum(workers)
+        chunks = ParallelUtils.Chunks(filter(None, (addr.strip() for addr in addresses)),
+                                      chunk_size)
+        return self.__ValidateMany(chunks, workers)
+
+    def __ValidateMany(self,
+                       chunks: Iterator[List[str]],
+                       workers: int) -> Iterator[AddrClassifierResult]:
+        """
+        Classify chunks of addresses.
+
+        Args:
+            chunks (Iterator[list[str]]): Chunks of addresses
+            workers (int)               : Number of worker processes
+
+        Returns:
+            Iterator[AddrClassifierResult]: Iterator of results
+        """
+        for _, results in ParallelUtils.MapChunks(_AddrClassifierUtils.ClassifyAddresses,
+                                                  chunks,
+                                                  workers,
+                                                  self.m_index):
+            yield from results
+
+    @staticmethod
+    def __BuildIndex(coins: Iterable[Enum]) -> _AddrClassifierIndex:
+        """
+        Build the classifier index.
+
+        Args:
+            coins (Iterable[Enum]): Coins
+
+        Returns:
+            _AddrClassifierIndex object: _AddrClassifierIndex object
+
+        Raises:
+            TypeError: If one of the coins type is not supported
+            ValueError: If the addresses of one of the coins cannot be classified
+        """
+
+        # Group coins by decoder and parameters
+        groups: Dict[Tuple[Type[IAddrDecoder], Tuple[Tuple[str, Any], ...]], _AddrDecoderGroup] = {}
+        groups_conf: Dict[Tuple[Type[IAddrDecoder], Tuple[Tuple[str, Any], ...]], Optional[BipCoinConf]] = {}
+        for coin in coins:
+            for decoder_cls, decoder_params, coin_conf in _AddrClassifierUtils.CoinDecoders(coin):
+                group_key = (decoder_cls, tuple(sorted(decoder_params.items())))
+                if group_key not in groups:
+                    groups[group_key] = _AddrDecoderGroup(decoder_cls, decoder_params, [])
+                    groups_conf[group_key] = coin_conf
+                groups[group_key].coins.append(coin)
+
+        # Index groups by their address features
+        index = _AddrClassifierIndex()
+        for group_key, group in groups.items():
+            if group.decoder_cls in AddrClassifierConst.HRP_DECODERS_SEP:
+                sep = AddrClassifierConst.HRP_DECODERS_SEP[group.decoder_cls]
+                coin_conf = groups_conf[group_key]
+                assert coin_conf is not None
+                sample_addr = _AddrClassifierUtils.SampleAddress(coin_conf)
+                index.AddHrpGroup(group, sep, sample_addr[:sample_addr.rfind(sep)])
+            elif group.decoder_cls in AddrClassifierConst.PREFIX_DECODERS:
+                index.AddPrefixGroup(group, AddrClassifierConst.PREFIX_DECODERS[group.decoder_cls])
+            elif group.decoder_cls in AddrClassifierConst.NET_VER_DECODERS:
+                index.AddNetVersionGroup(group,
+                                         group.decoder_params.get("base58_alph", Base58Alphabets.BITCOIN),
+                                         group.decoder_params["net_ver"])
+            elif group.decoder_cls in AddrClassifierConst.SS58_DECODERS:
+                index.AddSS58Group(group, group.decoder_params["ss58_format"])
+            elif group.decoder_cls in AddrClassifierConst.XMR_DECODERS:
+                index.AddXmrGroup(group, group.decoder_params["net_ver"])
+            else:
+                index.AddGenericGroup(group)
+        return index
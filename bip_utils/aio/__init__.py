@@ -0,0 +1,2 @@
+from bip_utils.aio.aio_bip import AioBip38Decrypter, AioBip38Encrypter, AioBip39SeedGenerator, AioBip44, AioBipConst
+from bip_utils.aio.aio_executor import AioExecutor, AioExecutorTypes
@@ -0,0 +1,391 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Module for asyncio versions of the BIP operations.
+Seed generation, BIP38 encryption/decryption, extended keys parsing and addresses derivation are executed by an
+AioExecutor, so that they don't block the event loop.
+"""
+
+# Imports
+import asyncio
+from typing import List, Optional, Tuple, Type, Union
+
+from bip_utils.aio.aio_executor import AioExecutor, AioExecutorTypes
+from bip_utils.bip.bip38 import Bip38Decrypter, Bip38Encrypter, Bip38PubKeyModes
+from bip_utils.bip.bip39 import Bip39Languages, Bip39SeedGenerator
+from bip_utils.bip.bip44_base import Bip44Base
+from bip_utils.bip.conf.common import BipCoins
+from bip_utils.utils.mnemonic import Mnemonic
+
+
+class AioBipConst:
+    """Class container for asyncio BIP constants."""
+
+    # Default number of addresses derived by a single executor operation
+    DEF_CHUNK_SIZE: int = 64
+
+
+class _AioBipUtils:
+    """
+    Class container for asyncio BIP utility functions.
+    They are the functions called by the executor, so they shall be picklable.
+    """
+
+    @staticmethod
+    def GenerateSeed(mnemonic: str,
+                     passphrase: str,
+                     lang: Optional[Bip39Languages]) -> bytes:
+        """
+        Generate a BIP39 seed.
+
+        Args:
+            mnemonic (str)               : Mnemonic
+            passphrase (str)             : Passphrase
+            lang (Bip39Languages or None): Language, None for automatic detection
+
+        Returns:
+            bytes: Generated seed
+        """
+        return Bip39SeedGenerator(mnemonic, lang).Generate(passphrase)
+
+    @staticmethod
+    def DeriveAddresses(bip_cls: Type[Bip44Base],
+                        ex_key_str: str,
+                        coin_type: BipCoins,
+                        start: int,
+                        stop: int) -> List[str]:
+        """
+        Derive the addresses of the specified indexes from a change level extended key.
+
+        Args:
+            bip_cls (class)     : Bip44Base child class
+            ex_key_str (str)    : Extended key string
+            coin_type (BipCoins): Coin type
+            start (int)         : First address index (included)
+            stop (int)          : Last address index (excluded)
+
+        Returns:
+            list[str]: Addresses
+        """
+        bip_obj = bip_cls.FromExtendedKey(ex_key_str, coin_type)
+        return [bip_obj.AddressIndex(i).PublicKey().ToAddress() for i in range(start, stop)]
+
+
+class _AioBipExecutor:
+    """Class container for getting the executor of asyncio BIP operations."""
+
+    @staticmethod
+    def Get(executor: Optional[AioExecutor],
+            thread_only: bool = False) -> AioExecutor:
+        """
+        Get the specified executor or the default one.
+
+        Args:
+            executor (AioExecutor or None): Executor, None for the default one
+            thread_only (bool, optional)  : True if a thread executor is required
+
+        Returns:
+            AioExecutor object: AioExecutor object
+
+        Raises:
+            ValueError: If a thread executor is required but the executor is not
+        """
+        executor = executor if executor is not None else AioExecutor.Default()
+        if thread_only and executor.ExecutorType() != AioExecutorTypes.THREAD:
+            raise ValueError("A thread executor is required, since Bip44Base objects cannot be pickled")
+        return executor
+
+
+class AioBip39SeedGenerator:
+    """
+    Asyncio BIP39 seed generator class.
+    Seeds generation is executed by an AioExecutor.
+    """
+
+    @staticmethod
+    async def Generate(mnemonic: Union[str, Mnemonic],
+                       passphrase: str = "",
+                       lang: Optional[Bip39Languages] = None,
+                       executor: Optional[AioExecutor] = None) -> bytes:
+        """
+        Generate the seed of the specified mnemonic using the specified passphrase.
+
+        Args:
+            mnemonic (str or Mnemonic object)  : Mnemonic
+            passphrase (str, optional)         : Passphrase, empty if not specified
+            lang (Bip39Languages, optional)    : Language, None for automatic detection
+            executor (AioExecutor, optional)   : Executor (default: AioExecutor.Default())
+
+        Returns:
+            bytes: Generated seed
+
+        Raises:
+            ValueError: If the mnemonic is not valid
+        """
+        mnemonic = mnemonic.ToStr() if isinstance(mnemonic, Mnemonic) else mnemonic
+        return await _AioBipExecutor.Get(executor).RunCoalesced(
+            ("bip39_seed", mnemonic, passphrase, lang),
+            _AioBipUtils.GenerateSeed,
+            mnemonic,
+            passphrase,
+            lang
+        )
+
+
+class AioBip38Encrypter:
+    """
+    Asyncio BIP38 encrypter class.
+    Encryption is executed by an AioExecutor.
+    """
+
+    @staticmethod
+    async def EncryptNoEc(priv_key: bytes,
+                          passphrase: str,
+                          pub_key_mode: Bip38PubKeyModes = Bip38PubKeyModes.COMPRESSED,
+                          executor: Optional[AioExecutor] = None) -> str:
+        """
+        Encrypt the specified private key without EC multiplication.
+
+        Args:
+            priv_key (bytes)                         : Private key bytes
+            passphrase (str)                         : Passphrase
+            pub_key_mode (Bip38PubKeyModes, optional): Public key mode
+            executor (AioExecutor, optional)         : Executor (default: AioExecutor.Default())
+
+        Returns:
+            str: Encrypted private key
+
+        Raises:
+            ValueError: If the private key bytes are not valid
+        """
+        return await _AioBipExecutor.Get(executor).RunCoalesced(
+            ("bip38_enc_no_ec", priv_key, passphrase, pub_key_mode),
+            Bip38Encrypter.EncryptNoEc,
+            priv_key,
+            passphrase,
+            pub_key_mode
+        )
+
+    @staticmethod
+    async def GeneratePrivateKeyEc(passphrase: str,
+                                   pub_key_mode: Bip38PubKeyModes = Bip38PubKeyModes.COMPRESSED,
+                                   lot_num: Optional[int] = None,
+                                   sequence_num: Optional[int] = None,
+                                   executor: Optional[AioExecutor] = None) -> str:
+        """
+        Generate a random encrypted private key with EC multiplication, using the specified parameters.
+        Requests are never coalesced, since the generated key is random.
+
+        Args:
+            passphrase (str)                         : Passphrase
+            pub_key_mode (Bip38PubKeyModes, optional): Public key mode
+            lot_num (int, optional)                  : Lot number
+            sequence_num (int, optional)             : Sequence number
+            executor (AioExecutor, optional)         : Executor (default: AioExecutor.Default())
+
+        Returns:
+            str: Encrypted private key
+        """
+        return await _AioBipExecutor.Get(executor).Run(
+            Bip38Encrypter.GeneratePrivateKeyEc,
+            passphrase,
+            pub_key_mode,
+            lot_num,
+            sequence_num
+        )
+
+
+class AioBip38Decrypter:
+    """
+    Asyncio BIP38 decrypter class.
+    Decryption is executed by an AioExecutor.
+    """
+
+    @staticmethod
+    async def DecryptNoEc(priv_key_enc: str,
+                          passphrase: str,
+                          executor: Optional[AioExecutor] = None) -> Tuple[bytes, Bip38PubKeyModes]:
+        """
+        Decrypt the specified private key without EC multiplication.
+
+        Args:
+            priv_key_enc (str)              : Encrypted private key bytes
+            passphrase (str)                : Passphrase
+            executor (AioExecutor, optional): Executor (default: AioExecutor.Default())
+
+        Returns:
+            tuple[bytes, Bip38PubKeyModes]: Decrypted private key (index 0), public key mode (index 1)
+
+        Raises:
+            Base58ChecksumError: If base58 checksum is not valid
+            ValueError: If the encrypted key is not valid
+        """
+        return await _AioBipExecutor.Get(executor).RunCoalesced(
+            ("bip38_dec_no_ec", priv_key_enc, passphrase),
+            Bip38Decrypter.DecryptNoEc,
+            priv_key_enc,
+            passphrase
+        )
+
+    @staticmethod
+    async def DecryptEc(priv_key_enc: str,
+                        passphrase: str,
+                        executor: Optional[AioExecutor] = None) -> Tuple[bytes, Bip38PubKeyModes]:
+        """
+        Decrypt the specified private key with EC multiplication.
+
+        Args:
+            priv_key_enc (str)              : Encrypted private key bytes
+            passphrase (str)                : Passphrase
+            executor (AioExecutor, optional): Executor (default: AioExecutor.Default())
+
+        Returns:
+            tuple[bytes, Bip38PubKeyModes]: Decrypted private key (index 0), public key mode (index 1)
+
+        Raises:
+            Base58ChecksumError: If base58 checksum is not valid
+            ValueError: If the encrypted key is not valid
+        """
+        return await _AioBipExecutor.Get(executor).RunCoalesced(
+            ("bip38_dec_ec", priv_key_enc, passphrase),
+            Bip38Decrypter.DecryptEc,
+            priv_key_enc,
+            passphrase
+        )
+
+
+class AioBip44:
+    """
+    Asyncio BIP44 class.
+    It works with any Bip44Base child class (i.e. BIP44, BIP49, BIP84, BIP86) and executes the derivations by an
+    AioExecutor.
+    Since Bip44Base objects cannot be pickled, methods taking or returning them require a thread executor.
+    """
+
+    @staticmethod
+    async def FromExtendedKey(bip_cls: Type[Bip44Base],
+                              ex_key_str: str,
+                              coin_type: BipCoins,
+                              executor: Optional[AioExecutor] = None) -> Bip44Base:
+        """
+        Create a Bip44Base object from the specified extended key.
+
+        Args:
+            bip_cls (class)                 : Bip44Base child class
+            ex_key_str (str)                : Extended key string
+            coin_type (BipCoins)            : Coin type (the type depends on the specific class)
+            executor (AioExecutor, optional): Thread executor (default: AioExecutor.Default())
+
+        Returns:
+            Bip44Base object: Bip44Base object
+
+        Raises:
+            TypeError: If coin type is not of the correct type
+            ValueError: If the executor is not a thread executor
+            Bip32KeyError: If the extended key is not valid
+        """
+        return await _AioBipExecutor.Get(executor, True).RunCoalesced(
+            ("bip44_ex_key", bip_cls, ex_key_str, coin_type),
+            bip_cls.FromExtendedKey,
+            ex_key_str,
+            coin_type
+        )
+
+    @staticmethod
+    async def DeriveDefaultPath(bip_obj: Bip44Base,
+                                executor: Optional[AioExecutor] = None) -> Bip44Base:
+        """
+        Derive the default coin path (i.e. account 0, external chain, address index 0).
+
+        Args:
+            bip_obj (Bip44Base object)      : Bip44Base object (purpose or master level)
+            executor (AioExecutor, optional): Thread executor (default: AioExecutor.Default())
+
+        Returns:
+            Bip44Base object: Bip44Base object
+
+        Raises:
+            Bip44DepthError: If the current depth is not suitable for deriving keys
+            Bip32KeyError: If the derivation results in an invalid key
+            ValueError: If the executor is not a thread executor
+        """
+        return await _AioBipExecutor.Get(executor, True).Run(bip_obj.DeriveDefaultPath)
+
+    @staticmethod
+    async def AddressesRange(bip_cls: Type[Bip44Base],
+                             ex_key_str: str,
+                             coin_type: BipCoins,
+                             start: int,
+                             stop: int,
+                             executor: Optional[AioExecutor] = None,
+                             chunk_size: int = AioBipConst.DEF_CHUNK_SIZE) -> List[str]:
+        """
+        Derive the addresses in the specified range, i.e. /start ... /(stop - 1), from a change level extended key.
+        The range is split in chunks, each one derived by a single executor operation, so chunks can be derived in
+        parallel by a process executor. If the caller is cancelled or an error occurs, the remaining chunks are
+        cancelled.
+
+        Args:
+            bip_cls (class)                 : Bip44Base child class
+            ex_key_str (str)                : Extended key string (change level)
+            coin_type (BipCoins)            : Coin type (the type depends on the specific class)
+            start (int)                     : First address index (included)
+            stop (int)                      : Last address index (excluded)
+            executor (AioExecutor, optional): Executor (default: AioExecutor.Default())
+            chunk_size (int, optional)      : Number of addresses derived by a single operation
+
+        Returns:
+            list[str]: Addresses (in order)
+
+        Raises:
+            TypeError: If coin type is not of the correct type
+            ValueError: If the parameters are not valid
+            Bip32KeyError: If the extended key is not valid
+            Bip44DepthError: If the extended key is not at change level
+        """
+        if start < 0 or stop < start:
+            raise ValueError(f"Invalid range ({start}, {stop})")
+        if chunk_size <= 0:
+            raise ValueError(f"Invalid chunk size ({chunk_size})")
+
+        aio_executor = _AioBipExecutor.Get(executor)
+        futures = [
+            asyncio.ensure_future(
+                aio_executor.RunCoalesced(
+                    ("bip44_addrs", bip_cls, ex_key_str, coin_type, chunk_start, min(chunk_start + chunk_size, stop)),
+                    _AioBipUtils.DeriveAddresses,
+                    bip_cls,
+                    ex_key_str,
+                    coin_type,
+                    chunk_start,
+                    min(chunk_start + chunk_size, stop)
+                )
+            )
+            for chunk_start in range(start, stop, chunk_size)
+        ]
+        try:
+            chunks_addrs = await asyncio.gather(*futures)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+        return [addr for chunk_addrs in chunks_addrs for addr in chunk_addrs]
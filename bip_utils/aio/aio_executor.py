@@ -0,0 +1,357 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Module for running blocking library operations from asyncio code.
+Operations are dispatched to a thread or process pool, the number of operations submitted at once is bounded,
+waiting operations can be cancelled and identical in-flight requests can be coalesced into a single computation.
+"""
+
+# Imports
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum, auto, unique
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from bip_utils.utils.misc import ParallelUtils
+
+
+@unique
+class AioExecutorTypes(Enum):
+    """Enumerative for executor types."""
+
+    THREAD = auto()
+    PROCESS = auto()
+
+
+class _AioInFlightRequest:
+    """Class for keeping track of an in-flight coalesced request."""
+
+    m_future: asyncio.Future
+    m_waiters_num: int
+
+    def __init__(self,
+                 future: asyncio.Future) -> None:
+        """
+        Construct class.
+
+        Args:
+            future (asyncio.Future): Future of the request
+        """
+        self.m_future = future
+        self.m_waiters_num = 0
+
+
+class _AioLoopState:
+    """Class for keeping the state bound to a specific event loop."""
+
+    m_semaphore: asyncio.Semaphore
+    m_in_flight: Dict[Hashable, _AioInFlightRequest]
+
+    def __init__(self,
+                 max_concurrency: int) -> None:
+        """
+        Construct class.
+        It shall be constructed inside the event loop it belongs to.
+
+        Args:
+            max_concurrency (int): Maximum number of concurrent operations
+        """
+        self.m_semaphore = asyncio.Semaphore(max_concurrency)
+        self.m_in_flight = {}
+
+
+class AioExecutor:
+    """
+    Asyncio executor class.
+    It runs blocking functions in a thread or process pool without blocking the event loop.
+    The pool is created at the first usage. If a process pool is used, functions, arguments and results shall be
+    picklable.
+    """
+
+    m_default: Optional[AioExecutor] = None
+    m_default_lock: threading.Lock = threading.Lock()
+
+    m_executor_type: AioExecutorTypes
+    m_max_workers: int
+    m_max_concurrency: int
+    m_coalesce: bool
+    m_executor: Optional[Executor]
+    m_lock: threading.Lock
+    m_loops_state: weakref.WeakKeyDictionary
+
+    @classmethod
+    def Default(cls) -> AioExecutor:
+        """
+        Get the default executor, i.e. a thread executor with default parameters shared by the whole library.
+        It is used when no executor is specified.
+
+        Returns:
+            AioExecutor object: AioExecutor object
+        """
+        with cls.m_default_lock:
+            if cls.m_default is None:
+                cls.m_default = cls()
+            return cls.m_default
+
+    def __init__(self,
+                 executor_type: AioExecutorTypes = AioExecutorTypes.THREAD,
+                 max_workers: Optional[int] = None,
+                 max_concurrency: Optional[int] = None,
+                 coalesce: bool = True) -> None:
+        """
+        Construct class.
+
+        Args:
+            executor_type (AioExecutorTypes, optional): Executor type (default: thread)
+            max_workers (int, optional)               : Number of workers (default: CPU count)
+            max_concurrency (int, optional)           : Maximum number of operations submitted to the pool at once
+                                                        for each event loop (default: number of workers), the other
+                                                        ones wait without using any worker
+            coalesce (bool, optional)                 : True for coalescing identical in-flight requests (default),
+                                                        false otherwise
+
+        Raises:
+            TypeError: If executor type is not a AioExecutorTypes enum
+            ValueError: If the parameters are not valid
+        """
+        if not isinstance(executor_type, AioExecutorTypes):
+            raise TypeError("Executor type is not an enumerative of AioExecutorTypes")
+        max_workers = ParallelUtils.WorkersNum(max_workers)
+        max_concurrency = max_concurrency if max_concurrency is not None else max_workers
+        if max_concurrency <= 0:
+            raise ValueError(f"Invalid maximum concurrency ({max_concurrency})")
+
+        self.m_executor_type = executor_type
+        self.m_max_workers = max_workers
+        self.m_max_concurrency = max_concurrency
+        self.m_coalesce = coalesce
+        self.m_executor = None
+        self.m_lock = threading.Lock()
+        self.m_loops_state = weakref.WeakKeyDictionary()
+
+    def __enter__(self) -> AioExecutor:
+        """
+        Enter the context.
+
+        Returns:
+            AioExecutor object: AioExecutor object
+        """
+        return self
+
+    def __exit__(self,
+                 *args: Any) -> None:
+        """
+        Exit the context, shutting down the pool.
+
+        Args:
+            *args: Exception information (not used)
+        """
+        self.Shutdown()
+
+    async def __aenter__(self) -> AioExecutor:
+        """
+        Enter the context.
+
+        Returns:
+            AioExecutor object: AioExecutor object
+        """
+        return self
+
+    async def __aexit__(self,
+                        *args: Any) -> None:
+        """
+        Exit the context, shutting down the pool.
+
+        Args:
+            *args: Exception information (not used)
+        """
+        self.Shutdown()
+
+    def ExecutorType(self) -> AioExecutorTypes:
+        """
+        Get the executor type.
+
+        Returns:
+            AioExecutorTypes: Executor type
+        """
+        return self.m_executor_type
+
+    def MaxWorkers(self) -> int:
+        """
+        Get the number of workers.
+
+        Returns:
+            int: Number of workers
+        """
+        return self.m_max_workers
+
+    def MaxConcurrency(self) -> int:
+        """
+        Get the maximum number of operations submitted to the pool at once.
+
+        Returns:
+            int: Maximum number of concurrent operations
+        """
+        return self.m_max_concurrency
+
+    def IsCoalescing(self) -> bool:
+        """
+        Get if identical in-flight requests are coalesced.
+
+        Returns:
+            bool: True if coalesced, false otherwise
+        """
+        return self.m_coalesce
+
+    def Shutdown(self,
+                 wait: bool = True) -> None:
+        """
+        Shutdown the pool. A new one will be created if the executor is used again.
+
+        Args:
+            wait (bool, optional): True for waiting the running operations (default), false otherwise
+        """
+        with self.m_lock:
+            executor = self.m_executor
+            self.m_executor = None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    async def Run(self,
+                  fct: Callable[..., Any],
+                  *args: Any) -> Any:
+        """
+        Run the function with the specified arguments in the pool, i.e. fct(*args).
+        If the caller is cancelled while the function is waiting to be submitted or is queued in the pool, the
+        function is not called. A function that is already running cannot be interrupted, its result is discarded.
+
+        Args:
+            fct (function): Function
+            *args         : Arguments
+
+        Returns:
+            Any: Function result
+
+        Raises:
+            Any: The same exceptions raised by the function
+        """
+        loop = asyncio.get_running_loop()
+        async with self.__LoopState(loop).m_semaphore:
+            return await loop.run_in_executor(self.__Executor(), fct, *args)
+
+    async def RunCoalesced(self,
+                           key: Hashable,
+                           fct: Callable[..., Any],
+                           *args: Any) -> Any:
+        """
+        Same of Run, but requests with the same key that are in-flight at the same time in the same event loop
+        share a single computation. The key shall identify the function and all its arguments.
+        The computation is cancelled only if all the callers waiting for it are cancelled.
+        If coalescing is disabled, it is the same of Run.
+
+        Args:
+            key (Hashable): Request key
+            fct (function): Function
+            *args         : Arguments
+
+        Returns:
+            Any: Function result
+
+        Raises:
+            Any: The same exceptions raised by the function
+        """
+        if not self.m_coalesce:
+            return await self.Run(fct, *args)
+
+        in_flight = self.__LoopState(asyncio.get_running_loop()).m_in_flight
+        request = in_flight.get(key)
+        if request is None:
+            request = _AioInFlightRequest(asyncio.ensure_future(self.Run(fct, *args)))
+            in_flight[key] = request
+            request.m_future.add_done_callback(
+                functools.partial(AioExecutor.__RemoveInFlight, in_flight, key, request)
+            )
+
+        request.m_waiters_num += 1
+        try:
+            return await asyncio.shield(request.m_future)
+        except asyncio.CancelledError:
+            # Cancel the computation if nobody else is waiting for it
+            if request.m_waiters_num == 1:
+                AioExecutor.__RemoveInFlight(in_flight, key, request)
+                request.m_future.cancel()
+            raise
+        finally:
+            request.m_waiters_num -= 1
+
+    def __Executor(self) -> Executor:
+        """
+        Get the pool, creating it if needed.
+
+        Returns:
+            Executor object: Executor object
+        """
+        with self.m_lock:
+            if self.m_executor is None:
+                self.m_executor = (ThreadPoolExecutor(max_workers=self.m_max_workers)
+                                   if self.m_executor_type == AioExecutorTypes.THREAD
+                                   else ProcessPoolExecutor(max_workers=self.m_max_workers))
+            return self.m_executor
+
+    def __LoopState(self,
+                    loop: asyncio.AbstractEventLoop) -> _AioLoopState:
+        """
+        Get the state of the specified event loop, creating it if needed.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): Event loop
+
+        Returns:
+            _AioLoopState object: _AioLoopState object
+        """
+        with self.m_lock:
+            loop_state = self.m_loops_state.get(loop)
+            if loop_state is None:
+                loop_state = _AioLoopState(self.m_max_concurrency)
+                self.m_loops_state[loop] = loop_state
+            return loop_state
+
+    @staticmethod
+    def __RemoveInFlight(in_flight: Dict[Hashable, _AioInFlightRequest],
+                         key: Hashable,
+                         request: _AioInFlightRequest,
+                         *args: Any) -> None:
+        """
+        Remove a request from the in-flight ones, if it was not already replaced by a new one.
+
+        Args:
+            in_flight (dict)                 : In-flight requests
+            key (Hashable)                   : Request key
+            request (_AioInFlightRequest obj): Request
+            *args                            : Not used (future passed by done callbacks)
+        """
+        if in_flight.get(key) is request:
+            del in_flight[key]
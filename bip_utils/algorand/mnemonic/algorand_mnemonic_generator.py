@@ -21,7 +21,7 @@
 """Module for Algorand mnemonic generation."""
 
 # Imports
-from typing import Dict, Union
+from typing import Dict, Iterator, Union
 
 from bip_utils.algorand.mnemonic.algorand_entropy_generator import AlgorandEntropyBitLen, AlgorandEntropyGenerator
 from bip_utils.algorand.mnemonic.algorand_mnemonic import AlgorandLanguages, AlgorandMnemonicConst, AlgorandWordsNum
@@ -77,21 +77,34 @@ class AlgorandMnemonicGenerator:
             ValueError: If words number is not valid
         """
 
-        # Check words number
-        if words_num not in AlgorandMnemonicConst.MNEMONIC_WORD_NUM:
-            raise ValueError(f"Words number for mnemonic ({words_num}) is not valid")
-
-        # Convert int to enum if necessary
-        if isinstance(words_num, int):
-            words_num = AlgorandWordsNum(words_num)
-
         # Get entropy length in bit from words number
-        entropy_bit_len = AlgorandMnemonicGeneratorConst.WORDS_NUM_TO_ENTROPY_LEN[words_num]
+        entropy_bit_len = self.__EntropyBitLenFromWordsNum(words_num)
         # Generate entropy
         entropy_bytes = AlgorandEntropyGenerator(entropy_bit_len).Generate()
 
         return self.FromEntropy(entropy_bytes)
 
+    def GenerateMany(self,
+                     count: int,
+                     words_num: Union[int, AlgorandWordsNum]) -> Iterator[Mnemonic]:
+        """
+        Generate multiple mnemonics with the specified words number from random entropy.
+        Entropy is read in large chunks from a random pool, so it is much faster than calling FromWordsNumber
+        multiple times.
+
+        Args:
+            count (int)                        : Number of mnemonics
+            words_num (int or AlgorandWordsNum): Number of words (25)
+
+        Returns:
+            Iterator[Mnemonic]: Iterator of generated mnemonics
+
+        Raises:
+            ValueError: If count or words number is not valid
+        """
+        entropy_bit_len = self.__EntropyBitLenFromWordsNum(words_num)
+        return map(self.FromEntropy, AlgorandEntropyGenerator(entropy_bit_len).GenerateMany(count))
+
     def FromEntropy(self,
                     entropy_bytes: bytes) -> Mnemonic:
         """
@@ -107,3 +120,28 @@ class AlgorandMnemonicGenerator:
             ValueError: If entropy byte length is not valid
         """
         return self.m_mnemonic_encoder.Encode(entropy_bytes)
+
+    @staticmethod
+    def __EntropyBitLenFromWordsNum(words_num: Union[int, AlgorandWordsNum]) -> int:
+        """
+        Get entropy length from words number.
+
+        Args:
+            words_num (int or AlgorandWordsNum): Words number
+
+        Returns:
+            int: Correspondent entropy length
+
+        Raises:
+            ValueError: If words number is not valid
+        """
+
+        # Check words number
+        if words_num not in AlgorandMnemonicConst.MNEMONIC_WORD_NUM:
+            raise ValueError(f"Words number for mnemonic ({words_num}) is not valid")
+
+        # Convert int to enum if necessary
+        if isinstance(words_num, int):
+            words_num = AlgorandWordsNum(words_num)
+
+        return AlgorandMnemonicGeneratorConst.WORDS_NUM_TO_ENTROPY_LEN[words_num]
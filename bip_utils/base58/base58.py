@@ -22,11 +22,11 @@
 
 # Imports
 from enum import Enum, auto, unique
-from typing import Dict
+from typing import Dict, List
 
 from bip_utils.base58.base58_ex import Base58ChecksumError
 from bip_utils.utils.crypto import DoubleSha256
-from bip_utils.utils.misc import BytesUtils
+from bip_utils.utils.misc import BytesUtils, IntegerUtils
 
 
 @unique
@@ -42,6 +42,8 @@ class Base58Const:
 
     # Base58 radix
     RADIX: int = 58
+    # Base58 radix squared, to encode two digits at a time
+    RADIX_SQUARED: int = RADIX ** 2
     # Checksum length in bytes
     CHECKSUM_BYTE_LEN: int = 4
     # Alphabets
@@ -49,6 +51,16 @@ class Base58Const:
         Base58Alphabets.BITCOIN: "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz",
         Base58Alphabets.RIPPLE: "rpshnaf39wBUDNEGHJKLM4PQRST7VWXYZ2bcdeCg65jkm8oFqi1tuvAxyz",
     }
+    # Alphabets digit values, indexed by character
+    ALPHABETS_VALUES: Dict[Base58Alphabets, Dict[str, int]] = {
+        alph_idx: {digit: i for i, digit in enumerate(alph)}
+        for alph_idx, alph in ALPHABETS.items()
+    }
+    # Alphabets digit pairs, indexed by the value of two digits
+    ALPHABETS_PAIRS: Dict[Base58Alphabets, List[str]] = {
+        alph_idx: [digit_hi + digit_lo for digit_hi in alph for digit_lo in alph]
+        for alph_idx, alph in ALPHABETS.items()
+    }
 
 
 class Base58Utils:
@@ -90,18 +102,20 @@ class Base58Encoder:
         if not isinstance(alph_idx, Base58Alphabets):
             raise TypeError("Alphabet index is not an enumerative of Base58Alphabets")
 
-        enc = ""
-
         # Get alphabet
         alphabet = Base58Const.ALPHABETS[alph_idx]
+        alphabet_pairs = Base58Const.ALPHABETS_PAIRS[alph_idx]
 
         # Convert bytes to integer
         val = BytesUtils.ToInteger(data_bytes)
 
-        # Algorithm implementation
+        # Algorithm implementation, two digits at a time
+        enc_pairs = []
         while val > 0:
-            val, mod = divmod(val, Base58Const.RADIX)
-            enc = alphabet[mod] + enc
+            val, mod = divmod(val, Base58Const.RADIX_SQUARED)
+            enc_pairs.append(alphabet_pairs[mod])
+        # The most significant pair can have a leading zero digit
+        enc = "".join(reversed(enc_pairs)).lstrip(alphabet[0])
 
         # Get number of leading zeros
         n = len(data_bytes) - len(data_bytes.lstrip(b"\x00"))
@@ -146,6 +160,7 @@ class Base58Decoder:
             bytes: Decoded bytes
 
         Raises:
+            ValueError: If the string contains invalid characters
             TypeError: If alphabet index is not a Base58Alphabets enumerative
         """
         if not isinstance(alph_idx, Base58Alphabets):
@@ -153,21 +168,22 @@ class Base58Decoder:
 
         # Get alphabet
         alphabet = Base58Const.ALPHABETS[alph_idx]
+        alphabet_values = Base58Const.ALPHABETS_VALUES[alph_idx]
 
         # Convert string to integer
         val = 0
-        for i, c in enumerate(data_str[::-1]):
-            val += alphabet.index(c) * (Base58Const.RADIX ** i)
+        try:
+            for c in data_str:
+                val = val * Base58Const.RADIX + alphabet_values[c]
+        except KeyError as ex:
+            raise ValueError(f"Invalid Base58 character ({ex.args[0]!r})") from ex
 
-        dec = bytearray()
-        while val > 0:
-            val, mod = divmod(val, 2**8)
-            dec.append(mod)
+        dec = IntegerUtils.ToBytes(val) if val > 0 else b""
 
         # Get padding length
         pad_len = len(data_str) - len(data_str.lstrip(alphabet[0]))
         # Add padding
-        return (b"\x00" * pad_len) + bytes(dec[::-1])
+        return (b"\x00" * pad_len) + dec
 
     @staticmethod
     def CheckDecode(data_str: str,
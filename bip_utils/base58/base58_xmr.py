@@ -21,9 +21,9 @@
 """Module for base58-monero decoding/encoding."""
 
 # Imports
-from typing import List
+from typing import Dict, List
 
-from bip_utils.base58.base58 import Base58Alphabets, Base58Const, Base58Decoder, Base58Encoder
+from bip_utils.base58.base58 import Base58Alphabets, Base58Const
 
 
 class Base58XmrConst:
@@ -31,6 +31,12 @@ class Base58XmrConst:
 
     # Alphabet
     ALPHABET: str = Base58Const.ALPHABETS[Base58Alphabets.BITCOIN]
+    # Alphabet digit values, indexed by character
+    ALPHABET_VALUES: Dict[str, int] = Base58Const.ALPHABETS_VALUES[Base58Alphabets.BITCOIN]
+    # Alphabet digit pairs, indexed by the value of two digits
+    ALPHABET_PAIRS: List[str] = Base58Const.ALPHABETS_PAIRS[Base58Alphabets.BITCOIN]
+    # Alphabet digit pairs values, indexed by two digits
+    ALPHABET_PAIRS_VALUES: Dict[str, int] = {pair: i for i, pair in enumerate(ALPHABET_PAIRS)}
 
     # Block decoded maximum length in bytes
     BLOCK_DEC_MAX_BYTE_LEN: int = 8
@@ -45,6 +51,8 @@ class Base58XmrEncoder:
     """
     Base58 Monero encoder class.
     It provides methods for encoding to Base58 format with Monero variation (encoding by blocks of 8-byte).
+    Each block is converted to a fixed number of digits two at a time, without going through a generic Base58
+    encoding and padding.
     """
 
     @staticmethod
@@ -58,42 +66,59 @@ class Base58XmrEncoder:
         Returns:
             str: Encoded string
         """
-        enc = ""
+        alphabet = Base58XmrConst.ALPHABET
+        alphabet_pairs = Base58XmrConst.ALPHABET_PAIRS
+        radix_sqr = Base58Const.RADIX_SQUARED
 
         # Get lengths
         data_len = len(data_bytes)
         block_dec_len = Base58XmrConst.BLOCK_DEC_MAX_BYTE_LEN
-
-        # Compute total block count and last block length
-        tot_block_cnt, last_block_enc_len = divmod(data_len, block_dec_len)
-
-        # Encode each single block and pad
-        for i in range(tot_block_cnt):
-            block_enc = Base58Encoder.Encode(data_bytes[i * block_dec_len:(i + 1) * block_dec_len])
-            enc += Base58XmrEncoder.__Pad(block_enc, Base58XmrConst.BLOCK_ENC_MAX_BYTE_LEN)
-
-        # Encode last block and pad
-        if last_block_enc_len > 0:
-            block_enc = Base58Encoder.Encode(
-                data_bytes[tot_block_cnt * block_dec_len:(tot_block_cnt * block_dec_len) + last_block_enc_len])
-            enc += Base58XmrEncoder.__Pad(block_enc, Base58XmrConst.BLOCK_ENC_BYTE_LENS[last_block_enc_len])
-
-        return enc
+        full_blocks_len = data_len - (data_len % block_dec_len)
+
+        # Encode each full block (8 bytes are always 11 digits, i.e. 1 digit and 5 pairs)
+        enc = []
+        for i in range(0, full_blocks_len, block_dec_len):
+            block_val, pair_0 = divmod(int.from_bytes(data_bytes[i:i + block_dec_len], "big"), radix_sqr)
+            block_val, pair_1 = divmod(block_val, radix_sqr)
+            block_val, pair_2 = divmod(block_val, radix_sqr)
+            block_val, pair_3 = divmod(block_val, radix_sqr)
+            block_val, pair_4 = divmod(block_val, radix_sqr)
+            enc.append(alphabet[block_val]
+                       + alphabet_pairs[pair_4]
+                       + alphabet_pairs[pair_3]
+                       + alphabet_pairs[pair_2]
+                       + alphabet_pairs[pair_1]
+                       + alphabet_pairs[pair_0])
+
+        # Encode last block
+        if full_blocks_len < data_len:
+            enc.append(
+                Base58XmrEncoder.__EncodeBlock(int.from_bytes(data_bytes[full_blocks_len:], "big"),
+                                               Base58XmrConst.BLOCK_ENC_BYTE_LENS[data_len - full_blocks_len])
+            )
+
+        return "".join(enc)
 
     @staticmethod
-    def __Pad(enc_str: str,
-              pad_len: int) -> str:
+    def __EncodeBlock(block_val: int,
+                      enc_len: int) -> str:
         """
-        Pad the encoded string to the specified length.
+        Encode a block value to the specified number of digits.
 
         Args:
-            enc_str (str): Encoded string
-            pad_len (int): Pad length
+            block_val (int): Block value
+            enc_len (int)  : Encoded length
 
         Returns:
-            str: Padded string
+            str: Encoded block
         """
-        return enc_str.rjust(pad_len, Base58XmrConst.ALPHABET[0])
+        enc = []
+        for _ in range(enc_len // 2):
+            block_val, pair = divmod(block_val, Base58Const.RADIX_SQUARED)
+            enc.append(Base58XmrConst.ALPHABET_PAIRS[pair])
+        if enc_len % 2 != 0:
+            enc.append(Base58XmrConst.ALPHABET[block_val])
+        return "".join(reversed(enc))
 
 
 class Base58XmrDecoder:
@@ -112,44 +137,85 @@ class Base58XmrDecoder:
 
         Returns:
             bytes: Decoded bytes
+
+        Raises:
+            ValueError: If the string is not valid
         """
-        dec = b""
+        alphabet_values = Base58XmrConst.ALPHABET_VALUES
+        alphabet_pairs_values = Base58XmrConst.ALPHABET_PAIRS_VALUES
+        radix_sqr = Base58Const.RADIX_SQUARED
 
         # Get lengths
         data_len = len(data_str)
         block_dec_len = Base58XmrConst.BLOCK_DEC_MAX_BYTE_LEN
         block_enc_len = Base58XmrConst.BLOCK_ENC_MAX_BYTE_LEN
-
-        # Compute block count and last block length
-        tot_block_cnt, last_block_enc_len = divmod(data_len, block_enc_len)
+        full_blocks_len = data_len - (data_len % block_enc_len)
 
         # Get last block decoded length
+        last_block_enc_len = data_len - full_blocks_len
+        if last_block_enc_len not in Base58XmrConst.BLOCK_ENC_BYTE_LENS:
+            raise ValueError(f"Invalid string length ({data_len})")
         last_block_dec_len = Base58XmrConst.BLOCK_ENC_BYTE_LENS.index(last_block_enc_len)
 
-        # Decode each single block and unpad
-        for i in range(tot_block_cnt):
-            block_dec = Base58Decoder.Decode(data_str[(i * block_enc_len):((i + 1) * block_enc_len)])
-            dec += Base58XmrDecoder.__UnPad(block_dec, block_dec_len)
+        dec = []
+        try:
+            # Decode each full block (11 digits, i.e. 1 digit and 5 pairs)
+            for i in range(0, full_blocks_len, block_enc_len):
+                block_val = (((((alphabet_values[data_str[i]] * radix_sqr
+                                 + alphabet_pairs_values[data_str[i + 1:i + 3]]) * radix_sqr
+                                + alphabet_pairs_values[data_str[i + 3:i + 5]]) * radix_sqr
+                               + alphabet_pairs_values[data_str[i + 5:i + 7]]) * radix_sqr
+                              + alphabet_pairs_values[data_str[i + 7:i + 9]]) * radix_sqr
+                             + alphabet_pairs_values[data_str[i + 9:i + 11]])
+                dec.append(Base58XmrDecoder.__BlockToBytes(block_val, block_dec_len))
+
+            # Decode last block
+            if last_block_dec_len > 0:
+                dec.append(
+                    Base58XmrDecoder.__BlockToBytes(Base58XmrDecoder.__DecodeBlock(data_str[full_blocks_len:]),
+                                                    last_block_dec_len)
+                )
+        except KeyError as ex:
+            raise ValueError(f"Invalid Base58 character ({ex.args[0]!r})") from ex
+
+        return b"".join(dec)
+
+    @staticmethod
+    def __DecodeBlock(block_str: str) -> int:
+        """
+        Decode a block to its value.
 
-        # Decode last block and unpad
-        if last_block_enc_len > 0:
-            block_dec = Base58Decoder.Decode(
-                data_str[(tot_block_cnt * block_enc_len):((tot_block_cnt * block_enc_len) + last_block_enc_len)])
-            dec += Base58XmrDecoder.__UnPad(block_dec, last_block_dec_len)
+        Args:
+            block_str (str): Block string
 
-        return dec
+        Returns:
+            int: Block value
+
+        Raises:
+            KeyError: If the block contains invalid characters
+        """
+        start_idx = len(block_str) % 2
+        block_val = Base58XmrConst.ALPHABET_VALUES[block_str[0]] if start_idx != 0 else 0
+        for i in range(start_idx, len(block_str), 2):
+            block_val = block_val * Base58Const.RADIX_SQUARED + Base58XmrConst.ALPHABET_PAIRS_VALUES[block_str[i:i + 2]]
+        return block_val
 
     @staticmethod
-    def __UnPad(dec_bytes: bytes,
-                unpad_len: int) -> bytes:
+    def __BlockToBytes(block_val: int,
+                       dec_len: int) -> bytes:
         """
-        Unpad the decoded string to the specified length.
+        Convert a block value to bytes.
 
         Args:
-            dec_bytes (bytes): Decoded bytes
-            unpad_len (int): Unpad length
+            block_val (int): Block value
+            dec_len (int)  : Decoded length
 
         Returns:
-            bytes: Unpadded string
+            bytes: Block bytes
+
+        Raises:
+            ValueError: If the block value overflows the decoded length
         """
-        return dec_bytes[len(dec_bytes) - unpad_len:len(dec_bytes)]
+        if block_val >> (dec_len * 8) != 0:
+            raise ValueError("Invalid block value (overflow)")
+        return block_val.to_bytes(dec_len, "big")
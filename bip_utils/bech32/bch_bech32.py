@@ -24,6 +24,7 @@ Reference: https://github.com/bitcoincashorg/bitcoincash.org/blob/master/spec/ca
 """
 
 # Imports
+from functools import lru_cache
 from typing import List, Tuple
 
 from bip_utils.bech32.bech32_base import Bech32BaseUtils, Bech32DecoderBase, Bech32EncoderBase
@@ -37,6 +38,18 @@ class BchBech32Const:
     SEPARATOR: str = ":"
     # Checksum length
     CHECKSUM_STR_LEN: int = 8
+    # Generator polynomial values, indexed by the top 5 bits of the modulus (i.e. XOR of the generator values
+    # corresponding to each bit)
+    GENERATOR_TABLE: Tuple[int, ...] = (
+        0x0000000000, 0x98f2bc8e61, 0x79b76d99e2, 0xe145d11783,
+        0xf33e5fb3c4, 0x6bcce33da5, 0x8a89322a26, 0x127b8ea447,
+        0xae2eabe2a8, 0x36dc176cc9, 0xd799c67b4a, 0x4f6b7af52b,
+        0x5d10f4516c, 0xc5e248df0d, 0x24a799c88e, 0xbc552546ef,
+        0x1e4f43e470, 0x86bdff6a11, 0x67f82e7d92, 0xff0a92f3f3,
+        0xed711c57b4, 0x7583a0d9d5, 0x94c671ce56, 0x0c34cd4037,
+        0xb061e806d8, 0x28935488b9, 0xc9d6859f3a, 0x512439115b,
+        0x435fb7b51c, 0xdbad0b3b7d, 0x3ae8da2cfe, 0xa21a66a29f,
+    )
 
 
 class BchBech32Utils:
@@ -53,25 +66,41 @@ class BchBech32Utils:
         Returns:
             int: Computed modulus
         """
+        return BchBech32Utils.PolyModUpdate(1, values) ^ 1
 
-        # Generator polynomial
-        generator = [
-            (0x01, 0x98f2bc8e61),
-            (0x02, 0x79b76d99e2),
-            (0x04, 0xf33e5fb3c4),
-            (0x08, 0xae2eabe2a8),
-            (0x10, 0x1e4f43e470)
-        ]
-        # Compute modulus
-        chk = 1
+    @staticmethod
+    def PolyModUpdate(chk: int,
+                      values: List[int]) -> int:
+        """
+        Update the polynomial modulus state with the specified values.
+        The final modulus is the returned state XOR 1.
+
+        Args:
+            chk (int)         : Current state (1 for the initial one)
+            values (list[int]): List of polynomial coefficients
+
+        Returns:
+            int: Updated state
+        """
+        generator_table = BchBech32Const.GENERATOR_TABLE
         for value in values:
-            top = chk >> 35
-            chk = ((chk & 0x07ffffffff) << 5) ^ value
-            for i in generator:
-                if top & i[0] != 0:
-                    chk ^= i[1]
+            chk = ((chk & 0x07ffffffff) << 5) ^ value ^ generator_table[chk >> 35]
+        return chk
 
-        return chk ^ 1
+    @staticmethod
+    @lru_cache()
+    def HrpPolyModState(hrp: str) -> int:
+        """
+        Get the polynomial modulus state after the expanded HRP values.
+        States are cached, so the HRP is processed only once.
+
+        Args:
+            hrp (str): HRP
+
+        Returns:
+            int: Polynomial modulus state
+        """
+        return BchBech32Utils.PolyModUpdate(1, BchBech32Utils.HrpExpand(hrp))
 
     @staticmethod
     def HrpExpand(hrp: str) -> List[int]:
@@ -100,8 +129,8 @@ class BchBech32Utils:
         Returns:
             list[int]: Computed checksum
         """
-        values = BchBech32Utils.HrpExpand(hrp) + data
-        polymod = BchBech32Utils.PolyMod(values + [0, 0, 0, 0, 0, 0, 0, 0])
+        polymod = BchBech32Utils.PolyModUpdate(BchBech32Utils.HrpPolyModState(hrp),
+                                               data + [0, 0, 0, 0, 0, 0, 0, 0]) ^ 1
         return [(polymod >> 5 * (7 - i)) & 0x1f for i in range(BchBech32Const.CHECKSUM_STR_LEN)]
 
     @staticmethod
@@ -117,7 +146,7 @@ class BchBech32Utils:
         Returns:
             bool: True if valid, false otherwise
         """
-        return BchBech32Utils.PolyMod(BchBech32Utils.HrpExpand(hrp) + data) == 0
+        return BchBech32Utils.PolyModUpdate(BchBech32Utils.HrpPolyModState(hrp), data) == 1
 
 
 class BchBech32Encoder(Bech32EncoderBase):
@@ -29,7 +29,7 @@ References:
 
 # Imports
 from enum import Enum, auto, unique
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from bip_utils.bech32.bech32_base import Bech32BaseUtils, Bech32DecoderBase, Bech32EncoderBase
 from bip_utils.utils.misc import BytesUtils
@@ -55,6 +55,18 @@ class Bech32Const:
         Bech32Encodings.BECH32: 1,
         Bech32Encodings.BECH32M: 0x2bc830a3,
     }
+    # Generator polynomial values, indexed by the top 5 bits of the modulus (i.e. XOR of the generator values
+    # corresponding to each bit, generator: 0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3)
+    GENERATOR_TABLE: Tuple[int, ...] = (
+        0x00000000, 0x3b6a57b2, 0x26508e6d, 0x1d3ad9df,
+        0x1ea119fa, 0x25cb4e48, 0x38f19797, 0x039bc025,
+        0x3d4233dd, 0x0628646f, 0x1b12bdb0, 0x2078ea02,
+        0x23e32a27, 0x18897d95, 0x05b3a44a, 0x3ed9f3f8,
+        0x2a1462b3, 0x117e3501, 0x0c44ecde, 0x372ebb6c,
+        0x34b57b49, 0x0fdf2cfb, 0x12e5f524, 0x298fa296,
+        0x1756516e, 0x2c3c06dc, 0x3106df03, 0x0a6c88b1,
+        0x09f74894, 0x329d1f26, 0x2fa7c6f9, 0x14cd914b,
+    )
 
 
 class Bech32Utils:
@@ -71,17 +83,12 @@ class Bech32Utils:
         Returns:
             int: Computed modulus
         """
+        generator_table = Bech32Const.GENERATOR_TABLE
 
-        # Generator polynomial
-        generator = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
-
-        # Compute modulus
+        # Compute modulus (the generator values for the top bits are looked up instead of XORed one by one)
         chk = 1
         for value in values:
-            top = chk >> 25
-            chk = (chk & 0x1ffffff) << 5 ^ value
-            for i in range(5):
-                chk ^= generator[i] if ((top >> i) & 1) else 0
+            chk = ((chk & 0x1ffffff) << 5 ^ value) ^ generator_table[chk >> 25]
         return chk
 
     @staticmethod
@@ -22,7 +22,7 @@
 
 # Imports
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from bip_utils.bech32.bech32_ex import Bech32ChecksumError
 from bip_utils.utils.misc import AlgoUtils
@@ -33,6 +33,8 @@ class Bech32BaseConst:
 
     # Character set
     CHARSET: str = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+    # Character set values, indexed by character
+    CHARSET_VALUES: Dict[str, int] = {c: i for i, c in enumerate(CHARSET)}
 
 
 class Bech32BaseUtils:
@@ -217,14 +219,16 @@ class Bech32DecoderBase(ABC):
         if len(hrp) == 0 or any(ord(x) < 33 or ord(x) > 126 for x in hrp):
             raise ValueError(f"Invalid bech32 format (HRP not valid: {hrp})")
 
-        # Get data and check it
+        # Get data, check it and convert back from alphabet
         data_part = bech_str[sep_pos + 1:]
-        if (len(data_part) < (checksum_len + 1)
-                or not all(x in Bech32BaseConst.CHARSET for x in data_part)):
+        if len(data_part) < (checksum_len + 1):
             raise ValueError("Invalid bech32 format (data part not valid)")
+        try:
+            int_data = [Bech32BaseConst.CHARSET_VALUES[x] for x in data_part]
+        except KeyError as ex:
+            raise ValueError("Invalid bech32 format (data part not valid)") from ex
 
-        # Convert back from alphabet and verify checksum
-        int_data = [Bech32BaseConst.CHARSET.find(x) for x in data_part]
+        # Verify checksum
         if not cls._VerifyChecksum(hrp, int_data):
             raise Bech32ChecksumError("Invalid bech32 checksum")
 
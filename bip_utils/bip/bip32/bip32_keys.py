@@ -24,7 +24,6 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from functools import lru_cache
 from typing import Union
 
 from bip_utils.bip.bip32.bip32_ex import Bip32KeyError
@@ -33,7 +32,7 @@ from bip_utils.bip.bip32.bip32_key_net_ver import Bip32KeyNetVersions
 from bip_utils.bip.bip32.bip32_key_ser import Bip32PrivateKeySerializer, Bip32PublicKeySerializer
 from bip_utils.ecc import EllipticCurve, EllipticCurveGetter, EllipticCurveTypes, IPoint, IPrivateKey, IPublicKey
 from bip_utils.utils.crypto import Hash160
-from bip_utils.utils.misc import DataBytes
+from bip_utils.utils.misc import DataBytes, MemoUtils
 
 
 class _Bip32KeyBase(ABC):
@@ -217,7 +216,7 @@ class Bip32PublicKey(_Bip32KeyBase):
         """
         return self.m_pub_key
 
-    @lru_cache()
+    @MemoUtils.CachedMethod
     def RawCompressed(self) -> DataBytes:
         """
         Return raw compressed public key.
@@ -227,7 +226,7 @@ class Bip32PublicKey(_Bip32KeyBase):
         """
         return self.m_pub_key.RawCompressed()
 
-    @lru_cache()
+    @MemoUtils.CachedMethod
     def RawUncompressed(self) -> DataBytes:
         """
         Return raw uncompressed public key.
@@ -237,6 +236,7 @@ class Bip32PublicKey(_Bip32KeyBase):
         """
         return self.m_pub_key.RawUncompressed()
 
+    @MemoUtils.CachedMethod
     def Point(self) -> IPoint:
         """
         Get public key point.
@@ -246,7 +246,7 @@ class Bip32PublicKey(_Bip32KeyBase):
         """
         return self.m_pub_key.Point()
 
-    @lru_cache()
+    @MemoUtils.CachedMethod
     def FingerPrint(self) -> Bip32FingerPrint:
         """
         Get key fingerprint.
@@ -256,7 +256,7 @@ class Bip32PublicKey(_Bip32KeyBase):
         """
         return Bip32FingerPrint(self.KeyIdentifier())
 
-    @lru_cache()
+    @MemoUtils.CachedMethod
     def KeyIdentifier(self) -> bytes:
         """
         Get key identifier.
@@ -266,7 +266,7 @@ class Bip32PublicKey(_Bip32KeyBase):
         """
         return Hash160.QuickDigest(self.m_pub_key.RawCompressed().ToBytes())
 
-    @lru_cache()
+    @MemoUtils.CachedMethod
     def ToExtended(self) -> str:
         """
         Return key in serialized extended format.
@@ -400,7 +400,7 @@ class Bip32PrivateKey(_Bip32KeyBase):
         """
         return self.m_priv_key
 
-    @lru_cache()
+    @MemoUtils.CachedMethod
     def Raw(self) -> DataBytes:
         """
         Return raw private key.
@@ -410,7 +410,7 @@ class Bip32PrivateKey(_Bip32KeyBase):
         """
         return self.m_priv_key.Raw()
 
-    @lru_cache()
+    @MemoUtils.CachedMethod
     def PublicKey(self) -> Bip32PublicKey:
         """
         Get the public key correspondent to the private one.
@@ -422,7 +422,7 @@ class Bip32PrivateKey(_Bip32KeyBase):
                               self.m_key_data,
                               self.m_key_net_ver)
 
-    @lru_cache()
+    @MemoUtils.CachedMethod
     def ToExtended(self) -> str:
         """
         Return key in serialized extended format.
@@ -1,3 +1,7 @@
 from bip_utils.bip.bip38.bip38 import Bip38Decrypter, Bip38Encrypter
 from bip_utils.bip.bip38.bip38_addr import Bip38PubKeyModes
+from bip_utils.bip.bip38.bip38_candidates import (
+    Bip38MaskCandidates, Bip38MutationCandidates, Bip38MutationRules, Bip38WordlistCandidates, IBip38CandidatesGenerator
+)
 from bip_utils.bip.bip38.bip38_ec import Bip38EcKeysGenerator
+from bip_utils.bip.bip38.bip38_recovery import Bip38PassphraseRecovery, Bip38RecoveryResult
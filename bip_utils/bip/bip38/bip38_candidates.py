@@ -0,0 +1,409 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module with passphrase candidates generators for BIP38 passphrase recovery."""
+
+# Imports
+from __future__ import annotations
+
+import itertools
+import string
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+
+class Bip38CandidatesConst:
+    """Class container for BIP38 candidates constants."""
+
+    # Mask placeholder character
+    MASK_PLACEHOLDER_CHAR: str = "?"
+    # Mask charsets
+    MASK_CHARSETS: Dict[str, str] = {
+        "l": string.ascii_lowercase,
+        "u": string.ascii_uppercase,
+        "d": string.digits,
+        "s": " " + string.punctuation,
+        "a": string.ascii_lowercase + string.ascii_uppercase + string.digits + " " + string.punctuation,
+    }
+
+    # Leet substitutions
+    LEET_SUBST: Dict[int, str] = str.maketrans({
+        "a": "4", "A": "4",
+        "e": "3", "E": "3",
+        "i": "1", "I": "1",
+        "o": "0", "O": "0",
+        "s": "5", "S": "5",
+        "t": "7", "T": "7",
+    })
+
+
+class IBip38CandidatesGenerator(ABC):
+    """
+    BIP38 candidates generator interface.
+    A candidates generator shall always generate the same candidates in the same order, so that a recovery can be
+    resumed by skipping the candidates already tested.
+    """
+
+    @abstractmethod
+    def Count(self) -> Optional[int]:
+        """
+        Get the number of candidates, if known in advance.
+
+        Returns:
+            int: Number of candidates, None if unknown
+        """
+
+    @abstractmethod
+    def Generate(self) -> Iterator[str]:
+        """
+        Generate candidates.
+
+        Returns:
+            Iterator[str]: Candidates iterator
+        """
+
+
+class Bip38WordlistCandidates(IBip38CandidatesGenerator):
+    """
+    BIP38 wordlist candidates class.
+    It generates candidates from a list of words or a file (one candidate per line), which is read lazily.
+    """
+
+    m_words: Optional[Sequence[str]]
+    m_file_path: Optional[str]
+
+    def __init__(self,
+                 words: Sequence[str]) -> None:
+        """
+        Construct class.
+
+        Args:
+            words (list[str]): Words list
+        """
+        self.m_words = words
+        self.m_file_path = None
+
+    @classmethod
+    def FromFile(cls,
+                 file_path: str) -> Bip38WordlistCandidates:
+        """
+        Construct class from a file, containing one candidate per line.
+
+        Args:
+            file_path (str): File path
+
+        Returns:
+            Bip38WordlistCandidates object: Bip38WordlistCandidates object
+        """
+        obj = cls([])
+        obj.m_words = None
+        obj.m_file_path = file_path
+        return obj
+
+    def Count(self) -> Optional[int]:
+        """
+        Get the number of candidates, if known in advance.
+
+        Returns:
+            int: Number of candidates, None if unknown (i.e. when reading from file)
+        """
+        return len(self.m_words) if self.m_words is not None else None
+
+    def Generate(self) -> Iterator[str]:
+        """
+        Generate candidates.
+
+        Returns:
+            Iterator[str]: Candidates iterator
+        """
+        if self.m_words is not None:
+            yield from self.m_words
+        else:
+            # Type is checked by construction
+            with open(self.m_file_path, "r", encoding="utf-8") as fin:  # type: ignore
+                for line in fin:
+                    yield line.rstrip("\r\n")
+
+
+class Bip38MaskCandidates(IBip38CandidatesGenerator):
+    """
+    BIP38 mask candidates class.
+    It generates candidates from a mask, where each position is either a literal character or a placeholder
+    for a charset: ?l (lowercase letters), ?u (uppercase letters), ?d (digits), ?s (space and symbols),
+    ?a (all the previous ones), ?? (literal "?"). Custom charsets can be specified too (e.g. ?1, ?2, ...).
+    """
+
+    m_charsets: List[str]
+
+    def __init__(self,
+                 mask: str,
+                 custom_charsets: Optional[Dict[str, str]] = None) -> None:
+        """
+        Construct class.
+
+        Args:
+            mask (str)                            : Mask
+            custom_charsets (dict[str, str], opt.): Custom charsets, indexed by placeholder character
+
+        Raises:
+            ValueError: If the mask is not valid
+        """
+        self.m_charsets = self.__ParseMask(mask, custom_charsets or {})
+
+    def Count(self) -> Optional[int]:
+        """
+        Get the number of candidates, if known in advance.
+
+        Returns:
+            int: Number of candidates
+        """
+        count = 1
+        for charset in self.m_charsets:
+            count *= len(charset)
+        return count
+
+    def Generate(self) -> Iterator[str]:
+        """
+        Generate candidates.
+
+        Returns:
+            Iterator[str]: Candidates iterator
+        """
+        for chars in itertools.product(*self.m_charsets):
+            yield "".join(chars)
+
+    @staticmethod
+    def __ParseMask(mask: str,
+                    custom_charsets: Dict[str, str]) -> List[str]:
+        """
+        Parse a mask.
+
+        Args:
+            mask (str)                      : Mask
+            custom_charsets (dict[str, str]): Custom charsets
+
+        Returns:
+            list[str]: Charset for each position
+
+        Raises:
+            ValueError: If the mask is not valid
+        """
+        charsets = []
+
+        i = 0
+        while i < len(mask):
+            if mask[i] != Bip38CandidatesConst.MASK_PLACEHOLDER_CHAR:
+                charsets.append(mask[i])
+                i += 1
+                continue
+
+            if i + 1 >= len(mask):
+                raise ValueError("Invalid mask (incomplete placeholder)")
+
+            placeholder = mask[i + 1]
+            if placeholder == Bip38CandidatesConst.MASK_PLACEHOLDER_CHAR:
+                charsets.append(Bip38CandidatesConst.MASK_PLACEHOLDER_CHAR)
+            elif placeholder in custom_charsets:
+                charsets.append(custom_charsets[placeholder])
+            elif placeholder in Bip38CandidatesConst.MASK_CHARSETS:
+                charsets.append(Bip38CandidatesConst.MASK_CHARSETS[placeholder])
+            else:
+                raise ValueError(f"Invalid mask placeholder ({placeholder})")
+            i += 2
+
+        return charsets
+
+
+class Bip38MutationRules:
+    """
+    BIP38 mutation rules class.
+    It contains some common mutation rules that can be used with Bip38MutationCandidates.
+    A rule is a function that takes a candidate and returns the mutated candidates.
+    """
+
+    @staticmethod
+    def Identity(candidate: str) -> Iterable[str]:
+        """
+        Candidate as it is.
+
+        Args:
+            candidate (str): Candidate
+
+        Returns:
+            Iterable[str]: Mutated candidates
+        """
+        return (candidate,)
+
+    @staticmethod
+    def Lower(candidate: str) -> Iterable[str]:
+        """
+        Candidate in lowercase.
+
+        Args:
+            candidate (str): Candidate
+
+        Returns:
+            Iterable[str]: Mutated candidates
+        """
+        return (candidate.lower(),)
+
+    @staticmethod
+    def Upper(candidate: str) -> Iterable[str]:
+        """
+        Candidate in uppercase.
+
+        Args:
+            candidate (str): Candidate
+
+        Returns:
+            Iterable[str]: Mutated candidates
+        """
+        return (candidate.upper(),)
+
+    @staticmethod
+    def Capitalize(candidate: str) -> Iterable[str]:
+        """
+        Candidate with the first letter capitalized.
+
+        Args:
+            candidate (str): Candidate
+
+        Returns:
+            Iterable[str]: Mutated candidates
+        """
+        return (candidate.capitalize(),)
+
+    @staticmethod
+    def SwapCase(candidate: str) -> Iterable[str]:
+        """
+        Candidate with swapped case.
+
+        Args:
+            candidate (str): Candidate
+
+        Returns:
+            Iterable[str]: Mutated candidates
+        """
+        return (candidate.swapcase(),)
+
+    @staticmethod
+    def Reverse(candidate: str) -> Iterable[str]:
+        """
+        Candidate reversed.
+
+        Args:
+            candidate (str): Candidate
+
+        Returns:
+            Iterable[str]: Mutated candidates
+        """
+        return (candidate[::-1],)
+
+    @staticmethod
+    def Leet(candidate: str) -> Iterable[str]:
+        """
+        Candidate with leet substitutions (e.g. a -> 4, e -> 3, ...).
+
+        Args:
+            candidate (str): Candidate
+
+        Returns:
+            Iterable[str]: Mutated candidates
+        """
+        return (candidate.translate(Bip38CandidatesConst.LEET_SUBST),)
+
+    @staticmethod
+    def AppendDigit(candidate: str) -> Iterable[str]:
+        """
+        Candidate with a digit appended (0-9).
+
+        Args:
+            candidate (str): Candidate
+
+        Returns:
+            Iterable[str]: Mutated candidates
+        """
+        return (candidate + d for d in string.digits)
+
+    @staticmethod
+    def PrependDigit(candidate: str) -> Iterable[str]:
+        """
+        Candidate with a digit prepended (0-9).
+
+        Args:
+            candidate (str): Candidate
+
+        Returns:
+            Iterable[str]: Mutated candidates
+        """
+        return (d + candidate for d in string.digits)
+
+
+class Bip38MutationCandidates(IBip38CandidatesGenerator):
+    """
+    BIP38 mutation candidates class.
+    It generates candidates by applying mutation rules to the candidates of another generator.
+    Duplicated candidates coming from the same base candidate are skipped.
+    """
+
+    m_base_gen: IBip38CandidatesGenerator
+    m_rules: Sequence[Callable[[str], Iterable[str]]]
+
+    def __init__(self,
+                 base_gen: IBip38CandidatesGenerator,
+                 rules: Sequence[Callable[[str], Iterable[str]]]) -> None:
+        """
+        Construct class.
+
+        Args:
+            base_gen (IBip38CandidatesGenerator object): Base candidates generator
+            rules (list[function])                     : Mutation rules (see Bip38MutationRules)
+
+        Raises:
+            ValueError: If no rule is specified
+        """
+        if len(rules) == 0:
+            raise ValueError("At least one mutation rule shall be specified")
+        self.m_base_gen = base_gen
+        self.m_rules = rules
+
+    def Count(self) -> Optional[int]:
+        """
+        Get the number of candidates, if known in advance.
+
+        Returns:
+            int: Number of candidates, None if unknown
+        """
+        return None
+
+    def Generate(self) -> Iterator[str]:
+        """
+        Generate candidates.
+
+        Returns:
+            Iterator[str]: Candidates iterator
+        """
+        for base_candidate in self.m_base_gen.Generate():
+            generated = set()
+            for rule in self.m_rules:
+                for candidate in rule(base_candidate):
+                    if candidate not in generated:
+                        generated.add(candidate)
+                        yield candidate
@@ -24,14 +24,16 @@ Reference: https://github.com/bitcoin/bips/blob/master/bip-0038.mediawiki
 """
 
 # Imports
+from __future__ import annotations
+
 import os
-from typing import Optional, Tuple
+from typing import Iterator, List, NamedTuple, Optional, Tuple
 
 from bip_utils.base58 import Base58Decoder, Base58Encoder
 from bip_utils.bip.bip38.bip38_addr import Bip38Addr, Bip38PubKeyModes
-from bip_utils.ecc import Secp256k1, Secp256k1PrivateKey, Secp256k1PublicKey
+from bip_utils.ecc import IPublicKey, Secp256k1, Secp256k1PrivateKey, Secp256k1PublicKey
 from bip_utils.utils.crypto import AesEcbDecrypter, AesEcbEncrypter, DoubleSha256, Scrypt
-from bip_utils.utils.misc import BitUtils, BytesUtils, IntegerUtils, StringUtils
+from bip_utils.utils.misc import BitUtils, BytesUtils, IntegerUtils, ParallelUtils, StringUtils
 
 
 class Bip38EcConst:
@@ -56,6 +58,8 @@ class Bip38EcConst:
 
     # Seedb byte length
     SEED_B_BYTE_LEN: int = 24
+    # Default number of keys generated by a worker at once
+    GEN_KEYS_CHUNK_SIZE: int = 256
 
     # Encrypted length
     ENC_BYTE_LEN: int = 39
@@ -219,58 +223,19 @@ class _Bip38EcUtils:
         return derived_half_1, derived_half_2
 
 
-class Bip38EcKeysGenerator:
-    """
-    BIP38 keys generator class.
-    It generates intermediate codes and private keys using the algorithm specified in BIP38 with EC multiplication.
-    """
-
-    @staticmethod
-    def GenerateIntermediatePassphrase(passphrase: str,
-                                       lot_num: Optional[int] = None,
-                                       sequence_num: Optional[int] = None) -> str:
-        """
-        Generate an intermediate passphrase from the user passphrase as specified in BIP38.
-
-        Args:
-            passphrase (str)            : Passphrase
-            lot_num (int, optional)     : Lot number
-            sequence_num (int, optional): Sequence number
-
-        Returns:
-            str: Intermediate passphrase encoded in base58
-        """
-
-        # Get if lot and sequence are used
-        has_lot_seq = lot_num is not None and sequence_num is not None
-
-        # Compute owner entropy and salt
-        # We can ignore the mypy warning because has_lot_seq checks for variables for being not None
-        owner_entropy = (_Bip38EcUtils.OwnerEntropyWithLotSeq(lot_num, sequence_num)    # type: ignore
-                         if has_lot_seq
-                         else _Bip38EcUtils.OwnerEntropyNoLotSeq())
-        # Compute passpoint
-        passfactor = _Bip38EcUtils.PassFactor(passphrase, owner_entropy, has_lot_seq)
-        passpoint = _Bip38EcUtils.PassPoint(passfactor)
-
-        # Get magic
-        magic = Bip38EcConst.INT_PASS_MAGIC_WITH_LOT_SEQ if has_lot_seq else Bip38EcConst.INT_PASS_MAGIC_NO_LOT_SEQ
-
-        # Build and encode intermediate passphrase
-        return Base58Encoder.CheckEncode(magic + owner_entropy + passpoint)
+class _Bip38EcKeysGeneratorUtils:
+    """Class container for BIP38 EC keys generator utility functions."""
 
     @staticmethod
-    def GeneratePrivateKey(int_passphrase: str,
-                           pub_key_mode: Bip38PubKeyModes) -> str:
+    def DecodeIntermediatePassphrase(int_passphrase: str) -> Tuple[bytes, bytes, IPublicKey]:
         """
-        Generate a random encrypted private key from the intermediate passphrase.
+        Decode an intermediate passphrase.
 
         Args:
-            int_passphrase (str)           : Intermediate passphrase
-            pub_key_mode (Bip38PubKeyModes): Public key mode
+            int_passphrase (str): Intermediate passphrase
 
         Returns:
-            str: Encrypted private key
+            tuple[bytes, bytes, IPublicKey]: Magic (index 0), owner entropy (index 1), passpoint (index 2)
 
         Raises:
             Base58ChecksumError: If base58 checksum is not valid
@@ -293,8 +258,28 @@ class Bip38EcKeysGenerator:
         if magic not in (Bip38EcConst.INT_PASS_MAGIC_NO_LOT_SEQ, Bip38EcConst.INT_PASS_MAGIC_WITH_LOT_SEQ):
             raise ValueError(f"Invalid magic ({BytesUtils.ToHexString(magic)})")
 
-        # Generate seedb
-        seedb = os.urandom(Bip38EcConst.SEED_B_BYTE_LEN)
+        return magic, owner_entropy, passpoint
+
+    @staticmethod
+    def GeneratePrivateKey(magic: bytes,
+                           owner_entropy: bytes,
+                           passpoint: IPublicKey,
+                           seedb: bytes,
+                           pub_key_mode: Bip38PubKeyModes) -> str:
+        """
+        Generate an encrypted private key from the decoded intermediate passphrase and seedb.
+
+        Args:
+            magic (bytes)                  : Magic
+            owner_entropy (bytes)          : Owner entropy
+            passpoint (IPublicKey object)  : Passpoint
+            seedb (bytes)                  : Seedb
+            pub_key_mode (Bip38PubKeyModes): Public key mode
+
+        Returns:
+            str: Encrypted private key
+        """
+
         # Compute factorb from seedb
         factorb = DoubleSha256.QuickDigest(seedb)
 
@@ -308,12 +293,12 @@ class Bip38EcKeysGenerator:
                                                                        address_hash,
                                                                        owner_entropy)
         # Encrypt seedb in two parts
-        encrypted_part_1, encrypted_part_2 = Bip38EcKeysGenerator.__EncryptSeedb(seedb,
-                                                                                 derived_half_1,
-                                                                                 derived_half_2)
+        encrypted_part_1, encrypted_part_2 = _Bip38EcKeysGeneratorUtils.EncryptSeedb(seedb,
+                                                                                     derived_half_1,
+                                                                                     derived_half_2)
 
         # Get flagbyte by setting bits
-        flagbyte = Bip38EcKeysGenerator.__SetFlagbyteBits(magic, pub_key_mode)
+        flagbyte = _Bip38EcKeysGeneratorUtils.SetFlagbyteBits(magic, pub_key_mode)
         # Concatenate all parts
         enc_key_bytes = (Bip38EcConst.ENC_KEY_PREFIX + flagbyte + address_hash
                          + owner_entropy + encrypted_part_1[:8] + encrypted_part_2)
@@ -322,9 +307,54 @@ class Bip38EcKeysGenerator:
         return Base58Encoder.CheckEncode(enc_key_bytes)
 
     @staticmethod
-    def __EncryptSeedb(seedb: bytes,
-                       derived_half_1: bytes,
-                       derived_half_2: bytes) -> Tuple[bytes, bytes]:
+    def GeneratePrivateKeys(magic: bytes,
+                            owner_entropy: bytes,
+                            passpoint_bytes: bytes,
+                            pub_key_mode: Bip38PubKeyModes,
+                            seedbs: List[bytes]) -> List[str]:
+        """
+        Generate encrypted private keys from the decoded intermediate passphrase, one for each seedb.
+        The passpoint is passed as bytes, so that it can be sent to a worker process.
+
+        Args:
+            magic (bytes)                  : Magic
+            owner_entropy (bytes)          : Owner entropy
+            passpoint_bytes (bytes)        : Passpoint bytes
+            pub_key_mode (Bip38PubKeyModes): Public key mode
+            seedbs (list[bytes])           : Seedbs
+
+        Returns:
+            list[str]: Encrypted private keys
+        """
+        passpoint = Secp256k1PublicKey.FromBytes(passpoint_bytes)
+        return [
+            _Bip38EcKeysGeneratorUtils.GeneratePrivateKey(magic, owner_entropy, passpoint, seedb, pub_key_mode)
+            for seedb in seedbs
+        ]
+
+    @staticmethod
+    def GenerateSeedbs(count: int,
+                       chunk_size: int) -> Iterator[List[bytes]]:
+        """
+        Generate seedbs in chunks, reading random bytes once for each chunk.
+
+        Args:
+            count (int)     : Number of seedbs
+            chunk_size (int): Chunk size
+
+        Returns:
+            Iterator[list[bytes]]: Chunks of seedbs
+        """
+        seedb_len = Bip38EcConst.SEED_B_BYTE_LEN
+        for i in range(0, count, chunk_size):
+            seedbs_num = min(chunk_size, count - i)
+            rand_bytes = os.urandom(seedb_len * seedbs_num)
+            yield [rand_bytes[j * seedb_len:(j + 1) * seedb_len] for j in range(seedbs_num)]
+
+    @staticmethod
+    def EncryptSeedb(seedb: bytes,
+                     derived_half_1: bytes,
+                     derived_half_2: bytes) -> Tuple[bytes, bytes]:
         """
         Encrypt seedb in two parts.
 
@@ -349,8 +379,8 @@ class Bip38EcKeysGenerator:
         return encrypted_part_1, encrypted_part_2
 
     @staticmethod
-    def __SetFlagbyteBits(magic: bytes,
-                          pub_key_mode: Bip38PubKeyModes) -> bytes:
+    def SetFlagbyteBits(magic: bytes,
+                        pub_key_mode: Bip38PubKeyModes) -> bytes:
         """
         Set flagbyte bits and return it.
 
@@ -370,24 +400,165 @@ class Bip38EcKeysGenerator:
         return IntegerUtils.ToBytes(flagbyte_int)
 
 
-class Bip38EcDecrypter:
+class Bip38EcKeysGenerator:
     """
-    BIP38 decrypter class.
-    It decrypts a private key using the algorithm specified in BIP38 with EC multiplication.
+    BIP38 keys generator class.
+    It generates intermediate codes and private keys using the algorithm specified in BIP38 with EC multiplication.
     """
 
     @staticmethod
-    def Decrypt(priv_key_enc: str,  # pylint: disable=too-many-locals
-                passphrase: str) -> Tuple[bytes, Bip38PubKeyModes]:
+    def GenerateIntermediatePassphrase(passphrase: str,
+                                       lot_num: Optional[int] = None,
+                                       sequence_num: Optional[int] = None) -> str:
         """
-        Decrypt the specified private key.
+        Generate an intermediate passphrase from the user passphrase as specified in BIP38.
+
+        Args:
+            passphrase (str)            : Passphrase
+            lot_num (int, optional)     : Lot number
+            sequence_num (int, optional): Sequence number
+
+        Returns:
+            str: Intermediate passphrase encoded in base58
+        """
+
+        # Get if lot and sequence are used
+        has_lot_seq = lot_num is not None and sequence_num is not None
+
+        # Compute owner entropy and salt
+        # We can ignore the mypy warning because has_lot_seq checks for variables for being not None
+        owner_entropy = (_Bip38EcUtils.OwnerEntropyWithLotSeq(lot_num, sequence_num)    # type: ignore
+                         if has_lot_seq
+                         else _Bip38EcUtils.OwnerEntropyNoLotSeq())
+        # Compute passpoint
+        passfactor = _Bip38EcUtils.PassFactor(passphrase, owner_entropy, has_lot_seq)
+        passpoint = _Bip38EcUtils.PassPoint(passfactor)
+
+        # Get magic
+        magic = Bip38EcConst.INT_PASS_MAGIC_WITH_LOT_SEQ if has_lot_seq else Bip38EcConst.INT_PASS_MAGIC_NO_LOT_SEQ
+
+        # Build and encode intermediate passphrase
+        return Base58Encoder.CheckEncode(magic + owner_entropy + passpoint)
+
+    @staticmethod
+    def GeneratePrivateKey(int_passphrase: str,
+                           pub_key_mode: Bip38PubKeyModes) -> str:
+        """
+        Generate a random encrypted private key from the intermediate passphrase.
+
+        Args:
+            int_passphrase (str)           : Intermediate passphrase
+            pub_key_mode (Bip38PubKeyModes): Public key mode
+
+        Returns:
+            str: Encrypted private key
+
+        Raises:
+            Base58ChecksumError: If base58 checksum is not valid
+            ValueError: If the intermediate code is not valid
+        """
+        magic, owner_entropy, passpoint = _Bip38EcKeysGeneratorUtils.DecodeIntermediatePassphrase(int_passphrase)
+        return _Bip38EcKeysGeneratorUtils.GeneratePrivateKey(magic,
+                                                             owner_entropy,
+                                                             passpoint,
+                                                             os.urandom(Bip38EcConst.SEED_B_BYTE_LEN),
+                                                             pub_key_mode)
+
+    @staticmethod
+    def GeneratePrivateKeys(int_passphrase: str,  # pylint: disable=too-many-arguments
+                            count: int,
+                            pub_key_mode: Bip38PubKeyModes = Bip38PubKeyModes.COMPRESSED,
+                            workers: Optional[int] = None,
+                            chunk_size: int = Bip38EcConst.GEN_KEYS_CHUNK_SIZE) -> Iterator[str]:
+        """
+        Generate the specified number of random encrypted private keys from the same intermediate passphrase.
+        The intermediate passphrase is decoded only once and keys are generated in chunks by a pool of processes.
+
+        Args:
+            int_passphrase (str)                     : Intermediate passphrase
+            count (int)                              : Number of keys
+            pub_key_mode (Bip38PubKeyModes, optional): Public key mode
+            workers (int, optional)                  : Number of worker processes (default: CPU count),
+                                                       1 for generating keys in the current process
+            chunk_size (int, optional)               : Number of keys generated by a worker at once
+
+        Returns:
+            Iterator[str]: Encrypted private keys iterator
+
+        Raises:
+            Base58ChecksumError: If base58 checksum is not valid
+            ValueError: If the intermediate code or the parameters are not valid
+        """
+        if count < 0:
+            raise ValueError(f"Invalid number of keys ({count})")
+        if chunk_size <= 0:
+            raise ValueError(f"Invalid chunk size ({chunk_size})")
+        workers = ParallelUtils.WorkersNum(workers)
+
+        magic, owner_entropy, passpoint = _Bip38EcKeysGeneratorUtils.DecodeIntermediatePassphrase(int_passphrase)
+
+        return Bip38EcKeysGenerator.__GeneratePrivateKeys(magic,
+                                                          owner_entropy,
+                                                          passpoint.RawCompressed().ToBytes(),
+                                                          pub_key_mode,
+                                                          _Bip38EcKeysGeneratorUtils.GenerateSeedbs(count, chunk_size),
+                                                          workers)
+
+    @staticmethod
+    def __GeneratePrivateKeys(magic: bytes,  # pylint: disable=too-many-arguments
+                              owner_entropy: bytes,
+                              passpoint_bytes: bytes,
+                              pub_key_mode: Bip38PubKeyModes,
+                              seedbs_chunks: Iterator[List[bytes]],
+                              workers: int) -> Iterator[str]:
+        """
+        Generate encrypted private keys from chunks of seedbs.
+
+        Args:
+            magic (bytes)                        : Magic
+            owner_entropy (bytes)                : Owner entropy
+            passpoint_bytes (bytes)              : Passpoint bytes
+            pub_key_mode (Bip38PubKeyModes)      : Public key mode
+            seedbs_chunks (Iterator[list[bytes]]): Chunks of seedbs
+            workers (int)                        : Number of worker processes
+
+        Returns:
+            Iterator[str]: Encrypted private keys iterator
+        """
+        for _, priv_keys_enc in ParallelUtils.MapChunks(_Bip38EcKeysGeneratorUtils.GeneratePrivateKeys,
+                                                        seedbs_chunks,
+                                                        workers,
+                                                        magic,
+                                                        owner_entropy,
+                                                        passpoint_bytes,
+                                                        pub_key_mode):
+            yield from priv_keys_enc
+
+
+class Bip38EcEncKey(NamedTuple):
+    """
+    BIP38 encrypted key class (with EC multiplication).
+    It contains the parts of a decoded encrypted key, so that it can be decrypted several times without decoding it.
+    """
+
+    address_hash: bytes
+    owner_entropy: bytes
+    encrypted_part_1_lower: bytes
+    encrypted_part_2: bytes
+    pub_key_mode: Bip38PubKeyModes
+    has_lot_seq: bool
+
+    @classmethod
+    def Decode(cls,
+               priv_key_enc: str) -> Bip38EcEncKey:
+        """
+        Decode the specified encrypted private key.
 
         Args:
             priv_key_enc (str): Encrypted private key bytes
-            passphrase (str)  : Passphrase
 
         Returns:
-            tuple[bytes, Bip38PubKeyModes]: Decrypted private key (index 0), public key mode (index 1)
+            Bip38EcEncKey object: Bip38EcEncKey object
 
         Raises:
             Base58ChecksumError: If base58 checksum is not valid
@@ -412,33 +583,111 @@ class Bip38EcDecrypter:
         if prefix != Bip38EcConst.ENC_KEY_PREFIX:
             raise ValueError(f"Invalid prefix ({BytesUtils.ToHexString(prefix)})")
         # Get flagbyte options
-        pub_key_mode, has_lot_seq = Bip38EcDecrypter.__GetFlagbyteOptions(flagbyte)
+        pub_key_mode, has_lot_seq = cls.__GetFlagbyteOptions(flagbyte)
 
-        # Compute passfactor
-        passfactor = _Bip38EcUtils.PassFactor(passphrase, owner_entropy, has_lot_seq)
-        # Derive key halves from the passpoint, address hash and owner entropy
-        derived_half_1, derived_half_2 = _Bip38EcUtils.DeriveKeyHalves(_Bip38EcUtils.PassPoint(passfactor),
-                                                                       address_hash,
-                                                                       owner_entropy)
+        return cls(address_hash,
+                   owner_entropy,
+                   encrypted_part_1_lower,
+                   encrypted_part_2,
+                   pub_key_mode,
+                   has_lot_seq)
 
-        # Get factorb back by decrypting
-        factorb = Bip38EcDecrypter.__DecryptAndGetFactorb(encrypted_part_1_lower,
-                                                          encrypted_part_2,
-                                                          derived_half_1,
-                                                          derived_half_2)
-        # Compute private key
-        priv_key_bytes = Bip38EcDecrypter.__ComputePrivateKey(passfactor, factorb)
+    @staticmethod
+    def __GetFlagbyteOptions(flagbyte: bytes) -> Tuple[Bip38PubKeyModes, bool]:
+        """
+        Get the options from the flagbyte.
+
+        Args:
+            flagbyte (bytes): Flagbyte
+
+        Returns:
+            tuple[Bip38PubKeyModes, bool]: Public key mode (index 0), has lot/sequence numbers (index 1)
+        """
+
+        # Convert flagbyte to integer
+        flagbyte_int = BytesUtils.ToInteger(flagbyte)
+        # Get bit set in flagbyte
+        has_lot_seq = BitUtils.IsBitSet(flagbyte_int, Bip38EcConst.FLAG_BIT_LOT_SEQ)
+        pub_key_mode = (Bip38PubKeyModes.COMPRESSED
+                        if BitUtils.IsBitSet(flagbyte_int, Bip38EcConst.FLAG_BIT_COMPRESSED)
+                        else Bip38PubKeyModes.UNCOMPRESSED)
+        # Check flagbyte
+        flagbyte_int = BitUtils.ResetBit(flagbyte_int, Bip38EcConst.FLAG_BIT_LOT_SEQ)
+        flagbyte_int = BitUtils.ResetBit(flagbyte_int, Bip38EcConst.FLAG_BIT_COMPRESSED)
+        if flagbyte_int != 0:
+            raise ValueError(f"Invalid flagbyte ({BytesUtils.ToHexString(flagbyte)})")
+
+        return pub_key_mode, has_lot_seq
+
+
+class Bip38EcDecrypter:
+    """
+    BIP38 decrypter class.
+    It decrypts a private key using the algorithm specified in BIP38 with EC multiplication.
+    """
+
+    @staticmethod
+    def Decrypt(priv_key_enc: str,
+                passphrase: str) -> Tuple[bytes, Bip38PubKeyModes]:
+        """
+        Decrypt the specified private key.
+
+        Args:
+            priv_key_enc (str): Encrypted private key bytes
+            passphrase (str)  : Passphrase
+
+        Returns:
+            tuple[bytes, Bip38PubKeyModes]: Decrypted private key (index 0), public key mode (index 1)
+
+        Raises:
+            Base58ChecksumError: If base58 checksum is not valid
+            ValueError: If the encrypted key is not valid
+        """
+        enc_key = Bip38EcEncKey.Decode(priv_key_enc)
+
+        # Decrypt the private key
+        priv_key_bytes = Bip38EcDecrypter.DecryptKey(enc_key, passphrase)
 
         # Verify the address hash
         address_hash_got = Bip38Addr.AddressHash(Secp256k1PrivateKey.FromBytes(priv_key_bytes).PublicKey(),
-                                                 pub_key_mode)
-        if address_hash != address_hash_got:
+                                                 enc_key.pub_key_mode)
+        if enc_key.address_hash != address_hash_got:
             raise ValueError(
-                f"Invalid address hash (expected: {BytesUtils.ToHexString(address_hash)}, "
+                f"Invalid address hash (expected: {BytesUtils.ToHexString(enc_key.address_hash)}, "
                 f"got: {BytesUtils.ToHexString(address_hash_got)})"
             )
 
-        return priv_key_bytes, pub_key_mode
+        return priv_key_bytes, enc_key.pub_key_mode
+
+    @staticmethod
+    def DecryptKey(enc_key: Bip38EcEncKey,
+                   passphrase: str) -> bytes:
+        """
+        Decrypt an already decoded encrypted key.
+        The address hash is NOT verified, so the result is a valid private key only if the passphrase is correct.
+
+        Args:
+            enc_key (Bip38EcEncKey object): Decoded encrypted key
+            passphrase (str)              : Passphrase
+
+        Returns:
+            bytes: Decrypted private key
+        """
+
+        # Compute passfactor
+        passfactor = _Bip38EcUtils.PassFactor(passphrase, enc_key.owner_entropy, enc_key.has_lot_seq)
+        # Derive key halves from the passpoint, address hash and owner entropy
+        derived_half_1, derived_half_2 = _Bip38EcUtils.DeriveKeyHalves(_Bip38EcUtils.PassPoint(passfactor),
+                                                                       enc_key.address_hash,
+                                                                       enc_key.owner_entropy)
+
+        # Get factorb back by decrypting
+        factorb = Bip38EcDecrypter.__DecryptAndGetFactorb(enc_key.encrypted_part_1_lower,
+                                                          enc_key.encrypted_part_2,
+                                                          derived_half_1,
+                                                          derived_half_2)
+        # Compute private key
+        return Bip38EcDecrypter.__ComputePrivateKey(passfactor, factorb)
 
     @staticmethod
     def __DecryptAndGetFactorb(encrypted_part_1_lower: bytes,
@@ -493,30 +742,3 @@ class Bip38EcDecrypter:
         # Private key: (passfactor * factorb) mod N
         priv_key_int = (BytesUtils.ToInteger(passfactor) * BytesUtils.ToInteger(factorb)) % Secp256k1.Order()
         return IntegerUtils.ToBytes(priv_key_int, bytes_num=Secp256k1PrivateKey.Length())
-
-    @staticmethod
-    def __GetFlagbyteOptions(flagbyte: bytes) -> Tuple[Bip38PubKeyModes, bool]:
-        """
-        Get the options from the flagbyte.
-
-        Args:
-            flagbyte (bytes): Flagbyte
-
-        Returns:
-            tuple[Bip38PubKeyModes, bool]: Public key mode (index 0), has lot/sequence numbers (index 1)
-        """
-
-        # Convert flagbyte to integer
-        flagbyte_int = BytesUtils.ToInteger(flagbyte)
-        # Get bit set in flagbyte
-        has_lot_seq = BitUtils.IsBitSet(flagbyte_int, Bip38EcConst.FLAG_BIT_LOT_SEQ)
-        pub_key_mode = (Bip38PubKeyModes.COMPRESSED
-                        if BitUtils.IsBitSet(flagbyte_int, Bip38EcConst.FLAG_BIT_COMPRESSED)
-                        else Bip38PubKeyModes.UNCOMPRESSED)
-        # Check flagbyte
-        flagbyte_int = BitUtils.ResetBit(flagbyte_int, Bip38EcConst.FLAG_BIT_LOT_SEQ)
-        flagbyte_int = BitUtils.ResetBit(flagbyte_int, Bip38EcConst.FLAG_BIT_COMPRESSED)
-        if flagbyte_int != 0:
-            raise ValueError(f"Invalid flagbyte ({BytesUtils.ToHexString(flagbyte)})")
-
-        return pub_key_mode, has_lot_seq
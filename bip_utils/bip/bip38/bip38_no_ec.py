@@ -24,7 +24,9 @@ Reference: https://github.com/bitcoin/bips/blob/master/bip-0038.mediawiki
 """
 
 # Imports
-from typing import Tuple, Union
+from __future__ import annotations
+
+from typing import NamedTuple, Tuple, Union
 
 from bip_utils.base58 import Base58Decoder, Base58Encoder
 from bip_utils.bip.bip38.bip38_addr import Bip38Addr, Bip38PubKeyModes
@@ -183,24 +185,28 @@ class Bip38NoEcEncrypter:
         return encrypted_half_1, encrypted_half_2
 
 
-class Bip38NoEcDecrypter:
+class Bip38NoEcEncKey(NamedTuple):
     """
-    BIP38 decrypter class.
-    It decrypts a private key using the algorithm specified in BIP38 without EC multiplication.
+    BIP38 encrypted key class (without EC multiplication).
+    It contains the parts of a decoded encrypted key, so that it can be decrypted several times without decoding it.
     """
 
-    @staticmethod
-    def Decrypt(priv_key_enc: str,
-                passphrase: str) -> Tuple[bytes, Bip38PubKeyModes]:
+    address_hash: bytes
+    encrypted_half_1: bytes
+    encrypted_half_2: bytes
+    pub_key_mode: Bip38PubKeyModes
+
+    @classmethod
+    def Decode(cls,
+               priv_key_enc: str) -> Bip38NoEcEncKey:
         """
-        Decrypt the specified private key.
+        Decode the specified encrypted private key.
 
         Args:
             priv_key_enc (str): Encrypted private key bytes
-            passphrase (str)  : Passphrase
 
         Returns:
-            tuple[bytes, Bip38PubKeyModes]: Decrypted private key (index 0), public key mode (index 1)
+            Bip38NoEcEncKey object: Bip38NoEcEncKey object
 
         Raises:
             Base58ChecksumError: If base58 checksum is not valid
@@ -226,28 +232,74 @@ class Bip38NoEcDecrypter:
         if flagbyte not in (Bip38NoEcConst.FLAGBYTE_COMPRESSED, Bip38NoEcConst.FLAGBYTE_UNCOMPRESSED):
             raise ValueError(f"Invalid flagbyte ({BytesUtils.ToHexString(flagbyte)})")
 
-        # Derive key halves from the passphrase and address hash
-        derived_half_1, derived_half_2 = _Bip38NoEcUtils.DeriveKeyHalves(passphrase, address_hash)
-        # Get the private key back by decrypting
-        priv_key_bytes = Bip38NoEcDecrypter.__DecryptAndGetPrivKey(encrypted_half_1,
-                                                                   encrypted_half_2,
-                                                                   derived_half_1,
-                                                                   derived_half_2)
-
         # Get public key mode
         pub_key_mode = (Bip38PubKeyModes.COMPRESSED
                         if flagbyte == Bip38NoEcConst.FLAGBYTE_COMPRESSED
                         else Bip38PubKeyModes.UNCOMPRESSED)
 
+        return cls(address_hash, encrypted_half_1, encrypted_half_2, pub_key_mode)
+
+
+class Bip38NoEcDecrypter:
+    """
+    BIP38 decrypter class.
+    It decrypts a private key using the algorithm specified in BIP38 without EC multiplication.
+    """
+
+    @staticmethod
+    def Decrypt(priv_key_enc: str,
+                passphrase: str) -> Tuple[bytes, Bip38PubKeyModes]:
+        """
+        Decrypt the specified private key.
+
+        Args:
+            priv_key_enc (str): Encrypted private key bytes
+            passphrase (str)  : Passphrase
+
+        Returns:
+            tuple[bytes, Bip38PubKeyModes]: Decrypted private key (index 0), public key mode (index 1)
+
+        Raises:
+            Base58ChecksumError: If base58 checksum is not valid
+            ValueError: If the encrypted key is not valid
+        """
+        enc_key = Bip38NoEcEncKey.Decode(priv_key_enc)
+
+        # Decrypt the private key
+        priv_key_bytes = Bip38NoEcDecrypter.DecryptKey(enc_key, passphrase)
+
         # Verify the address hash
-        address_hash_got = _Bip38NoEcUtils.AddressHash(priv_key_bytes, pub_key_mode)
-        if address_hash != address_hash_got:
+        address_hash_got = _Bip38NoEcUtils.AddressHash(priv_key_bytes, enc_key.pub_key_mode)
+        if enc_key.address_hash != address_hash_got:
             raise ValueError(
-                f"Invalid address hash (expected: {BytesUtils.ToHexString(address_hash)}, "
+                f"Invalid address hash (expected: {BytesUtils.ToHexString(enc_key.address_hash)}, "
                 f"got: {BytesUtils.ToHexString(address_hash_got)})"
             )
 
-        return priv_key_bytes, pub_key_mode
+        return priv_key_bytes, enc_key.pub_key_mode
+
+    @staticmethod
+    def DecryptKey(enc_key: Bip38NoEcEncKey,
+                   passphrase: str) -> bytes:
+        """
+        Decrypt an already decoded encrypted key.
+        The address hash is NOT verified, so the result is a valid private key only if the passphrase is correct.
+
+        Args:
+            enc_key (Bip38NoEcEncKey object): Decoded encrypted key
+            passphrase (str)                : Passphrase
+
+        Returns:
+            bytes: Decrypted private key
+        """
+
+        # Derive key halves from the passphrase and address hash
+        derived_half_1, derived_half_2 = _Bip38NoEcUtils.DeriveKeyHalves(passphrase, enc_key.address_hash)
+        # Get the private key back by decrypting
+        return Bip38NoEcDecrypter.__DecryptAndGetPrivKey(enc_key.encrypted_half_1,
+                                                         enc_key.encrypted_half_2,
+                                                         derived_half_1,
+                                                         derived_half_2)
 
     @staticmethod
     def __DecryptAndGetPrivKey(encrypted_half_1: bytes,
@@ -0,0 +1,302 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for BIP38 passphrase recovery."""
+
+# Imports
+import itertools
+import json
+import os
+from typing import Callable, List, NamedTuple, Optional, Tuple, Union
+
+from bip_utils.base58 import Base58Decoder
+from bip_utils.bip.bip38.bip38_addr import Bip38Addr, Bip38PubKeyModes
+from bip_utils.bip.bip38.bip38_candidates import IBip38CandidatesGenerator
+from bip_utils.bip.bip38.bip38_ec import Bip38EcConst, Bip38EcDecrypter, Bip38EcEncKey
+from bip_utils.bip.bip38.bip38_no_ec import Bip38NoEcDecrypter, Bip38NoEcEncKey
+from bip_utils.ecc import Secp256k1PrivateKey
+from bip_utils.utils.misc import ParallelUtils
+
+
+class Bip38RecoveryConst:
+    """Class container for BIP38 recovery constants."""
+
+    # Default number of candidates sent to a worker at once
+    DEF_CHUNK_SIZE: int = 16
+    # Default number of tested candidates between two checkpoints
+    DEF_CHECKPOINT_INTERVAL: int = 1024
+    # Checkpoint keys
+    CHECKPOINT_KEY_PRIV_KEY_ENC: str = "priv_key_enc"
+    CHECKPOINT_KEY_TESTED_NUM: str = "tested_num"
+
+
+class Bip38RecoveryResult(NamedTuple):
+    """BIP38 recovery result class."""
+
+    passphrase: str
+    priv_key_bytes: bytes
+    pub_key_mode: Bip38PubKeyModes
+    tested_num: int
+
+
+class _Bip38RecoveryUtils:
+    """Class container for BIP38 recovery utility functions."""
+
+    @staticmethod
+    def TestPassphrase(enc_key: Union[Bip38EcEncKey, Bip38NoEcEncKey],
+                       passphrase: str) -> Optional[bytes]:
+        """
+        Test a passphrase.
+
+        Args:
+            enc_key (Bip38EcEncKey or Bip38NoEcEncKey object): Decoded encrypted key
+            passphrase (str)                                 : Passphrase
+
+        Returns:
+            bytes: Private key bytes if the passphrase is correct, None otherwise
+        """
+        priv_key_bytes = (Bip38EcDecrypter.DecryptKey(enc_key, passphrase)
+                          if isinstance(enc_key, Bip38EcEncKey)
+                          else Bip38NoEcDecrypter.DecryptKey(enc_key, passphrase))
+        # A wrong passphrase can also lead to an invalid private key
+        try:
+            pub_key = Secp256k1PrivateKey.FromBytes(priv_key_bytes).PublicKey()
+        except ValueError:
+            return None
+
+        return (priv_key_bytes
+                if Bip38Addr.AddressHash(pub_key, enc_key.pub_key_mode) == enc_key.address_hash
+                else None)
+
+    @staticmethod
+    def TestCandidates(enc_key: Union[Bip38EcEncKey, Bip38NoEcEncKey],
+                       candidates: List[str]) -> Optional[Tuple[int, bytes]]:
+        """
+        Test a chunk of candidates.
+
+        Args:
+            enc_key (Bip38EcEncKey or Bip38NoEcEncKey object): Decoded encrypted key
+            candidates (list[str])                           : Candidates
+
+        Returns:
+            tuple[int, bytes]: Index of the correct candidate (index 0) and private key bytes (index 1),
+                               None if no candidate is correct
+        """
+        for i, candidate in enumerate(candidates):
+            priv_key_bytes = _Bip38RecoveryUtils.TestPassphrase(enc_key, candidate)
+            if priv_key_bytes is not None:
+                return i, priv_key_bytes
+        return None
+
+
+class _Bip38RecoveryCheckpoint:
+    """BIP38 recovery checkpoint class. It saves/loads the recovery progress to/from a local file."""
+
+    m_file_path: str
+    m_priv_key_enc: str
+
+    def __init__(self,
+                 file_path: str,
+                 priv_key_enc: str) -> None:
+        """
+        Construct class.
+
+        Args:
+            file_path (str)   : Checkpoint file path
+            priv_key_enc (str): Encrypted private key
+        """
+        self.m_file_path = file_path
+        self.m_priv_key_enc = priv_key_enc
+
+    def Load(self) -> int:
+        """
+        Load the number of already tested candidates.
+
+        Returns:
+            int: Number of tested candidates, zero if the checkpoint file does not exist
+
+        Raises:
+            ValueError: If the checkpoint file is not valid or it refers to another encrypted key
+        """
+        if not os.path.isfile(self.m_file_path):
+            return 0
+
+        try:
+            with open(self.m_file_path, "r", encoding="utf-8") as fin:
+                checkpoint = json.load(fin)
+            priv_key_enc = checkpoint[Bip38RecoveryConst.CHECKPOINT_KEY_PRIV_KEY_ENC]
+            tested_num = int(checkpoint[Bip38RecoveryConst.CHECKPOINT_KEY_TESTED_NUM])
+        except (json.JSONDecodeError, KeyError, TypeError) as ex:
+            raise ValueError(f"Invalid checkpoint file ({self.m_file_path})") from ex
+
+        if priv_key_enc != self.m_priv_key_enc:
+            raise ValueError("Checkpoint file refers to a different encrypted key")
+        if tested_num < 0:
+            raise ValueError(f"Invalid number of tested candidates in checkpoint file ({tested_num})")
+
+        return tested_num
+
+    def Save(self,
+             tested_num: int) -> None:
+        """
+        Save the number of tested candidates.
+        The file is written atomically, so that an interrupted job never leaves a corrupted checkpoint.
+
+        Args:
+            tested_num (int): Number of tested candidates
+        """
+        tmp_file_path = self.m_file_path + ".tmp"
+        with open(tmp_file_path, "w", encoding="utf-8") as fout:
+            json.dump({
+                Bip38RecoveryConst.CHECKPOINT_KEY_PRIV_KEY_ENC: self.m_priv_key_enc,
+                Bip38RecoveryConst.CHECKPOINT_KEY_TESTED_NUM: tested_num,
+            }, fout)
+        os.replace(tmp_file_path, self.m_file_path)
+
+
+class Bip38PassphraseRecovery:
+    """
+    BIP38 passphrase recovery class.
+    It tries the candidates passphrases on an encrypted key (both with and without EC multiplication).
+    The encrypted key is decoded only once and candidates are tested in chunks by a pool of processes.
+    """
+
+    m_priv_key_enc: str
+    m_enc_key: Union[Bip38EcEncKey, Bip38NoEcEncKey]
+
+    def __init__(self,
+                 priv_key_enc: str) -> None:
+        """
+        Construct class.
+
+        Args:
+            priv_key_enc (str): Encrypted private key
+
+        Raises:
+            Base58ChecksumError: If base58 checksum is not valid
+            ValueError: If the encrypted key is not valid
+        """
+        self.m_priv_key_enc = priv_key_enc
+        self.m_enc_key = self.__DecodeKey(priv_key_enc)
+
+    def IsEc(self) -> bool:
+        """
+        Get if the encrypted key uses EC multiplication.
+
+        Returns:
+            bool: True if EC multiplication is used, false otherwise
+        """
+        return isinstance(self.m_enc_key, Bip38EcEncKey)
+
+    def TestPassphrase(self,
+                       passphrase: str) -> Optional[bytes]:
+        """
+        Test a single passphrase.
+
+        Args:
+            passphrase (str): Passphrase
+
+        Returns:
+            bytes: Private key bytes if the passphrase is correct, None otherwise
+        """
+        return _Bip38RecoveryUtils.TestPassphrase(self.m_enc_key, passphrase)
+
+    def Recover(self,  # pylint: disable=too-many-arguments
+                candidates_gen: IBip38CandidatesGenerator,
+                workers: Optional[int] = None,
+                chunk_size: int = Bip38RecoveryConst.DEF_CHUNK_SIZE,
+                checkpoint_file: Optional[str] = None,
+                checkpoint_interval: int = Bip38RecoveryConst.DEF_CHECKPOINT_INTERVAL,
+                progress_fct: Optional[Callable[[int], None]] = None) -> Optional[Bip38RecoveryResult]:
+        """
+        Recover the passphrase by testing the specified candidates.
+        If a checkpoint file is specified, the progress is periodically saved to it and, if the file already exists,
+        the candidates already tested are skipped.
+
+        Args:
+            candidates_gen (IBip38CandidatesGenerator object): Candidates generator
+            workers (int, optional)                          : Number of worker processes (default: CPU count),
+                                                               1 for testing candidates in the current process
+            chunk_size (int, optional)                       : Number of candidates sent to a worker at once
+            checkpoint_file (str, optional)                  : Checkpoint file path (default: no checkpoint)
+            checkpoint_interval (int, optional)              : Number of tested candidates between two checkpoints
+            progress_fct (function, optional)                : Function called with the number of tested
+                                                               candidates after each chunk
+
+        Returns:
+            Bip38RecoveryResult object: Recovery result, None if no candidate is correct
+
+        Raises:
+            ValueError: If the parameters or the checkpoint file are not valid
+        """
+        if checkpoint_interval <= 0:
+            raise ValueError(f"Invalid checkpoint interval ({checkpoint_interval})")
+        workers = ParallelUtils.WorkersNum(workers)
+
+        # Load checkpoint and skip the already tested candidates
+        checkpoint = (_Bip38RecoveryCheckpoint(checkpoint_file, self.m_priv_key_enc)
+                      if checkpoint_file is not None
+                      else None)
+        tested_num = checkpoint.Load() if checkpoint is not None else 0
+        chunks = ParallelUtils.Chunks(itertools.islice(candidates_gen.Generate(), tested_num, None),
+                                      chunk_size)
+
+        last_checkpoint_num = tested_num
+        for chunk, res in ParallelUtils.MapChunks(_Bip38RecoveryUtils.TestCandidates,
+                                                  chunks,
+                                                  workers,
+                                                  self.m_enc_key):
+            if res is not None:
+                idx, priv_key_bytes = res
+                tested_num += idx + 1
+                if checkpoint is not None:
+                    checkpoint.Save(tested_num)
+                return Bip38RecoveryResult(chunk[idx], priv_key_bytes, self.m_enc_key.pub_key_mode, tested_num)
+
+            tested_num += len(chunk)
+            if checkpoint is not None and tested_num - last_checkpoint_num >= checkpoint_interval:
+                checkpoint.Save(tested_num)
+                last_checkpoint_num = tested_num
+            if progress_fct is not None:
+                progress_fct(tested_num)
+
+        if checkpoint is not None:
+            checkpoint.Save(tested_num)
+        return None
+
+    @staticmethod
+    def __DecodeKey(priv_key_enc: str) -> Union[Bip38EcEncKey, Bip38NoEcEncKey]:
+        """
+        Decode the encrypted key, detecting if EC multiplication is used.
+
+        Args:
+            priv_key_enc (str): Encrypted private key
+
+        Returns:
+            Bip38EcEncKey or Bip38NoEcEncKey object: Decoded encrypted key
+
+        Raises:
+            Base58ChecksumError: If base58 checksum is not valid
+            ValueError: If the encrypted key is not valid
+        """
+        prefix = Base58Decoder.CheckDecode(priv_key_enc)[:len(Bip38EcConst.ENC_KEY_PREFIX)]
+        return (Bip38EcEncKey.Decode(priv_key_enc)
+                if prefix == Bip38EcConst.ENC_KEY_PREFIX
+                else Bip38NoEcEncKey.Decode(priv_key_enc))
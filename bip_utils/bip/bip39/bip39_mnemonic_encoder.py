@@ -28,7 +28,7 @@ from bip_utils.bip.bip39.bip39_entropy_generator import Bip39EntropyGenerator
 from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39Mnemonic, Bip39MnemonicConst
 from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39WordsListGetter
 from bip_utils.utils.crypto import Sha256
-from bip_utils.utils.misc import BytesUtils, IntegerUtils
+from bip_utils.utils.misc import BytesUtils
 from bip_utils.utils.mnemonic import Mnemonic, MnemonicEncoderBase
 
 
@@ -72,22 +72,19 @@ class Bip39MnemonicEncoder(MnemonicEncoderBase):
         if not Bip39EntropyGenerator.IsValidEntropyByteLen(entropy_byte_len):
             raise ValueError(f"Entropy byte length ({entropy_byte_len}) is not valid")
 
-        # Convert entropy to binary string
-        entropy_bin_str = BytesUtils.ToBinaryStr(entropy_bytes, entropy_byte_len * 8)
-        # Get entropy hash as binary string
-        entropy_hash_bin_str = BytesUtils.ToBinaryStr(Sha256.QuickDigest(entropy_bytes),
-                                                      Sha256.DigestSize() * 8)
-        # Get mnemonic binary string by concatenating entropy and checksum
-        mnemonic_bin_str = entropy_bin_str + entropy_hash_bin_str[:entropy_byte_len // 4]
+        # Get mnemonic integer by concatenating entropy and checksum (i.e. the first bits of the entropy hash)
+        chksum_bit_len = entropy_byte_len // 4
+        mnemonic_int = ((BytesUtils.ToInteger(entropy_bytes) << chksum_bit_len)
+                        | (Sha256.QuickDigest(entropy_bytes)[0] >> (8 - chksum_bit_len)))
 
-        # Get mnemonic from entropy
-        mnemonic = []
-        for i in range(len(mnemonic_bin_str) // Bip39MnemonicConst.WORD_BIT_LEN):
-            # Get current word index
-            word_bin_str = (mnemonic_bin_str[i * Bip39MnemonicConst.WORD_BIT_LEN:(i + 1)
-                            * Bip39MnemonicConst.WORD_BIT_LEN])
-            word_idx = IntegerUtils.FromBinaryStr(word_bin_str)
-            # Get word at given index
-            mnemonic.append(self.m_words_list.GetWordAtIdx(word_idx))
+        # Get mnemonic from entropy by slicing the integer in groups of 11 bits
+        word_mask = (1 << Bip39MnemonicConst.WORD_BIT_LEN) - 1
+        words_num = (entropy_byte_len * 8 + chksum_bit_len) // Bip39MnemonicConst.WORD_BIT_LEN
+        mnemonic = [
+            self.m_words_list.GetWordAtIdx(
+                (mnemonic_int >> ((words_num - i - 1) * Bip39MnemonicConst.WORD_BIT_LEN)) & word_mask
+            )
+            for i in range(words_num)
+        ]
 
         return Bip39Mnemonic.FromList(mnemonic)
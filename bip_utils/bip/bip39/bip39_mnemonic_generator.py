@@ -21,7 +21,7 @@
 """Module for BIP39 mnemonic generation."""
 
 # Imports
-from typing import Union
+from typing import Iterator, Union
 
 from bip_utils.bip.bip39.bip39_entropy_generator import Bip39EntropyGenerator
 from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39MnemonicConst, Bip39WordsNum
@@ -66,10 +66,6 @@ class Bip39MnemonicGenerator:
             ValueError: If words number is not valid
         """
 
-        # Check words number
-        if words_num not in Bip39MnemonicConst.MNEMONIC_WORD_NUM:
-            raise ValueError(f"Words number for mnemonic ({words_num}) is not valid")
-
         # Get entropy length in bit from words number
         entropy_bit_len = self.__EntropyBitLenFromWordsNum(words_num)
         # Generate entropy
@@ -77,6 +73,27 @@ class Bip39MnemonicGenerator:
 
         return self.FromEntropy(entropy_bytes)
 
+    def GenerateMany(self,
+                     count: int,
+                     words_num: Union[int, Bip39WordsNum]) -> Iterator[Mnemonic]:
+        """
+        Generate multiple mnemonics with the specified words number from random entropy.
+        Entropy is read in large chunks from a random pool, so it is much faster than calling FromWordsNumber
+        multiple times.
+
+        Args:
+            count (int)                     : Number of mnemonics
+            words_num (int or Bip39WordsNum): Number of words (12, 15, 18, 21, 24)
+
+        Returns:
+            Iterator[Mnemonic]: Iterator of generated mnemonics
+
+        Raises:
+            ValueError: If count or words number is not valid
+        """
+        entropy_bit_len = self.__EntropyBitLenFromWordsNum(words_num)
+        return map(self.FromEntropy, Bip39EntropyGenerator(entropy_bit_len).GenerateMany(count))
+
     def FromEntropy(self,
                     entropy_bytes: bytes) -> Mnemonic:
         """
@@ -103,5 +120,13 @@ class Bip39MnemonicGenerator:
 
         Returns:
             int: Correspondent entropy length
+
+        Raises:
+            ValueError: If words number is not valid
         """
+
+        # Check words number
+        if words_num not in Bip39MnemonicConst.MNEMONIC_WORD_NUM:
+            raise ValueError(f"Words number for mnemonic ({words_num}) is not valid")
+
         return (words_num * Bip39MnemonicConst.WORD_BIT_LEN) - (words_num // 3)
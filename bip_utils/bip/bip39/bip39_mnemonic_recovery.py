@@ -0,0 +1,182 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for BIP39 mnemonic recovery."""
+
+# Imports
+import functools
+from typing import Callable, Iterator, List, Union
+
+from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39Mnemonic, Bip39MnemonicConst
+from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39WordsListGetter
+from bip_utils.bip.bip39.bip39_seed_generator import Bip39SeedGeneratorConst
+from bip_utils.utils.crypto import Pbkdf2HmacSha512, Sha256
+from bip_utils.utils.misc import IntegerUtils, StringUtils
+from bip_utils.utils.mnemonic import Mnemonic, MnemonicRecoveryBase, MnemonicRecoveryConst
+
+
+class _Bip39MnemonicRecoveryUtils:
+    """Class container for BIP39 mnemonic recovery utility functions."""
+
+    @staticmethod
+    def GenerateSeed(salt: str,
+                     mnemonic: str) -> bytes:
+        """
+        Generate the seed of a mnemonic.
+        The mnemonic is not validated again, since candidates are already filtered by checksum.
+
+        Args:
+            salt (str)    : Normalized salt (i.e. salt modifier and passphrase)
+            mnemonic (str): Mnemonic string
+
+        Returns:
+            bytes: Generated seed
+        """
+        return Pbkdf2HmacSha512.DeriveKey(mnemonic, salt, Bip39SeedGeneratorConst.SEED_PBKDF2_ROUNDS)
+
+
+class Bip39MnemonicRecovery(MnemonicRecoveryBase):
+    """
+    BIP39 mnemonic recovery class.
+    Unknown words shall be specified as "?", while words not belonging to the words list are considered misspelled
+    and replaced with the similar ones.
+    Candidates are filtered by checksum before computing the seed and, if the last word is unknown, only the words
+    with a valid checksum are generated (so 16-256 times less candidates, depending on the words number).
+    """
+
+    m_salt: str
+
+    def __init__(self,
+                 mnemonic: Union[str, List[str]],
+                 lang: Bip39Languages = Bip39Languages.ENGLISH,
+                 passphrase: str = "",
+                 max_edit_dist: int = MnemonicRecoveryConst.DEF_MAX_EDIT_DIST) -> None:
+        """
+        Construct class.
+
+        Args:
+            mnemonic (str or list[str])   : Mnemonic with unknown ("?") or misspelled words
+            lang (Bip39Languages, optional): Language (default: English)
+            passphrase (str, optional)     : Passphrase, empty if not specified
+            max_edit_dist (int, optional)  : Maximum edit distance for replacing misspelled words
+
+        Raises:
+            TypeError: If the language is not a Bip39Languages enum
+            ValueError: If the mnemonic or maximum edit distance is not valid
+        """
+        mnemonic_list = (Bip39Mnemonic.FromString(mnemonic)
+                         if isinstance(mnemonic, str)
+                         else Bip39Mnemonic.FromList(mnemonic)).ToList()
+        if len(mnemonic_list) not in Bip39MnemonicConst.MNEMONIC_WORD_NUM:
+            raise ValueError(f"Mnemonic words count is not valid ({len(mnemonic_list)})")
+
+        super().__init__(mnemonic_list, lang, Bip39WordsListGetter, max_edit_dist)
+        self.m_salt = StringUtils.NormalizeNfkd(Bip39SeedGeneratorConst.SEED_SALT_MOD + passphrase)
+
+    def _GenerateValidIndexes(self) -> Iterator[List[int]]:
+        """
+        Generate the word indexes of the candidate mnemonics with a valid checksum.
+
+        Returns:
+            Iterator[list[int]]: Iterator of word indexes
+        """
+        word_bit_len = Bip39MnemonicConst.WORD_BIT_LEN
+        last_pos = len(self.m_words_idx) - 1
+        chksum_bit_len = len(self.m_words_idx) // 3
+
+        # If the last word is unknown, only its entropy bits are enumerated and the checksum is computed
+        last_unknown = len(self.m_words_idx[last_pos]) == self.m_words_list.Length()
+        var_pos = [pos for pos, words_idx in enumerate(self.m_words_idx)
+                   if len(words_idx) > 1 and not (last_unknown and pos == last_pos)]
+
+        fixed_int = 0
+        for pos, words_idx in enumerate(self.m_words_idx):
+            if pos not in var_pos and not (last_unknown and pos == last_pos):
+                fixed_int |= words_idx[0] << ((last_pos - pos) * word_bit_len)
+
+        for words_comb in self._ProductIndexes(var_pos):
+            mnemonic_int = fixed_int
+            for pos, word_idx in words_comb:
+                mnemonic_int |= word_idx << ((last_pos - pos) * word_bit_len)
+
+            if last_unknown:
+                entropy_int_base = (mnemonic_int >> word_bit_len) << (word_bit_len - chksum_bit_len)
+                for last_entropy_bits in range(1 << (word_bit_len - chksum_bit_len)):
+                    entropy_int = entropy_int_base | last_entropy_bits
+                    yield self.__IntegerToIndexes((entropy_int << chksum_bit_len)
+                                                  | self.__ComputeChecksum(entropy_int, chksum_bit_len))
+            elif (self.__ComputeChecksum(mnemonic_int >> chksum_bit_len, chksum_bit_len)
+                  == mnemonic_int & ((1 << chksum_bit_len) - 1)):
+                yield self.__IntegerToIndexes(mnemonic_int)
+
+    def _SeedFunction(self) -> Callable[[str], bytes]:
+        """
+        Get the (picklable) function for generating the seed from a candidate mnemonic string.
+
+        Returns:
+            function: Seed function
+        """
+        return functools.partial(_Bip39MnemonicRecoveryUtils.GenerateSeed, self.m_salt)
+
+    @staticmethod
+    def _MnemonicFromList(mnemonic_list: List[str]) -> Mnemonic:
+        """
+        Get a mnemonic object from a list of words.
+
+        Args:
+            mnemonic_list (list[str]): Mnemonic words
+
+        Returns:
+            Mnemonic object: Mnemonic object
+        """
+        return Bip39Mnemonic.FromList(mnemonic_list)
+
+    def __ComputeChecksum(self,
+                          entropy_int: int,
+                          chksum_bit_len: int) -> int:
+        """
+        Compute the checksum of the entropy.
+
+        Args:
+            entropy_int (int)   : Entropy integer
+            chksum_bit_len (int): Checksum length in bits
+
+        Returns:
+            int: Checksum
+        """
+        entropy_bytes = IntegerUtils.ToBytes(entropy_int, chksum_bit_len * 4)
+        return Sha256.QuickDigest(entropy_bytes)[0] >> (8 - chksum_bit_len)
+
+    def __IntegerToIndexes(self,
+                           mnemonic_int: int) -> List[int]:
+        """
+        Get the word indexes from the mnemonic integer.
+
+        Args:
+            mnemonic_int (int): Mnemonic integer
+
+        Returns:
+            list[int]: Word indexes
+        """
+        word_bit_len = Bip39MnemonicConst.WORD_BIT_LEN
+        word_mask = (1 << word_bit_len) - 1
+        last_pos = len(self.m_words_idx) - 1
+        return [(mnemonic_int >> ((last_pos - pos) * word_bit_len)) & word_mask
+                for pos in range(last_pos + 1)]
@@ -24,13 +24,13 @@ Reference: https://github.com/bitcoin/bips/blob/master/bip-0039.mediawiki
 """
 
 # Imports
-from typing import Optional, Union
+from typing import Iterable, Iterator, List, Optional, Union
 
 from bip_utils.bip.bip39.bip39_mnemonic import Bip39Languages, Bip39Mnemonic
 from bip_utils.bip.bip39.bip39_mnemonic_validator import Bip39MnemonicValidator
 from bip_utils.bip.bip39.ibip39_seed_generator import IBip39SeedGenerator
 from bip_utils.utils.crypto import Pbkdf2HmacSha512
-from bip_utils.utils.misc import StringUtils
+from bip_utils.utils.misc import ParallelUtils, StringUtils
 from bip_utils.utils.mnemonic import Mnemonic
 
 
@@ -41,6 +41,32 @@ class Bip39SeedGeneratorConst:
     SEED_SALT_MOD: str = "mnemonic"
     # PBKDF2 round for seed generation
     SEED_PBKDF2_ROUNDS: int = 2048
+    # Default number of mnemonics sent to a worker at once when generating multiple seeds
+    GEN_MANY_CHUNK_SIZE: int = 64
+
+
+class _Bip39SeedGeneratorUtils:
+    """Class container for BIP39 seed generator utility functions."""
+
+    @staticmethod
+    def GenerateSeeds(passphrase: str,
+                      lang: Optional[Bip39Languages],
+                      mnemonics: List[str]) -> List[bytes]:
+        """
+        Generate the seeds of a chunk of mnemonics.
+
+        Args:
+            passphrase (str)             : Passphrase
+            lang (Bip39Languages or None): Language, None for automatic detection
+            mnemonics (list[str])        : Mnemonics
+
+        Returns:
+            list[bytes]: Generated seeds
+
+        Raises:
+            ValueError: If a mnemonic is not valid
+        """
+        return [Bip39SeedGenerator(mnemonic, lang).Generate(passphrase) for mnemonic in mnemonics]
 
 
 class Bip39SeedGenerator(IBip39SeedGenerator):
@@ -88,3 +114,58 @@ class Bip39SeedGenerator(IBip39SeedGenerator):
         return Pbkdf2HmacSha512.DeriveKey(self.m_mnemonic.ToStr(),
                                           salt,
                                           Bip39SeedGeneratorConst.SEED_PBKDF2_ROUNDS)
+
+    @staticmethod
+    def GenerateMany(mnemonics: Iterable[Union[str, Mnemonic]],
+                     passphrase: str = "",
+                     lang: Optional[Bip39Languages] = None,
+                     workers: Optional[int] = None,
+                     chunk_size: int = Bip39SeedGeneratorConst.GEN_MANY_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Generate the seeds of multiple mnemonics using the specified passphrase.
+        Seeds are returned in the same order of mnemonics and can be optionally generated by a pool of processes.
+
+        Args:
+            mnemonics (Iterable[str or Mnemonic]): Mnemonics
+            passphrase (str, optional)           : Passphrase, empty if not specified
+            lang (Bip39Languages, optional)      : Language, None for automatic detection
+            workers (int, optional)              : Number of worker processes (default: CPU count),
+                                                   1 for generating seeds in the current process
+            chunk_size (int, optional)           : Number of mnemonics sent to a worker at once
+
+        Returns:
+            Iterator[bytes]: Iterator of generated seeds
+
+        Raises:
+            ValueError: If the parameters or a mnemonic are not valid
+        """
+        workers = ParallelUtils.WorkersNum(workers)
+        chunks = ParallelUtils.Chunks(
+            (mnemonic.ToStr() if isinstance(mnemonic, Mnemonic) else mnemonic for mnemonic in mnemonics),
+            chunk_size
+        )
+        return Bip39SeedGenerator.__GenerateMany(chunks, passphrase, lang, workers)
+
+    @staticmethod
+    def __GenerateMany(chunks: Iterator[List[str]],
+                       passphrase: str,
+                       lang: Optional[Bip39Languages],
+                       workers: int) -> Iterator[bytes]:
+        """
+        Generate the seeds of chunks of mnemonics.
+
+        Args:
+            chunks (Iterator[list[str]]) : Chunks of mnemonics
+            passphrase (str)             : Passphrase
+            lang (Bip39Languages or None): Language, None for automatic detection
+            workers (int)                : Number of worker processes
+
+        Returns:
+            Iterator[bytes]: Iterator of generated seeds
+        """
+        for _, seeds in ParallelUtils.MapChunks(_Bip39SeedGeneratorUtils.GenerateSeeds,
+                                                chunks,
+                                                workers,
+                                                passphrase,
+                                                lang):
+            yield from seeds
@@ -0,0 +1,361 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Module for BIP44 pre-bound address encoding.
+The address class and parameters of a coin configuration are resolved only once, so that many public keys can be
+encoded without repeating the same lookups and checks for each of them.
+"""
+
+# Imports
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from bip_utils.addr import (
+    AdaShelleyAddrEncoder, AtomAddrEncoder, BchP2PKHAddrEncoder, BchP2SHAddrEncoder, P2PKHAddrEncoder, P2PKHPubKeyModes,
+    P2SHAddrEncoder, P2WPKHAddrEncoder, XmrAddrEncoder
+)
+from bip_utils.base58 import Base58Alphabets, Base58Encoder
+from bip_utils.bech32 import BchBech32Encoder, Bech32Encoder, SegwitBech32Encoder
+from bip_utils.bip.bip32 import Bip32PublicKey
+from bip_utils.bip.conf.common import BipCoinConf
+from bip_utils.ecc import EllipticCurveTypes, IPublicKey, Secp256k1PublicKey
+from bip_utils.utils.crypto import Hash160
+
+
+class Bip44AddrEncoderConst:
+    """Class container for BIP44 address encoder constants."""
+
+    # Script bytes for P2SH (P2WPKH nested in P2SH)
+    P2SH_SCRIPT_BYTES: bytes = b"\x00\x14"
+    # Witness version for P2WPKH
+    P2WPKH_WITNESS_VER: int = 0
+    # Prefixes of secp256k1 compressed public keys (even and odd y)
+    SECP256K1_COMPR_PREFIXES: Tuple[int, int] = (0x02, 0x03)
+    # Prefix of secp256k1 uncompressed public keys
+    SECP256K1_UNCOMPR_PREFIX: int = 0x04
+
+
+class _Bip44Secp256k1FastEncoders:
+    """
+    Class container for fast secp256k1 address encoders.
+    Each encoder takes the compressed public key bytes, which are assumed to be valid.
+    """
+
+    @staticmethod
+    def P2PKH(net_ver: bytes,
+              base58_alph: Base58Alphabets,
+              pub_key_bytes: bytes) -> str:
+        """
+        Encode a P2PKH address.
+
+        Args:
+            net_ver (bytes)                : Net address version
+            base58_alph (Base58Alphabets)  : Base58 alphabet
+            pub_key_bytes (bytes)          : Compressed public key bytes
+
+        Returns:
+            str: Address string
+        """
+        return Base58Encoder.CheckEncode(net_ver + Hash160.QuickDigest(pub_key_bytes), base58_alph)
+
+    @staticmethod
+    def P2SH(net_ver: bytes,
+             pub_key_bytes: bytes) -> str:
+        """
+        Encode a P2SH address.
+
+        Args:
+            net_ver (bytes)      : Net address version
+            pub_key_bytes (bytes): Compressed public key bytes
+
+        Returns:
+            str: Address string
+        """
+        return Base58Encoder.CheckEncode(net_ver + _Bip44Secp256k1FastEncoders.__ScriptSigHash(pub_key_bytes))
+
+    @staticmethod
+    def P2WPKH(hrp: str,
+               pub_key_bytes: bytes) -> str:
+        """
+        Encode a P2WPKH address.
+
+        Args:
+            hrp (str)            : HRP
+            pub_key_bytes (bytes): Compressed public key bytes
+
+        Returns:
+            str: Address string
+        """
+        return SegwitBech32Encoder.Encode(hrp,
+                                          Bip44AddrEncoderConst.P2WPKH_WITNESS_VER,
+                                          Hash160.QuickDigest(pub_key_bytes))
+
+    @staticmethod
+    def BchP2PKH(hrp: str,
+                 net_ver: bytes,
+                 pub_key_bytes: bytes) -> str:
+        """
+        Encode a Bitcoin Cash P2PKH address.
+
+        Args:
+            hrp (str)            : HRP
+            net_ver (bytes)      : Net address version
+            pub_key_bytes (bytes): Compressed public key bytes
+
+        Returns:
+            str: Address string
+        """
+        return BchBech32Encoder.Encode(hrp, net_ver, Hash160.QuickDigest(pub_key_bytes))
+
+    @staticmethod
+    def BchP2SH(hrp: str,
+                net_ver: bytes,
+                pub_key_bytes: bytes) -> str:
+        """
+        Encode a Bitcoin Cash P2SH address.
+
+        Args:
+            hrp (str)            : HRP
+            net_ver (bytes)      : Net address version
+            pub_key_bytes (bytes): Compressed public key bytes
+
+        Returns:
+            str: Address string
+        """
+        return BchBech32Encoder.Encode(hrp, net_ver, _Bip44Secp256k1FastEncoders.__ScriptSigHash(pub_key_bytes))
+
+    @staticmethod
+    def Atom(hrp: str,
+             pub_key_bytes: bytes) -> str:
+        """
+        Encode an Atom address.
+
+        Args:
+            hrp (str)            : HRP
+            pub_key_bytes (bytes): Compressed public key bytes
+
+        Returns:
+            str: Address string
+        """
+        return Bech32Encoder.Encode(hrp, Hash160.QuickDigest(pub_key_bytes))
+
+    @staticmethod
+    def __ScriptSigHash(pub_key_bytes: bytes) -> bytes:
+        """
+        Compute the hash of the script signature of a public key.
+
+        Args:
+            pub_key_bytes (bytes): Compressed public key bytes
+
+        Returns:
+            bytes: Script signature hash bytes
+        """
+        return Hash160.QuickDigest(Bip44AddrEncoderConst.P2SH_SCRIPT_BYTES + Hash160.QuickDigest(pub_key_bytes))
+
+
+class _Bip44AddrEncoderCompiler:
+    """Class container for compiling address parameters into fast encoders."""
+
+    @staticmethod
+    def CompileSecp256k1(addr_cls: Any,
+                         addr_params: Dict[str, Any]) -> Optional[Callable[[bytes], str]]:
+        """
+        Compile a fast encoder taking compressed secp256k1 public key bytes.
+
+        Args:
+            addr_cls (IAddrEncoder class): Address class
+            addr_params (dict)           : Address parameters
+
+        Returns:
+            Callable: Fast encoder
+            None: If the address class has no fast encoder
+        """
+        if addr_cls is P2PKHAddrEncoder:
+            if addr_params.get("pub_key_mode", P2PKHPubKeyModes.COMPRESSED) != P2PKHPubKeyModes.COMPRESSED:
+                return None
+            return partial(_Bip44Secp256k1FastEncoders.P2PKH,
+                           addr_params["net_ver"],
+                           addr_params.get("base58_alph", Base58Alphabets.BITCOIN))
+        if addr_cls is P2SHAddrEncoder:
+            return partial(_Bip44Secp256k1FastEncoders.P2SH, addr_params["net_ver"])
+        if addr_cls is P2WPKHAddrEncoder:
+            return partial(_Bip44Secp256k1FastEncoders.P2WPKH, addr_params["hrp"])
+        if addr_cls is BchP2PKHAddrEncoder:
+            return partial(_Bip44Secp256k1FastEncoders.BchP2PKH, addr_params["hrp"], addr_params["net_ver"])
+        if addr_cls is BchP2SHAddrEncoder:
+            return partial(_Bip44Secp256k1FastEncoders.BchP2SH, addr_params["hrp"], addr_params["net_ver"])
+        if addr_cls is AtomAddrEncoder:
+            return partial(_Bip44Secp256k1FastEncoders.Atom, addr_params["hrp"])
+        return None
+
+
+class Bip44AddrEncoder:
+    """
+    BIP44 address encoder class.
+    It binds the address class and parameters of a coin configuration, so that they are resolved only once.
+    For the most common secp256k1 addresses (P2PKH, P2SH, P2WPKH, Bitcoin Cash and Atom), raw public key bytes are
+    hashed and encoded directly, without constructing and validating the public key point: therefore, they shall be
+    valid public keys (e.g. coming from a derivation).
+    """
+
+    m_coin_conf: BipCoinConf
+    m_addr_params: Dict[str, Any]
+    m_addr_cls: Any
+    m_addr_params_have_fct_calls: bool
+    m_key_enc: Callable[[Union[bytes, IPublicKey]], str]
+    m_secp256k1_fast_enc: Optional[Callable[[bytes], str]]
+
+    def __init__(self,
+                 coin_conf: BipCoinConf) -> None:
+        """
+        Construct class.
+
+        Args:
+            coin_conf (BipCoinConf object): BipCoinConf object
+
+        Raises:
+            ValueError: If the address of the coin cannot be computed from a single public key
+        """
+        addr_cls = coin_conf.AddrClass()
+        if addr_cls is AdaShelleyAddrEncoder:
+            raise ValueError("Use the CardanoShelley class to get Cardano Shelley addresses")
+        if addr_cls is XmrAddrEncoder:
+            raise ValueError("Use the Monero class to get Monero addresses")
+
+        self.m_coin_conf = coin_conf
+        self.m_addr_params = coin_conf.AddrParams()
+        self.m_addr_cls = addr_cls
+        self.m_addr_params_have_fct_calls = coin_conf.AddrParamsHaveFctCalls()
+        self.m_key_enc = partial(addr_cls.EncodeKey, **self.m_addr_params)
+        self.m_secp256k1_fast_enc = (
+            _Bip44AddrEncoderCompiler.CompileSecp256k1(addr_cls, self.m_addr_params)
+            if coin_conf.Bip32Class().CurveType() == EllipticCurveTypes.SECP256K1
+            else None
+        )
+
+    def CoinConf(self) -> BipCoinConf:
+        """
+        Get the coin configuration.
+
+        Returns:
+            BipCoinConf object: BipCoinConf object
+        """
+        return self.m_coin_conf
+
+    def Encode(self,
+               pub_key: Union[bytes, IPublicKey, Bip32PublicKey]) -> str:
+        """
+        Encode a public key to address.
+        Public keys objects can be used for coins whose address depends on other key data (e.g. the chain code).
+
+        Args:
+            pub_key (bytes, IPublicKey or Bip32PublicKey object): Public key bytes or object
+
+        Returns:
+            str: Address string
+
+        Raises:
+            ValueError: If the public key is not valid or the address requires a Bip32PublicKey object
+            TypeError: If the public key is not of the correct type
+        """
+        if self.m_secp256k1_fast_enc is not None:
+            return self.m_secp256k1_fast_enc(self.__Secp256k1CompressedBytes(pub_key))
+        return self.__EncodeGeneric(pub_key)
+
+    def EncodeMany(self,
+                   pub_keys: Iterable[Union[bytes, IPublicKey, Bip32PublicKey]]) -> List[str]:
+        """
+        Encode many public keys to addresses.
+
+        Args:
+            pub_keys (iterable): Public keys bytes or objects
+
+        Returns:
+            list[str]: Address strings, in the same order of the public keys
+
+        Raises:
+            ValueError: If one of the public keys is not valid or the address requires a Bip32PublicKey object
+            TypeError: If one of the public keys is not of the correct type
+        """
+        # Select the encoding path once for all the keys
+        if self.m_secp256k1_fast_enc is not None:
+            fast_enc = self.m_secp256k1_fast_enc
+            compr_bytes = self.__Secp256k1CompressedBytes
+            return [fast_enc(compr_bytes(pub_key)) for pub_key in pub_keys]
+        return list(map(self.__EncodeGeneric, pub_keys))
+
+    def __EncodeGeneric(self,
+                        pub_key: Union[bytes, IPublicKey, Bip32PublicKey]) -> str:
+        """
+        Encode a public key to address using the address class.
+
+        Args:
+            pub_key (bytes, IPublicKey or Bip32PublicKey object): Public key bytes or object
+
+        Returns:
+            str: Address string
+
+        Raises:
+            ValueError: If the public key is not valid or the address requires a Bip32PublicKey object
+            TypeError: If the public key is not of the correct type
+        """
+        if self.m_addr_params_have_fct_calls:
+            if not isinstance(pub_key, Bip32PublicKey):
+                raise ValueError("A Bip32PublicKey object is required to compute the address")
+            return self.m_addr_cls.EncodeKey(pub_key.KeyObject(),
+                                             **self.m_coin_conf.AddrParamsWithResolvedCalls(pub_key))
+
+        if isinstance(pub_key, Bip32PublicKey):
+            pub_key = pub_key.KeyObject()
+        return self.m_key_enc(pub_key)
+
+    @staticmethod
+    def __Secp256k1CompressedBytes(pub_key: Union[bytes, IPublicKey, Bip32PublicKey]) -> bytes:
+        """
+        Get the compressed bytes of a secp256k1 public key.
+        Uncompressed keys are compressed without any point computation.
+
+        Args:
+            pub_key (bytes, IPublicKey or Bip32PublicKey object): Public key bytes or object
+
+        Returns:
+            bytes: Compressed public key bytes
+
+        Raises:
+            ValueError: If the public key length or prefix is not valid
+            TypeError: If the public key is not secp256k1
+        """
+        if isinstance(pub_key, (Bip32PublicKey, IPublicKey)):
+            key_obj = pub_key.KeyObject() if isinstance(pub_key, Bip32PublicKey) else pub_key
+            if not isinstance(key_obj, Secp256k1PublicKey):
+                raise TypeError("A secp256k1 public key is required")
+            # Bip32PublicKey caches the compressed bytes, so take them from it
+            return pub_key.RawCompressed().ToBytes()
+
+        pub_key_len = len(pub_key)
+        compr_prefixes = Bip44AddrEncoderConst.SECP256K1_COMPR_PREFIXES
+        if pub_key_len == Secp256k1PublicKey.CompressedLength() and pub_key[0] in compr_prefixes:
+            return pub_key
+        if (pub_key_len == Secp256k1PublicKey.UncompressedLength()
+                and pub_key[0] == Bip44AddrEncoderConst.SECP256K1_UNCOMPR_PREFIX):
+            # The compressed key is the x coordinate, with a prefix depending on the y parity
+            return bytes([compr_prefixes[pub_key[-1] & 1]]) + pub_key[1:Secp256k1PublicKey.CompressedLength()]
+        raise ValueError("Invalid secp256k1 public key bytes")
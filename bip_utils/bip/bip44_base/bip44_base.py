@@ -26,14 +26,15 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from enum import IntEnum, unique
-from functools import lru_cache
-from typing import Union
+from typing import Optional, Union
 
 from bip_utils.bip.bip32 import Bip32Base, Bip32KeyData, Bip32KeyIndex
 from bip_utils.bip.bip44_base.bip44_base_ex import Bip44DepthError
 from bip_utils.bip.bip44_base.bip44_keys import Bip44PrivateKey, Bip44PublicKey
+from bip_utils.bip.bip44_base.bip44_keys_batch import Bip44KeysBatch, Bip44KeysBatchConst
 from bip_utils.bip.conf.common import BipCoinConf, BipCoins
 from bip_utils.ecc import IPrivateKey, IPublicKey
+from bip_utils.utils.misc import MemoUtils
 
 
 @unique
@@ -207,7 +208,7 @@ class Bip44Base(ABC):
         self.m_bip32_obj = bip32_obj
         self.m_coin_conf = coin_conf
 
-    @lru_cache()
+    @MemoUtils.CachedMethod
     def PublicKey(self) -> Bip44PublicKey:
         """
         Return the public key.
@@ -218,7 +219,7 @@ class Bip44Base(ABC):
         return Bip44PublicKey(self.m_bip32_obj.PublicKey(),
                               self.m_coin_conf)
 
-    @lru_cache()
+    @MemoUtils.CachedMethod
     def PrivateKey(self) -> Bip44PrivateKey:
         """
         Return the private key.
@@ -304,6 +305,42 @@ class Bip44Base(ABC):
         return self.__class__(bip_obj.m_bip32_obj.DerivePath(bip_obj.m_coin_conf.DefaultPath()),
                               bip_obj.m_coin_conf)
 
+    def AddressesRange(self,
+                       start: int,
+                       stop: int,
+                       workers: Optional[int] = 1,
+                       chunk_size: int = Bip44KeysBatchConst.DEF_CHUNK_SIZE) -> Bip44KeysBatch:
+        """
+        Derive the keys and addresses of the address indexes in the specified range, i.e. start ... (stop - 1).
+        Results are stored in a Bip44KeysBatch object, without creating a Bip44Base object for each index.
+
+        Args:
+            start (int)               : First address index (included)
+            stop (int)                : Last address index (excluded)
+            workers (int, optional)   : Number of worker processes (default: 1, i.e. in the current process),
+                                        None for CPU count
+            chunk_size (int, optional): Number of keys derived by a worker at once
+
+        Returns:
+            Bip44KeysBatch object: Bip44KeysBatch object
+
+        Raises:
+            Bip44DepthError: If the current depth is not suitable for deriving keys
+            Bip32KeyError: If the derivation results in an invalid key
+            ValueError: If the parameters are not valid or the address of the coin cannot be computed
+        """
+        if not self.IsLevel(Bip44Levels.CHANGE):
+            raise Bip44DepthError(
+                f"Current depth ({self.m_bip32_obj.Depth().ToInt()}) is not suitable for deriving address"
+            )
+
+        return Bip44KeysBatch.Derive(self.m_bip32_obj,
+                                     self.m_coin_conf,
+                                     start,
+                                     stop,
+                                     workers,
+                                     chunk_size)
+
     #
     # Protected class methods
     #
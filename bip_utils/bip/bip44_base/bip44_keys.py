@@ -21,12 +21,11 @@
 """Module for BIP44 keys handling."""
 
 # Imports
-from functools import lru_cache
 
 from bip_utils.addr import AdaShelleyAddrEncoder, XmrAddrEncoder
 from bip_utils.bip.bip32 import Bip32ChainCode, Bip32PrivateKey, Bip32PublicKey
 from bip_utils.bip.conf.common import BipCoinConf
-from bip_utils.utils.misc import DataBytes
+from bip_utils.utils.misc import DataBytes, MemoUtils
 from bip_utils.wif import WifEncoder, WifPubKeyModes
 
 
@@ -106,7 +105,7 @@ class Bip44PublicKey:
         """
         return self.m_pub_key.RawUncompressed()
 
-    @lru_cache()
+    @MemoUtils.CachedMethod
     def ToAddress(self) -> str:
         """
         Return the address correspondent to the public key.
@@ -195,7 +194,7 @@ class Bip44PrivateKey:
         """
         return self.m_priv_key.Raw()
 
-    @lru_cache()
+    @MemoUtils.CachedMethod
     def PublicKey(self) -> Bip44PublicKey:
         """
         Get the public key correspondent to the private one.
@@ -206,7 +205,7 @@ class Bip44PrivateKey:
         return Bip44PublicKey(self.m_priv_key.PublicKey(),
                               self.m_coin_conf)
 
-    @lru_cache()
+    @MemoUtils.CachedArgsMethod()
     def ToWif(self,
               pub_key_mode: WifPubKeyModes = WifPubKeyModes.COMPRESSED) -> str:
         """
@@ -0,0 +1,569 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Module for BIP44 keys batches.
+A batch stores the keys and addresses derived from a range of address indexes in contiguous fixed-width buffers
+(and addresses in an Arrow-like layout, i.e. offsets and data), instead of a Python object for each key.
+Buffers can be exported without copies via the buffer protocol, to NumPy arrays or to Arrow tables. NumPy and
+PyArrow are optional dependencies and they are imported only when needed.
+"""
+
+# Imports
+from __future__ import annotations
+
+import importlib
+import itertools
+from array import array
+from types import ModuleType
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from bip_utils.bip.bip32 import Bip32Base, Bip32ChainCode, Bip32KeyIndex, Bip32KeyNetVersions
+from bip_utils.bip.bip44_base.bip44_addr_encoder import Bip44AddrEncoder
+from bip_utils.bip.conf.common import BipCoinConf
+from bip_utils.utils.crypto import Hash160
+from bip_utils.utils.misc import ParallelUtils
+
+
+class Bip44KeysBatchConst:
+    """Class container for BIP44 keys batch constants."""
+
+    # Default number of keys derived by a worker at once
+    DEF_CHUNK_SIZE: int = 256
+
+    # Type code of indexes array (32-bit unsigned)
+    INDEXES_TYPE_CODE: str = "I"
+    # Type code of address offsets array (32-bit signed, like Arrow string offsets)
+    ADDR_OFFSETS_TYPE_CODE: str = "i"
+    # Encoding of addresses data
+    ADDR_ENCODING: str = "utf-8"
+
+    # Chain code length in bytes
+    CHAIN_CODE_BYTE_LEN: int = Bip32ChainCode.FixedLength()
+    # Hash160 length in bytes
+    HASH160_BYTE_LEN: int = Hash160.DigestSize()
+
+    # Column names
+    COL_INDEX: str = "index"
+    COL_PUB_KEY: str = "public_key"
+    COL_CHAIN_CODE: str = "chain_code"
+    COL_HASH160: str = "hash160"
+    COL_ADDRESS: str = "address"
+
+
+class _Bip44KeysBatchChunk(NamedTuple):
+    """Keys batch chunk, i.e. the result of a worker."""
+
+    pub_keys: bytes
+    chain_codes: bytes
+    hash160s: bytes
+    addr_lens: List[int]
+    addr_data: bytes
+
+
+class _Bip44KeysBatchUtils:
+    """Class container for BIP44 keys batch utility functions."""
+
+    @staticmethod
+    def DeriveChunk(coin_conf: BipCoinConf,
+                    key_net_ver: Bip32KeyNetVersions,
+                    ex_key_str: str,
+                    indexes: List[int]) -> _Bip44KeysBatchChunk:
+        """
+        Derive the keys and addresses of the specified indexes from a change level extended key.
+        It is called by the worker processes, so it shall be picklable.
+
+        Args:
+            coin_conf (BipCoinConf object)          : BipCoinConf object
+            key_net_ver (Bip32KeyNetVersions object): Bip32KeyNetVersions object
+            ex_key_str (str)                        : Extended key string
+            indexes (list[int])                     : Address indexes
+
+        Returns:
+            _Bip44KeysBatchChunk object: Keys batch chunk
+        """
+        bip32_obj = coin_conf.Bip32Class().FromExtendedKey(ex_key_str, key_net_ver)
+        harden = not bip32_obj.IsPublicDerivationSupported()
+        addr_encoder = Bip44AddrEncoder(coin_conf)
+
+        pub_keys = []
+        chain_codes = []
+        addrs = []
+        for index in indexes:
+            child_obj = bip32_obj.ChildKey(Bip32KeyIndex.HardenIndex(index) if harden else index)
+            pub_key = child_obj.PublicKey()
+            pub_keys.append(pub_key.RawCompressed().ToBytes())
+            chain_codes.append(child_obj.ChainCode().ToBytes())
+            addrs.append(addr_encoder.Encode(pub_key).encode(Bip44KeysBatchConst.ADDR_ENCODING))
+
+        return _Bip44KeysBatchChunk(b"".join(pub_keys),
+                                    b"".join(chain_codes),
+                                    b"".join(Hash160.QuickDigestMany(pub_keys)),
+                                    [len(addr) for addr in addrs],
+                                    b"".join(addrs))
+
+    @staticmethod
+    def ImportOptional(module_name: str) -> ModuleType:
+        """
+        Import an optional dependency.
+
+        Args:
+            module_name (str): Module name
+
+        Returns:
+            ModuleType: Imported module
+
+        Raises:
+            ImportError: If the module is not installed
+        """
+        try:
+            return importlib.import_module(module_name)
+        except ImportError as ex:
+            raise ImportError(f"Module {module_name} is required, please install it") from ex
+
+
+class Bip44KeysBatch:
+    """
+    BIP44 keys batch class.
+    It stores the public keys (compressed), chain codes, Hash160 of the public keys and addresses derived from a
+    range of address indexes. Each column is a single contiguous buffer: single elements or lists are created
+    only when requested.
+    """
+
+    m_indexes: array
+    m_pub_key_len: int
+    m_pub_keys: bytes
+    m_chain_codes: bytes
+    m_hash160s: bytes
+    m_addr_offsets: array
+    m_addr_data: bytes
+
+    @classmethod
+    def Derive(cls,
+               bip32_obj: Bip32Base,
+               coin_conf: BipCoinConf,
+               start: int,
+               stop: int,
+               workers: Optional[int] = 1,
+               chunk_size: int = Bip44KeysBatchConst.DEF_CHUNK_SIZE) -> Bip44KeysBatch:
+        """
+        Derive the children of the specified address indexes, i.e. start ... (stop - 1), from a change level
+        BIP32 object. Indexes are hardened if public derivation is not supported (e.g. ed25519 coins).
+
+        Args:
+            bip32_obj (Bip32Base object)  : Change level Bip32Base object
+            coin_conf (BipCoinConf object): BipCoinConf object
+            start (int)                   : First address index (included)
+            stop (int)                    : Last address index (excluded)
+            workers (int, optional)       : Number of worker processes (default: 1, i.e. in the current process),
+                                            None for CPU count
+            chunk_size (int, optional)    : Number of keys derived by a worker at once
+
+        Returns:
+            Bip44KeysBatch object: Bip44KeysBatch object
+
+        Raises:
+            Bip32KeyError: If the derivation results in an invalid key
+            ValueError: If the parameters are not valid or the address of the coin cannot be computed
+        """
+        if start < 0 or stop < start:
+            raise ValueError(f"Invalid range ({start}, {stop})")
+
+        workers = ParallelUtils.WorkersNum(workers)
+        # Private keys are sent if available, since hardened derivation is not possible from public keys
+        ex_key_str = (bip32_obj.PublicKey().ToExtended()
+                      if bip32_obj.IsPublicOnly()
+                      else bip32_obj.PrivateKey().ToExtended())
+
+        results = [
+            res
+            for _, res in ParallelUtils.MapChunks(_Bip44KeysBatchUtils.DeriveChunk,
+                                                  ParallelUtils.Chunks(range(start, stop), chunk_size),
+                                                  workers,
+                                                  coin_conf,
+                                                  bip32_obj.KeyNetVersions(),
+                                                  ex_key_str)
+        ]
+
+        return cls(array(Bip44KeysBatchConst.INDEXES_TYPE_CODE, range(start, stop)),
+                   bip32_obj.PublicKey().KeyObject().CompressedLength(),
+                   b"".join(res.pub_keys for res in results),
+                   b"".join(res.chain_codes for res in results),
+                   b"".join(res.hash160s for res in results),
+                   array(Bip44KeysBatchConst.ADDR_OFFSETS_TYPE_CODE,
+                         itertools.accumulate(itertools.chain([0], *(res.addr_lens for res in results)))),
+                   b"".join(res.addr_data for res in results))
+
+    def __init__(self,
+                 indexes: array,
+                 pub_key_len: int,
+                 pub_keys: bytes,
+                 chain_codes: bytes,
+                 hash160s: bytes,
+                 addr_offsets: array,
+                 addr_data: bytes) -> None:
+        """
+        Construct class.
+
+        Args:
+            indexes (array)     : Address indexes (32-bit unsigned)
+            pub_key_len (int)   : Public key length in bytes
+            pub_keys (bytes)    : Public keys buffer
+            chain_codes (bytes) : Chain codes buffer
+            hash160s (bytes)    : Hash160 of public keys buffer
+            addr_offsets (array): Addresses offsets (32-bit signed), i.e. address i is addr_data[off[i]:off[i + 1]]
+            addr_data (bytes)   : Addresses data buffer
+
+        Raises:
+            ValueError: If the buffers lengths are not consistent
+        """
+        count = len(indexes)
+        if (len(pub_keys) != count * pub_key_len
+                or len(chain_codes) != count * Bip44KeysBatchConst.CHAIN_CODE_BYTE_LEN
+                or len(hash160s) != count * Bip44KeysBatchConst.HASH160_BYTE_LEN
+                or len(addr_offsets) != count + 1
+                or addr_offsets[-1] != len(addr_data)):
+            raise ValueError("Inconsistent batch buffers")
+
+        self.m_indexes = indexes
+        self.m_pub_key_len = pub_key_len
+        self.m_pub_keys = pub_keys
+        self.m_chain_codes = chain_codes
+        self.m_hash160s = hash160s
+        self.m_addr_offsets = addr_offsets
+        self.m_addr_data = addr_data
+
+    def Count(self) -> int:
+        """
+        Get the number of keys.
+
+        Returns:
+            int: Number of keys
+        """
+        return len(self.m_indexes)
+
+    def PublicKeyLength(self) -> int:
+        """
+        Get the public key length in bytes.
+
+        Returns:
+            int: Public key length in bytes
+        """
+        return self.m_pub_key_len
+
+    def Index(self,
+              i: int) -> int:
+        """
+        Get the address index of the i-th key.
+
+        Args:
+            i (int): Element index
+
+        Returns:
+            int: Address index
+
+        Raises:
+            IndexError: If the element index is not valid
+        """
+        return self.m_indexes[self.__CheckElemIndex(i)]
+
+    def PublicKey(self,
+                  i: int) -> bytes:
+        """
+        Get the i-th public key (compressed).
+
+        Args:
+            i (int): Element index
+
+        Returns:
+            bytes: Public key bytes
+
+        Raises:
+            IndexError: If the element index is not valid
+        """
+        return self.__FixedWidthElem(self.m_pub_keys, self.m_pub_key_len, i)
+
+    def ChainCode(self,
+                  i: int) -> bytes:
+        """
+        Get the i-th chain code.
+
+        Args:
+            i (int): Element index
+
+        Returns:
+            bytes: Chain code bytes
+
+        Raises:
+            IndexError: If the element index is not valid
+        """
+        return self.__FixedWidthElem(self.m_chain_codes, Bip44KeysBatchConst.CHAIN_CODE_BYTE_LEN, i)
+
+    def Hash160(self,
+                i: int) -> bytes:
+        """
+        Get the Hash160 of the i-th public key (compressed).
+
+        Args:
+            i (int): Element index
+
+        Returns:
+            bytes: Hash160 bytes
+
+        Raises:
+            IndexError: If the element index is not valid
+        """
+        return self.__FixedWidthElem(self.m_hash160s, Bip44KeysBatchConst.HASH160_BYTE_LEN, i)
+
+    def Address(self,
+                i: int) -> str:
+        """
+        Get the i-th address.
+
+        Args:
+            i (int): Element index
+
+        Returns:
+            str: Address string
+
+        Raises:
+            IndexError: If the element index is not valid
+        """
+        i = self.__CheckElemIndex(i)
+        return self.m_addr_data[self.m_addr_offsets[i]:self.m_addr_offsets[i + 1]].decode(
+            Bip44KeysBatchConst.ADDR_ENCODING
+        )
+
+    def PublicKeys(self) -> List[bytes]:
+        """
+        Get all the public keys as a list.
+
+        Returns:
+            list[bytes]: Public keys bytes
+        """
+        return [self.PublicKey(i) for i in range(self.Count())]
+
+    def Addresses(self) -> List[str]:
+        """
+        Get all the addresses as a list.
+
+        Returns:
+            list[str]: Address strings
+        """
+        addr_data = self.m_addr_data
+        addr_offsets = self.m_addr_offsets
+        return [
+            addr_data[addr_offsets[i]:addr_offsets[i + 1]].decode(Bip44KeysBatchConst.ADDR_ENCODING)
+            for i in range(self.Count())
+        ]
+
+    def IndexesBuffer(self) -> memoryview:
+        """
+        Get the address indexes buffer (32-bit unsigned integers, native byte order), without copying it.
+
+        Returns:
+            memoryview: Address indexes buffer
+        """
+        return memoryview(self.m_indexes)
+
+    def PublicKeysBuffer(self) -> memoryview:
+        """
+        Get the public keys buffer (PublicKeyLength bytes for each key), without copying it.
+
+        Returns:
+            memoryview: Public keys buffer
+        """
+        return memoryview(self.m_pub_keys)
+
+    def ChainCodesBuffer(self) -> memoryview:
+        """
+        Get the chain codes buffer (32 bytes for each key), without copying it.
+
+        Returns:
+            memoryview: Chain codes buffer
+        """
+        return memoryview(self.m_chain_codes)
+
+    def Hash160sBuffer(self) -> memoryview:
+        """
+        Get the public keys Hash160 buffer (20 bytes for each key), without copying it.
+
+        Returns:
+            memoryview: Hash160 buffer
+        """
+        return memoryview(self.m_hash160s)
+
+    def AddressesOffsetsBuffer(self) -> memoryview:
+        """
+        Get the addresses offsets buffer (Count + 1 32-bit signed integers, native byte order), without copying it.
+
+        Returns:
+            memoryview: Addresses offsets buffer
+        """
+        return memoryview(self.m_addr_offsets)
+
+    def AddressesDataBuffer(self) -> memoryview:
+        """
+        Get the addresses data buffer (UTF-8), without copying it.
+
+        Returns:
+            memoryview: Addresses data buffer
+        """
+        return memoryview(self.m_addr_data)
+
+    def ToNumpy(self) -> Dict[str, Any]:
+        """
+        Get the columns as NumPy arrays (NumPy is required).
+        Keys columns are fixed-width bytes arrays (e.g. S33, S32 and S20) sharing the batch buffers, while the
+        addresses column is a new S array with the maximum address length.
+        Please note that NumPy strips trailing null bytes when accessing a single element of a bytes array, so
+        the buffer (e.g. tobytes) shall be used for getting the exact bytes.
+
+        Returns:
+            dict[str, numpy.ndarray]: Columns dictionary
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        np = _Bip44KeysBatchUtils.ImportOptional("numpy")
+        return {
+            Bip44KeysBatchConst.COL_INDEX: np.frombuffer(self.m_indexes, dtype=np.uint32),
+            Bip44KeysBatchConst.COL_PUB_KEY: np.frombuffer(self.m_pub_keys, dtype=f"S{self.m_pub_key_len}"),
+            Bip44KeysBatchConst.COL_CHAIN_CODE: np.frombuffer(self.m_chain_codes,
+                                                              dtype=f"S{Bip44KeysBatchConst.CHAIN_CODE_BYTE_LEN}"),
+            Bip44KeysBatchConst.COL_HASH160: np.frombuffer(self.m_hash160s,
+                                                           dtype=f"S{Bip44KeysBatchConst.HASH160_BYTE_LEN}"),
+            Bip44KeysBatchConst.COL_ADDRESS: np.array([
+                self.m_addr_data[self.m_addr_offsets[i]:self.m_addr_offsets[i + 1]] for i in range(self.Count())
+            ], dtype="S"),
+        }
+
+    def ToArrow(self) -> Any:
+        """
+        Get the columns as an Arrow table (PyArrow is required).
+        All the columns share the batch buffers, i.e. no data is copied.
+
+        Returns:
+            pyarrow.Table object: Arrow table
+
+        Raises:
+            ImportError: If PyArrow is not installed
+        """
+        pa = _Bip44KeysBatchUtils.ImportOptional("pyarrow")
+        count = self.Count()
+        return pa.table({
+            Bip44KeysBatchConst.COL_INDEX: pa.Array.from_buffers(
+                pa.uint32(), count, [None, pa.py_buffer(self.m_indexes)]
+            ),
+            Bip44KeysBatchConst.COL_PUB_KEY: pa.Array.from_buffers(
+                pa.binary(self.m_pub_key_len), count, [None, pa.py_buffer(self.m_pub_keys)]
+            ),
+            Bip44KeysBatchConst.COL_CHAIN_CODE: pa.Array.from_buffers(
+                pa.binary(Bip44KeysBatchConst.CHAIN_CODE_BYTE_LEN), count, [None, pa.py_buffer(self.m_chain_codes)]
+            ),
+            Bip44KeysBatchConst.COL_HASH160: pa.Array.from_buffers(
+                pa.binary(Bip44KeysBatchConst.HASH160_BYTE_LEN), count, [None, pa.py_buffer(self.m_hash160s)]
+            ),
+            Bip44KeysBatchConst.COL_ADDRESS: pa.Array.from_buffers(
+                pa.string(), count, [None, pa.py_buffer(self.m_addr_offsets), pa.py_buffer(self.m_addr_data)]
+            ),
+        })
+
+    def WriteArrowIpc(self,
+                      file_path: str) -> None:
+        """
+        Write the batch to an Arrow IPC (i.e. Feather V2) file (PyArrow is required).
+
+        Args:
+            file_path (str): File path
+
+        Raises:
+            ImportError: If PyArrow is not installed
+        """
+        pa = _Bip44KeysBatchUtils.ImportOptional("pyarrow")
+        table = self.ToArrow()
+        with pa.OSFile(file_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    def WriteParquet(self,
+                     file_path: str,
+                     **kwargs: Any) -> None:
+        """
+        Write the batch to a Parquet file (PyArrow is required).
+
+        Args:
+            file_path (str): File path
+            **kwargs       : Arguments passed to pyarrow.parquet.write_table (e.g. compression)
+
+        Raises:
+            ImportError: If PyArrow is not installed
+        """
+        pq = _Bip44KeysBatchUtils.ImportOptional("pyarrow.parquet")
+        pq.write_table(self.ToArrow(), file_path, **kwargs)
+
+    def __len__(self) -> int:
+        """
+        Get the number of keys.
+
+        Returns:
+            int: Number of keys
+        """
+        return self.Count()
+
+    def __FixedWidthElem(self,
+                         buff: bytes,
+                         width: int,
+                         i: int) -> bytes:
+        """
+        Get the i-th element of a fixed-width buffer.
+
+        Args:
+            buff (bytes): Buffer
+            width (int) : Element width in bytes
+            i (int)     : Element index
+
+        Returns:
+            bytes: Element bytes
+
+        Raises:
+            IndexError: If the element index is not valid
+        """
+        i = self.__CheckElemIndex(i)
+        return buff[i * width:(i + 1) * width]
+
+    def __CheckElemIndex(self,
+                         i: int) -> int:
+        """
+        Check an element index. Negative indexes count from the end, like lists.
+
+        Args:
+            i (int): Element index
+
+        Returns:
+            int: Non-negative element index
+
+        Raises:
+            IndexError: If the element index is not valid
+        """
+        count = self.Count()
+        if i < -count or i >= count:
+            raise IndexError(f"Element index {i} out of range")
+        return i + count if i < 0 else i
@@ -184,6 +184,15 @@ class BipCoinConf:  # pylint: disable=too-many-instance-attributes
         """
         return self.m_addr_params
 
+    def AddrParamsHaveFctCalls(self) -> bool:
+        """
+        Get if the address parameters contain function calls to be resolved.
+
+        Returns:
+            bool: True if function calls shall be resolved, false otherwise
+        """
+        return self.m_any_addr_params_fct_call
+
     def AddrParamsWithResolvedCalls(self,
                                     pub_key: Bip32PublicKey) -> Dict[str, Any]:
         """
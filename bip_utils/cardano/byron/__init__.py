@@ -1 +1,2 @@
 from bip_utils.cardano.byron.cardano_byron_legacy import CardanoByronLegacy
+from bip_utils.cardano.byron.cardano_byron_legacy_scanner import CardanoByronLegacyScanner
@@ -0,0 +1,497 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Module for scanning Cardano Byron legacy addresses, in order to find the ones belonging to a wallet.
+The HD path of a legacy address is encrypted with ChaCha20-Poly1305 using a fixed nonce, so the key stream only
+depends on the wallet HD path key and it can be computed once for all addresses.
+"""
+
+# Imports
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import cbor2
+from Crypto.Cipher import ChaCha20
+from Crypto.Hash.Poly1305 import Poly1305_MAC
+
+from bip_utils.addr import AdaByronAddrDecoder, AdaByronAddrTypes
+from bip_utils.addr.ada_byron_addr import AdaByronAddrConst
+from bip_utils.base58 import Base58Decoder
+from bip_utils.bip.bip32 import Bip32Path
+from bip_utils.cardano.byron.cardano_byron_legacy import CardanoByronLegacy
+from bip_utils.utils.crypto import ChaCha20Poly1305, Crc32
+from bip_utils.utils.misc import BytesUtils, CborIndefiniteLenArrayDecoder, IntegerUtils, ParallelUtils
+
+
+class CardanoByronLegacyScannerConst:
+    """Class container for Cardano Byron legacy scanner constants."""
+
+    # Default number of addresses sent to a worker at once
+    DEF_CHUNK_SIZE: int = 1024
+    # Maximum encrypted HD path length handled with the precomputed key stream
+    KEY_STREAM_BYTE_LEN: int = 256
+
+    # ChaCha20 block length
+    CHACHA20_BLOCK_BYTE_LEN: int = 64
+    # Poly1305 block length
+    POLY1305_BLOCK_BYTE_LEN: int = 16
+
+    # CBOR major types
+    CBOR_MAJOR_TYPE_UINT: int = 0
+    CBOR_MAJOR_TYPE_BYTES: int = 2
+    CBOR_MAJOR_TYPE_ARRAY: int = 4
+    CBOR_MAJOR_TYPE_MAP: int = 5
+    CBOR_MAJOR_TYPE_TAG: int = 6
+    # CBOR additional info to argument byte length
+    CBOR_ARG_INFO_TO_BYTE_LEN = {24: 1, 25: 2, 26: 4, 27: 8}
+    # Key of the encrypted HD path in the address attributes
+    ATTRS_HD_PATH_KEY: int = 1
+
+
+class _CardanoByronLegacyHdPathCipher:
+    """
+    Cardano Byron legacy HD path cipher class.
+    It decrypts HD paths with ChaCha20-Poly1305 by using a key stream and a Poly1305 key precomputed from the
+    HD path key (this is possible because the nonce is always the same).
+    """
+
+    m_hd_path_key_bytes: bytes
+    m_key_stream: bytes
+    m_poly1305_r: bytes
+    m_poly1305_s: bytes
+
+    def __init__(self,
+                 hd_path_key_bytes: bytes) -> None:
+        """
+        Construct class.
+
+        Args:
+            hd_path_key_bytes (bytes): HD path key bytes
+        """
+        cipher = ChaCha20.new(key=hd_path_key_bytes, nonce=AdaByronAddrConst.CHACHA20_POLY1305_NONCE)
+        key_stream = cipher.encrypt(
+            b"\x00" * (CardanoByronLegacyScannerConst.CHACHA20_BLOCK_BYTE_LEN
+                       + CardanoByronLegacyScannerConst.KEY_STREAM_BYTE_LEN)
+        )
+        # Poly1305 key is the first 32 bytes of block 0, encryption starts from block 1
+        self.m_hd_path_key_bytes = hd_path_key_bytes
+        self.m_poly1305_r = key_stream[:16]
+        self.m_poly1305_s = key_stream[16:32]
+        self.m_key_stream = key_stream[CardanoByronLegacyScannerConst.CHACHA20_BLOCK_BYTE_LEN:]
+
+    def Decrypt(self,
+                hd_path_enc_bytes: bytes) -> Optional[bytes]:
+        """
+        Decrypt an HD path.
+
+        Args:
+            hd_path_enc_bytes (bytes): Encrypted HD path bytes
+
+        Returns:
+            bytes: Decrypted HD path bytes, None if the tag is not valid
+        """
+        cipher_text = hd_path_enc_bytes[:-ChaCha20Poly1305.TagSize()]
+        tag = hd_path_enc_bytes[-ChaCha20Poly1305.TagSize():]
+        if len(cipher_text) == 0:
+            return None
+
+        # Use the generic implementation for unusually long paths
+        if len(cipher_text) > len(self.m_key_stream):
+            try:
+                return ChaCha20Poly1305.Decrypt(self.m_hd_path_key_bytes,
+                                                AdaByronAddrConst.CHACHA20_POLY1305_NONCE,
+                                                AdaByronAddrConst.CHACHA20_POLY1305_ASSOC_DATA,
+                                                cipher_text,
+                                                tag)
+            except ValueError:
+                return None
+
+        try:
+            self.__ComputeMac(cipher_text).verify(tag)
+        except ValueError:
+            return None
+        return BytesUtils.Xor(cipher_text, self.m_key_stream)
+
+    def __ComputeMac(self,
+                     cipher_text: bytes) -> Poly1305_MAC:
+        """
+        Compute the Poly1305 MAC of the cipher text (associated data is empty).
+
+        Args:
+            cipher_text (bytes): Cipher text
+
+        Returns:
+            Poly1305_MAC object: Poly1305_MAC object
+        """
+        block_len = CardanoByronLegacyScannerConst.POLY1305_BLOCK_BYTE_LEN
+        pad_len = -len(cipher_text) % block_len
+        mac_data = (cipher_text
+                    + b"\x00" * pad_len
+                    + IntegerUtils.ToBytes(len(AdaByronAddrConst.CHACHA20_POLY1305_ASSOC_DATA), 8, "little")
+                    + IntegerUtils.ToBytes(len(cipher_text), 8, "little"))
+        # r and s are 16-byte strings, even though the pycryptodome stubs declare them as integers
+        return Poly1305_MAC(self.m_poly1305_r, self.m_poly1305_s, mac_data)  # type: ignore
+
+
+class _CardanoByronLegacyAddrFastDecoder:
+    """
+    Cardano Byron legacy address fast decoder class.
+    It gets the encrypted HD path by parsing only the fixed CBOR structure of a Byron address, without a generic
+    CBOR decoder.
+    """
+
+    @staticmethod
+    def DecodeHdPath(addr_bytes: bytes) -> Optional[bytes]:
+        """
+        Get the encrypted HD path from the address bytes.
+
+        Args:
+            addr_bytes (bytes): Address bytes (i.e. Base58-decoded)
+
+        Returns:
+            bytes: Encrypted HD path bytes, None if the address does not contain any HD path
+
+        Raises:
+            ValueError: If the address encoding is not valid or not in the expected form
+        """
+        try:
+            return _CardanoByronLegacyAddrFastDecoder.__DecodeHdPath(addr_bytes)
+        except IndexError as ex:
+            raise ValueError("Invalid address encoding") from ex
+
+    @staticmethod
+    def __DecodeHdPath(addr_bytes: bytes) -> Optional[bytes]:
+        """
+        Get the encrypted HD path from the address bytes.
+
+        Args:
+            addr_bytes (bytes): Address bytes (i.e. Base58-decoded)
+
+        Returns:
+            bytes: Encrypted HD path bytes, None if the address does not contain any HD path
+
+        Raises:
+            IndexError: If the address is shorter than expected
+            ValueError: If the address encoding is not valid or not in the expected form
+        """
+        read_header = _CardanoByronLegacyAddrFastDecoder.__ReadHeader
+
+        # Address: [tag 24 (payload bytes), CRC]
+        offset = read_header(addr_bytes, 0, CardanoByronLegacyScannerConst.CBOR_MAJOR_TYPE_ARRAY, 2)
+        offset = read_header(addr_bytes, offset, CardanoByronLegacyScannerConst.CBOR_MAJOR_TYPE_TAG,
+                             AdaByronAddrConst.PAYLOAD_TAG)
+        payload, offset = _CardanoByronLegacyAddrFastDecoder.__ReadBytes(addr_bytes, offset)
+        crc, offset = _CardanoByronLegacyAddrFastDecoder.__ReadArg(addr_bytes, offset,
+                                                                   CardanoByronLegacyScannerConst.CBOR_MAJOR_TYPE_UINT)
+        if offset != len(addr_bytes):
+            raise ValueError("Invalid address encoding")
+        if Crc32.QuickIntDigest(payload) != crc:
+            raise ValueError("Invalid CRC")
+
+        # Payload: [root hash, attributes, type]
+        offset = read_header(payload, 0, CardanoByronLegacyScannerConst.CBOR_MAJOR_TYPE_ARRAY, 3)
+        _, offset = _CardanoByronLegacyAddrFastDecoder.__ReadBytes(payload, offset)
+        read_arg = _CardanoByronLegacyAddrFastDecoder.__ReadArg
+        attrs_num, offset = read_arg(payload, offset, CardanoByronLegacyScannerConst.CBOR_MAJOR_TYPE_MAP)
+        hd_path_attr = None
+        for _ in range(attrs_num):
+            attr_key, offset = read_arg(payload, offset, CardanoByronLegacyScannerConst.CBOR_MAJOR_TYPE_UINT)
+            attr_val, offset = _CardanoByronLegacyAddrFastDecoder.__ReadBytes(payload, offset)
+            if attr_key == CardanoByronLegacyScannerConst.ATTRS_HD_PATH_KEY:
+                hd_path_attr = attr_val
+        offset = read_header(payload, offset, CardanoByronLegacyScannerConst.CBOR_MAJOR_TYPE_UINT,
+                             AdaByronAddrTypes.PUBLIC_KEY)
+        if offset != len(payload):
+            raise ValueError("Invalid address payload")
+
+        if hd_path_attr is None:
+            return None
+
+        # The HD path attribute is itself CBOR-encoded bytes
+        hd_path_enc_bytes, offset = _CardanoByronLegacyAddrFastDecoder.__ReadBytes(hd_path_attr, 0)
+        if offset != len(hd_path_attr):
+            raise ValueError("Invalid address attributes")
+        return hd_path_enc_bytes
+
+    @staticmethod
+    def __ReadArg(data: bytes,
+                  offset: int,
+                  major_type: int) -> Tuple[int, int]:
+        """
+        Read a CBOR header with the specified major type.
+
+        Args:
+            data (bytes)    : Data bytes
+            offset (int)    : Current offset
+            major_type (int): Expected major type
+
+        Returns:
+            tuple[int, int]: Header argument (index 0) and new offset (index 1)
+
+        Raises:
+            IndexError: If data is shorter than expected
+            ValueError: If the major type is not the expected one or the encoding is not supported
+        """
+        initial_byte = data[offset]
+        if initial_byte >> 5 != major_type:
+            raise ValueError(f"Invalid CBOR major type ({initial_byte >> 5})")
+
+        add_info = initial_byte & 0x1F
+        if add_info < 24:
+            return add_info, offset + 1
+        if add_info not in CardanoByronLegacyScannerConst.CBOR_ARG_INFO_TO_BYTE_LEN:
+            raise ValueError(f"Unsupported CBOR additional information ({add_info})")
+
+        arg_len = CardanoByronLegacyScannerConst.CBOR_ARG_INFO_TO_BYTE_LEN[add_info]
+        arg_bytes = data[offset + 1:offset + 1 + arg_len]
+        if len(arg_bytes) != arg_len:
+            raise IndexError("Data too short")
+        return BytesUtils.ToInteger(arg_bytes), offset + 1 + arg_len
+
+    @staticmethod
+    def __ReadHeader(data: bytes,
+                     offset: int,
+                     major_type: int,
+                     arg: int) -> int:
+        """
+        Read a CBOR header with the specified major type and argument.
+
+        Args:
+            data (bytes)    : Data bytes
+            offset (int)    : Current offset
+            major_type (int): Expected major type
+            arg (int)       : Expected argument
+
+        Returns:
+            int: New offset
+
+        Raises:
+            IndexError: If data is shorter than expected
+            ValueError: If the header is not the expected one
+        """
+        arg_got, offset = _CardanoByronLegacyAddrFastDecoder.__ReadArg(data, offset, major_type)
+        if arg_got != arg:
+            raise ValueError(f"Invalid CBOR argument (expected: {arg}, got: {arg_got})")
+        return offset
+
+    @staticmethod
+    def __ReadBytes(data: bytes,
+                    offset: int) -> Tuple[bytes, int]:
+        """
+        Read a CBOR byte string.
+
+        Args:
+            data (bytes): Data bytes
+            offset (int): Current offset
+
+        Returns:
+            tuple[bytes, int]: Byte string (index 0) and new offset (index 1)
+
+        Raises:
+            IndexError: If data is shorter than expected
+            ValueError: If the encoding is not valid
+        """
+        bytes_len, offset = _CardanoByronLegacyAddrFastDecoder.__ReadArg(
+            data, offset, CardanoByronLegacyScannerConst.CBOR_MAJOR_TYPE_BYTES
+        )
+        bytes_val = data[offset:offset + bytes_len]
+        if len(bytes_val) != bytes_len:
+            raise IndexError("Data too short")
+        return bytes_val, offset + bytes_len
+
+
+class _CardanoByronLegacyScannerUtils:
+    """Class container for Cardano Byron legacy scanner utility functions."""
+
+    @staticmethod
+    def HdPathEncFromAddress(address: str) -> Optional[bytes]:
+        """
+        Get the encrypted HD path from an address.
+
+        Args:
+            address (str): Address string
+
+        Returns:
+            bytes: Encrypted HD path bytes, None if the address is not valid or it does not contain any HD path
+        """
+        try:
+            addr_bytes = Base58Decoder.Decode(address)
+        except ValueError:
+            return None
+
+        try:
+            return _CardanoByronLegacyAddrFastDecoder.DecodeHdPath(addr_bytes)
+        except ValueError:
+            pass
+
+        # Fall back to the generic decoder for addresses that are not in the usual form
+        try:
+            hd_path_enc_bytes = AdaByronAddrDecoder.SplitDecodedBytes(AdaByronAddrDecoder.DecodeAddr(address))[1]
+        except (ValueError, cbor2.CBORError):
+            return None
+        return hd_path_enc_bytes if len(hd_path_enc_bytes) > 0 else None
+
+    @staticmethod
+    def ScanAddress(cipher: _CardanoByronLegacyHdPathCipher,
+                    address: str) -> Optional[Bip32Path]:
+        """
+        Get the HD path of an address, if it belongs to the wallet.
+
+        Args:
+            cipher (_CardanoByronLegacyHdPathCipher object): HD path cipher
+            address (str)                                  : Address string
+
+        Returns:
+            Bip32Path object: Bip32Path object, None if the address does not belong to the wallet
+        """
+        hd_path_enc_bytes = _CardanoByronLegacyScannerUtils.HdPathEncFromAddress(address)
+        if hd_path_enc_bytes is None:
+            return None
+
+        hd_path_bytes = cipher.Decrypt(hd_path_enc_bytes)
+        if hd_path_bytes is None:
+            return None
+        try:
+            return Bip32Path(CborIndefiniteLenArrayDecoder.Decode(hd_path_bytes), True)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def ScanAddresses(hd_path_key_bytes: bytes,
+                      addresses: List[str]) -> List[Tuple[str, Bip32Path]]:
+        """
+        Scan a chunk of addresses.
+
+        Args:
+            hd_path_key_bytes (bytes): HD path key bytes
+            addresses (list[str])    : Addresses
+
+        Returns:
+            list[tuple[str, Bip32Path]]: Addresses belonging to the wallet and their HD paths
+        """
+        cipher = _CardanoByronLegacyHdPathCipher(hd_path_key_bytes)
+
+        matches = []
+        for address in addresses:
+            hd_path = _CardanoByronLegacyScannerUtils.ScanAddress(cipher, address)
+            if hd_path is not None:
+                matches.append((address, hd_path))
+        return matches
+
+
+class CardanoByronLegacyScanner:
+    """
+    Cardano Byron legacy scanner class.
+    It finds the Byron legacy addresses (i.e. Ddz...) belonging to a wallet, by decrypting their HD path.
+    The HD path key is computed only once and addresses are scanned in chunks by a pool of processes.
+    """
+
+    m_hd_path_key_bytes: bytes
+    m_cipher: _CardanoByronLegacyHdPathCipher
+
+    @classmethod
+    def FromByronLegacy(cls,
+                        byron_legacy_obj: CardanoByronLegacy) -> CardanoByronLegacyScanner:
+        """
+        Construct class from a CardanoByronLegacy object.
+
+        Args:
+            byron_legacy_obj (CardanoByronLegacy object): CardanoByronLegacy object
+
+        Returns:
+            CardanoByronLegacyScanner object: CardanoByronLegacyScanner object
+        """
+        return cls(byron_legacy_obj.HdPathKey())
+
+    def __init__(self,
+                 hd_path_key_bytes: bytes) -> None:
+        """
+        Construct class.
+
+        Args:
+            hd_path_key_bytes (bytes): HD path key bytes (see CardanoByronLegacy.HdPathKey)
+
+        Raises:
+            ValueError: If the HD path key is not valid
+        """
+        if len(hd_path_key_bytes) != ChaCha20Poly1305.KeySize():
+            raise ValueError("HD path key shall be 32-byte long")
+        self.m_hd_path_key_bytes = hd_path_key_bytes
+        self.m_cipher = _CardanoByronLegacyHdPathCipher(hd_path_key_bytes)
+
+    def ScanAddress(self,
+                    address: str) -> Optional[Bip32Path]:
+        """
+        Get the HD path of a single address, if it belongs to the wallet.
+
+        Args:
+            address (str): Address string
+
+        Returns:
+            Bip32Path object: Bip32Path object, None if the address does not belong to the wallet
+        """
+        return _CardanoByronLegacyScannerUtils.ScanAddress(self.m_cipher, address)
+
+    def Scan(self,
+             addresses: Iterable[str],
+             workers: Optional[int] = None,
+             chunk_size: int = CardanoByronLegacyScannerConst.DEF_CHUNK_SIZE) -> Iterator[Tuple[str, Bip32Path]]:
+        """
+        Scan the specified addresses and return the ones belonging to the wallet, in the same order.
+        Addresses are stripped (so lines of a file can be passed directly), while empty lines and addresses that
+        are not valid Byron legacy addresses are skipped.
+
+        Args:
+            addresses (Iterable[str])  : Addresses (e.g. a file object)
+            workers (int, optional)    : Number of worker processes (default: CPU count),
+                                         1 for scanning addresses in the current process
+            chunk_size (int, optional) : Number of addresses sent to a worker at once
+
+        Returns:
+            Iterator[tuple[str, Bip32Path]]: Iterator of address (index 0) and HD path (index 1)
+
+        Raises:
+            ValueError: If the parameters are not valid
+        """
+        workers = ParallelUtils.WorkersNum(workers)
+        chunks = ParallelUtils.Chunks(filter(None, (addr.strip() for addr in addresses)),
+                                      chunk_size)
+        return self.__Scan(chunks, workers)
+
+    def __Scan(self,
+               chunks: Iterator[List[str]],
+               workers: int) -> Iterator[Tuple[str, Bip32Path]]:
+        """
+        Scan chunks of addresses.
+
+        Args:
+            chunks (Iterator[list[str]]): Chunks of addresses
+            workers (int)               : Number of worker processes
+
+        Returns:
+            Iterator[tuple[str, Bip32Path]]: Iterator of address (index 0) and HD path (index 1)
+        """
+        for _, matches in ParallelUtils.MapChunks(_CardanoByronLegacyScannerUtils.ScanAddresses,
+                                                  chunks,
+                                                  workers,
+                                                  self.m_hd_path_key_bytes):
+            yield from matches
@@ -1,2 +1,5 @@
 from bip_utils.cardano.shelley.cardano_shelley import CardanoShelley
+from bip_utils.cardano.shelley.cardano_shelley_addr_generator import (
+    CardanoShelleyAddrGenerator, CardanoShelleyAddrGeneratorConst, CardanoShelleyAddrs
+)
 from bip_utils.cardano.shelley.cardano_shelley_keys import CardanoShelleyPrivateKeys, CardanoShelleyPublicKeys
@@ -27,12 +27,12 @@ Reference: https://cips.cardano.org/cips/cip11
 from __future__ import annotations
 
 import copy
-from functools import lru_cache
 
 from bip_utils.addr import AdaShelleyStakingAddrEncoder
 from bip_utils.bip.bip44_base import Bip44Base, Bip44Changes, Bip44Levels
 from bip_utils.cardano.cip1852 import Cip1852
 from bip_utils.cardano.shelley.cardano_shelley_keys import CardanoShelleyPrivateKeys, CardanoShelleyPublicKeys
+from bip_utils.utils.misc import MemoUtils
 
 
 class CardanoShelley:
@@ -85,7 +85,7 @@ class CardanoShelley:
         self.m_bip_obj = bip_obj
         self.m_bip_sk_obj = bip_sk_obj
 
-    @lru_cache()
+    @MemoUtils.CachedMethod
     def PublicKeys(self) -> CardanoShelleyPublicKeys:
         """
         Return the public keys.
@@ -97,7 +97,7 @@ class CardanoShelley:
                                         self.m_bip_sk_obj.PublicKey().Bip32Key(),
                                         self.m_bip_obj.CoinConf())
 
-    @lru_cache()
+    @MemoUtils.CachedMethod
     def PrivateKeys(self) -> CardanoShelleyPrivateKeys:
         """
         Return the private keys.
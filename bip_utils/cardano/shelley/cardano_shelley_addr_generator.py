@@ -0,0 +1,217 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Module for generating many Cardano Shelley addresses of an account.
+All the addresses of an account share the same staking credential, so the staking key is derived and hashed only once.
+Reference: https://cips.cardano.org/cips/cip19
+"""
+
+# Imports
+from typing import Iterator, List, NamedTuple, Optional
+
+from bip_utils.addr import AdaShelleyStakingAddrEncoder
+from bip_utils.addr.ada_shelley_addr import AdaShelleyAddrConst, AdaShelleyAddrHeaderTypes, _AdaShelleyAddrUtils
+from bip_utils.bech32 import Bech32Encoder
+from bip_utils.bip.bip32 import Bip32Base, Bip32KeyIndex
+from bip_utils.bip.bip44_base import Bip44Base, Bip44Changes, Bip44Levels
+from bip_utils.cardano.cip1852 import Cip1852
+from bip_utils.utils.crypto import Blake2b224
+from bip_utils.utils.misc import ParallelUtils
+
+
+class CardanoShelleyAddrGeneratorConst:
+    """Class container for Cardano Shelley address generator constants."""
+
+    # Default number of addresses generated by a worker at once
+    DEF_CHUNK_SIZE: int = 256
+    # Staking key path (relative to the account)
+    STAKING_KEY_PATH: str = "2/0"
+
+
+class CardanoShelleyAddrs(NamedTuple):
+    """Cardano Shelley addresses of an address index."""
+
+    addr_idx: int
+    base_address: str
+    enterprise_address: str
+    reward_address: str
+
+
+class _CardanoShelleyAddrEncodingData(NamedTuple):
+    """Data for encoding the addresses of an account, computed only once."""
+
+    hrp: str
+    base_prefix: bytes
+    enterprise_prefix: bytes
+    pub_skey_hash: bytes
+    reward_address: str
+
+
+class _CardanoShelleyAddrGeneratorUtils:
+    """Class container for Cardano Shelley address generator utility functions."""
+
+    @staticmethod
+    def GenerateAddresses(chg_bip32_obj: Bip32Base,
+                          enc_data: _CardanoShelleyAddrEncodingData,
+                          addr_idxs: List[int]) -> List[CardanoShelleyAddrs]:
+        """
+        Generate the addresses of a chunk of address indexes.
+
+        Args:
+            chg_bip32_obj (Bip32Base object)                 : Bip32 object of the change level
+            enc_data (_CardanoShelleyAddrEncodingData object): Encoding data
+            addr_idxs (list[int])                            : Address indexes
+
+        Returns:
+            list[CardanoShelleyAddrs]: Addresses, in the same order of the indexes
+        """
+        addrs = []
+        for addr_idx in addr_idxs:
+            pub_key_bytes = chg_bip32_obj.ChildKey(addr_idx).PublicKey().RawCompressed().ToBytes()[1:]
+            pub_key_hash = Blake2b224.QuickDigest(pub_key_bytes)
+            addrs.append(
+                CardanoShelleyAddrs(
+                    addr_idx,
+                    Bech32Encoder.Encode(enc_data.hrp,
+                                         enc_data.base_prefix + pub_key_hash + enc_data.pub_skey_hash),
+                    Bech32Encoder.Encode(enc_data.hrp,
+                                         enc_data.enterprise_prefix + pub_key_hash),
+                    enc_data.reward_address,
+                )
+            )
+        return addrs
+
+
+class CardanoShelleyAddrGenerator:
+    """
+    Cardano Shelley address generator class.
+    It generates the base, enterprise and reward addresses of many address indexes of an account.
+    The staking key is derived and hashed only once, then payment keys are derived from the change key.
+    Public-only accounts are supported as well, even if public derivation is slower than the private one.
+    """
+
+    m_acc_bip32_obj: Bip32Base
+    m_enc_data: _CardanoShelleyAddrEncodingData
+
+    def __init__(self,
+                 bip_obj: Bip44Base) -> None:
+        """
+        Construct class.
+
+        Args:
+            bip_obj (Bip44Base object): Cip1852 object of account level
+
+        Raises:
+            ValueError: If the object is not a Cip1852 instance of account level
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        if not isinstance(bip_obj, Cip1852):
+            raise ValueError("The Bip object shall be a Cip1852 instance")
+        if bip_obj.Level() != Bip44Levels.ACCOUNT:
+            raise ValueError("The Bip object shall be of account level")
+
+        net_tag = bip_obj.CoinConf().AddrParams()["net_tag"]
+        pub_skey = bip_obj.Bip32Object().DerivePath(CardanoShelleyAddrGeneratorConst.STAKING_KEY_PATH).PublicKey()
+
+        self.m_acc_bip32_obj = bip_obj.Bip32Object()
+        self.m_enc_data = _CardanoShelleyAddrEncodingData(
+            AdaShelleyAddrConst.NETWORK_TAG_TO_ADDR_HRP[net_tag],
+            _AdaShelleyAddrUtils.EncodePrefix(AdaShelleyAddrHeaderTypes.PAYMENT, net_tag),
+            _AdaShelleyAddrUtils.EncodePrefix(AdaShelleyAddrHeaderTypes.ENTERPRISE, net_tag),
+            Blake2b224.QuickDigest(pub_skey.RawCompressed().ToBytes()[1:]),
+            AdaShelleyStakingAddrEncoder.EncodeKey(pub_skey.KeyObject(), net_tag=net_tag),
+        )
+
+    def RewardAddress(self) -> str:
+        """
+        Alias for StakingAddress.
+
+        Returns:
+            str: Reward address string
+        """
+        return self.StakingAddress()
+
+    def StakingAddress(self) -> str:
+        """
+        Get the staking address of the account (shared by all the addresses).
+
+        Returns:
+            str: Staking address string
+        """
+        return self.m_enc_data.reward_address
+
+    def Addresses(self,
+                  start_idx: int,
+                  count: int,
+                  change_type: Bip44Changes = Bip44Changes.CHAIN_EXT,
+                  workers: Optional[int] = 1,
+                  chunk_size: int = CardanoShelleyAddrGeneratorConst.DEF_CHUNK_SIZE) -> Iterator[CardanoShelleyAddrs]:
+        """
+        Generate the addresses of an address index range.
+
+        Args:
+            start_idx (int)                      : First address index
+            count (int)                          : Number of addresses
+            change_type (Bip44Changes, optional) : Change type (default: external chain)
+            workers (int, optional)              : Number of worker processes (default: 1, i.e. in the current
+                                                   process), None for CPU count
+            chunk_size (int, optional)           : Number of addresses generated by a worker at once
+
+        Returns:
+            Iterator[CardanoShelleyAddrs]: Iterator of addresses, in the same order of the indexes
+
+        Raises:
+            TypeError: If change type is not a Bip44Changes enum
+            ValueError: If the parameters are not valid
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        if not isinstance(change_type, Bip44Changes):
+            raise TypeError("Change index is not an enumerative of Bip44Changes")
+        if start_idx < 0 or count < 0:
+            raise ValueError(f"Invalid address index range (start: {start_idx}, count: {count})")
+        if start_idx + count > Bip32KeyIndex.HardenIndex(0):
+            raise ValueError("Address indexes shall not be hardened")
+
+        workers = ParallelUtils.WorkersNum(workers)
+        chunks = ParallelUtils.Chunks(range(start_idx, start_idx + count), chunk_size)
+        return self.__Addresses(self.m_acc_bip32_obj.ChildKey(int(change_type)), chunks, workers)
+
+    def __Addresses(self,
+                    chg_bip32_obj: Bip32Base,
+                    chunks: Iterator[List[int]],
+                    workers: int) -> Iterator[CardanoShelleyAddrs]:
+        """
+        Generate the addresses of chunks of address indexes.
+
+        Args:
+            chg_bip32_obj (Bip32Base object): Bip32 object of the change level
+            chunks (Iterator[list[int]])    : Chunks of address indexes
+            workers (int)                   : Number of worker processes
+
+        Returns:
+            Iterator[CardanoShelleyAddrs]: Iterator of addresses
+        """
+        for _, addrs in ParallelUtils.MapChunks(_CardanoShelleyAddrGeneratorUtils.GenerateAddresses,
+                                                chunks,
+                                                workers,
+                                                chg_bip32_obj,
+                                                self.m_enc_data):
+            yield from addrs
@@ -0,0 +1,5 @@
+from bip_utils.cli.cli import Cli, CliConst
+from bip_utils.cli.cli_convert import CliConvertConst, CliConverter, CliConvertRecord, CliConvertTypes
+from bip_utils.cli.cli_derive import CliDeriveConst, CliDeriver, CliDeriveRecord, CliDeriveSpecs
+from bip_utils.cli.cli_output import CliOutputConst, CliOutputFormats, CliProgress, CliWriter
+from bip_utils.cli.cli_validate import CliValidateConst, CliValidateRecord, CliValidator
@@ -0,0 +1,266 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Module for the command line interface, i.e. python -m bip_utils.
+Records are streamed to stdout as soon as they are computed (NDJSON or CSV), while the progress and the errors are
+reported to stderr. Usage examples:
+    python -m bip_utils derive --spec bip84 --coin bitcoin --count 1000 --workers 4 < mnemonic.txt
+    python -m bip_utils validate --format csv < addresses.txt
+    python -m bip_utils convert --to substrate --coin kusama < addresses.txt
+"""
+
+# Imports
+import argparse
+import os
+import sys
+from enum import Enum
+from typing import Iterator, List, NamedTuple, Optional, Sequence, TextIO, Type
+
+from bip_utils._version import __version__
+from bip_utils.base58 import Base58ChecksumError
+from bip_utils.bip.bip32 import Bip32KeyError
+from bip_utils.bip.bip44_base import Bip44DepthError
+from bip_utils.cli.cli_convert import CliConverter, CliConvertTypes
+from bip_utils.cli.cli_derive import CliDeriveConst, CliDeriver, CliDeriveSpecs
+from bip_utils.cli.cli_output import CliOutputFormats, CliProgress, CliWriter
+from bip_utils.cli.cli_validate import CliValidator
+from bip_utils.monero import MoneroKeyError
+from bip_utils.substrate import SubstrateKeyError, SubstratePathError
+from bip_utils.utils.misc import BytesUtils
+from bip_utils.utils.mnemonic import MnemonicChecksumError
+
+
+class CliConst:
+    """Class container for command line interface constants."""
+
+    # Program name
+    PROG_NAME: str = "python -m bip_utils"
+
+    # Exit codes
+    EXIT_OK: int = 0
+    EXIT_ERR: int = 1
+
+
+class Cli:
+    """
+    Command line interface class.
+    It provides the following commands:
+    - derive  : derive a range of addresses from a mnemonic, a seed or an extended key
+    - validate: validate addresses read from stdin, one per line
+    - convert : convert addresses read from stdin, one per line
+    """
+
+    @staticmethod
+    def Main(argv: Optional[Sequence[str]] = None,
+             stdin: Optional[TextIO] = None,
+             stdout: Optional[TextIO] = None,
+             stderr: Optional[TextIO] = None) -> int:
+        """
+        Run the command line interface.
+
+        Args:
+            argv (list[str], optional): Arguments (default: sys.argv[1:])
+            stdin (TextIO, optional)  : Input stream (default: sys.stdin)
+            stdout (TextIO, optional) : Output stream (default: sys.stdout)
+            stderr (TextIO, optional) : Error and progress stream (default: sys.stderr)
+
+        Returns:
+            int: Exit code
+
+        Raises:
+            SystemExit: If the arguments are not valid or help is requested
+        """
+        stdin = stdin if stdin is not None else sys.stdin
+        stdout = stdout if stdout is not None else sys.stdout
+        stderr = stderr if stderr is not None else sys.stderr
+
+        args = Cli.__Parser().parse_args(argv)
+        try:
+            if args.command == "derive":
+                records = Cli.__Derive(args, stdin)
+            elif args.command == "validate":
+                records = CliValidator(args.coins).Validate(stdin, Cli.__Workers(args), args.chunk_size)
+            else:
+                records = CliConverter(CliConvertTypes[args.to.upper()],
+                                       args.hrp,
+                                       BytesUtils.FromHexString(args.net_ver) if args.net_ver is not None else None,
+                                       args.coin).Convert(stdin, Cli.__Workers(args), args.chunk_size)
+            Cli.__WriteRecords(records,
+                               CliWriter(stdout, CliOutputFormats[args.format.upper()]),
+                               CliProgress(None if args.quiet else stderr))
+        except BrokenPipeError:
+            # Output closed by the reader (e.g. head), redirect the remaining output to avoid another error at exit
+            if stdout is sys.stdout:
+                devnull = os.open(os.devnull, os.O_WRONLY)
+                os.dup2(devnull, sys.stdout.fileno())
+            return CliConst.EXIT_ERR
+        except (Base58ChecksumError, Bip32KeyError, Bip44DepthError, MnemonicChecksumError, MoneroKeyError,
+                SubstrateKeyError, SubstratePathError, TypeError, ValueError) as ex:
+            stderr.write(f"{CliConst.PROG_NAME}: error: {ex}\n")
+            return CliConst.EXIT_ERR
+
+        return CliConst.EXIT_OK
+
+    @staticmethod
+    def __Derive(args: argparse.Namespace,
+                 stdin: TextIO) -> Iterator[NamedTuple]:
+        """
+        Run the derive command.
+        If no source is specified, the mnemonic is read from the first line of stdin.
+
+        Args:
+            args (argparse.Namespace): Parsed arguments
+            stdin (TextIO)           : Input stream
+
+        Returns:
+            Iterator[NamedTuple]: Iterator of records
+
+        Raises:
+            ValueError: If the parameters are not valid
+        """
+        mnemonic = args.mnemonic
+        if mnemonic is None and args.seed is None and args.ex_key is None:
+            mnemonic = stdin.readline().strip()
+
+        deriver = CliDeriver(CliDeriveSpecs[args.spec.upper()],
+                             args.coin,
+                             mnemonic=mnemonic,
+                             seed_bytes=BytesUtils.FromHexString(args.seed) if args.seed is not None else None,
+                             ex_key_str=args.ex_key,
+                             passphrase=args.passphrase,
+                             account=args.account,
+                             change=args.change)
+        return deriver.Derive(args.start, args.count, Cli.__Workers(args), args.chunk_size)
+
+    @staticmethod
+    def __WriteRecords(records: Iterator[NamedTuple],
+                       writer: CliWriter,
+                       progress: CliProgress) -> None:
+        """
+        Write records and report the progress.
+
+        Args:
+            records (Iterator[NamedTuple]): Iterator of records
+            writer (CliWriter object)     : CliWriter object
+            progress (CliProgress object) : CliProgress object
+        """
+        for record in records:
+            writer.Write(record)
+            progress.Update()
+        progress.Finish()
+
+    @staticmethod
+    def __Workers(args: argparse.Namespace) -> Optional[int]:
+        """
+        Get the number of workers from the arguments.
+
+        Args:
+            args (argparse.Namespace): Parsed arguments
+
+        Returns:
+            int or None: Number of workers, None for CPU count
+        """
+        return args.workers if args.workers != 0 else None
+
+    @staticmethod
+    def __Parser() -> argparse.ArgumentParser:
+        """
+        Build the arguments parser.
+
+        Returns:
+            argparse.ArgumentParser object: Arguments parser
+        """
+        parser = argparse.ArgumentParser(prog=CliConst.PROG_NAME,
+                                         description="Derive, validate and convert addresses in bulk.")
+        parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+        subparsers = parser.add_subparsers(dest="command", metavar="command")
+        subparsers.required = True
+
+        # Options common to all commands
+        common_parser = argparse.ArgumentParser(add_help=False)
+        common_parser.add_argument("--format", choices=Cli.__Choices(CliOutputFormats), default="ndjson",
+                                   help="output format (default: ndjson)")
+        common_parser.add_argument("--workers", type=int, default=1,
+                                   help="number of worker processes, 0 for CPU count (default: 1)")
+        common_parser.add_argument("--chunk-size", type=int, default=CliDeriveConst.DEF_CHUNK_SIZE,
+                                   help=f"number of elements processed by a worker at once "
+                                        f"(default: {CliDeriveConst.DEF_CHUNK_SIZE})")
+        common_parser.add_argument("--quiet", action="store_true",
+                                   help="do not report the progress on stderr")
+
+        # Derive command
+        derive_parser = subparsers.add_parser("derive", parents=[common_parser],
+                                              help="derive a range of addresses")
+        derive_parser.add_argument("--spec", choices=Cli.__Choices(CliDeriveSpecs), required=True,
+                                   help="derivation specification")
+        derive_parser.add_argument("--coin", required=True,
+                                   help="coin name of the specification (e.g. bitcoin, polkadot, monero_mainnet)")
+        source_group = derive_parser.add_mutually_exclusive_group()
+        source_group.add_argument("--mnemonic",
+                                  help="mnemonic (default: read from the first line of stdin)")
+        source_group.add_argument("--seed",
+                                  help="seed in hex format")
+        source_group.add_argument("--ex-key",
+                                  help="extended key at account or change level (only for BIP and CIP-1852)")
+        derive_parser.add_argument("--passphrase", default="",
+                                   help="mnemonic passphrase (default: empty)")
+        derive_parser.add_argument("--account", type=int, default=0,
+                                   help="account index (default: 0)")
+        derive_parser.add_argument("--change", type=int, default=0,
+                                   help="change index, 0 for external and 1 for internal chain (default: 0)")
+        derive_parser.add_argument("--start", type=int, default=0,
+                                   help="first address index (default: 0)")
+        derive_parser.add_argument("--count", type=int, default=20,
+                                   help="number of addresses (default: 20)")
+
+        # Validate command
+        validate_parser = subparsers.add_parser("validate", parents=[common_parser],
+                                                help="validate addresses read from stdin")
+        validate_parser.add_argument("--coins", nargs="+", metavar="SPEC:COIN",
+                                     help="coins to validate for, e.g. bip84:bitcoin (default: all)")
+
+        # Convert command
+        convert_parser = subparsers.add_parser("convert", parents=[common_parser],
+                                               help="convert addresses read from stdin")
+        convert_parser.add_argument("--to", choices=Cli.__Choices(CliConvertTypes), required=True,
+                                    help="conversion type")
+        convert_parser.add_argument("--hrp",
+                                    help="new HRP (bch only)")
+        convert_parser.add_argument("--net-ver",
+                                    help="new net version in hex format (bch and bch_legacy only, "
+                                         "default: the address one)")
+        convert_parser.add_argument("--coin",
+                                    help="Substrate coin name (substrate only)")
+
+        return parser
+
+    @staticmethod
+    def __Choices(enum_cls: Type[Enum]) -> List[str]:
+        """
+        Get the command line choices of an enumerative.
+
+        Args:
+            enum_cls (class): Enumerative class
+
+        Returns:
+            list[str]: Choices
+        """
+        return [elem.name.lower() for elem in enum_cls]
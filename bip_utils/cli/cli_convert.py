@@ -0,0 +1,186 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Module for converting addresses from the command line interface.
+Contrary to the library converters, an address that cannot be converted does not stop the conversion: its record
+reports the error instead.
+"""
+
+# Imports
+from enum import Enum, auto, unique
+from typing import Any, Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from bip_utils.addr import BchAddrConverter
+from bip_utils.base58 import Base58ChecksumError
+from bip_utils.bech32 import Bech32ChecksumError
+from bip_utils.ss58 import SS58ChecksumError
+from bip_utils.substrate import SubstrateAddrConverter
+from bip_utils.substrate.conf import SubstrateCoins
+from bip_utils.utils.misc import ParallelUtils
+
+
+@unique
+class CliConvertTypes(Enum):
+    """Enumerative for conversion types."""
+
+    BCH = auto()
+    BCH_LEGACY = auto()
+    SUBSTRATE = auto()
+
+
+class CliConvertConst:
+    """Class container for command line interface conversion constants."""
+
+    # Default number of addresses converted by a worker at once
+    DEF_CHUNK_SIZE: int = 256
+
+
+class CliConvertRecord(NamedTuple):
+    """Converted address record."""
+
+    address: str
+    converted: Optional[str]
+    error: Optional[str]
+
+
+class _CliConvertUtils:
+    """
+    Class container for command line interface conversion utility functions.
+    They are called by the worker processes, so they shall be picklable.
+    """
+
+    @staticmethod
+    def ConvertChunk(conv_fct: Callable[..., str],
+                     conv_args: Tuple[Any, ...],
+                     addresses: List[str]) -> List[CliConvertRecord]:
+        """
+        Convert a chunk of addresses, reporting the error of the ones that cannot be converted.
+
+        Args:
+            conv_fct (function): Conversion function, i.e. conv_fct(address, *conv_args)
+            conv_args (tuple)  : Conversion function arguments
+            addresses (list)   : Addresses
+
+        Returns:
+            list[CliConvertRecord]: Converted address records
+        """
+        records = []
+        for address in addresses:
+            try:
+                records.append(CliConvertRecord(address, conv_fct(address, *conv_args), None))
+            except (Base58ChecksumError, Bech32ChecksumError, SS58ChecksumError, TypeError, ValueError) as ex:
+                records.append(CliConvertRecord(address, None, str(ex)))
+        return records
+
+
+class CliConverter:
+    """
+    Command line interface converter class.
+    It converts addresses to Bitcoin Cash format (i.e. changing HRP and net version), to Bitcoin Cash legacy format
+    or to the SS58 format of a Substrate coin.
+    """
+
+    m_conv_fct: Callable[..., str]
+    m_conv_args: Tuple[Any, ...]
+
+    def __init__(self,
+                 conv_type: CliConvertTypes,
+                 hrp: Optional[str] = None,
+                 net_ver: Optional[bytes] = None,
+                 coin_name: Optional[str] = None) -> None:
+        """
+        Construct class.
+
+        Args:
+            conv_type (CliConvertTypes): Conversion type
+            hrp (str, optional)        : New HRP (only for Bitcoin Cash, mandatory)
+            net_ver (bytes, optional)  : New net version (only for Bitcoin Cash and legacy, if None the address one)
+            coin_name (str, optional)  : SubstrateCoins name (only for Substrate, mandatory)
+
+        Raises:
+            TypeError: If the conversion type is not a CliConvertTypes enumerative
+            ValueError: If the parameters are not valid
+        """
+        if not isinstance(conv_type, CliConvertTypes):
+            raise TypeError("Conversion type is not an enumerative of CliConvertTypes")
+
+        if conv_type == CliConvertTypes.BCH:
+            if hrp is None:
+                raise ValueError("HRP shall be specified for Bitcoin Cash conversion")
+            self.m_conv_fct = BchAddrConverter.Convert
+            self.m_conv_args = (hrp, net_ver)
+        elif conv_type == CliConvertTypes.BCH_LEGACY:
+            self.m_conv_fct = BchAddrConverter.ToLegacy
+            self.m_conv_args = (net_ver,)
+        else:
+            if coin_name is None:
+                raise ValueError("Coin shall be specified for Substrate conversion")
+            try:
+                coin_type = SubstrateCoins[coin_name.upper()]
+            except KeyError as ex:
+                raise ValueError(f"Invalid Substrate coin ({coin_name})") from ex
+            self.m_conv_fct = SubstrateAddrConverter.Convert
+            self.m_conv_args = (coin_type,)
+
+    def Convert(self,
+                addresses: Iterable[str],
+                workers: Optional[int] = 1,
+                chunk_size: int = CliConvertConst.DEF_CHUNK_SIZE) -> Iterator[CliConvertRecord]:
+        """
+        Convert many addresses, in the same order.
+        Addresses are stripped (so lines of a file can be passed directly) and empty lines are skipped.
+
+        Args:
+            addresses (Iterable[str]) : Addresses (e.g. a file object)
+            workers (int, optional)   : Number of worker processes (default: 1, i.e. in the current process),
+                                        None for CPU count
+            chunk_size (int, optional): Number of addresses converted by a worker at once
+
+        Returns:
+            Iterator[CliConvertRecord]: Iterator of converted address records
+
+        Raises:
+            ValueError: If the parameters are not valid
+        """
+        workers = ParallelUtils.WorkersNum(workers)
+        chunks = ParallelUtils.Chunks(filter(None, (addr.strip() for addr in addresses)),
+                                      chunk_size)
+        return self.__Convert(chunks, workers)
+
+    def __Convert(self,
+                  chunks: Iterator[List[str]],
+                  workers: int) -> Iterator[CliConvertRecord]:
+        """
+        Convert chunks of addresses.
+
+        Args:
+            chunks (Iterator[list[str]]): Chunks of addresses
+            workers (int)               : Number of worker processes
+
+        Returns:
+            Iterator[CliConvertRecord]: Iterator of converted address records
+        """
+        for _, records in ParallelUtils.MapChunks(_CliConvertUtils.ConvertChunk,
+                                                  chunks,
+                                                  workers,
+                                                  self.m_conv_fct,
+                                                  self.m_conv_args):
+            yield from records
@@ -0,0 +1,553 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Module for deriving addresses ranges from the command line interface.
+Addresses are derived in chunks of indexes by worker processes, starting from the keys of the last non-address
+level, and yielded in order one by one, so that the memory usage does not depend on the range size.
+"""
+
+# Imports
+from enum import Enum, auto, unique
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Type
+
+from bip_utils.addr import XmrAddrEncoder
+from bip_utils.bip.bip32 import Bip32KeyIndex
+from bip_utils.bip.bip39 import Bip39SeedGenerator
+from bip_utils.bip.bip44 import Bip44
+from bip_utils.bip.bip44_base import Bip44Base, Bip44Changes, Bip44Levels
+from bip_utils.bip.bip49 import Bip49
+from bip_utils.bip.bip84 import Bip84
+from bip_utils.bip.bip86 import Bip86
+from bip_utils.bip.conf.bip44 import Bip44Coins
+from bip_utils.bip.conf.bip49 import Bip49Coins
+from bip_utils.bip.conf.bip84 import Bip84Coins
+from bip_utils.bip.conf.bip86 import Bip86Coins
+from bip_utils.bip.conf.common import BipCoins
+from bip_utils.cardano.cip1852 import Cip1852
+from bip_utils.cardano.cip1852.conf import Cip1852Coins
+from bip_utils.cardano.mnemonic import CardanoIcarusSeedGenerator
+from bip_utils.cardano.shelley import CardanoShelley
+from bip_utils.monero import Monero, MoneroSubaddress
+from bip_utils.monero.conf import MoneroCoins
+from bip_utils.monero.mnemonic import MoneroSeedGenerator
+from bip_utils.ss58 import SS58Codec
+from bip_utils.substrate import Substrate
+from bip_utils.substrate.conf import SubstrateCoins
+from bip_utils.substrate.mnemonic import SubstrateBip39SeedGenerator
+from bip_utils.utils.misc import BytesUtils, ParallelUtils
+
+
+@unique
+class CliDeriveSpecs(Enum):
+    """Enumerative for derivation specifications."""
+
+    BIP44 = auto()
+    BIP49 = auto()
+    BIP84 = auto()
+    BIP86 = auto()
+    CIP1852 = auto()
+    SUBSTRATE = auto()
+    MONERO = auto()
+
+
+class CliDeriveConst:
+    """Class container for command line interface derivation constants."""
+
+    # Default number of addresses derived by a worker at once
+    DEF_CHUNK_SIZE: int = 256
+
+    # Coins enumerative for each specification
+    SPEC_TO_COINS: Dict[CliDeriveSpecs, Type[Enum]] = {
+        CliDeriveSpecs.BIP44: Bip44Coins,
+        CliDeriveSpecs.BIP49: Bip49Coins,
+        CliDeriveSpecs.BIP84: Bip84Coins,
+        CliDeriveSpecs.BIP86: Bip86Coins,
+        CliDeriveSpecs.CIP1852: Cip1852Coins,
+        CliDeriveSpecs.SUBSTRATE: SubstrateCoins,
+        CliDeriveSpecs.MONERO: MoneroCoins,
+    }
+
+    # BIP class for each BIP specification
+    SPEC_TO_BIP_CLASS: Dict[CliDeriveSpecs, Type[Bip44Base]] = {
+        CliDeriveSpecs.BIP44: Bip44,
+        CliDeriveSpecs.BIP49: Bip49,
+        CliDeriveSpecs.BIP84: Bip84,
+        CliDeriveSpecs.BIP86: Bip86,
+    }
+
+    # Cardano coins whose seed is generated with the Icarus seed generator
+    CARDANO_ICARUS_COINS: Tuple[Cip1852Coins, ...] = (
+        Cip1852Coins.CARDANO_ICARUS,
+        Cip1852Coins.CARDANO_ICARUS_TESTNET,
+    )
+
+
+class CliDeriveRecord(NamedTuple):
+    """Derived address record."""
+
+    address_index: int
+    path: str
+    address: str
+    public_key: str
+
+
+class _CliDeriveUtils:
+    """
+    Class container for command line interface derivation utility functions.
+    The derivation functions are called by the worker processes, so they shall be picklable. Each of them
+    returns, for each index of the chunk, the path element, the address and the public key.
+    """
+
+    @staticmethod
+    def IndexToStr(index: Bip32KeyIndex) -> str:
+        """
+        Convert a BIP32 key index to a path element string.
+
+        Args:
+            index (Bip32KeyIndex object): Key index
+
+        Returns:
+            str: Path element string
+        """
+        return f"{index.Unharden().ToInt()}'" if index.IsHardened() else str(index.ToInt())
+
+    @staticmethod
+    def DeriveBip(bip_cls: Type[Bip44Base],
+                  ex_key_str: str,
+                  coin_type: BipCoins,
+                  indexes: List[int]) -> List[Tuple[str, str, str]]:
+        """
+        Derive the addresses of the specified indexes from a change level extended key.
+
+        Args:
+            bip_cls (class)     : Bip44Base child class
+            ex_key_str (str)    : Extended key string
+            coin_type (BipCoins): Coin type
+            indexes (list[int]) : Address indexes
+
+        Returns:
+            list[tuple[str, str, str]]: Path element, address and public key of each index
+        """
+        bip_obj = bip_cls.FromExtendedKey(ex_key_str, coin_type)
+
+        results = []
+        for index in indexes:
+            addr_obj = bip_obj.AddressIndex(index)
+            pub_key = addr_obj.PublicKey()
+            results.append((_CliDeriveUtils.IndexToStr(addr_obj.Bip32Object().Index()),
+                            pub_key.ToAddress(),
+                            pub_key.RawCompressed().ToHex()))
+        return results
+
+    @staticmethod
+    def DeriveCardano(ex_key_str: str,
+                      coin_type: Cip1852Coins,
+                      change: Bip44Changes,
+                      indexes: List[int]) -> List[Tuple[str, str, str]]:
+        """
+        Derive the Cardano Shelley addresses of the specified indexes from an account level extended key.
+
+        Args:
+            ex_key_str (str)        : Extended key string
+            coin_type (Cip1852Coins)  : Coin type
+            change (Bip44Changes)   : Change type
+            indexes (list[int])     : Address indexes
+
+        Returns:
+            list[tuple[str, str, str]]: Path element, address and public key of each index
+        """
+        shelley_obj = CardanoShelley.FromCip1852Object(Cip1852.FromExtendedKey(ex_key_str, coin_type)).Change(change)
+
+        results = []
+        for index in indexes:
+            pub_keys = shelley_obj.AddressIndex(index).PublicKeys()
+            results.append((_CliDeriveUtils.IndexToStr(Bip32KeyIndex(index)),
+                            pub_keys.ToAddress(),
+                            pub_keys.AddressKey().RawCompressed().ToHex()))
+        return results
+
+    @staticmethod
+    def DeriveSubstrate(pub_key_bytes: bytes,
+                        coin_type: SubstrateCoins,
+                        indexes: List[int]) -> List[Tuple[str, str, str]]:
+        """
+        Derive the Substrate addresses of the specified soft children indexes from a public key.
+        Indexes shall be consecutive.
+
+        Args:
+            pub_key_bytes (bytes)     : Public key bytes
+            coin_type (SubstrateCoins): Coin type
+            indexes (list[int])       : Soft children indexes
+
+        Returns:
+            list[tuple[str, str, str]]: Path element, address and public key of each index
+        """
+        substrate_obj = Substrate.FromPublicKey(pub_key_bytes, coin_type)
+        codec = SS58Codec.FromFormat(substrate_obj.CoinConf().SS58Format())
+
+        return [
+            (str(index), codec.Encode(child_pub_key_bytes), BytesUtils.ToHexString(child_pub_key_bytes))
+            for index, child_pub_key_bytes in zip(indexes,
+                                                  substrate_obj.ChildPublicKeysRange(indexes[0], indexes[-1] + 1))
+        ]
+
+    @staticmethod
+    def DeriveMonero(priv_vkey_bytes: bytes,
+                     pub_skey_bytes: bytes,
+                     coin_type: MoneroCoins,
+                     account: int,
+                     indexes: List[int]) -> List[Tuple[str, str, str]]:
+        """
+        Derive the Monero subaddresses of the specified indexes from the watch-only keys.
+
+        Args:
+            priv_vkey_bytes (bytes): Private view key bytes
+            pub_skey_bytes (bytes) : Public spend key bytes
+            coin_type (MoneroCoins): Coin type
+            account (int)          : Account index (i.e. subaddress major index)
+            indexes (list[int])    : Subaddress minor indexes
+
+        Returns:
+            list[tuple[str, str, str]]: Path element, address and public spend key of each index
+        """
+        monero = Monero.FromWatchOnly(priv_vkey_bytes, pub_skey_bytes, coin_type)
+        subaddr = MoneroSubaddress(monero.PrivateViewKey(), monero.PublicSpendKey(), monero.PublicViewKey())
+        coin_conf = monero.CoinConf()
+
+        results = []
+        for index in indexes:
+            pub_skey, pub_vkey = subaddr.ComputeKeys(index, account)
+            # Subaddress 0,0 is the primary address
+            net_ver = (coin_conf.AddrNetVersion()
+                       if index == 0 and account == 0
+                       else coin_conf.SubaddrNetVersion())
+            results.append((str(index),
+                            XmrAddrEncoder.EncodeKey(pub_skey.KeyObject(),
+                                                     pub_vkey=pub_vkey.KeyObject(),
+                                                     net_ver=net_ver),
+                            pub_skey.RawCompressed().ToHex()))
+        return results
+
+
+class CliDeriver:
+    """
+    Command line interface deriver class.
+    It prepares the keys of the last non-address level from a mnemonic, a seed or an extended key (only
+    for BIP and CIP-1852 specifications) and derives ranges of addresses from them:
+    - BIP: m/purpose'/coin'/account'/change/index (or relative to the extended key, at account or change level)
+    - CIP-1852: m/1852'/coin'/account'/change/index (or relative to the extended key, at account level)
+    - Substrate: soft children of the master key, i.e. /index
+    - Monero: subaddresses of the specified account, i.e. account/index
+    """
+
+    m_fct: Callable[..., List[Tuple[str, str, str]]]
+    m_args: Tuple[Any, ...]
+    m_path_prefix: str
+
+    def __init__(self,
+                 spec: CliDeriveSpecs,
+                 coin_name: str,
+                 mnemonic: Optional[str] = None,
+                 seed_bytes: Optional[bytes] = None,
+                 ex_key_str: Optional[str] = None,
+                 passphrase: str = "",
+                 account: int = 0,
+                 change: int = 0) -> None:
+        """
+        Construct class.
+        Exactly one between mnemonic, seed bytes and extended key shall be specified.
+
+        Args:
+            spec (CliDeriveSpecs)       : Derivation specification
+            coin_name (str)             : Coin name (i.e. name of a member of the specification coins enumerative)
+            mnemonic (str, optional)    : Mnemonic
+            seed_bytes (bytes, optional): Seed bytes
+            ex_key_str (str, optional)  : Extended key string
+            passphrase (str, optional)  : Mnemonic passphrase (default: empty)
+            account (int, optional)     : Account index (default: 0)
+            change (int, optional)      : Change index (default: 0, ignored for Substrate and Monero)
+
+        Raises:
+            TypeError: If the specification is not a CliDeriveSpecs enumerative
+            ValueError: If the parameters are not valid
+        """
+        if not isinstance(spec, CliDeriveSpecs):
+            raise TypeError("Specification is not an enumerative of CliDeriveSpecs")
+        if sum(src is not None for src in (mnemonic, seed_bytes, ex_key_str)) != 1:
+            raise ValueError("Exactly one between mnemonic, seed and extended key shall be specified")
+
+        coins_enum = CliDeriveConst.SPEC_TO_COINS[spec]
+        try:
+            coin_type = coins_enum[coin_name.upper()]
+        except KeyError as ex:
+            raise ValueError(f"Invalid coin {coin_name} for specification {spec.name.lower()}") from ex
+
+        # Cip1852Coins shall be checked before BipCoins, since it is derived from it
+        if isinstance(coin_type, Cip1852Coins):
+            self.__InitCardano(coin_type, mnemonic, seed_bytes, ex_key_str, passphrase, account, change)
+        elif isinstance(coin_type, BipCoins):
+            self.__InitBip(CliDeriveConst.SPEC_TO_BIP_CLASS[spec], coin_type, mnemonic, seed_bytes, ex_key_str,
+                           passphrase, account, change)
+        elif ex_key_str is not None:
+            raise ValueError(f"Extended keys are not supported for specification {spec.name.lower()}")
+        elif isinstance(coin_type, SubstrateCoins):
+            self.__InitSubstrate(coin_type, mnemonic, seed_bytes, passphrase)
+        else:
+            assert isinstance(coin_type, MoneroCoins)
+            self.__InitMonero(coin_type, mnemonic, seed_bytes, passphrase, account)
+
+    def PathPrefix(self) -> str:
+        """
+        Get the path prefix of the derived addresses.
+
+        Returns:
+            str: Path prefix
+        """
+        return self.m_path_prefix
+
+    def Derive(self,
+               start: int,
+               count: int,
+               workers: Optional[int] = 1,
+               chunk_size: int = CliDeriveConst.DEF_CHUNK_SIZE) -> Iterator[CliDeriveRecord]:
+        """
+        Derive the addresses of the indexes in the range [start, start + count).
+
+        Args:
+            start (int)               : First index
+            count (int)               : Number of addresses
+            workers (int, optional)   : Number of worker processes (default: 1, i.e. in the current process),
+                                        None for CPU count
+            chunk_size (int, optional): Number of addresses derived by a worker at once
+
+        Returns:
+            Iterator[CliDeriveRecord]: Iterator of derived address records (in order)
+
+        Raises:
+            ValueError: If the parameters are not valid
+        """
+        if start < 0 or count < 0:
+            raise ValueError(f"Invalid range (start: {start}, count: {count})")
+
+        workers = ParallelUtils.WorkersNum(workers)
+        chunks = ParallelUtils.Chunks(range(start, start + count), chunk_size)
+        return self.__Derive(chunks, workers)
+
+    def __Derive(self,
+                 chunks: Iterator[List[int]],
+                 workers: int) -> Iterator[CliDeriveRecord]:
+        """
+        Derive the addresses of chunks of indexes.
+
+        Args:
+            chunks (Iterator[list[int]]): Chunks of indexes
+            workers (int)               : Number of worker processes
+
+        Returns:
+            Iterator[CliDeriveRecord]: Iterator of derived address records (in order)
+        """
+        for indexes, results in ParallelUtils.MapChunks(self.m_fct, chunks, workers, *self.m_args):
+            for index, (path_elem, address, pub_key) in zip(indexes, results):
+                yield CliDeriveRecord(index, self.m_path_prefix + path_elem, address, pub_key)
+
+    def __InitBip(self,
+                  bip_cls: Type[Bip44Base],
+                  coin_type: BipCoins,
+                  mnemonic: Optional[str],
+                  seed_bytes: Optional[bytes],
+                  ex_key_str: Optional[str],
+                  passphrase: str,
+                  account: int,
+                  change: int) -> None:
+        """
+        Initialize the derivation for BIP specifications.
+
+        Args:
+            bip_cls (class)           : Bip44Base child class
+            coin_type (BipCoins)      : Coin type
+            mnemonic (str or None)    : Mnemonic
+            seed_bytes (bytes or None): Seed bytes
+            ex_key_str (str or None)  : Extended key string
+            passphrase (str)          : Mnemonic passphrase
+            account (int)             : Account index
+            change (int)              : Change index
+
+        Raises:
+            ValueError: If the parameters are not valid
+        """
+        if ex_key_str is not None:
+            bip_obj = bip_cls.FromExtendedKey(ex_key_str, coin_type)
+            if bip_obj.IsLevel(Bip44Levels.ACCOUNT):
+                path_objs = [bip_obj.Change(Bip44Changes(change))]
+            elif bip_obj.IsLevel(Bip44Levels.CHANGE):
+                path_objs = []
+            else:
+                raise ValueError("Extended key shall be at account or change level")
+            path_prefix = ""
+        else:
+            if mnemonic is not None:
+                seed_bytes = Bip39SeedGenerator(mnemonic).Generate(passphrase)
+            assert seed_bytes is not None
+            bip_obj = bip_cls.FromSeed(seed_bytes, coin_type)
+            path_objs = [bip_obj.Purpose()]
+            path_objs.append(path_objs[-1].Coin())
+            path_objs.append(path_objs[-1].Account(account))
+            path_objs.append(path_objs[-1].Change(Bip44Changes(change)))
+            path_prefix = "m/"
+
+        chg_obj = path_objs[-1] if path_objs else bip_obj
+        self.m_fct = _CliDeriveUtils.DeriveBip
+        self.m_args = (bip_cls, self.__ExtendedKey(chg_obj), coin_type)
+        self.m_path_prefix = path_prefix + self.__PathElements(path_objs)
+
+    def __InitCardano(self,
+                      coin_type: Cip1852Coins,
+                      mnemonic: Optional[str],
+                      seed_bytes: Optional[bytes],
+                      ex_key_str: Optional[str],
+                      passphrase: str,
+                      account: int,
+                      change: int) -> None:
+        """
+        Initialize the derivation for CIP-1852 specification.
+
+        Args:
+            coin_type (Cip1852Coins)  : Coin type
+            mnemonic (str or None)    : Mnemonic
+            seed_bytes (bytes or None): Seed bytes
+            ex_key_str (str or None)  : Extended key string
+            passphrase (str)          : Mnemonic passphrase
+            account (int)             : Account index
+            change (int)              : Change index
+
+        Raises:
+            ValueError: If the parameters are not valid
+        """
+        if ex_key_str is not None:
+            acc_obj = Cip1852.FromExtendedKey(ex_key_str, coin_type)
+            if not acc_obj.IsLevel(Bip44Levels.ACCOUNT):
+                raise ValueError("Extended key shall be at account level")
+            path_prefix = ""
+        else:
+            if mnemonic is not None:
+                if coin_type in CliDeriveConst.CARDANO_ICARUS_COINS:
+                    if passphrase:
+                        raise ValueError("Passphrase is not supported for Icarus seed generation")
+                    seed_bytes = CardanoIcarusSeedGenerator(mnemonic).Generate()
+                else:
+                    seed_bytes = Bip39SeedGenerator(mnemonic).Generate(passphrase)
+            assert seed_bytes is not None
+            purpose_obj = Cip1852.FromSeed(seed_bytes, coin_type).Purpose()
+            coin_obj = purpose_obj.Coin()
+            acc_obj = coin_obj.Account(account)
+            path_prefix = "m/" + self.__PathElements([purpose_obj, coin_obj, acc_obj])
+
+        change_type = Bip44Changes(change)
+        self.m_fct = _CliDeriveUtils.DeriveCardano
+        self.m_args = (self.__ExtendedKey(acc_obj), coin_type, change_type)
+        self.m_path_prefix = f"{path_prefix}{change_type.value}/"
+
+    def __InitSubstrate(self,
+                        coin_type: SubstrateCoins,
+                        mnemonic: Optional[str],
+                        seed_bytes: Optional[bytes],
+                        passphrase: str) -> None:
+        """
+        Initialize the derivation for Substrate.
+
+        Args:
+            coin_type (SubstrateCoins): Coin type
+            mnemonic (str or None)    : Mnemonic
+            seed_bytes (bytes or None): Seed bytes
+            passphrase (str)          : Mnemonic passphrase
+
+        Raises:
+            ValueError: If the parameters are not valid
+        """
+        if mnemonic is not None:
+            seed_bytes = SubstrateBip39SeedGenerator(mnemonic).Generate(passphrase)
+        assert seed_bytes is not None
+
+        substrate_obj = Substrate.FromSeed(seed_bytes, coin_type)
+        self.m_fct = _CliDeriveUtils.DeriveSubstrate
+        self.m_args = (substrate_obj.PublicKey().RawCompressed().ToBytes(), coin_type)
+        self.m_path_prefix = "/"
+
+    def __InitMonero(self,
+                     coin_type: MoneroCoins,
+                     mnemonic: Optional[str],
+                     seed_bytes: Optional[bytes],
+                     passphrase: str,
+                     account: int) -> None:
+        """
+        Initialize the derivation for Monero.
+
+        Args:
+            coin_type (MoneroCoins)   : Coin type
+            mnemonic (str or None)    : Mnemonic
+            seed_bytes (bytes or None): Seed bytes
+            passphrase (str)          : Mnemonic passphrase (not supported)
+            account (int)             : Account index
+
+        Raises:
+            ValueError: If the parameters are not valid
+        """
+        if passphrase:
+            raise ValueError("Passphrase is not supported for Monero")
+        if mnemonic is not None:
+            seed_bytes = MoneroSeedGenerator(mnemonic).Generate()
+        assert seed_bytes is not None
+
+        monero = Monero.FromSeed(seed_bytes, coin_type)
+        self.m_fct = _CliDeriveUtils.DeriveMonero
+        self.m_args = (monero.PrivateViewKey().Raw().ToBytes(),
+                       monero.PublicSpendKey().RawCompressed().ToBytes(),
+                       coin_type,
+                       account)
+        self.m_path_prefix = f"{account}/"
+
+    @staticmethod
+    def __PathElements(bip_objs: List[Bip44Base]) -> str:
+        """
+        Get the path elements of the specified objects, each one followed by a separator.
+
+        Args:
+            bip_objs (list[Bip44Base]): Bip44Base objects
+
+        Returns:
+            str: Path elements string
+        """
+        return "".join(f"{_CliDeriveUtils.IndexToStr(bip_obj.Bip32Object().Index())}/" for bip_obj in bip_objs)
+
+    @staticmethod
+    def __ExtendedKey(bip_obj: Bip44Base) -> str:
+        """
+        Get the extended key to be sent to the workers.
+        The private one is used if available, since hardened-only coins (e.g. ed25519 ones) cannot derive
+        addresses from public keys.
+
+        Args:
+            bip_obj (Bip44Base object): Bip44Base object
+
+        Returns:
+            str: Extended key string
+        """
+        return bip_obj.PublicKey().ToExtended() if bip_obj.IsPublicOnly() else bip_obj.PrivateKey().ToExtended()
@@ -0,0 +1,193 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for writing the command line interface records and reporting the progress."""
+
+# Imports
+import csv
+import json
+import time
+from enum import Enum, auto, unique
+from typing import Any, NamedTuple, Optional, TextIO
+
+
+@unique
+class CliOutputFormats(Enum):
+    """Enumerative for output formats."""
+
+    NDJSON = auto()
+    CSV = auto()
+
+
+class CliOutputConst:
+    """Class container for command line interface output constants."""
+
+    # Separator for list values in CSV format
+    CSV_LIST_SEP: str = ";"
+    # Default interval in seconds between progress reports
+    DEF_PROGRESS_INTERVAL: float = 1.0
+    # Prefix of progress reports
+    PROGRESS_PREFIX: str = "[bip_utils]"
+
+
+class CliWriter:
+    """
+    Command line interface writer class.
+    It writes records (i.e. named tuples) to a text stream one by one, as NDJSON lines or CSV rows.
+    In CSV format, the header is written with the first record.
+    """
+
+    m_stream: TextIO
+    m_format: CliOutputFormats
+    m_csv_writer: Optional[Any]
+
+    def __init__(self,
+                 stream: TextIO,
+                 out_format: CliOutputFormats) -> None:
+        """
+        Construct class.
+
+        Args:
+            stream (TextIO)              : Output stream
+            out_format (CliOutputFormats): Output format
+
+        Raises:
+            TypeError: If the output format is not a CliOutputFormats enumerative
+        """
+        if not isinstance(out_format, CliOutputFormats):
+            raise TypeError("Output format is not an enumerative of CliOutputFormats")
+
+        self.m_stream = stream
+        self.m_format = out_format
+        self.m_csv_writer = None
+
+    def Write(self,
+              record: NamedTuple) -> None:
+        """
+        Write a record.
+
+        Args:
+            record (NamedTuple): Record
+        """
+        if self.m_format == CliOutputFormats.NDJSON:
+            self.m_stream.write(json.dumps(record._asdict(), separators=(",", ":")) + "\n")
+        else:
+            if self.m_csv_writer is None:
+                self.m_csv_writer = csv.writer(self.m_stream, lineterminator="\n")
+                self.m_csv_writer.writerow(record._fields)
+            self.m_csv_writer.writerow([self.__CsvValue(value) for value in record])
+
+    @staticmethod
+    def __CsvValue(value: Any) -> str:
+        """
+        Convert a record value to a CSV field, so that it is written in the same way of the JSON one.
+
+        Args:
+            value (any): Value
+
+        Returns:
+            str: CSV field
+        """
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, (list, tuple)):
+            return CliOutputConst.CSV_LIST_SEP.join(value)
+        return str(value)
+
+
+class CliProgress:
+    """
+    Command line interface progress class.
+    It counts the processed records and periodically reports their number and the throughput to a text stream
+    (usually stderr, so that the output is not affected).
+    """
+
+    m_stream: Optional[TextIO]
+    m_interval: float
+    m_records_num: int
+    m_start_time: float
+    m_last_time: float
+
+    def __init__(self,
+                 stream: Optional[TextIO],
+                 interval: float = CliOutputConst.DEF_PROGRESS_INTERVAL) -> None:
+        """
+        Construct class.
+
+        Args:
+            stream (TextIO or None)   : Stream for the reports, None for not reporting
+            interval (float, optional): Interval in seconds between reports
+        """
+        self.m_stream = stream
+        self.m_interval = interval
+        self.m_records_num = 0
+        self.m_start_time = time.monotonic()
+        self.m_last_time = self.m_start_time
+
+    def RecordsNum(self) -> int:
+        """
+        Get the number of processed records.
+
+        Returns:
+            int: Number of processed records
+        """
+        return self.m_records_num
+
+    def Update(self,
+               records_num: int = 1) -> None:
+        """
+        Update the number of processed records and report the progress if the interval is elapsed.
+
+        Args:
+            records_num (int, optional): Number of new processed records (default: 1)
+        """
+        self.m_records_num += records_num
+        if self.m_stream is None:
+            return
+
+        curr_time = time.monotonic()
+        if curr_time - self.m_last_time >= self.m_interval:
+            self.m_last_time = curr_time
+            self.__Report("progress", curr_time)
+
+    def Finish(self) -> None:
+        """Report the final number of processed records and the throughput."""
+        if self.m_stream is not None:
+            self.__Report("done", time.monotonic())
+
+    def __Report(self,
+                 status: str,
+                 curr_time: float) -> None:
+        """
+        Report the number of processed records and the throughput.
+
+        Args:
+            status (str)     : Status string
+            curr_time (float): Current time
+        """
+        assert self.m_stream is not None
+
+        elapsed = curr_time - self.m_start_time
+        rate = self.m_records_num / elapsed if elapsed > 0 else 0.0
+        self.m_stream.write(f"{CliOutputConst.PROGRESS_PREFIX} {status}: {self.m_records_num} records "
+                            f"in {elapsed:.1f}s ({rate:.1f} records/s)\n")
+        self.m_stream.flush()
@@ -0,0 +1,130 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for validating addresses from the command line interface."""
+
+# Imports
+from enum import Enum
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Type
+
+from bip_utils.addr_classifier import AddrClassifier, AddrClassifierConst
+from bip_utils.cli.cli_derive import CliDeriveConst, CliDeriveSpecs
+
+
+class CliValidateConst:
+    """Class container for command line interface validation constants."""
+
+    # Separator between specification and coin names
+    COIN_NAME_SEP: str = ":"
+
+
+class CliValidateRecord(NamedTuple):
+    """Validated address record."""
+
+    address: str
+    valid: bool
+    coins: List[str]
+
+
+class CliValidator:
+    """
+    Command line interface validator class.
+    It classifies addresses with an AddrClassifier and names the coins they are valid for as "spec:COIN"
+    (e.g. "bip84:BITCOIN"), so that they can be passed back to the validator.
+    """
+
+    m_classifier: AddrClassifier
+    m_coins_specs: Dict[Type[Enum], CliDeriveSpecs]
+
+    def __init__(self,
+                 coin_names: Optional[Iterable[str]] = None) -> None:
+        """
+        Construct class.
+
+        Args:
+            coin_names (Iterable[str], optional): Coin names in "spec:COIN" format (default: all the coins)
+
+        Raises:
+            ValueError: If one of the coin names is not valid
+        """
+        self.m_coins_specs = {coins_enum: spec for spec, coins_enum in CliDeriveConst.SPEC_TO_COINS.items()}
+        self.m_classifier = AddrClassifier(
+            [self.__CoinFromName(coin_name) for coin_name in coin_names] if coin_names is not None else None
+        )
+
+    def Validate(self,
+                 addresses: Iterable[str],
+                 workers: Optional[int] = 1,
+                 chunk_size: int = AddrClassifierConst.DEF_CHUNK_SIZE) -> Iterator[CliValidateRecord]:
+        """
+        Validate many addresses, in the same order.
+        Addresses are stripped (so lines of a file can be passed directly) and empty lines are skipped.
+
+        Args:
+            addresses (Iterable[str]) : Addresses (e.g. a file object)
+            workers (int, optional)   : Number of worker processes (default: 1, i.e. in the current process),
+                                        None for CPU count
+            chunk_size (int, optional): Number of addresses sent to a worker at once
+
+        Returns:
+            Iterator[CliValidateRecord]: Iterator of validated address records
+
+        Raises:
+            ValueError: If the parameters are not valid
+        """
+        for result in self.m_classifier.ValidateMany(addresses, workers, chunk_size):
+            yield CliValidateRecord(result.address,
+                                    len(result.coins) > 0,
+                                    [self.__CoinToName(coin) for coin in result.coins])
+
+    def __CoinToName(self,
+                     coin: Enum) -> str:
+        """
+        Get the name of a coin.
+
+        Args:
+            coin (Enum): Coin
+
+        Returns:
+            str: Coin name in "spec:COIN" format
+        """
+        return f"{self.m_coins_specs[type(coin)].name.lower()}{CliValidateConst.COIN_NAME_SEP}{coin.name}"
+
+    @staticmethod
+    def __CoinFromName(coin_name: str) -> Enum:
+        """
+        Get a coin from its name.
+
+        Args:
+            coin_name (str): Coin name in "spec:COIN" format
+
+        Returns:
+            Enum: Coin
+
+        Raises:
+            ValueError: If the coin name is not valid
+        """
+        spec_name, sep, name = coin_name.partition(CliValidateConst.COIN_NAME_SEP)
+        try:
+            if not sep:
+                raise KeyError(coin_name)
+            return CliDeriveConst.SPEC_TO_COINS[CliDeriveSpecs[spec_name.upper()]][name.upper()]
+        except KeyError as ex:
+            raise ValueError(f"Invalid coin name ({coin_name})") from ex
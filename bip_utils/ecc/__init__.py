@@ -29,9 +29,7 @@ from bip_utils.ecc.ed25519_monero.ed25519_monero_keys import Ed25519MoneroPrivat
 from bip_utils.ecc.ed25519_monero.ed25519_monero_point import Ed25519MoneroPoint
 
 # nist256p1
-from bip_utils.ecc.nist256p1.nist256p1 import Nist256p1
-from bip_utils.ecc.nist256p1.nist256p1_keys import Nist256p1PrivateKey, Nist256p1PublicKey
-from bip_utils.ecc.nist256p1.nist256p1_point import Nist256p1Point
+from bip_utils.ecc.nist256p1.nist256p1 import Nist256p1, Nist256p1Point, Nist256p1PrivateKey, Nist256p1PublicKey
 
 # secp256k1
 from bip_utils.ecc.secp256k1.secp256k1 import Secp256k1, Secp256k1Point, Secp256k1PrivateKey, Secp256k1PublicKey
@@ -26,3 +26,5 @@ class EccConf:
 
     # True for using coincurve for secp256k1, false for using ecdsa
     USE_COINCURVE: bool = True
+    # True for using cryptography for nist256p1 (if installed), false for using ecdsa
+    USE_CRYPTOGRAPHY: bool = True
@@ -0,0 +1,345 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for precomputed tables for the generator multiplication of ECDSA curves."""
+
+# Imports
+import threading
+from typing import List, Optional, Tuple
+
+from ecdsa.numbertheory import inverse_mod
+
+from bip_utils.utils.crypto import Sha256
+from bip_utils.utils.misc import BytesUtils, IntegerUtils
+
+
+class EcdsaGeneratorTableConst:
+    """Class container for ECDSA generator table constants."""
+
+    # Window size in bits
+    WINDOW_BITS: int = 8
+    # Number of points for each window (the window digits are signed, so only half of them are needed)
+    WINDOW_POINTS_NUM: int = 1 << (WINDOW_BITS - 1)
+
+
+class _EcdsaGeneratorTableUtils:
+    """Class container for ECDSA generator table utility functions."""
+
+    @staticmethod
+    def AddAffine(p: int,
+                  a: int,
+                  point_1: Tuple[int, int],
+                  point_2: Tuple[int, int]) -> Tuple[int, int]:
+        """
+        Add two points in affine coordinates (it also works for doubling a point).
+
+        Args:
+            p (int)                : Field prime
+            a (int)                : Curve a coefficient
+            point_1 (tuple[int, int]): First point coordinates
+            point_2 (tuple[int, int]): Second point coordinates
+
+        Returns:
+            tuple[int, int]: Resulting point coordinates
+
+        Raises:
+            ValueError: If the resulting point is the point at infinity
+        """
+        x1, y1 = point_1
+        x2, y2 = point_2
+
+        if x1 == x2:
+            if (y1 + y2) % p == 0:
+                raise ValueError("Invalid point addition (point at infinity)")
+            lam = (3 * x1 * x1 + a) * inverse_mod(2 * y1, p) % p
+        else:
+            lam = (y2 - y1) * inverse_mod(x2 - x1, p) % p
+
+        x3 = (lam * lam - x1 - x2) % p
+        return x3, (lam * (x1 - x3) - y1) % p
+
+
+class EcdsaGeneratorTable:
+    """
+    ECDSA generator table class.
+    It multiplies the generator of a short Weierstrass curve by a scalar using a precomputed table.
+    The scalar is recoded in signed windows, so the table only contains the multiples from 1 to 128 of the
+    generator for each window (negative digits are obtained by negating the point). In this way, a multiplication
+    only requires an addition for each window and a single modular inversion at the end, instead of a doubling
+    for each bit.
+    The table is built the first time it is needed, or when Build is called. It can be saved to a file and loaded
+    back from it, so that it's not built again at every start.
+    The class can be used by multiple threads: the table is built only once even if more threads need it at the
+    same time, and a multiplication always uses a complete table.
+    """
+
+    m_field_prime: int
+    m_curve_a: int
+    m_order: int
+    m_generator: Tuple[int, int]
+    m_lock: threading.Lock
+    m_table: Optional[List[List[Tuple[int, int]]]]
+
+    def __init__(self,
+                 field_prime: int,
+                 curve_a: int,
+                 order: int,
+                 gen_x: int,
+                 gen_y: int) -> None:
+        """
+        Construct class.
+
+        Args:
+            field_prime (int): Field prime
+            curve_a (int)    : Curve a coefficient
+            order (int)      : Curve order
+            gen_x (int)      : X coordinate of the generator point
+            gen_y (int)      : Y coordinate of the generator point
+        """
+        self.m_field_prime = field_prime
+        self.m_curve_a = curve_a
+        self.m_order = order
+        self.m_generator = (gen_x, gen_y)
+        self.m_lock = threading.Lock()
+        self.m_table = None
+
+    def IsBuilt(self) -> bool:
+        """
+        Get if the table is built.
+
+        Returns:
+            bool: True if built, false otherwise
+        """
+        return self.m_table is not None
+
+    def Build(self) -> None:
+        """Build the table (if not already built)."""
+        self.__Table()
+
+    def Clear(self) -> None:
+        """Clear the table to free memory, it'll be built again when needed."""
+        self.m_table = None
+
+    def Save(self,
+             file_path: str) -> None:
+        """
+        Save the table to file (the table is built if needed).
+
+        Args:
+            file_path (str): File path
+        """
+        table_bytes = self.__ToBytes()
+        with open(file_path, "wb") as fout:
+            fout.write(Sha256.QuickDigest(table_bytes) + table_bytes)
+
+    def Load(self,
+             file_path: str) -> None:
+        """
+        Load the table from a file previously saved with Save.
+        The file shall come from a trusted source: its integrity is verified, but the points are not
+        computed again.
+
+        Args:
+            file_path (str): File path
+
+        Raises:
+            ValueError: If the file is not a valid table for the curve
+        """
+        with open(file_path, "rb") as fin:
+            file_bytes = fin.read()
+
+        digest_len = Sha256.DigestSize()
+        table_bytes = file_bytes[digest_len:]
+        if file_bytes[:digest_len] != Sha256.QuickDigest(table_bytes):
+            raise ValueError("Invalid generator table file (corrupted data)")
+        self.m_table = self.__FromBytes(table_bytes)
+
+    def Multiply(self,
+                 scalar: int) -> Tuple[int, int]:
+        """
+        Multiply the generator by a scalar (the table is built if needed).
+
+        Args:
+            scalar (int): Scalar
+
+        Returns:
+            tuple[int, int]: Resulting point coordinates
+
+        Raises:
+            ValueError: If the resulting point is the point at infinity
+        """
+        scalar %= self.m_order
+        if scalar == 0:
+            raise ValueError("Invalid point multiplication (point at infinity)")
+
+        table = self.__Table()
+
+        p = self.m_field_prime
+        win_mask = (1 << EcdsaGeneratorTableConst.WINDOW_BITS) - 1
+        win_half = EcdsaGeneratorTableConst.WINDOW_POINTS_NUM
+
+        # Accumulator in Jacobian coordinates (z equal to zero means point at infinity)
+        x1 = y1 = z1 = 0
+        carry = 0
+        for window in table:
+            digit = (scalar & win_mask) + carry
+            scalar >>= EcdsaGeneratorTableConst.WINDOW_BITS
+            carry = int(digit > win_half)
+            if carry:
+                digit -= win_mask + 1
+            if digit == 0:
+                continue
+
+            if digit > 0:
+                x2, y2 = window[digit - 1]
+            else:
+                x2, y2 = window[-digit - 1]
+                y2 = p - y2
+
+            if z1 == 0:
+                x1, y1, z1 = x2, y2, 1
+                continue
+
+            # Mixed addition (Jacobian + affine)
+            z1z1 = z1 * z1 % p
+            h = (x2 * z1z1 - x1) % p
+            r = (y2 * z1 * z1z1 - y1) % p
+            if h == 0:
+                # Same point, double it in affine coordinates (it practically never happens)
+                if r == 0:
+                    x1, y1 = _EcdsaGeneratorTableUtils.AddAffine(p, self.m_curve_a, (x2, y2), (x2, y2))
+                    z1 = 1
+                # Opposite point
+                else:
+                    z1 = 0
+                continue
+
+            hh = h * h % p
+            hhh = h * hh % p
+            v = x1 * hh % p
+            x1 = (r * r - hhh - 2 * v) % p
+            y1 = (r * (v - x1) - y1 * hhh) % p
+            z1 = z1 * h % p
+
+        # Back to affine coordinates
+        z_inv = inverse_mod(z1, p)
+        z_inv_2 = z_inv * z_inv % p
+        return x1 * z_inv_2 % p, y1 * z_inv_2 * z_inv % p
+
+    def __Table(self) -> List[List[Tuple[int, int]]]:
+        """
+        Get the table, building it if needed.
+        The lock is taken only if the table is not built, so that multiplications never wait once it's built.
+
+        Returns:
+            list[list[tuple[int, int]]]: Table
+        """
+        table = self.m_table
+        if table is None:
+            with self.m_lock:
+                table = self.m_table
+                if table is None:
+                    table = self.__Compute()
+                    self.m_table = table
+        return table
+
+    def __Compute(self) -> List[List[Tuple[int, int]]]:
+        """
+        Compute the table.
+
+        Returns:
+            list[list[tuple[int, int]]]: Table
+        """
+        table = []
+        base = self.m_generator
+        for _ in range(self.__WindowsNum()):
+            window = [base]
+            for _ in range(EcdsaGeneratorTableConst.WINDOW_POINTS_NUM - 1):
+                window.append(
+                    _EcdsaGeneratorTableUtils.AddAffine(self.m_field_prime, self.m_curve_a, window[-1], base)
+                )
+            table.append(window)
+            # Base of the next window: 2^WINDOW_BITS times the current one
+            base = _EcdsaGeneratorTableUtils.AddAffine(self.m_field_prime, self.m_curve_a, window[-1], window[-1])
+        return table
+
+    def __WindowsNum(self) -> int:
+        """
+        Get the number of windows (one more for the carry of the last signed digit).
+
+        Returns:
+            int: Number of windows
+        """
+        return (self.m_order.bit_length() + EcdsaGeneratorTableConst.WINDOW_BITS - 1) \
+            // EcdsaGeneratorTableConst.WINDOW_BITS + 1
+
+    def __CoordByteLen(self) -> int:
+        """
+        Get the length in bytes of a coordinate.
+
+        Returns:
+            int: Coordinate length in bytes
+        """
+        return (self.m_field_prime.bit_length() + 7) // 8
+
+    def __ToBytes(self) -> bytes:
+        """
+        Convert the table to bytes (the table is built if needed).
+
+        Returns:
+            bytes: Table bytes
+        """
+        coord_len = self.__CoordByteLen()
+        return b"".join(
+            IntegerUtils.ToBytes(x, coord_len) + IntegerUtils.ToBytes(y, coord_len)
+            for window in self.__Table() for x, y in window
+        )
+
+    def __FromBytes(self,
+                    table_bytes: bytes) -> List[List[Tuple[int, int]]]:
+        """
+        Convert bytes to table.
+
+        Args:
+            table_bytes (bytes): Table bytes
+
+        Returns:
+            list[list[tuple[int, int]]]: Table
+
+        Raises:
+            ValueError: If the bytes are not a valid table for the curve
+        """
+        coord_len = self.__CoordByteLen()
+        point_len = coord_len * 2
+        win_len = point_len * EcdsaGeneratorTableConst.WINDOW_POINTS_NUM
+        if len(table_bytes) != win_len * self.__WindowsNum():
+            raise ValueError("Invalid generator table file (wrong length)")
+
+        table = [
+            [
+                (BytesUtils.ToInteger(table_bytes[i:i + coord_len]),
+                 BytesUtils.ToInteger(table_bytes[i + coord_len:i + point_len]))
+                for i in range(win_start, win_start + win_len, point_len)
+            ]
+            for win_start in range(0, len(table_bytes), win_len)
+        ]
+        if table[0][0] != self.m_generator:
+            raise ValueError("Invalid generator table file (wrong curve)")
+        return table
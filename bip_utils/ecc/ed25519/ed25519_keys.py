@@ -21,9 +21,9 @@
 """Module for ed25519 keys."""
 
 # Imports
-from typing import Any
+from typing import Any, Iterable, List
 
-from nacl import exceptions, signing
+from nacl import bindings, exceptions, signing
 
 from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
 from bip_utils.ecc.common.ipoint import IPoint
@@ -200,6 +200,24 @@ class Ed25519PrivateKey(IPrivateKey):
         except (exceptions.RuntimeError, exceptions.ValueError) as ex:
             raise ValueError("Invalid private key bytes") from ex
 
+    @staticmethod
+    def PublicKeysFromPrivate(keys_bytes: Iterable[bytes]) -> List[bytes]:
+        """
+        Compute the public keys of many private keys.
+        The libsodium function is called directly for each key, without constructing any key object.
+        Since libsodium functions release the GIL, chunks of keys can be also processed by a thread pool.
+
+        Args:
+            keys_bytes (iterable[bytes]): Private keys bytes
+
+        Returns:
+            list[bytes]: Public keys bytes (without prefix)
+
+        Raises:
+            ValueError: If a private key is not valid
+        """
+        return [Ed25519PrivateKey.__PublicKeyFromPrivate(key_bytes) for key_bytes in keys_bytes]
+
     def __init__(self,
                  key_obj: signing.SigningKey) -> None:
         """
@@ -256,3 +274,21 @@ class Ed25519PrivateKey(IPrivateKey):
             IPublicKey object: IPublicKey object
         """
         return Ed25519PublicKey(self.m_sign_key.verify_key)
+
+    @staticmethod
+    def __PublicKeyFromPrivate(key_bytes: bytes) -> bytes:
+        """
+        Compute the public key of a private key.
+
+        Args:
+            key_bytes (bytes): Private key bytes
+
+        Returns:
+            bytes: Public key bytes (without prefix)
+
+        Raises:
+            ValueError: If the private key is not valid
+        """
+        if len(key_bytes) != Ed25519KeysConst.PRIV_KEY_BYTE_LEN:
+            raise ValueError("Invalid private key bytes")
+        return bindings.crypto_sign_seed_keypair(key_bytes)[0]
@@ -48,6 +48,23 @@ _D = -121665 * _inv(121666)
 _I = pow(2, (_Q - 1) // 4, _Q)  # noqa: E741
 
 
+def _is_square(x: int) -> bool:
+    # Jacobi symbol (equal to the Legendre symbol since _Q is prime), faster than Euler's criterion
+    a = x % _Q
+    n = _Q
+    t = 1
+    while a != 0:
+        while a & 1 == 0:
+            a >>= 1
+            if n & 7 in (3, 5):
+                t = -t
+        a, n = n, a
+        if a & 3 == 3 and n & 3 == 3:
+            t = -t
+        a %= n
+    return n != 1 or t == 1
+
+
 def _x_recover(y: int) -> int:
     xx = (y * y - 1) * _inv(_D * y * y + 1)
     x = pow(xx, (_Q + 3) // 8, _Q)
@@ -259,6 +276,11 @@ def point_is_on_curve(point: Union[bytes, Tuple[int, int]]) -> bool:
         ValueError: If point bytes are not valid
     """
     if isinstance(point, bytes):
+        # For encoded points, just check if x^2 = (y^2 - 1) / (d*y^2 + 1) has a square root, which is faster
+        # than recovering x. Since (d*y^2 + 1) is never zero, that's the same of checking (y^2 - 1) * (d*y^2 + 1).
+        if point_is_encoded_bytes(point):
+            yy = (int_decode(point) & ((1 << 255) - 1)) ** 2
+            return _is_square((yy - 1) * (_D * yy + 1))
         point = point_bytes_to_coord(point)
 
     x = point[0]
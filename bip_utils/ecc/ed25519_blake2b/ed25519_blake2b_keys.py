@@ -21,9 +21,10 @@
 """Module for ed25519-blake2b keys."""
 
 # Imports
-from typing import Any
+from typing import Any, Iterable, List
 
 import ed25519_blake2b
+from nacl import bindings
 
 from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
 from bip_utils.ecc.common.ipoint import IPoint
@@ -31,6 +32,7 @@ from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
 from bip_utils.ecc.ed25519.ed25519_keys import Ed25519KeysConst, Ed25519PublicKey
 from bip_utils.ecc.ed25519.lib import ed25519_lib
 from bip_utils.ecc.ed25519_blake2b.ed25519_blake2b_point import Ed25519Blake2bPoint
+from bip_utils.utils.crypto import Blake2b512
 from bip_utils.utils.misc import BytesUtils, DataBytes
 
 
@@ -190,6 +192,24 @@ class Ed25519Blake2bPrivateKey(IPrivateKey):
         except ValueError as ex:
             raise ValueError("Invalid private key bytes") from ex
 
+    @staticmethod
+    def PublicKeysFromPrivate(keys_bytes: Iterable[bytes]) -> List[bytes]:
+        """
+        Compute the public keys of many private keys.
+        The libsodium function is called directly for each key, without constructing any key object.
+        Since libsodium functions release the GIL, chunks of keys can be also processed by a thread pool.
+
+        Args:
+            keys_bytes (iterable[bytes]): Private keys bytes
+
+        Returns:
+            list[bytes]: Public keys bytes (without prefix)
+
+        Raises:
+            ValueError: If a private key is not valid
+        """
+        return [Ed25519Blake2bPrivateKey.__PublicKeyFromPrivate(key_bytes) for key_bytes in keys_bytes]
+
     def __init__(self,
                  key_obj: ed25519_blake2b.SigningKey) -> None:
         """
@@ -246,3 +266,24 @@ class Ed25519Blake2bPrivateKey(IPrivateKey):
             IPublicKey object: IPublicKey object
         """
         return Ed25519Blake2bPublicKey(self.m_sign_key.get_verifying_key())
+
+    @staticmethod
+    def __PublicKeyFromPrivate(key_bytes: bytes) -> bytes:
+        """
+        Compute the public key of a private key.
+
+        Args:
+            key_bytes (bytes): Private key bytes
+
+        Returns:
+            bytes: Public key bytes (without prefix)
+
+        Raises:
+            ValueError: If the private key is not valid
+        """
+        if len(key_bytes) != Ed25519KeysConst.PRIV_KEY_BYTE_LEN:
+            raise ValueError("Invalid private key bytes")
+        # Same of ed25519, but using BLAKE2b-512 instead of SHA512 (the scalar is clamped by libsodium)
+        return bindings.crypto_scalarmult_ed25519_base(
+            Blake2b512.QuickDigest(key_bytes)[:Ed25519KeysConst.PRIV_KEY_BYTE_LEN]
+        )
@@ -25,9 +25,9 @@ right 32-byte extension part).
 """
 
 # Imports
-from typing import Any
+from typing import Any, Iterable, List
 
-from nacl import signing
+from nacl import exceptions, signing
 
 from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
 from bip_utils.ecc.common.ipoint import IPoint
@@ -92,6 +92,24 @@ class Ed25519KholawPrivateKey(IPrivateKey):
         return cls(Ed25519PrivateKey.FromBytes(key_bytes[:Ed25519PrivateKey.Length()]),
                    key_bytes[Ed25519PrivateKey.Length():])
 
+    @staticmethod
+    def PublicKeysFromPrivate(keys_bytes: Iterable[bytes]) -> List[bytes]:
+        """
+        Compute the public keys of many private keys.
+        The libsodium function is called directly for each key, without constructing any key object.
+        Since libsodium functions release the GIL, chunks of keys can be also processed by a thread pool.
+
+        Args:
+            keys_bytes (iterable[bytes]): Private keys bytes
+
+        Returns:
+            list[bytes]: Public keys bytes (without prefix)
+
+        Raises:
+            ValueError: If a private key is not valid
+        """
+        return [Ed25519KholawPrivateKey.__PublicKeyFromPrivate(key_bytes) for key_bytes in keys_bytes]
+
     def __init__(self,
                  key_obj: IPrivateKey,
                  key_ex_bytes: bytes) -> None:
@@ -164,3 +182,24 @@ class Ed25519KholawPrivateKey(IPrivateKey):
                 ed25519_lib.point_scalar_mul_base(bytes(self.m_sign_key.UnderlyingObject()))
             )
         )
+
+    @staticmethod
+    def __PublicKeyFromPrivate(key_bytes: bytes) -> bytes:
+        """
+        Compute the public key of a private key.
+
+        Args:
+            key_bytes (bytes): Private key bytes
+
+        Returns:
+            bytes: Public key bytes (without prefix)
+
+        Raises:
+            ValueError: If the private key is not valid
+        """
+        if len(key_bytes) != Ed25519KholawKeysConst.PRIV_KEY_BYTE_LEN:
+            raise ValueError("Invalid private key bytes")
+        try:
+            return ed25519_lib.point_scalar_mul_base(key_bytes[:Ed25519PrivateKey.Length()])
+        except exceptions.RuntimeError as ex:
+            raise ValueError("Invalid private key bytes") from ex
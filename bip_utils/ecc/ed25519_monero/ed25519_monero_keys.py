@@ -21,7 +21,9 @@
 """Module for ed25519-monero keys."""
 
 # Imports
-from nacl import signing
+from typing import Iterable, List
+
+from nacl import exceptions, signing
 
 from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
 from bip_utils.ecc.common.ipoint import IPoint
@@ -106,6 +108,24 @@ class Ed25519MoneroPrivateKey(Ed25519PrivateKey):
             raise ValueError("Invalid private key bytes")
         return super().FromBytes(key_bytes)
 
+    @staticmethod
+    def PublicKeysFromPrivate(keys_bytes: Iterable[bytes]) -> List[bytes]:
+        """
+        Compute the public keys of many private keys.
+        The libsodium function is called directly for each key, without constructing any key object.
+        Since libsodium functions release the GIL, chunks of keys can be also processed by a thread pool.
+
+        Args:
+            keys_bytes (iterable[bytes]): Private keys bytes
+
+        Returns:
+            list[bytes]: Public keys bytes (without prefix)
+
+        Raises:
+            ValueError: If a private key is not valid
+        """
+        return [Ed25519MoneroPrivateKey.__PublicKeyFromPrivate(key_bytes) for key_bytes in keys_bytes]
+
     @staticmethod
     def CurveType() -> EllipticCurveTypes:
         """
@@ -128,3 +148,24 @@ class Ed25519MoneroPrivateKey(Ed25519PrivateKey):
                 ed25519_lib.point_scalar_mul_base(bytes(self.m_sign_key))
             )
         )
+
+    @staticmethod
+    def __PublicKeyFromPrivate(key_bytes: bytes) -> bytes:
+        """
+        Compute the public key of a private key.
+
+        Args:
+            key_bytes (bytes): Private key bytes
+
+        Returns:
+            bytes: Public key bytes (without prefix)
+
+        Raises:
+            ValueError: If the private key is not valid
+        """
+        if len(key_bytes) != Ed25519KeysConst.PRIV_KEY_BYTE_LEN or not ed25519_lib.scalar_is_valid(key_bytes):
+            raise ValueError("Invalid private key bytes")
+        try:
+            return ed25519_lib.point_scalar_mul_base(key_bytes)
+        except exceptions.RuntimeError as ex:
+            raise ValueError("Invalid private key bytes") from ex
@@ -21,10 +21,58 @@
 """Module with nist256p1 constants."""
 
 # Imports
-from ecdsa.ecdsa import generator_256
+from typing import Type
 
+from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
 from bip_utils.ecc.common.ipoint import IPoint
-from bip_utils.ecc.nist256p1.nist256p1_point import Nist256p1Point
+from bip_utils.ecc.conf import EccConf
+
+
+# Variables
+Nist256p1Point: Type[IPoint]
+Nist256p1PublicKey: Type[IPublicKey]
+Nist256p1PrivateKey: Type[IPrivateKey]
+_CURVE_ORDER: int
+_GENERATOR: IPoint
+
+# Check if cryptography library can be used, since it is an optional dependency
+_USE_CRYPTOGRAPHY: bool = False
+if EccConf.USE_CRYPTOGRAPHY:
+    try:
+        import cryptography  # noqa: F401
+        _USE_CRYPTOGRAPHY = True
+    except ImportError:
+        pass
+
+# Use classes from cryptography version
+if _USE_CRYPTOGRAPHY:
+    from bip_utils.ecc.nist256p1.nist256p1_keys_cryptography import (
+        Nist256p1PointCryptography, Nist256p1PrivateKeyCryptography, Nist256p1PublicKeyCryptography
+    )
+    from bip_utils.ecc.nist256p1.nist256p1_point_cryptography import Nist256p1PointCryptographyConst
+
+    Nist256p1Point = Nist256p1PointCryptography
+    Nist256p1PublicKey = Nist256p1PublicKeyCryptography
+    Nist256p1PrivateKey = Nist256p1PrivateKeyCryptography
+
+    _CURVE_ORDER = Nist256p1PointCryptographyConst.CURVE_ORDER
+    _GENERATOR = Nist256p1Point.FromCoordinates(Nist256p1PointCryptographyConst.GENERATOR_X,
+                                                Nist256p1PointCryptographyConst.GENERATOR_Y)
+
+# Use classes from ecdsa version
+else:
+    from ecdsa.ecdsa import generator_256
+
+    from bip_utils.ecc.nist256p1.nist256p1_keys_ecdsa import (
+        Nist256p1PointEcdsa, Nist256p1PrivateKeyEcdsa, Nist256p1PublicKeyEcdsa
+    )
+
+    Nist256p1Point = Nist256p1PointEcdsa
+    Nist256p1PublicKey = Nist256p1PublicKeyEcdsa
+    Nist256p1PrivateKey = Nist256p1PrivateKeyEcdsa
+
+    _CURVE_ORDER = generator_256.order()
+    _GENERATOR = Nist256p1Point(generator_256)
 
 
 class Nist256p1Const:
@@ -33,6 +81,6 @@ class Nist256p1Const:
     # Curve name
     NAME: str = "Nist256p1"
     # Curve order
-    CURVE_ORDER: int = generator_256.order()
+    CURVE_ORDER: int = _CURVE_ORDER
     # Curve generator point
-    GENERATOR: IPoint = Nist256p1Point(generator_256)
+    GENERATOR: IPoint = _GENERATOR
@@ -18,232 +18,12 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-"""Module for nist256p1 keys."""
+"""
+Module for nist256p1 keys.
+Kept for compatibility, keys classes are the ones of the selected backend (see nist256p1_const).
+"""
 
 # Imports
-from typing import Any
-
-import ecdsa
-from ecdsa import curves, ellipticcurve, keys
-from ecdsa.ecdsa import curve_256
-
-from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
-from bip_utils.ecc.common.ipoint import IPoint
-from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
-from bip_utils.ecc.ecdsa.ecdsa_keys import EcdsaKeysConst
-from bip_utils.ecc.nist256p1.nist256p1_point import Nist256p1Point
-from bip_utils.utils.misc import DataBytes
-
-
-class Nist256p1PublicKey(IPublicKey):
-    """Nist256p1 public key class."""
-
-    m_ver_key: ecdsa.VerifyingKey
-
-    @classmethod
-    def FromBytes(cls,
-                  key_bytes: bytes) -> IPublicKey:
-        """
-        Construct class from key bytes.
-
-        Args:
-            key_bytes (bytes): Key bytes
-
-        Returns:
-            IPublicKey: IPublicKey object
-
-        Raises:
-            ValueError: If key bytes are not valid
-        """
-        try:
-            return cls(ecdsa.VerifyingKey.from_string(key_bytes,
-                                                      curve=curves.NIST256p))
-        except keys.MalformedPointError as ex:
-            raise ValueError("Invalid public key bytes") from ex
-
-    @classmethod
-    def FromPoint(cls,
-                  key_point: IPoint) -> IPublicKey:
-        """
-        Construct class from key point.
-
-        Args:
-            key_point (IPoint object): Key point
-
-        Returns:
-            IPublicKey: IPublicKey object
-
-        Raises:
-            ValueError: If key point is not valid
-        """
-        try:
-            return cls(
-                ecdsa.VerifyingKey.from_public_point(
-                    ellipticcurve.Point(curve_256,
-                                        key_point.X(),
-                                        key_point.Y()),
-                    curve=curves.NIST256p
-                )
-            )
-        except keys.MalformedPointError as ex:
-            raise ValueError("Invalid public key point") from ex
-
-    def __init__(self,
-                 key_obj: ecdsa.VerifyingKey) -> None:
-        """
-        Construct class from key object.
-
-        Args:
-            key_obj (ecdsa.VerifyingKey): Key object
-        """
-        self.m_ver_key = key_obj
-
-    @staticmethod
-    def CurveType() -> EllipticCurveTypes:
-        """
-        Get the elliptic curve type.
-
-        Returns:
-           EllipticCurveTypes: Elliptic curve type
-        """
-        return EllipticCurveTypes.NIST256P1
-
-    @staticmethod
-    def CompressedLength() -> int:
-        """
-        Get the compressed key length.
-
-        Returns:
-           int: Compressed key length
-        """
-        return EcdsaKeysConst.PUB_KEY_COMPRESSED_BYTE_LEN
-
-    @staticmethod
-    def UncompressedLength() -> int:
-        """
-        Get the uncompressed key length.
-
-        Returns:
-           int: Uncompressed key length
-        """
-        return EcdsaKeysConst.PUB_KEY_UNCOMPRESSED_BYTE_LEN
-
-    def UnderlyingObject(self) -> Any:
-        """
-        Get the underlying object.
-
-        Returns:
-           Any: Underlying object
-        """
-        return self.m_ver_key
-
-    def RawCompressed(self) -> DataBytes:
-        """
-        Return raw compressed public key.
-
-        Returns:
-            DataBytes object: DataBytes object
-        """
-        return DataBytes(self.m_ver_key.to_string("compressed"))
-
-    def RawUncompressed(self) -> DataBytes:
-        """
-        Return raw uncompressed public key.
-
-        Returns:
-            DataBytes object: DataBytes object
-        """
-        return DataBytes(self.m_ver_key.to_string("uncompressed"))
-
-    def Point(self) -> IPoint:
-        """
-        Get public key point.
-
-        Returns:
-            IPoint object: IPoint object
-        """
-        return Nist256p1Point(self.m_ver_key.pubkey.point)
-
-
-class Nist256p1PrivateKey(IPrivateKey):
-    """Nist256p1 private key class."""
-
-    m_sign_key: ecdsa.SigningKey
-
-    @classmethod
-    def FromBytes(cls,
-                  key_bytes: bytes) -> IPrivateKey:
-        """
-        Construct class from key bytes.
-
-        Args:
-            key_bytes (bytes): Key bytes
-
-        Returns:
-            IPrivateKey: IPrivateKey object
-
-        Raises:
-            ValueError: If key bytes are not valid
-        """
-        try:
-            return cls(ecdsa.SigningKey.from_string(key_bytes,
-                                                    curve=curves.NIST256p))
-        except keys.MalformedPointError as ex:
-            raise ValueError("Invalid private key bytes") from ex
-
-    def __init__(self,
-                 key_obj: ecdsa.SigningKey) -> None:
-        """
-        Construct class from key object.
-
-        Args:
-            key_obj (ecdsa.SigningKey): Key object
-        """
-        self.m_sign_key = key_obj
-
-    @staticmethod
-    def CurveType() -> EllipticCurveTypes:
-        """
-        Get the elliptic curve type.
-
-        Returns:
-           EllipticCurveTypes: Elliptic curve type
-        """
-        return EllipticCurveTypes.NIST256P1
-
-    @staticmethod
-    def Length() -> int:
-        """
-        Get the key length.
-
-        Returns:
-           int: Key length
-        """
-        return EcdsaKeysConst.PRIV_KEY_BYTE_LEN
-
-    def UnderlyingObject(self) -> Any:
-        """
-        Get the underlying object.
-
-        Returns:
-           Any: Underlying object
-        """
-        return self.m_sign_key
-
-    def Raw(self) -> DataBytes:
-        """
-        Return raw private key.
-
-        Returns:
-            DataBytes object: DataBytes object
-        """
-        return DataBytes(self.m_sign_key.to_string())
-
-    def PublicKey(self) -> IPublicKey:
-        """
-        Get the public key correspondent to the private one.
-
-        Returns:
-            IPublicKey object: IPublicKey object
-        """
-        return Nist256p1PublicKey(self.m_sign_key.get_verifying_key())
+from bip_utils.ecc.nist256p1.nist256p1_const import (  # noqa: F401
+    Nist256p1Point, Nist256p1PrivateKey, Nist256p1PublicKey
+)
@@ -0,0 +1,326 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for nist256p1 point based on cryptography library."""
+
+# Imports
+from typing import Any, Tuple
+
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+from ecdsa import ellipticcurve
+from ecdsa.ecdsa import curve_256
+from ecdsa.numbertheory import inverse_mod
+
+from bip_utils.ecc.common.ipoint import IPoint
+from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
+from bip_utils.ecc.ecdsa.ecdsa_keys import EcdsaKeysConst
+from bip_utils.utils.misc import DataBytes
+
+
+class Nist256p1PointCryptographyConst:
+    """Class container for Nist256p1 point constants (cryptography library)."""
+
+    # Curve object
+    CURVE: ec.EllipticCurve = ec.SECP256R1()
+    # Field prime
+    FIELD_PRIME: int = 0xFFFFFFFF00000001000000000000000000000000FFFFFFFFFFFFFFFFFFFFFFFF
+    # Curve a coefficient
+    CURVE_A: int = -3
+    # Curve order
+    CURVE_ORDER: int = 0xFFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551
+    # Generator coordinates
+    GENERATOR_X: int = 0x6B17D1F2E12C4247F8BCE6E563A440F277037D812DEB33A0F4A13945D898C296
+    GENERATOR_Y: int = 0x4FE342E2FE1A7F9B8EE7EB4A7C0F9E162BCE33576B315ECECBB6406837BF51F5
+
+
+class _Nist256p1PointCryptographyUtils:
+    """Class container for Nist256p1 point utility functions (cryptography library)."""
+
+    @staticmethod
+    def AddAffine(x1: int,
+                  y1: int,
+                  x2: int,
+                  y2: int) -> Tuple[int, int]:
+        """
+        Add two points in affine coordinates.
+
+        Args:
+            x1 (int): X coordinate of the first point
+            y1 (int): Y coordinate of the first point
+            x2 (int): X coordinate of the second point
+            y2 (int): Y coordinate of the second point
+
+        Returns:
+            tuple[int, int]: X and Y coordinates of the resulting point
+
+        Raises:
+            ValueError: If the resulting point is the point at infinity
+        """
+        p = Nist256p1PointCryptographyConst.FIELD_PRIME
+
+        if x1 == x2:
+            if (y1 + y2) % p == 0:
+                raise ValueError("Invalid point addition (point at infinity)")
+            lam = (3 * x1 * x1 + Nist256p1PointCryptographyConst.CURVE_A) * inverse_mod(2 * y1, p) % p
+        else:
+            lam = (y2 - y1) * inverse_mod(x2 - x1, p) % p
+
+        x3 = (lam * lam - x1 - x2) % p
+        return x3, (lam * (x1 - x3) - y1) % p
+
+    @staticmethod
+    def MultiplyGenerator(scalar: int) -> ec.EllipticCurvePublicKey:
+        """
+        Multiply the generator point by a scalar.
+        The multiplication is delegated to OpenSSL by deriving a private key from the scalar.
+
+        Args:
+            scalar (int): Scalar, reduced modulo the curve order and not zero
+
+        Returns:
+            ec.EllipticCurvePublicKey: Resulting point
+        """
+        return ec.derive_private_key(scalar, Nist256p1PointCryptographyConst.CURVE).public_key()
+
+    @staticmethod
+    def MultiplyPoint(x: int,
+                      y: int,
+                      scalar: int) -> Tuple[int, int]:
+        """
+        Multiply a generic point by a scalar.
+        The cryptography library has no primitive for it, so the ecdsa library is used.
+
+        Args:
+            x (int)     : X coordinate of the point
+            y (int)     : Y coordinate of the point
+            scalar (int): Scalar, reduced modulo the curve order and not zero
+
+        Returns:
+            tuple[int, int]: X and Y coordinates of the resulting point
+        """
+        point = ellipticcurve.PointJacobi.from_affine(ellipticcurve.Point(curve_256, x, y)) * scalar
+        return point.x(), point.y()
+
+
+class Nist256p1PointCryptography(IPoint):
+    """
+    Nist256p1 point class.
+    In cryptography library, points can only be handled as public keys. For this reason, a public key is used
+    as underlying object. The multiplication of the generator point (i.e. the expensive part of keys derivation)
+    is performed by OpenSSL, while the addition is computed in affine coordinates.
+    """
+
+    m_pub_key: ec.EllipticCurvePublicKey
+    m_pub_nums: ec.EllipticCurvePublicNumbers
+
+    @classmethod
+    def FromBytes(cls,
+                  point_bytes: bytes) -> IPoint:
+        """
+        Construct class from point bytes.
+
+        Args:
+            point_bytes (bytes): Point bytes
+
+        Returns:
+            IPoint: IPoint object
+        """
+        if len(point_bytes) == EcdsaKeysConst.PUB_KEY_UNCOMPRESSED_BYTE_LEN - 1:
+            point_bytes = EcdsaKeysConst.PUB_KEY_UNCOMPRESSED_PREFIX + point_bytes
+        elif len(point_bytes) != EcdsaKeysConst.PUB_KEY_COMPRESSED_BYTE_LEN:
+            raise ValueError("Invalid point bytes")
+
+        try:
+            return cls(ec.EllipticCurvePublicKey.from_encoded_point(Nist256p1PointCryptographyConst.CURVE,
+                                                                    point_bytes))
+        except ValueError as ex:
+            raise ValueError("Invalid point bytes") from ex
+
+    @classmethod
+    def FromCoordinates(cls,
+                        x: int,
+                        y: int) -> IPoint:
+        """
+        Construct class from point coordinates.
+
+        Args:
+            x (int): X coordinate of the point
+            y (int): Y coordinate of the point
+
+        Returns:
+            IPoint: IPoint object
+        """
+        try:
+            return cls(
+                ec.EllipticCurvePublicNumbers(x, y, Nist256p1PointCryptographyConst.CURVE).public_key()
+            )
+        except ValueError as ex:
+            raise ValueError("Invalid point coordinates") from ex
+
+    def __init__(self,
+                 point_obj: ec.EllipticCurvePublicKey) -> None:
+        """
+        Construct class from point object.
+
+        Args:
+            point_obj (ec.EllipticCurvePublicKey): Point object
+        """
+        self.m_pub_key = point_obj
+        self.m_pub_nums = point_obj.public_numbers()
+
+    @staticmethod
+    def CurveType() -> EllipticCurveTypes:
+        """
+        Get the elliptic curve type.
+
+        Returns:
+           EllipticCurveTypes: Elliptic curve type
+        """
+        return EllipticCurveTypes.NIST256P1
+
+    def UnderlyingObject(self) -> Any:
+        """
+        Get the underlying object.
+
+        Returns:
+           Any: Underlying object
+        """
+        return self.m_pub_key
+
+    def X(self) -> int:
+        """
+        Get point X coordinate.
+
+        Returns:
+           int: Point X coordinate
+        """
+        return self.m_pub_nums.x
+
+    def Y(self) -> int:
+        """
+        Get point Y coordinate.
+
+        Returns:
+           int: Point Y coordinate
+        """
+        return self.m_pub_nums.y
+
+    def Raw(self) -> DataBytes:
+        """
+        Return the point raw bytes.
+
+        Returns:
+            DataBytes object: DataBytes object
+        """
+        return self.RawDecoded()
+
+    def RawEncoded(self) -> DataBytes:
+        """
+        Return the encoded point raw bytes.
+
+        Returns:
+            DataBytes object: DataBytes object
+        """
+        return DataBytes(self.m_pub_key.public_bytes(Encoding.X962, PublicFormat.CompressedPoint))
+
+    def RawDecoded(self) -> DataBytes:
+        """
+        Return the decoded point raw bytes.
+
+        Returns:
+            DataBytes object: DataBytes object
+        """
+        return DataBytes(self.m_pub_key.public_bytes(Encoding.X962, PublicFormat.UncompressedPoint)[1:])
+
+    def __add__(self,
+                point: IPoint) -> IPoint:
+        """
+        Add point to another point.
+
+        Args:
+            point (IPoint object): IPoint object
+
+        Returns:
+            IPoint object: IPoint object
+
+        Raises:
+            ValueError: If the resulting point is the point at infinity
+        """
+        return self.FromCoordinates(
+            *_Nist256p1PointCryptographyUtils.AddAffine(self.X(), self.Y(), point.X(), point.Y())
+        )
+
+    def __radd__(self,
+                 point: IPoint) -> IPoint:
+        """
+        Add point to another point.
+
+        Args:
+            point (IPoint object): IPoint object
+
+        Returns:
+            IPoint object: IPoint object
+
+        Raises:
+            ValueError: If the resulting point is the point at infinity
+        """
+        return self + point
+
+    def __mul__(self,
+                scalar: int) -> IPoint:
+        """
+        Multiply point by a scalar.
+
+        Args:
+            scalar (int): scalar
+
+        Returns:
+            IPoint object: IPoint object
+
+        Raises:
+            ValueError: If the resulting point is the point at infinity
+        """
+        scalar %= Nist256p1PointCryptographyConst.CURVE_ORDER
+        if scalar == 0:
+            raise ValueError("Invalid point multiplication (point at infinity)")
+
+        if (self.X() == Nist256p1PointCryptographyConst.GENERATOR_X
+                and self.Y() == Nist256p1PointCryptographyConst.GENERATOR_Y):
+            return self.__class__(_Nist256p1PointCryptographyUtils.MultiplyGenerator(scalar))
+        return self.FromCoordinates(
+            *_Nist256p1PointCryptographyUtils.MultiplyPoint(self.X(), self.Y(), scalar)
+        )
+
+    def __rmul__(self,
+                 scalar: int) -> IPoint:
+        """
+        Multiply point by a scalar.
+
+        Args:
+            scalar (int): scalar
+
+        Returns:
+            IPoint object: IPoint object
+
+        Raises:
+            ValueError: If the resulting point is the point at infinity
+        """
+        return self * scalar
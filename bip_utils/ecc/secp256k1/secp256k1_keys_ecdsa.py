@@ -21,18 +21,18 @@
 """Module for secp256k1 keys based on ecdsa library."""
 
 # Imports
-from typing import Any
+from typing import Any, Optional
 
 import ecdsa
 from ecdsa import curves, ellipticcurve, keys
-from ecdsa.ecdsa import curve_secp256k1
+from ecdsa.ecdsa import curve_secp256k1, generator_secp256k1
 
 from bip_utils.ecc.common.ikeys import IPrivateKey, IPublicKey
 from bip_utils.ecc.common.ipoint import IPoint
 from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
 from bip_utils.ecc.ecdsa.ecdsa_keys import EcdsaKeysConst
-from bip_utils.ecc.secp256k1.secp256k1_point_ecdsa import Secp256k1PointEcdsa
-from bip_utils.utils.misc import DataBytes
+from bip_utils.ecc.secp256k1.secp256k1_point_ecdsa import Secp256k1EcdsaGeneratorTable, Secp256k1PointEcdsa
+from bip_utils.utils.misc import BytesUtils, DataBytes
 
 
 class Secp256k1PublicKeyEcdsa(IPublicKey):
@@ -166,9 +166,15 @@ class Secp256k1PublicKeyEcdsa(IPublicKey):
 
 
 class Secp256k1PrivateKeyEcdsa(IPrivateKey):
-    """Secp256k1 private key class."""
+    """
+    Secp256k1 private key class.
+    The ecdsa library computes the public key when a signing key is constructed, so keys constructed from bytes
+    only create the signing key if the underlying object is requested. The public key is computed using the
+    precomputed generator table instead.
+    """
 
-    m_sign_key = ecdsa.SigningKey
+    m_key_bytes: bytes
+    m_sign_key: Optional[ecdsa.SigningKey]
 
     @classmethod
     def FromBytes(cls,
@@ -185,11 +191,15 @@ class Secp256k1PrivateKeyEcdsa(IPrivateKey):
         Raises:
             ValueError: If key bytes are not valid
         """
-        try:
-            return cls(ecdsa.SigningKey.from_string(key_bytes,
-                                                    curve=curves.SECP256k1))
-        except keys.MalformedPointError as ex:
-            raise ValueError("Invalid private key bytes") from ex
+        if len(key_bytes) != cls.Length():
+            raise ValueError("Invalid private key bytes")
+        if not 0 < BytesUtils.ToInteger(key_bytes) < generator_secp256k1.order():
+            raise ValueError("Invalid private key bytes")
+
+        priv_key = cls.__new__(cls)
+        priv_key.m_key_bytes = key_bytes
+        priv_key.m_sign_key = None
+        return priv_key
 
     def __init__(self,
                  key_obj: ecdsa.SigningKey) -> None:
@@ -199,6 +209,7 @@ class Secp256k1PrivateKeyEcdsa(IPrivateKey):
         Args:
             key_obj (ecdsa.SigningKey): Key object
         """
+        self.m_key_bytes = key_obj.to_string()
         self.m_sign_key = key_obj
 
     @staticmethod
@@ -228,6 +239,9 @@ class Secp256k1PrivateKeyEcdsa(IPrivateKey):
         Returns:
            Any: Underlying object
         """
+        if self.m_sign_key is None:
+            self.m_sign_key = ecdsa.SigningKey.from_string(self.m_key_bytes,
+                                                           curve=curves.SECP256k1)
         return self.m_sign_key
 
     def Raw(self) -> DataBytes:
@@ -237,7 +251,7 @@ class Secp256k1PrivateKeyEcdsa(IPrivateKey):
         Returns:
             DataBytes object: DataBytes object
         """
-        return DataBytes(self.m_sign_key.to_string())
+        return DataBytes(self.m_key_bytes)
 
     def PublicKey(self) -> IPublicKey:
         """
@@ -246,4 +260,11 @@ class Secp256k1PrivateKeyEcdsa(IPrivateKey):
         Returns:
             IPublicKey object: IPublicKey object
         """
-        return Secp256k1PublicKeyEcdsa(self.m_sign_key.get_verifying_key())
+        if self.m_sign_key is not None:
+            return Secp256k1PublicKeyEcdsa(self.m_sign_key.get_verifying_key())
+
+        x, y = Secp256k1EcdsaGeneratorTable.Multiply(BytesUtils.ToInteger(self.m_key_bytes))
+        return Secp256k1PublicKeyEcdsa(
+            ecdsa.VerifyingKey.from_public_point(ellipticcurve.Point(curve_secp256k1, x, y),
+                                                 curve=curves.SECP256k1)
+        )
@@ -24,14 +24,23 @@
 from typing import Any
 
 from ecdsa import ellipticcurve, keys
-from ecdsa.ecdsa import curve_secp256k1
+from ecdsa.ecdsa import curve_secp256k1, generator_secp256k1
 
 from bip_utils.ecc.common.ipoint import IPoint
 from bip_utils.ecc.curve.elliptic_curve_types import EllipticCurveTypes
+from bip_utils.ecc.ecdsa.ecdsa_gen_table import EcdsaGeneratorTable
 from bip_utils.ecc.ecdsa.ecdsa_keys import EcdsaKeysConst
 from bip_utils.utils.misc import BytesUtils, DataBytes, IntegerUtils
 
 
+# Precomputed table for multiplying the secp256k1 generator with the ecdsa library
+Secp256k1EcdsaGeneratorTable: EcdsaGeneratorTable = EcdsaGeneratorTable(curve_secp256k1.p(),
+                                                                        curve_secp256k1.a(),
+                                                                        generator_secp256k1.order(),
+                                                                        generator_secp256k1.x(),
+                                                                        generator_secp256k1.y())
+
+
 class Secp256k1PointEcdsa(IPoint):
     """Secp256k1 point class."""
 
@@ -207,7 +216,14 @@ class Secp256k1PointEcdsa(IPoint):
 
         Returns:
             IPoint object: IPoint object
+
+        Raises:
+            ValueError: If the point is the generator and the result is the point at infinity
         """
+        # Use the precomputed table for the generator
+        if self.m_point is generator_secp256k1:
+            x, y = Secp256k1EcdsaGeneratorTable.Multiply(scalar)
+            return self.__class__(ellipticcurve.PointJacobi(curve_secp256k1, x, y, 1))
         return self.__class__(self.m_point * scalar)
 
     def __rmul__(self,
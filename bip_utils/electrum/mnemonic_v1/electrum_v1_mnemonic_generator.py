@@ -21,7 +21,7 @@
 """Module for Electrum v1 mnemonic generation."""
 
 # Imports
-from typing import Dict, Union
+from typing import Dict, Iterator, Union
 
 from bip_utils.electrum.mnemonic_v1.electrum_v1_entropy_generator import (
     ElectrumV1EntropyBitLen, ElectrumV1EntropyGenerator
@@ -81,21 +81,34 @@ class ElectrumV1MnemonicGenerator:
             ValueError: If words number is not valid
         """
 
-        # Check words number
-        if words_num not in ElectrumV1MnemonicConst.MNEMONIC_WORD_NUM:
-            raise ValueError(f"Words number for mnemonic ({words_num}) is not valid")
-
-        # Convert int to enum if necessary
-        if isinstance(words_num, int):
-            words_num = ElectrumV1WordsNum(words_num)
-
         # Get entropy length in bit from words number
-        entropy_bit_len = ElectrumV1MnemonicGeneratorConst.WORDS_NUM_TO_ENTROPY_LEN[words_num]
+        entropy_bit_len = self.__EntropyBitLenFromWordsNum(words_num)
         # Generate entropy
         entropy_bytes = ElectrumV1EntropyGenerator(entropy_bit_len).Generate()
 
         return self.FromEntropy(entropy_bytes)
 
+    def GenerateMany(self,
+                     count: int,
+                     words_num: Union[int, ElectrumV1WordsNum]) -> Iterator[Mnemonic]:
+        """
+        Generate multiple mnemonics with the specified words number from random entropy.
+        Entropy is read in large chunks from a random pool, so it is much faster than calling FromWordsNumber
+        multiple times.
+
+        Args:
+            count (int)                          : Number of mnemonics
+            words_num (int or ElectrumV1WordsNum): Number of words (12)
+
+        Returns:
+            Iterator[Mnemonic]: Iterator of generated mnemonics
+
+        Raises:
+            ValueError: If count or words number is not valid
+        """
+        entropy_bit_len = self.__EntropyBitLenFromWordsNum(words_num)
+        return map(self.FromEntropy, ElectrumV1EntropyGenerator(entropy_bit_len).GenerateMany(count))
+
     def FromEntropy(self,
                     entropy_bytes: bytes) -> Mnemonic:
         """
@@ -111,3 +124,28 @@ class ElectrumV1MnemonicGenerator:
             ValueError: If entropy byte length is not valid
         """
         return self.m_mnemonic_encoder.Encode(entropy_bytes)
+
+    @staticmethod
+    def __EntropyBitLenFromWordsNum(words_num: Union[int, ElectrumV1WordsNum]) -> int:
+        """
+        Get entropy length from words number.
+
+        Args:
+            words_num (int or ElectrumV1WordsNum): Words number
+
+        Returns:
+            int: Correspondent entropy length
+
+        Raises:
+            ValueError: If words number is not valid
+        """
+
+        # Check words number
+        if words_num not in ElectrumV1MnemonicConst.MNEMONIC_WORD_NUM:
+            raise ValueError(f"Words number for mnemonic ({words_num}) is not valid")
+
+        # Convert int to enum if necessary
+        if isinstance(words_num, int):
+            words_num = ElectrumV1WordsNum(words_num)
+
+        return ElectrumV1MnemonicGeneratorConst.WORDS_NUM_TO_ENTROPY_LEN[words_num]
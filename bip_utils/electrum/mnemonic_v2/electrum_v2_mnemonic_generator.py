@@ -21,7 +21,7 @@
 """Module for Electrum v2 mnemonic generation."""
 
 # Imports
-from typing import Dict, Union
+from typing import Dict, Iterator, Union
 
 from bip_utils.electrum.mnemonic_v2.electrum_v2_entropy_generator import (
     ElectrumV2EntropyBitLen, ElectrumV2EntropyGenerator
@@ -86,21 +86,59 @@ class ElectrumV2MnemonicGenerator:
             ValueError: If words number is not valid
         """
 
-        # Check words number
-        if words_num not in ElectrumV2MnemonicConst.MNEMONIC_WORD_NUM:
-            raise ValueError(f"Words number for mnemonic ({words_num}) is not valid")
-
-        # Convert int to enum if necessary
-        if isinstance(words_num, int):
-            words_num = ElectrumV2WordsNum(words_num)
-
         # Get entropy length in bit from words number
-        entropy_bit_len = ElectrumV2MnemonicGeneratorConst.WORDS_NUM_TO_ENTROPY_LEN[words_num]
+        entropy_bit_len = self.__EntropyBitLenFromWordsNum(words_num)
         # Generate entropy
         entropy_bytes = ElectrumV2EntropyGenerator(entropy_bit_len).Generate()
 
         return self.FromEntropy(entropy_bytes)
 
+    def GenerateMany(self,
+                     count: int,
+                     words_num: Union[int, ElectrumV2WordsNum]) -> Iterator[Mnemonic]:
+        """
+        Generate multiple mnemonics with the specified words number from random entropy.
+        Entropy is read in large chunks from a random pool, so it is much faster than calling FromWordsNumber
+        multiple times.
+        Entropies that are not suitable for generating a mnemonic are discarded and replaced with new ones.
+
+        Args:
+            count (int)                          : Number of mnemonics
+            words_num (int or ElectrumV2WordsNum): Number of words (12, 24)
+
+        Returns:
+            Iterator[Mnemonic]: Iterator of generated mnemonics
+
+        Raises:
+            ValueError: If count or words number is not valid
+        """
+        entropy_gen = ElectrumV2EntropyGenerator(self.__EntropyBitLenFromWordsNum(words_num))
+        if count < 0:
+            raise ValueError(f"Invalid mnemonics count ({count})")
+        return self.__GenerateMany(entropy_gen, count)
+
+    def __GenerateMany(self,
+                       entropy_gen: ElectrumV2EntropyGenerator,
+                       count: int) -> Iterator[Mnemonic]:
+        """
+        Generate multiple mnemonics from random entropy.
+
+        Args:
+            entropy_gen (ElectrumV2EntropyGenerator object): Entropy generator
+            count (int)                                    : Number of mnemonics
+
+        Returns:
+            Iterator[Mnemonic]: Iterator of generated mnemonics
+        """
+        while count > 0:
+            for entropy_bytes in entropy_gen.GenerateMany(count):
+                try:
+                    mnemonic = self.FromEntropy(entropy_bytes)
+                except ValueError:
+                    continue
+                count -= 1
+                yield mnemonic
+
     def FromEntropy(self,
                     entropy_bytes: bytes) -> Mnemonic:
         """
@@ -134,3 +172,28 @@ class ElectrumV2MnemonicGenerator:
                     continue
 
         raise ValueError("Unable to generate a valid mnemonic")
+
+    @staticmethod
+    def __EntropyBitLenFromWordsNum(words_num: Union[int, ElectrumV2WordsNum]) -> int:
+        """
+        Get entropy length from words number.
+
+        Args:
+            words_num (int or ElectrumV2WordsNum): Words number
+
+        Returns:
+            int: Correspondent entropy length
+
+        Raises:
+            ValueError: If words number is not valid
+        """
+
+        # Check words number
+        if words_num not in ElectrumV2MnemonicConst.MNEMONIC_WORD_NUM:
+            raise ValueError(f"Words number for mnemonic ({words_num}) is not valid")
+
+        # Convert int to enum if necessary
+        if isinstance(words_num, int):
+            words_num = ElectrumV2WordsNum(words_num)
+
+        return ElectrumV2MnemonicGeneratorConst.WORDS_NUM_TO_ENTROPY_LEN[words_num]
@@ -0,0 +1,152 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for Electrum v2 mnemonic recovery."""
+
+# Imports
+import functools
+from typing import Callable, Iterator, List, Optional, Union
+
+from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39WordsListGetter
+from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic import (
+    ElectrumV2Languages, ElectrumV2Mnemonic, ElectrumV2MnemonicConst, ElectrumV2MnemonicTypes
+)
+from bip_utils.electrum.mnemonic_v2.electrum_v2_mnemonic_utils import (
+    ElectrumV2MnemonicUtils, ElectrumV2MnemonicUtilsConst
+)
+from bip_utils.electrum.mnemonic_v2.electrum_v2_seed_generator import ElectrumV2SeedGeneratorConst
+from bip_utils.utils.crypto import HmacSha512, Pbkdf2HmacSha512
+from bip_utils.utils.misc import BytesUtils, StringUtils
+from bip_utils.utils.mnemonic import Mnemonic, MnemonicRecoveryBase, MnemonicRecoveryConst
+
+
+class _ElectrumV2MnemonicRecoveryUtils:
+    """Class container for Electrum v2 mnemonic recovery utility functions."""
+
+    @staticmethod
+    def GenerateSeed(salt: str,
+                     mnemonic: str) -> bytes:
+        """
+        Generate the seed of a mnemonic.
+        The mnemonic is not validated again, since candidates are already filtered by version.
+
+        Args:
+            salt (str)    : Normalized salt (i.e. salt modifier and passphrase)
+            mnemonic (str): Mnemonic string
+
+        Returns:
+            bytes: Generated seed
+        """
+        return Pbkdf2HmacSha512.DeriveKey(mnemonic, salt, ElectrumV2SeedGeneratorConst.SEED_PBKDF2_ROUNDS)
+
+
+class ElectrumV2MnemonicRecovery(MnemonicRecoveryBase):
+    """
+    Electrum v2 mnemonic recovery class.
+    Unknown words shall be specified as "?", while words not belonging to the words list are considered misspelled
+    and replaced with the similar ones.
+    Candidates are filtered by the version prefix of their HMAC before computing the seed.
+    """
+
+    m_mnemonic_type: Optional[ElectrumV2MnemonicTypes]
+    m_salt: str
+
+    def __init__(self,
+                 mnemonic: Union[str, List[str]],
+                 mnemonic_type: Optional[ElectrumV2MnemonicTypes] = None,
+                 lang: ElectrumV2Languages = ElectrumV2Languages.ENGLISH,
+                 passphrase: str = "",
+                 max_edit_dist: int = MnemonicRecoveryConst.DEF_MAX_EDIT_DIST) -> None:
+        """
+        Construct class.
+
+        Args:
+            mnemonic (str or list[str])                      : Mnemonic with unknown ("?") or misspelled words
+            mnemonic_type (ElectrumV2MnemonicTypes, optional): Mnemonic type, None for all types
+            lang (ElectrumV2Languages, optional)             : Language (default: English)
+            passphrase (str, optional)                       : Passphrase, empty if not specified
+            max_edit_dist (int, optional)                    : Maximum edit distance for replacing misspelled words
+
+        Raises:
+            TypeError: If the language is not a ElectrumV2Languages enum or
+                       the mnemonic type is not a ElectrumV2MnemonicTypes enum
+            ValueError: If the mnemonic or maximum edit distance is not valid
+        """
+        if mnemonic_type is not None and not isinstance(mnemonic_type, ElectrumV2MnemonicTypes):
+            raise TypeError("Mnemonic type is not an enumerative of ElectrumV2MnemonicTypes")
+        if not isinstance(lang, ElectrumV2Languages):
+            raise TypeError("Language is not an enumerative of ElectrumV2Languages")
+
+        mnemonic_list = (ElectrumV2Mnemonic.FromString(mnemonic)
+                         if isinstance(mnemonic, str)
+                         else ElectrumV2Mnemonic.FromList(mnemonic)).ToList()
+        if len(mnemonic_list) not in ElectrumV2MnemonicConst.MNEMONIC_WORD_NUM:
+            raise ValueError(f"Mnemonic words count is not valid ({len(mnemonic_list)})")
+
+        super().__init__(mnemonic_list, lang.value, Bip39WordsListGetter, max_edit_dist)
+        self.m_mnemonic_type = mnemonic_type
+        self.m_salt = StringUtils.NormalizeNfkd(ElectrumV2SeedGeneratorConst.SEED_SALT_MOD + passphrase)
+
+    def _GenerateValidIndexes(self) -> Iterator[List[int]]:
+        """
+        Generate the word indexes of the candidate mnemonics with a valid version.
+
+        Returns:
+            Iterator[list[int]]: Iterator of word indexes
+        """
+        prefixes = ((ElectrumV2MnemonicConst.TYPE_TO_PREFIX[self.m_mnemonic_type],)
+                    if self.m_mnemonic_type is not None
+                    else tuple(ElectrumV2MnemonicConst.TYPE_TO_PREFIX.values()))
+        var_pos = [pos for pos, words_idx in enumerate(self.m_words_idx) if len(words_idx) > 1]
+        words_idx = [words_idx[0] for words_idx in self.m_words_idx]
+
+        for words_comb in self._ProductIndexes(var_pos):
+            for pos, word_idx in words_comb:
+                words_idx[pos] = word_idx
+
+            words = [self.m_words_list.GetWordAtIdx(word_idx) for word_idx in words_idx]
+            h = HmacSha512.QuickDigest(ElectrumV2MnemonicUtilsConst.HMAC_KEY, " ".join(words))
+            # Fully validate only the few candidates with the correct version (i.e. exclude BIP39 and v1 mnemonics)
+            if (BytesUtils.ToHexString(h).startswith(prefixes)
+                    and ElectrumV2MnemonicUtils.IsValidMnemonic(ElectrumV2Mnemonic.FromList(words),
+                                                                self.m_mnemonic_type)):
+                yield words_idx.copy()
+
+    def _SeedFunction(self) -> Callable[[str], bytes]:
+        """
+        Get the (picklable) function for generating the seed from a candidate mnemonic string.
+
+        Returns:
+            function: Seed function
+        """
+        return functools.partial(_ElectrumV2MnemonicRecoveryUtils.GenerateSeed, self.m_salt)
+
+    @staticmethod
+    def _MnemonicFromList(mnemonic_list: List[str]) -> Mnemonic:
+        """
+        Get a mnemonic object from a list of words.
+
+        Args:
+            mnemonic_list (list[str]): Mnemonic words
+
+        Returns:
+            Mnemonic object: Mnemonic object
+        """
+        return ElectrumV2Mnemonic.FromList(mnemonic_list)
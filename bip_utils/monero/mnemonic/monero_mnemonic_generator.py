@@ -21,7 +21,7 @@
 """Module for Monero mnemonic generation."""
 
 # Imports
-from typing import Dict, Union
+from typing import Dict, Iterator, Union
 
 from bip_utils.monero.mnemonic.monero_entropy_generator import MoneroEntropyBitLen, MoneroEntropyGenerator
 from bip_utils.monero.mnemonic.monero_mnemonic import MoneroLanguages, MoneroMnemonicConst, MoneroWordsNum
@@ -78,16 +78,8 @@ class MoneroMnemonicGenerator:
             ValueError: If words number is not valid
         """
 
-        # Check words number
-        if words_num not in MoneroMnemonicConst.MNEMONIC_WORD_NUM:
-            raise ValueError(f"Words number for mnemonic ({words_num}) is not valid")
-
-        # Convert int to enum if necessary
-        if isinstance(words_num, int):
-            words_num = MoneroWordsNum(words_num)
-
         # Get entropy length in bit from words number
-        entropy_bit_len = MoneroMnemonicGeneratorConst.WORDS_NUM_TO_ENTROPY_LEN[words_num]
+        entropy_bit_len = self.__EntropyBitLenFromWordsNum(words_num)
         # Generate entropy
         entropy_bytes = MoneroEntropyGenerator(entropy_bit_len).Generate()
 
@@ -95,6 +87,30 @@ class MoneroMnemonicGenerator:
                 if words_num in MoneroMnemonicConst.MNEMONIC_WORD_NUM_CHKSUM
                 else self.FromEntropyNoChecksum(entropy_bytes))
 
+    def GenerateMany(self,
+                     count: int,
+                     words_num: Union[int, MoneroWordsNum]) -> Iterator[Mnemonic]:
+        """
+        Generate multiple mnemonics with the specified words number from random entropy.
+        Entropy is read in large chunks from a random pool, so it is much faster than calling FromWordsNumber
+        multiple times.
+
+        Args:
+            count (int)                      : Number of mnemonics
+            words_num (int or MoneroWordsNum): Number of words (12, 13, 24, 25)
+
+        Returns:
+            Iterator[Mnemonic]: Iterator of generated mnemonics
+
+        Raises:
+            ValueError: If count or words number is not valid
+        """
+        entropy_bit_len = self.__EntropyBitLenFromWordsNum(words_num)
+        encode_fct = (self.FromEntropyWithChecksum
+                      if words_num in MoneroMnemonicConst.MNEMONIC_WORD_NUM_CHKSUM
+                      else self.FromEntropyNoChecksum)
+        return map(encode_fct, MoneroEntropyGenerator(entropy_bit_len).GenerateMany(count))
+
     def FromEntropyNoChecksum(self,
                               entropy_bytes: bytes) -> Mnemonic:
         """
@@ -126,3 +142,28 @@ class MoneroMnemonicGenerator:
             ValueError: If entropy byte length is not valid
         """
         return self.m_mnemonic_encoder.EncodeWithChecksum(entropy_bytes)
+
+    @staticmethod
+    def __EntropyBitLenFromWordsNum(words_num: Union[int, MoneroWordsNum]) -> int:
+        """
+        Get entropy length from words number.
+
+        Args:
+            words_num (int or MoneroWordsNum): Words number
+
+        Returns:
+            int: Correspondent entropy length
+
+        Raises:
+            ValueError: If words number is not valid
+        """
+
+        # Check words number
+        if words_num not in MoneroMnemonicConst.MNEMONIC_WORD_NUM:
+            raise ValueError(f"Words number for mnemonic ({words_num}) is not valid")
+
+        # Convert int to enum if necessary
+        if isinstance(words_num, int):
+            words_num = MoneroWordsNum(words_num)
+
+        return MoneroMnemonicGeneratorConst.WORDS_NUM_TO_ENTROPY_LEN[words_num]
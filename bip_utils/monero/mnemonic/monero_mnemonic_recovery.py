@@ -0,0 +1,156 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for Monero mnemonic recovery."""
+
+# Imports
+import functools
+from typing import Callable, Iterator, List, Union
+
+from bip_utils.monero.mnemonic.monero_mnemonic import MoneroLanguages, MoneroMnemonic, MoneroMnemonicConst
+from bip_utils.monero.mnemonic.monero_mnemonic_utils import MoneroMnemonicUtils, MoneroWordsListGetter
+from bip_utils.monero.mnemonic.monero_seed_generator import MoneroSeedGenerator
+from bip_utils.utils.mnemonic import Mnemonic, MnemonicRecoveryBase, MnemonicRecoveryConst
+
+
+class _MoneroMnemonicRecoveryUtils:
+    """Class container for Monero mnemonic recovery utility functions."""
+
+    @staticmethod
+    def GenerateSeed(lang: MoneroLanguages,
+                     mnemonic: str) -> bytes:
+        """
+        Generate the seed of a mnemonic.
+
+        Args:
+            lang (MoneroLanguages): Language
+            mnemonic (str)        : Mnemonic string
+
+        Returns:
+            bytes: Generated seed
+        """
+        return MoneroSeedGenerator(mnemonic, lang).Generate()
+
+
+class MoneroMnemonicRecovery(MnemonicRecoveryBase):
+    """
+    Monero mnemonic recovery class.
+    Unknown words shall be specified as "?", while words not belonging to the words list are considered misspelled
+    and replaced with the similar ones.
+    For mnemonics with checksum, candidates are filtered by checksum word and, if the checksum word is unknown,
+    it is directly computed instead of being enumerated.
+    """
+
+    m_lang: MoneroLanguages
+
+    def __init__(self,
+                 mnemonic: Union[str, List[str]],
+                 lang: MoneroLanguages = MoneroLanguages.ENGLISH,
+                 max_edit_dist: int = MnemonicRecoveryConst.DEF_MAX_EDIT_DIST) -> None:
+        """
+        Construct class.
+
+        Args:
+            mnemonic (str or list[str])     : Mnemonic with unknown ("?") or misspelled words
+            lang (MoneroLanguages, optional): Language (default: English)
+            max_edit_dist (int, optional)   : Maximum edit distance for replacing misspelled words
+
+        Raises:
+            TypeError: If the language is not a MoneroLanguages enum
+            ValueError: If the mnemonic or maximum edit distance is not valid
+        """
+        mnemonic_list = (MoneroMnemonic.FromString(mnemonic)
+                         if isinstance(mnemonic, str)
+                         else MoneroMnemonic.FromList(mnemonic)).ToList()
+        if len(mnemonic_list) not in MoneroMnemonicConst.MNEMONIC_WORD_NUM:
+            raise ValueError(f"Mnemonic words count is not valid ({len(mnemonic_list)})")
+
+        super().__init__(mnemonic_list, lang, MoneroWordsListGetter, max_edit_dist)
+        self.m_lang = lang
+
+    def _GenerateValidIndexes(self) -> Iterator[List[int]]:
+        """
+        Generate the word indexes of the candidate mnemonics with a valid checksum.
+
+        Returns:
+            Iterator[list[int]]: Iterator of word indexes
+        """
+        has_chksum = len(self.m_words_idx) in MoneroMnemonicConst.MNEMONIC_WORD_NUM_CHKSUM
+        data_words_num = len(self.m_words_idx) - 1 if has_chksum else len(self.m_words_idx)
+
+        var_pos = [pos for pos in range(data_words_num) if len(self.m_words_idx[pos]) > 1]
+        words_idx = [words_idx[0] for words_idx in self.m_words_idx[:data_words_num]]
+
+        for words_comb in self._ProductIndexes(var_pos):
+            for pos, word_idx in words_comb:
+                words_idx[pos] = word_idx
+            if not self.__AreChunksValid(words_idx):
+                continue
+            if not has_chksum:
+                yield words_idx.copy()
+                continue
+
+            chksum_word = MoneroMnemonicUtils.ComputeChecksum(
+                [self.m_words_list.GetWordAtIdx(word_idx) for word_idx in words_idx],
+                self.m_lang
+            )
+            chksum_word_idx = self.m_words_list.GetWordIdx(chksum_word)
+            if chksum_word_idx in self.m_words_idx[-1]:
+                yield words_idx + [chksum_word_idx]
+
+    def _SeedFunction(self) -> Callable[[str], bytes]:
+        """
+        Get the (picklable) function for generating the seed from a candidate mnemonic string.
+
+        Returns:
+            function: Seed function
+        """
+        return functools.partial(_MoneroMnemonicRecoveryUtils.GenerateSeed, self.m_lang)
+
+    @staticmethod
+    def _MnemonicFromList(mnemonic_list: List[str]) -> Mnemonic:
+        """
+        Get a mnemonic object from a list of words.
+
+        Args:
+            mnemonic_list (list[str]): Mnemonic words
+
+        Returns:
+            Mnemonic object: Mnemonic object
+        """
+        return MoneroMnemonic.FromList(mnemonic_list)
+
+    def __AreChunksValid(self,
+                         words_idx: List[int]) -> bool:
+        """
+        Get if each group of 3 words encodes a valid 32-bit chunk.
+
+        Args:
+            words_idx (list[int]): Data word indexes
+
+        Returns:
+            bool: True if valid, false otherwise
+        """
+        n = self.m_words_list.Length()
+        for i in range(0, len(words_idx), 3):
+            word1_idx, word2_idx, word3_idx = words_idx[i:i + 3]
+            if word1_idx + (n * ((word2_idx - word1_idx) % n)) + (n * n * ((word3_idx - word2_idx) % n)) >= 2**32:
+                return False
+        return True
@@ -23,13 +23,14 @@
 #
 # Imports
 #
-from typing import List
+import itertools
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from bip_utils.addr import SolAddrDecoder
 from bip_utils.base58 import Base58Encoder
 from bip_utils.ecc import Ed25519PublicKey
 from bip_utils.utils.crypto import Sha256
-from bip_utils.utils.misc import IntegerUtils
+from bip_utils.utils.misc import IntegerUtils, ParallelUtils
 
 
 #
@@ -49,6 +50,75 @@ class SplTokenConst:
     SEED_BUMP_MAX_VAL: int = 2 ** 8 - 1
     # Maximum number of seeds
     SEEDS_MAX_NUM: int = 16
+    # Default number of addresses computed by a worker at once
+    DEF_CHUNK_SIZE: int = 256
+
+
+class _SplTokenUtils:
+    """Class container for SPL token utility functions."""
+
+    @staticmethod
+    def FindPda(seeds_sha256: Sha256,
+                pda_suffix: bytes) -> str:
+        """
+        Find a valid PDA (Program Derived Address) by trying all bump seeds.
+
+        Args:
+            seeds_sha256 (Sha256 object): SHA256 object already updated with the seeds
+            pda_suffix (bytes)          : Program ID bytes followed by the PDA marker
+
+        Returns:
+            str: Found PDA
+
+        Raises:
+            ValueError: If the PDA cannot be found
+        """
+        for bump_seed in range(SplTokenConst.SEED_BUMP_MAX_VAL, 0, -1):
+            # Only the bump seed and the suffix are hashed, the seeds state is just copied
+            sha256 = seeds_sha256.Copy()
+            sha256.Update(IntegerUtils.ToBytes(bump_seed) + pda_suffix)
+            pda_bytes = sha256.Digest()
+
+            # A PDA shall NOT lie on the ed25519 curve, so it shall not be a valid public key
+            if not Ed25519PublicKey.IsValidBytes(pda_bytes):
+                return Base58Encoder.Encode(pda_bytes)
+
+        # Very unlucky case
+        raise ValueError("Unable to find a valid PDA")
+
+    @staticmethod
+    def FindAssociatedTokenAddresses(token_program_id_bytes: bytes,
+                                     pda_suffix: bytes,
+                                     addr_pairs: List[Tuple[bytes, bytes]]) -> List[str]:
+        """
+        Find the associated token addresses of a chunk of wallet and token mint address pairs.
+        The SHA256 state of a wallet is reused for all the consecutive pairs with the same wallet.
+
+        Args:
+            token_program_id_bytes (bytes)        : Token program ID bytes
+            pda_suffix (bytes)                    : Program ID bytes followed by the PDA marker
+            addr_pairs (list[tuple[bytes, bytes]]): Wallet and token mint address bytes
+
+        Returns:
+            list[str]: Associated token addresses
+
+        Raises:
+            ValueError: If an account address cannot be found
+        """
+        ata_addrs = []
+        wallet_sha256 = Sha256()
+        last_wallet_addr_bytes = None
+        for wallet_addr_bytes, token_mint_addr_bytes in addr_pairs:
+            if wallet_addr_bytes != last_wallet_addr_bytes:
+                wallet_sha256 = Sha256()
+                wallet_sha256.Update(wallet_addr_bytes)
+                wallet_sha256.Update(token_program_id_bytes)
+                last_wallet_addr_bytes = wallet_addr_bytes
+
+            seeds_sha256 = wallet_sha256.Copy()
+            seeds_sha256.Update(token_mint_addr_bytes)
+            ata_addrs.append(_SplTokenUtils.FindPda(seeds_sha256, pda_suffix))
+        return ata_addrs
 
 
 class SplToken:
@@ -106,6 +176,40 @@ class SplToken:
         ]
         return cls.FindPda(seeds, SplTokenConst.DEF_PROGRAM_ID)
 
+    @classmethod
+    def GetAssociatedTokenAddresses(cls,
+                                    wallet_addrs: Iterable[str],
+                                    token_mint_addrs: Iterable[str],
+                                    token_program_id: str = SplTokenConst.DEF_TOKEN_PROGRAM_ID,
+                                    workers: Optional[int] = 1,
+                                    chunk_size: int = SplTokenConst.DEF_CHUNK_SIZE) -> Iterator[str]:
+        """
+        Get the account addresses associated to all the specified SPL tokens for all the specified wallets.
+        Addresses are returned for each wallet (in order), for each token mint (in order).
+        Each address is decoded only once and all the addresses are validated before computing the results.
+
+        Args:
+            wallet_addrs (iterable[str])    : Wallet addresses
+            token_mint_addrs (iterable[str]): Token mint addresses
+            token_program_id (str, optional): Token program ID (default: SPL token program)
+            workers (int, optional)         : Number of worker processes (default: 1, i.e. in the current
+                                              process), None for CPU count
+            chunk_size (int, optional)      : Number of addresses computed by a worker at once
+
+        Returns:
+            Iterator[str]: Iterator of associated account addresses
+
+        Raises:
+            ValueError: If an account address cannot be found or the specified addresses or parameters are not valid
+        """
+        wallet_addrs_bytes = [SolAddrDecoder.DecodeAddr(addr) for addr in wallet_addrs]
+        token_mint_addrs_bytes = [SolAddrDecoder.DecodeAddr(addr) for addr in token_mint_addrs]
+        token_program_id_bytes = SolAddrDecoder.DecodeAddr(token_program_id)
+
+        workers = ParallelUtils.WorkersNum(workers)
+        chunks = ParallelUtils.Chunks(itertools.product(wallet_addrs_bytes, token_mint_addrs_bytes), chunk_size)
+        return cls.__GetAssociatedTokenAddresses(token_program_id_bytes, chunks, workers)
+
     @classmethod
     def FindPda(cls,
                 seeds: List[bytes],
@@ -132,49 +236,31 @@ class SplToken:
                 raise ValueError(f"Seed length is not valid ({len(seeds)})")
 
         program_id_bytes = SolAddrDecoder.DecodeAddr(program_id)
-        bump_seed = SplTokenConst.SEED_BUMP_MAX_VAL
-        for _ in range(SplTokenConst.SEED_BUMP_MAX_VAL):
-            # Add bump to seeds
-            seeds_with_bump = list(seeds)
-            seeds_with_bump.append(IntegerUtils.ToBytes(bump_seed))
-            # Try to create PDA
-            try:
-                return cls.__CreatePda(seeds_with_bump, program_id_bytes)
-            except ValueError:
-                # Continue with the next bump seed if PDA is not valid
-                bump_seed -= 1
-
-        # Very unlucky case
-        raise ValueError("Unable to find a valid PDA")
+        # Hash seeds only once for all the bump seeds
+        seeds_sha256 = Sha256()
+        for seed in seeds:
+            seeds_sha256.Update(seed)
+        return _SplTokenUtils.FindPda(seeds_sha256, program_id_bytes + SplTokenConst.PDA_MARKER)
 
     @staticmethod
-    def __CreatePda(seeds_with_bump: List[bytes],
-                    program_id_bytes: bytes) -> str:
+    def __GetAssociatedTokenAddresses(token_program_id_bytes: bytes,
+                                      chunks: Iterator[List[Tuple[bytes, bytes]]],
+                                      workers: int) -> Iterator[str]:
         """
-        Create a PDA (Program Derived Address) for the specified seeds and program ID.
+        Get the account addresses associated to chunks of wallet and token mint address pairs.
 
         Args:
-            seeds_with_bump (list[bytes]): List of seeds bytes with bump
-            program_id_bytes (bytes)     : Program ID bytes
+            token_program_id_bytes (bytes)              : Token program ID bytes
+            chunks (Iterator[list[tuple[bytes, bytes]]]): Chunks of wallet and token mint address bytes
+            workers (int)                               : Number of worker processes
 
         Returns:
-            str: Created PDA
-
-        Raises:
-            ValueError: If the created PDA is not valid
+            Iterator[str]: Iterator of associated account addresses
         """
-        sha256 = Sha256()
-        # Compute SHA256 of seeds with bump
-        for seed in seeds_with_bump:
-            sha256.Update(seed)
-        # Compute SHA256 of program ID and PDA marker
-        for elem in (program_id_bytes, SplTokenConst.PDA_MARKER):
-            sha256.Update(elem)
-        # Get PDA bytes
-        pda_bytes = sha256.Digest()
-
-        # A PDA shall NOT lie on the ed25519 curve, so it shall not be a valid public key
-        if Ed25519PublicKey.IsValidBytes(pda_bytes):
-            raise ValueError("Invalid created PDA")
-
-        return Base58Encoder.Encode(pda_bytes)
+        pda_suffix = SolAddrDecoder.DecodeAddr(SplTokenConst.DEF_PROGRAM_ID) + SplTokenConst.PDA_MARKER
+        for _, ata_addrs in ParallelUtils.MapChunks(_SplTokenUtils.FindAssociatedTokenAddresses,
+                                                    chunks,
+                                                    workers,
+                                                    token_program_id_bytes,
+                                                    pda_suffix):
+            yield from ata_addrs
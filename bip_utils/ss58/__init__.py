@@ -1,2 +1,2 @@
-from bip_utils.ss58.ss58 import SS58Decoder, SS58Encoder
+from bip_utils.ss58.ss58 import SS58Codec, SS58Decoder, SS58Encoder
 from bip_utils.ss58.ss58_ex import SS58ChecksumError
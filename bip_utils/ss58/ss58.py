@@ -24,7 +24,10 @@ Reference: https://github.com/paritytech/substrate/wiki/External-Address-Format-
 """
 
 # Imports
-from typing import Tuple
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Iterable, List, Tuple
 
 from bip_utils.base58 import Base58Decoder, Base58Encoder
 from bip_utils.ss58.ss58_ex import SS58ChecksumError
@@ -55,42 +58,33 @@ class _SS58Utils:
     """Class container for SS58 utility functions."""
 
     @staticmethod
-    def ComputeChecksum(data_bytes: bytes) -> bytes:
+    def CheckDataLength(data_bytes: bytes) -> None:
         """
-        Compute SS58 checksum.
+        Check data length.
 
         Args:
             data_bytes (bytes): Data bytes
 
-        Returns:
-            bytes: Computed checksum
+        Raises:
+            ValueError: If data length is not valid
         """
-        return Blake2b512.QuickDigest(SS58Const.CHECKSUM_PREFIX + data_bytes)[:SS58Const.CHECKSUM_BYTE_LEN]
-
-
-class SS58Encoder:
-    """SS58 encoder class. It provides methods for encoding to SS58 format."""
+        if len(data_bytes) != SS58Const.DATA_BYTE_LEN:
+            raise ValueError(f"Invalid data length ({len(data_bytes)})")
 
     @staticmethod
-    def Encode(data_bytes: bytes,
-               ss58_format: int) -> str:
+    def FormatToBytes(ss58_format: int) -> bytes:
         """
-        Encode bytes into a SS58 string.
+        Convert a SS58 format to bytes.
 
         Args:
-            data_bytes (bytes): Data bytes (32-byte length)
-            ss58_format (int) : SS58 format
+            ss58_format (int): SS58 format
 
         Returns:
-            str: SS58 encoded string
+            bytes: SS58 format bytes
 
         Raises:
-            ValueError: If parameters are not valid
+            ValueError: If the SS58 format is not valid
         """
-
-        # Check parameters
-        if len(data_bytes) != SS58Const.DATA_BYTE_LEN:
-            raise ValueError(f"Invalid data length ({len(data_bytes)})")
         if ss58_format < 0 or ss58_format > SS58Const.FORMAT_MAX_VAL:
             raise ValueError(f"Invalid SS58 format ({ss58_format})")
         if ss58_format in SS58Const.RESERVED_FORMATS:
@@ -98,44 +92,47 @@ class SS58Encoder:
 
         # Simple account
         if ss58_format <= SS58Const.SIMPLE_ACCOUNT_FORMAT_MAX_VAL:
-            ss58_format_bytes = IntegerUtils.ToBytes(ss58_format)
+            return IntegerUtils.ToBytes(ss58_format)
         # Full address
-        else:
-            # 0b00HHHHHH_MMLLLLLL -> (0b01LLLLLL, 0bHHHHHHMM)
-            ss58_format_bytes = bytes([
-                ((ss58_format & 0x00FC) >> 2) | 0x0040,
-                (ss58_format >> 8) | ((ss58_format & 0x0003) << 6)
-            ])
+        # 0b00HHHHHH_MMLLLLLL -> (0b01LLLLLL, 0bHHHHHHMM)
+        return bytes([
+            ((ss58_format & 0x00FC) >> 2) | 0x0040,
+            (ss58_format >> 8) | ((ss58_format & 0x0003) << 6)
+        ])
 
-        # Get payload
-        payload = ss58_format_bytes + data_bytes
-        # Compute checksum
-        checksum = _SS58Utils.ComputeChecksum(payload)
-        # Encode
-        return Base58Encoder.Encode(payload + checksum)
+    @staticmethod
+    def ComputeChecksum(payload_bytes: bytes) -> bytes:
+        """
+        Compute SS58 checksum.
 
+        Args:
+            payload_bytes (bytes): Payload bytes (format bytes and data bytes)
 
-class SS58Decoder:
-    """SS58 decoder class. It provides methods for decoding SS58 format."""
+        Returns:
+            bytes: Computed checksum
+        """
+        return Blake2b512.QuickDigest(SS58Const.CHECKSUM_PREFIX + payload_bytes)[:SS58Const.CHECKSUM_BYTE_LEN]
 
     @staticmethod
-    def Decode(data_str: str) -> Tuple[int, bytes]:
+    def SplitPayload(data_str: str) -> Tuple[int, bytes, bytes, bytes]:
         """
-        Decode bytes from a SS58 string.
+        Decode a SS58 string and split it into format, data and checksum.
 
         Args:
             data_str (string): Data string
 
         Returns:
-            tuple[int, bytes]: SS58 format and data bytes
+            tuple[int, bytes, bytes, bytes]: SS58 format, SS58 format bytes, data bytes and checksum bytes
 
         Raises:
-            SS58ChecksumError: If checksum is not valid
             ValueError: If the string is not a valid SS58 format
         """
 
         # Decode string
         dec_bytes = Base58Decoder.Decode(data_str)
+        # Check minimum length (simple account)
+        if len(dec_bytes) < 1 + SS58Const.DATA_BYTE_LEN + SS58Const.CHECKSUM_BYTE_LEN:
+            raise ValueError(f"Invalid length ({len(dec_bytes)})")
 
         # Full address
         if dec_bytes[0] & 0x40:
@@ -151,22 +148,280 @@ class SS58Decoder:
         if ss58_format in SS58Const.RESERVED_FORMATS:
             raise ValueError(f"Invalid SS58 format ({ss58_format})")
 
-        # Get back data and checksum
+        # Get back format, data and checksum
+        ss58_format_bytes = dec_bytes[:ss58_format_len]
         data_bytes = dec_bytes[ss58_format_len:-SS58Const.CHECKSUM_BYTE_LEN]
         checksum_bytes = dec_bytes[-SS58Const.CHECKSUM_BYTE_LEN:]
 
         # Check data length
-        if len(data_bytes) != SS58Const.DATA_BYTE_LEN:
-            raise ValueError(f"Invalid data length ({len(data_bytes)})")
+        _SS58Utils.CheckDataLength(data_bytes)
 
-        # Compute checksum
-        checksum_bytes_got = _SS58Utils.ComputeChecksum(dec_bytes[:-SS58Const.CHECKSUM_BYTE_LEN])
+        return ss58_format, ss58_format_bytes, data_bytes, checksum_bytes
 
-        # Verify checksum
+    @staticmethod
+    def VerifyChecksum(checksum_bytes: bytes,
+                       checksum_bytes_got: bytes) -> None:
+        """
+        Verify SS58 checksum.
+
+        Args:
+            checksum_bytes (bytes)    : Checksum bytes decoded from the string
+            checksum_bytes_got (bytes): Computed checksum bytes
+
+        Raises:
+            SS58ChecksumError: If checksum is not valid
+        """
         if checksum_bytes != checksum_bytes_got:
             raise SS58ChecksumError(
                 f"Invalid checksum (expected {BytesUtils.ToHexString(checksum_bytes_got)}, "
                 f"got {BytesUtils.ToHexString(checksum_bytes)})"
             )
 
+
+class SS58Codec:
+    """
+    SS58 codec class.
+    It encodes and decodes SS58 strings of a specific format. The format bytes and the checksum prefix are
+    computed once at construction, so that encoding/decoding many strings of the same format is faster.
+    """
+
+    m_ss58_format: int
+    m_ss58_format_bytes: bytes
+    m_chksum_hash: Blake2b512
+
+    @classmethod
+    @lru_cache()
+    def FromFormat(cls,
+                   ss58_format: int) -> SS58Codec:
+        """
+        Get a codec for the specified SS58 format.
+        Codecs are cached, so calling the method again with the same format returns the same object.
+
+        Args:
+            ss58_format (int): SS58 format
+
+        Returns:
+            SS58Codec object: SS58Codec object
+
+        Raises:
+            ValueError: If the SS58 format is not valid
+        """
+        return cls(ss58_format)
+
+    def __init__(self,
+                 ss58_format: int) -> None:
+        """
+        Construct class.
+
+        Args:
+            ss58_format (int): SS58 format
+
+        Raises:
+            ValueError: If the SS58 format is not valid
+        """
+        self.m_ss58_format = ss58_format
+        self.m_ss58_format_bytes = _SS58Utils.FormatToBytes(ss58_format)
+        self.m_chksum_hash = Blake2b512(SS58Const.CHECKSUM_PREFIX + self.m_ss58_format_bytes)
+
+    def Format(self) -> int:
+        """
+        Get the SS58 format.
+
+        Returns:
+            int: SS58 format
+        """
+        return self.m_ss58_format
+
+    def FormatBytes(self) -> bytes:
+        """
+        Get the SS58 format bytes.
+
+        Returns:
+            bytes: SS58 format bytes
+        """
+        return self.m_ss58_format_bytes
+
+    def ComputeChecksum(self,
+                        data_bytes: bytes) -> bytes:
+        """
+        Compute the SS58 checksum of the specified data with the codec format.
+
+        Args:
+            data_bytes (bytes): Data bytes
+
+        Returns:
+            bytes: Computed checksum
+        """
+        chksum_hash = self.m_chksum_hash.Copy()
+        chksum_hash.Update(data_bytes)
+        return chksum_hash.Digest()[:SS58Const.CHECKSUM_BYTE_LEN]
+
+    def Encode(self,
+               data_bytes: bytes) -> str:
+        """
+        Encode bytes into a SS58 string.
+
+        Args:
+            data_bytes (bytes): Data bytes (32-byte length)
+
+        Returns:
+            str: SS58 encoded string
+
+        Raises:
+            ValueError: If data length is not valid
+        """
+        _SS58Utils.CheckDataLength(data_bytes)
+        return Base58Encoder.Encode(self.m_ss58_format_bytes + data_bytes + self.ComputeChecksum(data_bytes))
+
+    def EncodeMany(self,
+                   data_bytes_list: Iterable[bytes]) -> List[str]:
+        """
+        Encode many bytes into SS58 strings.
+
+        Args:
+            data_bytes_list (iterable[bytes]): Data bytes (32-byte length each)
+
+        Returns:
+            list[str]: SS58 encoded strings
+
+        Raises:
+            ValueError: If data length is not valid
+        """
+        return [self.Encode(data_bytes) for data_bytes in data_bytes_list]
+
+    def Decode(self,
+               data_str: str) -> bytes:
+        """
+        Decode bytes from a SS58 string.
+
+        Args:
+            data_str (string): Data string
+
+        Returns:
+            bytes: Data bytes
+
+        Raises:
+            SS58ChecksumError: If checksum is not valid
+            ValueError: If the string is not a valid SS58 format or its format is different from the codec one
+        """
+        ss58_format, ss58_format_bytes, data_bytes, checksum_bytes = _SS58Utils.SplitPayload(data_str)
+        if ss58_format != self.m_ss58_format:
+            raise ValueError(f"Invalid SS58 format (expected {self.m_ss58_format}, got {ss58_format})")
+
+        # The cached checksum state is only valid for the canonical format bytes
+        if ss58_format_bytes == self.m_ss58_format_bytes:
+            checksum_bytes_got = self.ComputeChecksum(data_bytes)
+        else:
+            checksum_bytes_got = _SS58Utils.ComputeChecksum(ss58_format_bytes + data_bytes)
+        _SS58Utils.VerifyChecksum(checksum_bytes, checksum_bytes_got)
+
+        return data_bytes
+
+    def DecodeMany(self,
+                   data_strs: Iterable[str]) -> List[bytes]:
+        """
+        Decode bytes from many SS58 strings.
+
+        Args:
+            data_strs (iterable[str]): Data strings
+
+        Returns:
+            list[bytes]: Data bytes
+
+        Raises:
+            SS58ChecksumError: If checksum is not valid
+            ValueError: If a string is not a valid SS58 format or its format is different from the codec one
+        """
+        return [self.Decode(data_str) for data_str in data_strs]
+
+    def Reencode(self,
+                 data_str: str) -> str:
+        """
+        Re-encode a SS58 string of any format with the codec format.
+
+        Args:
+            data_str (string): Data string
+
+        Returns:
+            str: SS58 encoded string
+
+        Raises:
+            SS58ChecksumError: If checksum is not valid
+            ValueError: If the string is not a valid SS58 format
+        """
+        return self.Encode(SS58Decoder.Decode(data_str)[1])
+
+    def ReencodeMany(self,
+                     data_strs: Iterable[str]) -> List[str]:
+        """
+        Re-encode many SS58 strings of any format with the codec format.
+
+        Args:
+            data_strs (iterable[str]): Data strings
+
+        Returns:
+            list[str]: SS58 encoded strings
+
+        Raises:
+            SS58ChecksumError: If checksum is not valid
+            ValueError: If a string is not a valid SS58 format
+        """
+        return [self.Reencode(data_str) for data_str in data_strs]
+
+
+class SS58Encoder:
+    """SS58 encoder class. It provides methods for encoding to SS58 format."""
+
+    @staticmethod
+    def Encode(data_bytes: bytes,
+               ss58_format: int) -> str:
+        """
+        Encode bytes into a SS58 string.
+
+        Args:
+            data_bytes (bytes): Data bytes (32-byte length)
+            ss58_format (int) : SS58 format
+
+        Returns:
+            str: SS58 encoded string
+
+        Raises:
+            ValueError: If parameters are not valid
+        """
+
+        # Check data length before the format, the codec is only used for computing the string
+        _SS58Utils.CheckDataLength(data_bytes)
+
+        codec = SS58Codec.FromFormat(ss58_format)
+        return Base58Encoder.Encode(codec.FormatBytes() + data_bytes + codec.ComputeChecksum(data_bytes))
+
+
+class SS58Decoder:
+    """SS58 decoder class. It provides methods for decoding SS58 format."""
+
+    @staticmethod
+    def Decode(data_str: str) -> Tuple[int, bytes]:
+        """
+        Decode bytes from a SS58 string.
+
+        Args:
+            data_str (string): Data string
+
+        Returns:
+            tuple[int, bytes]: SS58 format and data bytes
+
+        Raises:
+            SS58ChecksumError: If checksum is not valid
+            ValueError: If the string is not a valid SS58 format
+        """
+        ss58_format, ss58_format_bytes, data_bytes, checksum_bytes = _SS58Utils.SplitPayload(data_str)
+
+        # Verify checksum over the decoded format bytes, which may not be the canonical ones
+        codec = SS58Codec.FromFormat(ss58_format)
+        if ss58_format_bytes == codec.FormatBytes():
+            checksum_bytes_got = codec.ComputeChecksum(data_bytes)
+        else:
+            checksum_bytes_got = _SS58Utils.ComputeChecksum(ss58_format_bytes + data_bytes)
+        _SS58Utils.VerifyChecksum(checksum_bytes, checksum_bytes_got)
+
         return ss58_format, data_bytes
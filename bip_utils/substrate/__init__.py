@@ -1,4 +1,5 @@
 from bip_utils.substrate.substrate import Substrate, SubstrateCoins
+from bip_utils.substrate.substrate_addr_converter import SubstrateAddrConverter
 from bip_utils.substrate.substrate_ex import SubstrateKeyError, SubstratePathError
 from bip_utils.substrate.substrate_keys import SubstratePrivateKey, SubstratePublicKey
 from bip_utils.substrate.substrate_path import SubstratePath, SubstratePathElem, SubstratePathParser
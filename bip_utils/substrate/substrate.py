@@ -23,15 +23,17 @@
 # Imports
 from __future__ import annotations
 
-from typing import Optional, Union
+from typing import Any, Callable, Iterator, List, Optional, Union
 
 import sr25519
 
 from bip_utils.ecc import IPrivateKey, IPublicKey
+from bip_utils.ss58 import SS58Codec
 from bip_utils.substrate.conf import SubstrateCoinConf, SubstrateCoins, SubstrateConfGetter
-from bip_utils.substrate.substrate_ex import SubstrateKeyError
+from bip_utils.substrate.substrate_ex import SubstrateKeyError, SubstratePathError
 from bip_utils.substrate.substrate_keys import SubstratePrivateKey, SubstratePublicKey
 from bip_utils.substrate.substrate_path import SubstratePath, SubstratePathElem, SubstratePathParser
+from bip_utils.utils.misc import ParallelUtils
 
 
 class SubstrateConst:
@@ -39,6 +41,50 @@ class SubstrateConst:
 
     # Seed minimum length in bytes
     SEED_MIN_BYTE_LEN: int = 32
+    # Default number of children derived by a worker at once
+    DEF_CHUNK_SIZE: int = 1024
+
+
+class _SubstrateUtils:
+    """Class container for Substrate utility functions."""
+
+    @staticmethod
+    def DeriveSoftPublicKeys(pub_key_bytes: bytes,
+                             indexes: range) -> List[bytes]:
+        """
+        Derive the public keys of a range of integer soft children.
+        Soft derivation only depends on the public key, so it is done directly on the raw parent public key.
+
+        Args:
+            pub_key_bytes (bytes): Parent public key bytes
+            indexes (range)      : Children indexes
+
+        Returns:
+            list[bytes]: Children public keys bytes
+        """
+        return [
+            sr25519.derive_pubkey((chain_code, pub_key_bytes), b"")[1]  # pylint: disable=no-member
+            for chain_code in SubstratePathElem.IntChainCodes(indexes.start, indexes.stop)
+        ]
+
+    @staticmethod
+    def DeriveSoftAddresses(pub_key_bytes: bytes,
+                            ss58_format: int,
+                            indexes: range) -> List[str]:
+        """
+        Derive the addresses of a range of integer soft children.
+
+        Args:
+            pub_key_bytes (bytes): Parent public key bytes
+            ss58_format (int)    : SS58 format
+            indexes (range)      : Children indexes
+
+        Returns:
+            list[str]: Children addresses
+        """
+        return SS58Codec.FromFormat(ss58_format).EncodeMany(
+            _SubstrateUtils.DeriveSoftPublicKeys(pub_key_bytes, indexes)
+        )
 
 
 class Substrate:
@@ -244,6 +290,68 @@ class Substrate:
 
         return substrate_obj
 
+    def ChildPublicKeysRange(self,
+                             start: int,
+                             stop: int,
+                             workers: Optional[int] = 1,
+                             chunk_size: int = SubstrateConst.DEF_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Derive the public keys of the integer soft children in the specified range, i.e. /start ... /(stop - 1).
+        Chain codes are computed in bulk and public keys are derived directly from the current raw public key,
+        without creating intermediate Substrate objects. It works for both private and public-only objects.
+
+        Args:
+            start (int)               : First child index (included)
+            stop (int)                : Last child index (excluded)
+            workers (int, optional)   : Number of worker processes (default: 1, i.e. in the current process),
+                                        None for CPU count
+            chunk_size (int, optional): Number of children derived by a worker at once
+
+        Returns:
+            Iterator[bytes]: Iterator of children public keys bytes (in order)
+
+        Raises:
+            SubstratePathError: If the range is not valid
+            ValueError: If the parameters are not valid
+        """
+        return self.__ChildrenRange(_SubstrateUtils.DeriveSoftPublicKeys,
+                                    start,
+                                    stop,
+                                    workers,
+                                    chunk_size,
+                                    self.m_pub_key.RawCompressed().ToBytes())
+
+    def ChildAddressesRange(self,
+                            start: int,
+                            stop: int,
+                            workers: Optional[int] = 1,
+                            chunk_size: int = SubstrateConst.DEF_CHUNK_SIZE) -> Iterator[str]:
+        """
+        Derive the addresses of the integer soft children in the specified range, i.e. /start ... /(stop - 1).
+        Same of ChildPublicKeysRange, but the public keys are also encoded to SS58 addresses with the coin format.
+
+        Args:
+            start (int)               : First child index (included)
+            stop (int)                : Last child index (excluded)
+            workers (int, optional)   : Number of worker processes (default: 1, i.e. in the current process),
+                                        None for CPU count
+            chunk_size (int, optional): Number of children derived by a worker at once
+
+        Returns:
+            Iterator[str]: Iterator of children addresses (in order)
+
+        Raises:
+            SubstratePathError: If the range is not valid
+            ValueError: If the parameters are not valid
+        """
+        return self.__ChildrenRange(_SubstrateUtils.DeriveSoftAddresses,
+                                    start,
+                                    stop,
+                                    workers,
+                                    chunk_size,
+                                    self.m_pub_key.RawCompressed().ToBytes(),
+                                    self.m_coin_conf.SS58Format())
+
     def ConvertToPublic(self) -> None:
         """Convert a private Substrate object into a public one."""
         self.m_priv_key = None
@@ -356,3 +464,61 @@ class Substrate:
                          pub_key=pub_key_bytes,
                          path=self.m_path.AddElem(path_elem),
                          coin_conf=self.m_coin_conf)
+
+    @staticmethod
+    def __ChildrenRange(fct: Callable[..., List[Any]],
+                        start: int,
+                        stop: int,
+                        workers: Optional[int],
+                        chunk_size: int,
+                        *args: Any) -> Iterator[Any]:
+        """
+        Derive a range of integer soft children by calling the function on chunks of indexes.
+
+        Args:
+            fct (function)  : Function called on each chunk, i.e. fct(*args, indexes)
+            start (int)     : First child index (included)
+            stop (int)      : Last child index (excluded)
+            workers (int)   : Number of worker processes, None for CPU count
+            chunk_size (int): Number of children derived by a worker at once
+            *args           : Arguments passed to the function before the indexes
+
+        Returns:
+            Iterator: Iterator of results
+
+        Raises:
+            SubstratePathError: If the range is not valid
+            ValueError: If the parameters are not valid
+        """
+
+        # Validate everything before starting the derivation
+        if start < 0 or stop < start:
+            raise SubstratePathError(f"Invalid integer range ({start}, {stop})")
+        if stop > start:
+            SubstratePathElem.IntChainCodes(stop - 1, stop)
+        workers = ParallelUtils.WorkersNum(workers)
+        if chunk_size <= 0:
+            raise ValueError(f"Invalid chunk size ({chunk_size})")
+
+        chunks = (range(i, min(i + chunk_size, stop)) for i in range(start, stop, chunk_size))
+        return Substrate.__ChildrenRangeChunks(fct, chunks, workers, *args)
+
+    @staticmethod
+    def __ChildrenRangeChunks(fct: Callable[..., List[Any]],
+                              chunks: Iterator[range],
+                              workers: int,
+                              *args: Any) -> Iterator[Any]:
+        """
+        Call the function on chunks of indexes and yield the results.
+
+        Args:
+            fct (function)          : Function called on each chunk, i.e. fct(*args, indexes)
+            chunks (Iterator[range]): Chunks of indexes
+            workers (int)           : Number of worker processes
+            *args                   : Arguments passed to the function before the indexes
+
+        Returns:
+            Iterator: Iterator of results
+        """
+        for _, results in ParallelUtils.MapChunks(fct, chunks, workers, *args):
+            yield from results
@@ -0,0 +1,118 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for converting Substrate addresses between coins."""
+
+# Imports
+from typing import Dict, Iterable, List, Optional
+
+from bip_utils.ss58 import SS58Codec, SS58Decoder
+from bip_utils.substrate.conf import SubstrateCoins, SubstrateConfGetter
+
+
+class SubstrateAddrConverter:
+    """
+    Substrate address converter class.
+    It allows to convert a Substrate address by changing its SS58 format to the one of another coin.
+    The same account can be therefore re-encoded for all the Substrate coins at once.
+    """
+
+    @staticmethod
+    def Convert(address: str,
+                coin_type: SubstrateCoins) -> str:
+        """
+        Convert a Substrate address to the SS58 format of the specified coin.
+
+        Args:
+            address (str)             : Substrate address (any SS58 format)
+            coin_type (SubstrateCoins): Coin type
+
+        Returns:
+            str: Converted address string
+
+        Raises:
+            SS58ChecksumError: If the address checksum is not valid
+            TypeError: If coin type is not of a SubstrateCoins enumerative
+            ValueError: If the address string is not valid
+        """
+        return SubstrateAddrConverter.__GetCodec(coin_type).Reencode(address)
+
+    @staticmethod
+    def ConvertMany(addresses: Iterable[str],
+                    coin_type: SubstrateCoins) -> List[str]:
+        """
+        Convert many Substrate addresses to the SS58 format of the specified coin.
+
+        Args:
+            addresses (iterable[str]) : Substrate addresses (any SS58 format)
+            coin_type (SubstrateCoins): Coin type
+
+        Returns:
+            list[str]: Converted address strings
+
+        Raises:
+            SS58ChecksumError: If an address checksum is not valid
+            TypeError: If coin type is not of a SubstrateCoins enumerative
+            ValueError: If an address string is not valid
+        """
+        return SubstrateAddrConverter.__GetCodec(coin_type).ReencodeMany(addresses)
+
+    @staticmethod
+    def ConvertToAll(address: str,
+                     coin_types: Optional[Iterable[SubstrateCoins]] = None) -> Dict[SubstrateCoins, str]:
+        """
+        Convert a Substrate address to the SS58 format of many coins.
+        The address is decoded only once.
+
+        Args:
+            address (str)                                  : Substrate address (any SS58 format)
+            coin_types (iterable[SubstrateCoins], optional): Coin types (default: all coins)
+
+        Returns:
+            dict[SubstrateCoins, str]: Converted address string for each coin
+
+        Raises:
+            SS58ChecksumError: If the address checksum is not valid
+            TypeError: If a coin type is not of a SubstrateCoins enumerative
+            ValueError: If the address string is not valid
+        """
+        codecs = {
+            coin_type: SubstrateAddrConverter.__GetCodec(coin_type)
+            for coin_type in (coin_types if coin_types is not None else SubstrateCoins)
+        }
+        # Decode only once
+        _, pub_key_bytes = SS58Decoder.Decode(address)
+        return {coin_type: codec.Encode(pub_key_bytes) for coin_type, codec in codecs.items()}
+
+    @staticmethod
+    def __GetCodec(coin_type: SubstrateCoins) -> SS58Codec:
+        """
+        Get the SS58 codec of the specified coin.
+
+        Args:
+            coin_type (SubstrateCoins): Coin type
+
+        Returns:
+            SS58Codec object: SS58Codec object
+
+        Raises:
+            TypeError: If coin type is not of a SubstrateCoins enumerative
+        """
+        return SS58Codec.FromFormat(SubstrateConfGetter.GetConfig(coin_type).SS58Format())
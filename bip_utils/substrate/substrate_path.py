@@ -24,7 +24,6 @@
 from __future__ import annotations
 
 import re
-from functools import lru_cache
 from typing import Dict, Iterator, List, Optional, Sequence, Type, Union
 
 from bip_utils.substrate.scale import (
@@ -33,6 +32,7 @@ from bip_utils.substrate.scale import (
 )
 from bip_utils.substrate.substrate_ex import SubstratePathError
 from bip_utils.utils.crypto import Blake2b256
+from bip_utils.utils.misc import MemoUtils
 
 
 class SubstratePathConst:
@@ -103,7 +103,40 @@ class SubstratePathElem:
         """
         return not self.IsHard()
 
-    @lru_cache()
+    @staticmethod
+    def IntChainCodes(start: int,
+                      stop: int) -> List[bytes]:
+        """
+        Compute the chain codes of a range of integer path elements at once.
+        It is equivalent to calling ChainCode on each element, without constructing any object.
+
+        Args:
+            start (int): First integer (included)
+            stop (int) : Last integer (excluded)
+
+        Returns:
+            list[bytes]: Chain codes
+
+        Raises:
+            SubstratePathError: If the range is not valid or contains numbers bigger than 256-bit
+        """
+        if start < 0 or stop < start:
+            raise SubstratePathError(f"Invalid integer range ({start}, {stop})")
+        if stop > 0 and (stop - 1).bit_length() > max(SubstratePathConst.SCALE_INT_ENCODERS):
+            raise SubstratePathError(f"Invalid integer bit length ({(stop - 1).bit_length()})")
+
+        chain_codes = []
+        # Integers are SCALE-encoded in little endian with the smallest fitting length, encoded data is never
+        # longer than the maximum length so it is just padded
+        for bit_len in SubstratePathConst.SCALE_INT_ENCODERS:
+            bit_len_stop = min(stop, 1 << bit_len)
+            if start < bit_len_stop:
+                padding = b"\x00" * (SubstratePathConst.ENCODED_ELEM_MAX_BYTE_LEN - bit_len // 8)
+                chain_codes.extend([i.to_bytes(bit_len // 8, "little") + padding for i in range(start, bit_len_stop)])
+                start = bit_len_stop
+        return chain_codes
+
+    @MemoUtils.CachedMethod
     def ChainCode(self) -> bytes:
         """
         Return the chain code.
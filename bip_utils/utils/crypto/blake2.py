@@ -23,7 +23,7 @@
 # Imports
 import hashlib
 from abc import ABC, abstractmethod
-from typing import Union
+from typing import Any, Iterable, List, Union
 
 from bip_utils.utils.misc import AlgoUtils
 
@@ -56,10 +56,76 @@ class Blake2b:
                                key=AlgoUtils.Encode(key),
                                salt=AlgoUtils.Encode(salt)).digest()
 
+    @staticmethod
+    def QuickDigestMany(data: Iterable[Union[bytes, str]],
+                        digest_size: int,
+                        key: Union[bytes, str] = b"",
+                        salt: Union[bytes, str] = b"") -> List[bytes]:
+        """
+        Compute the digests of many data (quick version).
+
+        Args:
+            data (iterable[str or bytes]): Data
+            digest_size (int)            : Digest size
+            key (str or bytes, optional) : Key (default: empty)
+            salt (str or bytes, optional): Salt (default: empty)
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        key = AlgoUtils.Encode(key)
+        salt = AlgoUtils.Encode(salt)
+        return [
+            hashlib.blake2b(AlgoUtils.Encode(data_elem), digest_size=digest_size, key=key, salt=salt).digest()
+            for data_elem in data
+        ]
+
 
 class _Blake2bWithSpecificSize(ABC):
     """Abstract class for Blake2b with specific digest size."""
 
+    handle: Any
+
+    def __init__(self,
+                 data: Union[bytes, str] = b"") -> None:
+        """
+        Construct class.
+
+        Args:
+            data (str or bytes, optional): Initial data (default: empty)
+        """
+        self.handle = hashlib.blake2b(AlgoUtils.Encode(data), digest_size=self.DigestSize())
+
+    def Update(self,
+               data_bytes: bytes) -> None:
+        """
+        Update digest.
+
+        Args:
+            data_bytes (bytes): Data bytes
+        """
+        self.handle.update(data_bytes)
+
+    def Digest(self) -> bytes:
+        """
+        Get the computed digest.
+
+        Returns:
+            bytes: Computed digest
+        """
+        return self.handle.digest()
+
+    def Copy(self) -> Any:
+        """
+        Get a copy of the current state, so that common data can be hashed only once.
+
+        Returns:
+            Object of the same class: Copied object
+        """
+        obj_copy = self.__class__.__new__(self.__class__)
+        obj_copy.handle = self.handle.copy()
+        return obj_copy
+
     @classmethod
     def QuickDigest(cls,
                     data: Union[bytes, str],
@@ -78,6 +144,24 @@ class _Blake2bWithSpecificSize(ABC):
         """
         return Blake2b.QuickDigest(data, cls.DigestSize(), key, salt)
 
+    @classmethod
+    def QuickDigestMany(cls,
+                        data: Iterable[Union[bytes, str]],
+                        key: Union[bytes, str] = b"",
+                        salt: Union[bytes, str] = b"") -> List[bytes]:
+        """
+        Compute the digests of many data (quick version).
+
+        Args:
+            data (iterable[str or bytes]): Data
+            key (str or bytes, optional) : Key bytes (default: empty)
+            salt (str or bytes, optional): Salt bytes (default: empty)
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        return Blake2b.QuickDigestMany(data, cls.DigestSize(), key, salt)
+
     @staticmethod
     @abstractmethod
     def DigestSize() -> int:
@@ -22,17 +22,11 @@
 
 # Imports
 import binascii
-from typing import Union
-
-import crcmod.predefined
+from typing import Iterable, List, Union
 
 from bip_utils.utils.misc import AlgoUtils, IntegerUtils
 
 
-# Get the class only once for efficiency
-XMODEM_CRC = crcmod.predefined.Crc("xmodem")
-
-
 class Crc32:
     """
     CRC32 class.
@@ -63,7 +57,20 @@ class Crc32:
         Returns:
             bytes: Computed digest
         """
-        return binascii.crc32(AlgoUtils.Encode(data))   # Much faster than crcmod
+        return binascii.crc32(AlgoUtils.Encode(data))
+
+    @staticmethod
+    def QuickDigestMany(data: Iterable[Union[bytes, str]]) -> List[bytes]:
+        """
+        Compute the digests of many data (quick version).
+
+        Args:
+            data (iterable[str or bytes]): Data
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        return [Crc32.QuickDigest(elem) for elem in data]
 
     @staticmethod
     def DigestSize() -> int:
@@ -93,7 +100,34 @@ class XModemCrc:
         Returns:
             bytes: Computed digest
         """
-        return XMODEM_CRC.new(AlgoUtils.Encode(data)).digest()
+        return IntegerUtils.ToBytes(XModemCrc.QuickIntDigest(data), bytes_num=XModemCrc.DigestSize())
+
+    @staticmethod
+    def QuickIntDigest(data: Union[bytes, str]) -> int:
+        """
+        Compute the digest as integer (quick version).
+
+        Args:
+            data (str or bytes): Data
+
+        Returns:
+            int: Computed digest
+        """
+        # CRC-CCITT with zero initial value, i.e. XMODEM-CRC, computed by a table-driven C implementation
+        return binascii.crc_hqx(AlgoUtils.Encode(data), 0)
+
+    @staticmethod
+    def QuickDigestMany(data: Iterable[Union[bytes, str]]) -> List[bytes]:
+        """
+        Compute the digests of many data (quick version).
+
+        Args:
+            data (iterable[str or bytes]): Data
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        return [XModemCrc.QuickDigest(elem) for elem in data]
 
     @staticmethod
     def DigestSize() -> int:
@@ -103,4 +137,4 @@ class XModemCrc:
         Returns:
             int: Digest size in bytes
         """
-        return XMODEM_CRC.digest_size
+        return 2
@@ -21,10 +21,13 @@
 """Module for HASH160 algorithm."""
 
 # Imports
-from typing import Union
+import hashlib
+from typing import Iterable, List, Union
 
+from bip_utils.utils.crypto.hash_backend import HashBackendRegistry
 from bip_utils.utils.crypto.ripemd import Ripemd160
 from bip_utils.utils.crypto.sha2 import Sha256
+from bip_utils.utils.misc import AlgoUtils
 
 
 class Hash160:
@@ -46,6 +49,23 @@ class Hash160:
         """
         return Ripemd160.QuickDigest(Sha256.QuickDigest(data))
 
+    @staticmethod
+    def QuickDigestMany(data: Iterable[Union[bytes, str]]) -> List[bytes]:
+        """
+        Compute the digests of many data (quick version).
+
+        Args:
+            data (iterable[str or bytes]): Data
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        ripemd160_new_fct = HashBackendRegistry.NewFunction("ripemd160")
+        return [
+            ripemd160_new_fct(hashlib.sha256(AlgoUtils.Encode(data_elem)).digest()).digest()
+            for data_elem in data
+        ]
+
     @staticmethod
     def DigestSize() -> int:
         """
@@ -0,0 +1,186 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Module for selecting the hash algorithms backends.
+For each algorithm, the fastest available implementation is selected when the module is imported.
+"""
+
+# Imports
+import binascii
+import functools
+import hashlib
+import threading
+from typing import Any, Callable, Dict
+
+from Crypto.Hash import RIPEMD160, SHA3_256, SHA512, keccak
+
+
+class HashBackendConst:
+    """Class container for hash backend constants."""
+
+    # hashlib backend name (i.e. OpenSSL or Python built-in implementations)
+    HASHLIB: str = "hashlib"
+    # pycryptodome backend name
+    PYCRYPTODOME: str = "pycryptodome"
+
+    # Data used for probing backends
+    PROBE_DATA: bytes = b"abc"
+    # Expected digests of the probing data for each algorithm
+    PROBE_DIGESTS: Dict[str, bytes] = {
+        "keccak256": binascii.unhexlify(b"4e03657aea45a94fc7d47ba826c8d667c0d1e6e33a64a036ec44f58fa12d6c45"),
+        "ripemd160": binascii.unhexlify(b"8eb208f7e05d987a9b044a8e98c6b087f15a0bfc"),
+        "sha3_256": binascii.unhexlify(b"3a985da74fe225b2045c172d6bd390bd855f086e3e9d525b46bfe24511431532"),
+        "sha512_256": binascii.unhexlify(b"53048e2681941ef99b2e29b76b4c7dabe4c2d0c634fc6d46e0e2f13107e7af23"),
+    }
+
+
+class _HashBackendUtils:
+    """Class container for hash backend utility functions."""
+
+    @staticmethod
+    def Keccak256New(data: bytes) -> Any:
+        """
+        Create a Keccak-256 hash object using pycryptodome.
+
+        Args:
+            data (bytes): Data bytes
+
+        Returns:
+            Keccak_Hash object: Keccak_Hash object
+        """
+        return keccak.new(data=data, digest_bits=256)
+
+
+class HashBackendRegistry:
+    """
+    Hash backend registry class.
+    It keeps the selected backend for each algorithm whose implementation can be provided by different libraries
+    (SHA256, SHA512 and BLAKE2b are always computed by hashlib). A backend is a function that takes the data bytes and
+    returns a hash object (i.e. with update/digest methods, like hashlib ones).
+    When a backend is registered, it is probed by computing the digest of known data and it replaces the current one
+    only if it works, so backends shall be registered from the slowest to the fastest.
+    Registrations are serialized by a lock, while getting backends never waits.
+    """
+
+    m_lock: threading.Lock = threading.Lock()
+    m_backend_names: Dict[str, str] = {}
+    m_new_fcts: Dict[str, Callable[..., Any]] = {}
+
+    @classmethod
+    def Register(cls,
+                 algo_name: str,
+                 backend_name: str,
+                 new_fct: Callable[..., Any]) -> bool:
+        """
+        Register a backend for the specified algorithm.
+        The backend is selected only if it is available and computes the correct digest.
+
+        Args:
+            algo_name (str)   : Algorithm name
+            backend_name (str): Backend name
+            new_fct (function): Function that takes the data bytes and returns a hash object
+
+        Returns:
+            bool: True if the backend is selected, false otherwise
+
+        Raises:
+            ValueError: If the algorithm is not valid
+        """
+        if algo_name not in HashBackendConst.PROBE_DIGESTS:
+            raise ValueError(f"Invalid hash algorithm ({algo_name})")
+
+        try:
+            if new_fct(HashBackendConst.PROBE_DATA).digest() != HashBackendConst.PROBE_DIGESTS[algo_name]:
+                return False
+        # Algorithm not supported (e.g. hashlib.new raises ValueError if OpenSSL does not provide it)
+        except ValueError:
+            return False
+
+        with cls.m_lock:
+            cls.m_backend_names[algo_name] = backend_name
+            cls.m_new_fcts[algo_name] = new_fct
+        return True
+
+    @classmethod
+    def Backend(cls,
+                algo_name: str) -> str:
+        """
+        Get the name of the backend selected for the specified algorithm.
+
+        Args:
+            algo_name (str): Algorithm name
+
+        Returns:
+            str: Backend name
+
+        Raises:
+            ValueError: If the algorithm is not valid
+        """
+        try:
+            return cls.m_backend_names[algo_name]
+        except KeyError as ex:
+            raise ValueError(f"Invalid hash algorithm ({algo_name})") from ex
+
+    @classmethod
+    def Backends(cls) -> Dict[str, str]:
+        """
+        Get the names of the backends selected for all the algorithms.
+
+        Returns:
+            dict: Algorithm names (keys) and backend names (values)
+        """
+        return dict(sorted(cls.m_backend_names.items()))
+
+    @classmethod
+    def NewFunction(cls,
+                    algo_name: str) -> Callable[..., Any]:
+        """
+        Get the function of the backend selected for the specified algorithm.
+
+        Args:
+            algo_name (str): Algorithm name
+
+        Returns:
+            function: Function that takes the data bytes and returns a hash object
+
+        Raises:
+            ValueError: If the algorithm is not valid
+        """
+        # Called for each digest, so it shall be as fast as possible
+        try:
+            return cls.m_new_fcts[algo_name]
+        except KeyError as ex:
+            raise ValueError(f"Invalid hash algorithm ({algo_name})") from ex
+
+
+# Default backends, from the slowest to the fastest
+# pycryptodome is always available, hashlib availability depends on the Python version and OpenSSL configuration
+# (e.g. RIPEMD160 is a legacy algorithm in OpenSSL 3 and KECCAK-256 was added in OpenSSL 3.2)
+HashBackendRegistry.Register("keccak256", HashBackendConst.PYCRYPTODOME, _HashBackendUtils.Keccak256New)
+HashBackendRegistry.Register("keccak256", HashBackendConst.HASHLIB, functools.partial(hashlib.new, "KECCAK-256"))
+HashBackendRegistry.Register("ripemd160", HashBackendConst.PYCRYPTODOME, RIPEMD160.new)
+HashBackendRegistry.Register("ripemd160", HashBackendConst.HASHLIB, functools.partial(hashlib.new, "ripemd160"))
+HashBackendRegistry.Register("sha3_256", HashBackendConst.PYCRYPTODOME, SHA3_256.new)
+HashBackendRegistry.Register("sha3_256", HashBackendConst.HASHLIB, hashlib.sha3_256)
+HashBackendRegistry.Register("sha512_256",
+                             HashBackendConst.PYCRYPTODOME,
+                             functools.partial(SHA512.new, truncate="256"))
+HashBackendRegistry.Register("sha512_256", HashBackendConst.HASHLIB, functools.partial(hashlib.new, "sha512_256"))
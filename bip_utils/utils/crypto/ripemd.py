@@ -21,10 +21,9 @@
 """Module for RIPEMD algorithm."""
 
 # Imports
-from typing import Union
-
-from Crypto.Hash import RIPEMD160
+from typing import Iterable, List, Union
 
+from bip_utils.utils.crypto.hash_backend import HashBackendRegistry
 from bip_utils.utils.misc import AlgoUtils
 
 
@@ -45,7 +44,21 @@ class Ripemd160:
         Returns:
             bytes: Computed digest
         """
-        return RIPEMD160.new(AlgoUtils.Encode(data)).digest()
+        return HashBackendRegistry.NewFunction("ripemd160")(AlgoUtils.Encode(data)).digest()
+
+    @staticmethod
+    def QuickDigestMany(data: Iterable[Union[bytes, str]]) -> List[bytes]:
+        """
+        Compute the digests of many data (quick version).
+
+        Args:
+            data (iterable[str or bytes]): Data
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        new_fct = HashBackendRegistry.NewFunction("ripemd160")
+        return [new_fct(AlgoUtils.Encode(data_elem)).digest() for data_elem in data]
 
     @staticmethod
     def DigestSize() -> int:
@@ -55,4 +68,4 @@ class Ripemd160:
         Returns:
             int: Digest size in bytes
         """
-        return RIPEMD160.digest_size
+        return 20
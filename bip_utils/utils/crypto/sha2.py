@@ -21,17 +21,15 @@
 """Module for SHA-2 algorithms."""
 
 # Imports
-import hashlib
-from typing import Any, Union
+from __future__ import annotations
 
-from Crypto.Hash import SHA512
+import hashlib
+from typing import Any, Iterable, List, Union
 
+from bip_utils.utils.crypto.hash_backend import HashBackendRegistry
 from bip_utils.utils.misc import AlgoUtils
 
 
-HASHLIB_USE_SHA512_256: bool = "sha512_256" in hashlib.algorithms_available
-
-
 class Sha256:
     """
     SHA256 class.
@@ -63,6 +61,17 @@ class Sha256:
         """
         return self.handle.digest()
 
+    def Copy(self) -> Sha256:
+        """
+        Get a copy of the current state, so that common data can be hashed only once.
+
+        Returns:
+            Sha256 object: Copied object
+        """
+        obj_copy = Sha256.__new__(Sha256)
+        obj_copy.handle = self.handle.copy()
+        return obj_copy
+
     @staticmethod
     def QuickDigest(data: Union[bytes, str]) -> bytes:
         """
@@ -76,6 +85,20 @@ class Sha256:
         """
         return hashlib.sha256(AlgoUtils.Encode(data)).digest()
 
+    @staticmethod
+    def QuickDigestMany(data: Iterable[Union[bytes, str]]) -> List[bytes]:
+        """
+        Compute the digests of many data (quick version).
+
+        Args:
+            data (iterable[str or bytes]): Data
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        new_fct = hashlib.sha256
+        return [new_fct(AlgoUtils.Encode(data_elem)).digest() for data_elem in data]
+
     @staticmethod
     def DigestSize() -> int:
         """
@@ -106,6 +129,20 @@ class DoubleSha256:
         """
         return Sha256.QuickDigest(Sha256.QuickDigest(data))
 
+    @staticmethod
+    def QuickDigestMany(data: Iterable[Union[bytes, str]]) -> List[bytes]:
+        """
+        Compute the digests of many data (quick version).
+
+        Args:
+            data (iterable[str or bytes]): Data
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        new_fct = hashlib.sha256
+        return [new_fct(new_fct(AlgoUtils.Encode(data_elem)).digest()).digest() for data_elem in data]
+
     @staticmethod
     def DigestSize() -> int:
         """
@@ -136,6 +173,20 @@ class Sha512:
         """
         return hashlib.sha512(AlgoUtils.Encode(data)).digest()
 
+    @staticmethod
+    def QuickDigestMany(data: Iterable[Union[bytes, str]]) -> List[bytes]:
+        """
+        Compute the digests of many data (quick version).
+
+        Args:
+            data (iterable[str or bytes]): Data
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        new_fct = hashlib.sha512
+        return [new_fct(AlgoUtils.Encode(data_elem)).digest() for data_elem in data]
+
     @staticmethod
     def DigestSize() -> int:
         """
@@ -164,10 +215,21 @@ class Sha512_256:   # noqa: N801
         Returns:
             bytes: Computed digest
         """
-        if HASHLIB_USE_SHA512_256:
-            return hashlib.new("sha512_256", AlgoUtils.Encode(data)).digest()
-        # Use Cryptodome if not implemented in hashlib
-        return SHA512.new(AlgoUtils.Encode(data), truncate="256").digest()
+        return HashBackendRegistry.NewFunction("sha512_256")(AlgoUtils.Encode(data)).digest()
+
+    @staticmethod
+    def QuickDigestMany(data: Iterable[Union[bytes, str]]) -> List[bytes]:
+        """
+        Compute the digests of many data (quick version).
+
+        Args:
+            data (iterable[str or bytes]): Data
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        new_fct = HashBackendRegistry.NewFunction("sha512_256")
+        return [new_fct(AlgoUtils.Encode(data_elem)).digest() for data_elem in data]
 
     @staticmethod
     def DigestSize() -> int:
@@ -177,6 +239,4 @@ class Sha512_256:   # noqa: N801
         Returns:
             int: Digest size in bytes
         """
-        return (hashlib.new("sha512_256").digest_size
-                if HASHLIB_USE_SHA512_256
-                else SHA512.new(truncate="256").digest_size)
+        return 32
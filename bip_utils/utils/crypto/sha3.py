@@ -21,17 +21,12 @@
 """Module for SHA-3 algorithms."""
 
 # Imports
-import hashlib
-from typing import Union
-
-from Crypto.Hash import SHA3_256, keccak
+from typing import Iterable, List, Union
 
+from bip_utils.utils.crypto.hash_backend import HashBackendRegistry
 from bip_utils.utils.misc import AlgoUtils
 
 
-HASHLIB_USE_SHA3_256: bool = "sha3_256" in hashlib.algorithms_available
-
-
 class Kekkak256:
     """
     Kekkak-256 class.
@@ -49,7 +44,21 @@ class Kekkak256:
         Returns:
             bytes: Computed digest
         """
-        return keccak.new(data=AlgoUtils.Encode(data), digest_bits=256).digest()
+        return HashBackendRegistry.NewFunction("keccak256")(AlgoUtils.Encode(data)).digest()
+
+    @staticmethod
+    def QuickDigestMany(data: Iterable[Union[bytes, str]]) -> List[bytes]:
+        """
+        Compute the digests of many data (quick version).
+
+        Args:
+            data (iterable[str or bytes]): Data
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        new_fct = HashBackendRegistry.NewFunction("keccak256")
+        return [new_fct(AlgoUtils.Encode(data_elem)).digest() for data_elem in data]
 
     @staticmethod
     def DigestSize() -> int:
@@ -59,9 +68,7 @@ class Kekkak256:
         Returns:
             int: Digest size in bytes
         """
-        return (hashlib.new("sha3_256").digest_size
-                if HASHLIB_USE_SHA3_256
-                else keccak.new(digest_bits=256).digest_size)
+        return 32
 
 
 class Sha3_256:     # noqa: N801
@@ -81,10 +88,21 @@ class Sha3_256:     # noqa: N801
         Returns:
             bytes: Computed digest
         """
-        if HASHLIB_USE_SHA3_256:
-            return hashlib.new("sha3_256", AlgoUtils.Encode(data)).digest()
-        # Use Cryptodome if not implemented in hashlib
-        return SHA3_256.new(AlgoUtils.Encode(data)).digest()
+        return HashBackendRegistry.NewFunction("sha3_256")(AlgoUtils.Encode(data)).digest()
+
+    @staticmethod
+    def QuickDigestMany(data: Iterable[Union[bytes, str]]) -> List[bytes]:
+        """
+        Compute the digests of many data (quick version).
+
+        Args:
+            data (iterable[str or bytes]): Data
+
+        Returns:
+            list[bytes]: Computed digests
+        """
+        new_fct = HashBackendRegistry.NewFunction("sha3_256")
+        return [new_fct(AlgoUtils.Encode(data_elem)).digest() for data_elem in data]
 
     @staticmethod
     def DigestSize() -> int:
@@ -94,6 +112,4 @@ class Sha3_256:     # noqa: N801
         Returns:
             int: Digest size in bytes
         """
-        return (hashlib.new("sha3_256").digest_size
-                if HASHLIB_USE_SHA3_256
-                else SHA3_256.digest_size)
+        return 32
@@ -4,5 +4,8 @@ from bip_utils.utils.misc.bit import BitUtils
 from bip_utils.utils.misc.bytes import BytesUtils
 from bip_utils.utils.misc.cbor_indefinite_len_array import CborIndefiniteLenArrayDecoder, CborIndefiniteLenArrayEncoder
 from bip_utils.utils.misc.data_bytes import DataBytes
+from bip_utils.utils.misc.instrumentation import Instrumentation, InstrumentationConst, InstrumentationSession
 from bip_utils.utils.misc.integer import IntegerUtils
+from bip_utils.utils.misc.memo import MemoUtils
+from bip_utils.utils.misc.parallel import ParallelUtils
 from bip_utils.utils.misc.string import StringUtils
@@ -88,10 +88,11 @@ class AlgoUtils:
         Raises:
             TypeError: If the data is neither string nor bytes
         """
-        if isinstance(data, str):
-            return data.encode(encoding)
+        # Bytes are checked first since they are the most common case
         if isinstance(data, bytes):
             return data
+        if isinstance(data, str):
+            return data.encode(encoding)
         raise TypeError("Invalid data type")
 
     @staticmethod
@@ -105,4 +106,4 @@ class AlgoUtils:
         Returns:
             bool: True if mixed case, false otherwise
         """
-        return any(c.islower() for c in data_str) and any(c.isupper() for c in data_str)
+        return any(map(str.islower, data_str)) and any(map(str.isupper, data_str))
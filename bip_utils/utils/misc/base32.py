@@ -21,9 +21,8 @@
 """Module with helper class for Base32."""
 
 # Imports
-import base64
-import binascii
-from typing import Optional, Union
+from functools import lru_cache
+from typing import Dict, FrozenSet, Optional, Tuple, Union
 
 from bip_utils.utils.misc.algo import AlgoUtils
 
@@ -35,6 +34,10 @@ class Base32Const:
     ALPHABET: str = "ABCDEFGHIJKLMNOPQRSTUVWXYZ234567"
     # Padding character
     PADDING_CHAR: str = "="
+    # Alphabet used by int() for base 32
+    INT_ALPHABET: str = "0123456789abcdefghijklmnopqrstuv"
+    # Valid number of padding characters
+    VALID_PADDING_LEN: Tuple[int, ...] = (0, 1, 3, 4, 6)
 
 
 class _Base32Utils:
@@ -44,38 +47,79 @@ class _Base32Utils:
     """
 
     @staticmethod
-    def AddPadding(data: str) -> str:
+    @lru_cache()
+    def AlphabetTables(alphabet: str) -> Tuple[Tuple[str, ...], Tuple[str, ...], Dict[int, int], FrozenSet[str]]:
         """
-        Add padding to an encoded Base32 string.
-        Used if the string was encoded with Base32Encoder.EncodeNoPadding
+        Get the tables for encoding/decoding with the specified alphabet.
+        Tables are computed only once for each alphabet.
 
         Args:
-            data (str): Data
+            alphabet (str): Alphabet string
 
         Returns:
-            str: Padded string
+            tuple: Characters, pairs of characters (indexed by 10-bit values), translation table to the int()
+                   alphabet and set of valid characters
         """
-        last_block_width = len(data) % 8
-        if last_block_width != 0:
-            data += (8 - last_block_width) * Base32Const.PADDING_CHAR
-        return data
+        return (
+            tuple(alphabet),
+            tuple(c1 + c2 for c1 in alphabet for c2 in alphabet),
+            str.maketrans(alphabet, Base32Const.INT_ALPHABET),
+            frozenset(alphabet),
+        )
 
     @staticmethod
-    def TranslateAlphabet(data: str,
-                          from_alphabet: str,
-                          to_alphabet: str) -> str:
+    def EncodeNoPadding(data_bytes: bytes,
+                        alphabet: str) -> str:
         """
-        Translate the standard Base32 alphabet to a custom one.
+        Encode bytes to Base32 without padding.
 
         Args:
-            data (str)         : Data
-            from_alphabet (str): Starting alphabet string
-            to_alphabet (str)  : Final alphabet string
+            data_bytes (bytes): Data bytes
+            alphabet (str)    : Alphabet string
 
         Returns:
-            str: String with translated alphabet
+            str: Encoded string
+        """
+        chars, pairs, _, _ = _Base32Utils.AlphabetTables(alphabet)
+
+        # Encode the whole data as an integer, padded with zero bits up to a multiple of 5 bits
+        enc_len = (len(data_bytes) * 8 + 4) // 5
+        data_int = int.from_bytes(data_bytes, "big") << (enc_len * 5 - len(data_bytes) * 8)
+
+        # Take 10 bits at a time, plus the first 5 bits if the length is odd
+        enc_str = "".join([pairs[(data_int >> shift) & 0x3FF] for shift in range((enc_len & ~1) * 5 - 10, -1, -10)])
+        return chars[data_int >> ((enc_len - 1) * 5)] + enc_str if enc_len & 1 else enc_str
+
+    @staticmethod
+    def Decode(data: str,
+               alphabet: str) -> bytes:
+        """
+        Decode bytes from Base32, with or without padding.
+
+        Args:
+            data (str)    : Data
+            alphabet (str): Alphabet string
+
+        Returns:
+            bytes: Decoded bytes
+
+        Raises:
+            ValueError: If the Base32 string is not valid
         """
-        return data.translate(str.maketrans(from_alphabet, to_alphabet))
+        _, _, trans_table, valid_chars = _Base32Utils.AlphabetTables(alphabet)
+
+        data_no_pad = data.rstrip(Base32Const.PADDING_CHAR)
+        if (-len(data) % 8 + len(data) - len(data_no_pad)) not in Base32Const.VALID_PADDING_LEN:
+            raise ValueError("Invalid Base32 string")
+        if not valid_chars.issuperset(data_no_pad):
+            raise ValueError("Invalid Base32 string")
+        if len(data_no_pad) == 0:
+            return b""
+
+        # Decode as an integer and discard the padding bits
+        dec_len = len(data_no_pad) * 5 // 8
+        data_int = int(data_no_pad.translate(trans_table), 32) >> (len(data_no_pad) * 5 - dec_len * 8)
+        return data_int.to_bytes(dec_len, "big")
 
 
 class Base32Decoder:
@@ -100,14 +144,8 @@ class Base32Decoder:
         Raises:
             ValueError: If the Base32 string is not valid
         """
-        try:
-            data_dec = _Base32Utils.AddPadding(data)
-            if custom_alphabet is not None:
-                data_dec = _Base32Utils.TranslateAlphabet(data_dec, custom_alphabet, Base32Const.ALPHABET)
-
-            return base64.b32decode(data_dec)
-        except binascii.Error as ex:
-            raise ValueError("Invalid Base32 string") from ex
+        return _Base32Utils.Decode(data,
+                                   custom_alphabet if custom_alphabet is not None else Base32Const.ALPHABET)
 
 
 class Base32Encoder:
@@ -129,11 +167,8 @@ class Base32Encoder:
         Returns:
             str: Encoded string
         """
-        b32_enc = AlgoUtils.Decode(base64.b32encode(AlgoUtils.Encode(data)))
-        if custom_alphabet is not None:
-            b32_enc = _Base32Utils.TranslateAlphabet(b32_enc, Base32Const.ALPHABET, custom_alphabet)
-
-        return b32_enc
+        b32_enc = Base32Encoder.EncodeNoPadding(data, custom_alphabet)
+        return b32_enc + (-len(b32_enc) % 8) * Base32Const.PADDING_CHAR
 
     @staticmethod
     def EncodeNoPadding(data: Union[bytes, str],
@@ -148,4 +183,5 @@ class Base32Encoder:
         Returns:
             str: Encoded string
         """
-        return Base32Encoder.Encode(data, custom_alphabet).rstrip(Base32Const.PADDING_CHAR)
+        return _Base32Utils.EncodeNoPadding(AlgoUtils.Encode(data),
+                                            custom_alphabet if custom_alphabet is not None else Base32Const.ALPHABET)
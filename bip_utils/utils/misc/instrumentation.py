@@ -0,0 +1,365 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Module for instrumenting the library operations.
+When enabled, the main operations (elliptic curve math, hashes, key derivation functions, encodings and BIP32
+derivations) are wrapped to count their calls and measure their time. When disabled, the original functions are
+restored, so there is no overhead at all.
+"""
+
+# Imports
+from __future__ import annotations
+
+import functools
+import importlib
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+
+class InstrumentationConst:
+    """Class container for instrumentation constants."""
+
+    # Instrumented methods: category, module name, class names and method names
+    TARGETS: Tuple[Tuple[str, str, Tuple[str, ...], Tuple[str, ...]], ...] = (
+        (
+            "hash",
+            "bip_utils.utils.crypto",
+            ("Blake2b", "Crc32", "DoubleSha256", "Hash160", "Kekkak256", "Ripemd160", "Sha256", "Sha3_256", "Sha512",
+             "Sha512_256", "XModemCrc"),
+            ("QuickDigest", "QuickDigestMany"),
+        ),
+        (
+            "hmac",
+            "bip_utils.utils.crypto",
+            ("HmacSha256", "HmacSha512"),
+            ("QuickDigest", "QuickDigestHalves"),
+        ),
+        (
+            "kdf",
+            "bip_utils.utils.crypto",
+            ("Pbkdf2HmacSha512", "Scrypt"),
+            ("DeriveKey",),
+        ),
+        (
+            "codec",
+            "bip_utils.base58",
+            ("Base58Decoder", "Base58Encoder", "Base58XmrDecoder", "Base58XmrEncoder"),
+            ("CheckDecode", "CheckEncode", "Decode", "Encode"),
+        ),
+        (
+            "codec",
+            "bip_utils.bech32",
+            ("BchBech32Decoder", "BchBech32Encoder", "Bech32Decoder", "Bech32Encoder", "SegwitBech32Decoder",
+             "SegwitBech32Encoder"),
+            ("Decode", "Encode"),
+        ),
+        (
+            "bip32",
+            "bip_utils.bip.bip32",
+            ("Bip32Base",),
+            ("ChildKey", "DerivePath", "FromSeed"),
+        ),
+    )
+
+    # Instrumented methods of the elliptic curve classes (all the concrete subclasses of the interfaces are wrapped)
+    ECC_TARGETS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+        ("IPoint", ("__add__", "__radd__", "__mul__", "__rmul__")),
+        ("IPublicKey", ("FromBytes", "FromPoint")),
+        ("IPrivateKey", ("FromBytes", "PublicKey")),
+    )
+    # Category of the elliptic curve operations
+    ECC_CATEGORY: str = "ecc"
+
+
+class _InstrumentationUtils:
+    """Class container for instrumentation utility functions."""
+
+    @staticmethod
+    def Wrap(fct: Callable[..., Any],
+             op_name: str) -> Callable[..., Any]:
+        """
+        Wrap a function to count its calls and measure its time.
+
+        Args:
+            fct (function): Function
+            op_name (str) : Operation name
+
+        Returns:
+            function: Wrapped function
+        """
+        @functools.wraps(fct)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return fct(*args, **kwargs)
+            finally:
+                Instrumentation.Record(op_name, time.perf_counter() - start)
+        return wrapper
+
+    @staticmethod
+    def WrapAttribute(attr: Any,
+                      op_name: str) -> Any:
+        """
+        Wrap a class attribute, keeping its type (i.e. static method, class method or normal method).
+
+        Args:
+            attr (any)   : Class attribute
+            op_name (str): Operation name
+
+        Returns:
+            any: Wrapped class attribute
+        """
+        if isinstance(attr, staticmethod):
+            return staticmethod(_InstrumentationUtils.Wrap(attr.__func__, op_name))
+        if isinstance(attr, classmethod):
+            return classmethod(_InstrumentationUtils.Wrap(attr.__func__, op_name))
+        return _InstrumentationUtils.Wrap(attr, op_name)
+
+    @staticmethod
+    def Subclasses(cls: Type) -> List[Type]:
+        """
+        Get all the subclasses of a class (recursively).
+
+        Args:
+            cls (class): Class
+
+        Returns:
+            list[class]: Subclasses
+        """
+        subclasses = []
+        for subclass in cls.__subclasses__():
+            subclasses.append(subclass)
+            subclasses.extend(_InstrumentationUtils.Subclasses(subclass))
+        return subclasses
+
+
+class Instrumentation:
+    """
+    Instrumentation class.
+    It counts the calls and measures the time of the library operations, which are named as
+    <category>.<class>.<method> (e.g. "hash.Sha256.QuickDigest").
+    Times are inclusive, so an operation that calls other instrumented operations includes their time.
+    Only operations executed in the current process are recorded (i.e. not the ones in worker processes).
+    """
+
+    m_lock: threading.Lock = threading.Lock()
+    m_patches: List[Tuple[Type, str, Any]] = []
+    m_stats: Dict[str, List[Any]] = {}
+
+    @classmethod
+    def Enable(cls) -> None:
+        """Enable instrumentation by wrapping the operations. Nothing is done if already enabled."""
+        with cls.m_lock:
+            if cls.m_patches:
+                return
+
+            for category, module_name, class_names, method_names in InstrumentationConst.TARGETS:
+                module = importlib.import_module(module_name)
+                for class_name in class_names:
+                    cls.__PatchClass(getattr(module, class_name), category, method_names)
+
+            ecc_module = importlib.import_module("bip_utils.ecc")
+            for base_class_name, method_names in InstrumentationConst.ECC_TARGETS:
+                for ecc_cls in _InstrumentationUtils.Subclasses(getattr(ecc_module, base_class_name)):
+                    cls.__PatchClass(ecc_cls, InstrumentationConst.ECC_CATEGORY, method_names)
+
+    @classmethod
+    def Disable(cls) -> None:
+        """Disable instrumentation by restoring the original operations. Recorded data is kept."""
+        with cls.m_lock:
+            for target_cls, method_name, attr in reversed(cls.m_patches):
+                setattr(target_cls, method_name, attr)
+            cls.m_patches = []
+
+    @classmethod
+    def IsEnabled(cls) -> bool:
+        """
+        Get if instrumentation is enabled.
+
+        Returns:
+            bool: True if enabled, false otherwise
+        """
+        return len(cls.m_patches) > 0
+
+    @classmethod
+    def Reset(cls) -> None:
+        """Reset recorded data."""
+        with cls.m_lock:
+            cls.m_stats = {}
+
+    @classmethod
+    def Record(cls,
+               op_name: str,
+               elapsed_time: float) -> None:
+        """
+        Record a call of an operation.
+
+        Args:
+            op_name (str)       : Operation name
+            elapsed_time (float): Elapsed time in seconds
+        """
+        with cls.m_lock:
+            stats = cls.m_stats.get(op_name)
+            if stats is None:
+                cls.m_stats[op_name] = [1, elapsed_time]
+            else:
+                stats[0] += 1
+                stats[1] += elapsed_time
+
+    @classmethod
+    def Snapshot(cls) -> Dict[str, Dict[str, Any]]:
+        """
+        Get a snapshot of the recorded data.
+
+        Returns:
+            dict: Operation names (keys) and their number of calls ("count") and total time in seconds ("time")
+        """
+        with cls.m_lock:
+            return {
+                op_name: {"count": stats[0], "time": stats[1]}
+                for op_name, stats in sorted(cls.m_stats.items())
+            }
+
+    @classmethod
+    def SnapshotJson(cls,
+                     indent: Optional[int] = None) -> str:
+        """
+        Get a snapshot of the recorded data as a JSON string.
+
+        Args:
+            indent (int, optional): JSON indentation (default: None, i.e. compact)
+
+        Returns:
+            str: JSON string
+        """
+        return json.dumps(cls.Snapshot(), indent=indent)
+
+    @staticmethod
+    def Session(reset: bool = True) -> InstrumentationSession:
+        """
+        Get a context manager that enables instrumentation in its scope.
+
+        Args:
+            reset (bool, optional): True to reset recorded data when entering the scope (default: True)
+
+        Returns:
+            InstrumentationSession object: InstrumentationSession object
+        """
+        return InstrumentationSession(reset)
+
+    @classmethod
+    def __PatchClass(cls,
+                     target_cls: Type,
+                     category: str,
+                     method_names: Tuple[str, ...]) -> None:
+        """
+        Wrap the methods defined by a class (inherited methods are wrapped in the class that defines them).
+
+        Args:
+            target_cls (class)       : Class
+            category (str)           : Operation category
+            method_names (tuple[str]): Method names
+        """
+        for method_name in method_names:
+            attr = target_cls.__dict__.get(method_name)
+            if attr is None or getattr(attr, "__isabstractmethod__", False):
+                continue
+            cls.m_patches.append((target_cls, method_name, attr))
+            setattr(target_cls,
+                    method_name,
+                    _InstrumentationUtils.WrapAttribute(attr, f"{category}.{target_cls.__name__}.{method_name}"))
+
+
+class InstrumentationSession:
+    """
+    Instrumentation session class.
+    Context manager that enables instrumentation when entering its scope and restores the previous state when
+    exiting it. The recorded data is saved when exiting, so it can be got after the scope.
+    """
+
+    m_reset: bool
+    m_is_active: bool
+    m_was_enabled: bool
+    m_snapshot: Dict[str, Dict[str, Any]]
+
+    def __init__(self,
+                 reset: bool = True) -> None:
+        """
+        Construct class.
+
+        Args:
+            reset (bool, optional): True to reset recorded data when entering the scope (default: True)
+        """
+        self.m_reset = reset
+        self.m_is_active = False
+        self.m_was_enabled = False
+        self.m_snapshot = {}
+
+    def __enter__(self) -> InstrumentationSession:
+        """
+        Enter the scope.
+
+        Returns:
+            InstrumentationSession object: Current object
+        """
+        self.m_was_enabled = Instrumentation.IsEnabled()
+        if self.m_reset:
+            Instrumentation.Reset()
+        Instrumentation.Enable()
+        self.m_is_active = True
+        return self
+
+    def __exit__(self,
+                 *args: Any) -> None:
+        """
+        Exit the scope.
+
+        Args:
+            *args: Exception information (not used)
+        """
+        self.m_snapshot = Instrumentation.Snapshot()
+        self.m_is_active = False
+        if not self.m_was_enabled:
+            Instrumentation.Disable()
+
+    def Snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get a snapshot of the recorded data (current data inside the scope, data at the exit after it).
+
+        Returns:
+            dict: Operation names (keys) and their number of calls ("count") and total time in seconds ("time")
+        """
+        return Instrumentation.Snapshot() if self.m_is_active else self.m_snapshot
+
+    def SnapshotJson(self,
+                     indent: Optional[int] = None) -> str:
+        """
+        Get a snapshot of the recorded data as a JSON string.
+
+        Args:
+            indent (int, optional): JSON indentation (default: None, i.e. compact)
+
+        Returns:
+            str: JSON string
+        """
+        return json.dumps(self.Snapshot(), indent=indent)
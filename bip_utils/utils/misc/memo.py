@@ -0,0 +1,111 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module with some utility functions for memoization."""
+
+# Imports
+import functools
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+
+# Type for memoized results
+ResultType = TypeVar("ResultType")
+
+
+class MemoUtilsConst:
+    """Class container for memoization utility constants."""
+
+    # Prefix of the attributes where results are stored
+    ATTR_PREFIX: str = "_memo_"
+    # Default maximum number of results stored for each object by methods with arguments
+    ARGS_DEF_MAX_SIZE: int = 128
+
+
+class MemoUtils:
+    """Class container for memoization utility functions."""
+
+    @staticmethod
+    def CachedMethod(fct: Callable[[Any], ResultType]) -> Callable[[Any], ResultType]:
+        """
+        Decorator for caching the result of a method without arguments in the object itself.
+        Contrary to functools.lru_cache, there is no cache shared by all the objects (and all the threads), so objects
+        are not kept alive by the cache, results are never evicted and no lock is needed.
+        If the method is called by more threads at the same time, it may be computed more than once, but all of them
+        get the same result object. Exceptions are not cached.
+
+        Args:
+            fct (function): Method
+
+        Returns:
+            function: Decorated method
+        """
+        attr_name = MemoUtilsConst.ATTR_PREFIX + fct.__name__
+
+        @functools.wraps(fct)
+        def wrapper(self: Any) -> ResultType:
+            try:
+                return self.__dict__[attr_name]
+            except KeyError:
+                # setdefault is atomic, so the first stored result wins
+                return self.__dict__.setdefault(attr_name, fct(self))
+
+        return wrapper
+
+    @staticmethod
+    def CachedArgsMethod(max_size: int = MemoUtilsConst.ARGS_DEF_MAX_SIZE
+                         ) -> Callable[[Callable[..., ResultType]], Callable[..., ResultType]]:
+        """
+        Decorator for caching the results of a method with arguments in the object itself, indexed by the arguments.
+        Like CachedMethod, there is no cache shared by all the objects and no lock is needed. At most max_size
+        results are stored for each object, further results are computed but not stored, so deriving many keys from
+        the same object does not make the object grow indefinitely. Arguments shall be hashable.
+
+        Args:
+            max_size (int, optional): Maximum number of results stored for each object
+
+        Returns:
+            function: Decorator
+        """
+
+        def decorator(fct: Callable[..., ResultType]) -> Callable[..., ResultType]:
+            # Qualified name, so that private methods of a base class and of a subclass do not share the cache
+            attr_name = MemoUtilsConst.ATTR_PREFIX + fct.__qualname__
+
+            @functools.wraps(fct)
+            def wrapper(self: Any,
+                        *args: Any,
+                        **kwargs: Any) -> ResultType:
+                cache: Dict[Tuple[Any, ...], ResultType] = self.__dict__.get(attr_name)
+                if cache is None:
+                    cache = self.__dict__.setdefault(attr_name, {})
+
+                key = (args, tuple(sorted(kwargs.items())))
+                try:
+                    return cache[key]
+                except KeyError:
+                    res = fct(self, *args, **kwargs)
+                    if len(cache) >= max_size:
+                        return res
+                    # setdefault is atomic, so the first stored result wins
+                    return cache.setdefault(key, res)
+
+            return wrapper
+
+        return decorator
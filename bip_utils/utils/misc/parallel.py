@@ -0,0 +1,144 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module with some utility functions for parallel processing."""
+
+# Imports
+import itertools
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+
+# Types for chunks and results
+ChunkType = TypeVar("ChunkType")
+ResultType = TypeVar("ResultType")
+
+
+class ParallelUtilsConst:
+    """Class container for parallel utility constants."""
+
+    # Number of chunks queued for each worker
+    QUEUED_CHUNKS_PER_WORKER: int = 2
+
+
+class ParallelUtils:
+    """Class container for parallel processing utility functions."""
+
+    @staticmethod
+    def WorkersNum(workers: Optional[int]) -> int:
+        """
+        Get the number of workers.
+
+        Args:
+            workers (int): Number of workers, None for CPU count
+
+        Returns:
+            int: Number of workers
+
+        Raises:
+            ValueError: If the number of workers is not valid
+        """
+        workers = workers if workers is not None else (os.cpu_count() or 1)
+        if workers <= 0:
+            raise ValueError(f"Invalid number of workers ({workers})")
+        return workers
+
+    @staticmethod
+    def Chunks(elems: Iterable[Any],
+               chunk_size: int) -> Iterator[List[Any]]:
+        """
+        Split elements in chunks (the last one can be shorter).
+
+        Args:
+            elems (Iterable): Elements
+            chunk_size (int): Chunk size
+
+        Returns:
+            Iterator[list]: Chunks iterator
+
+        Raises:
+            ValueError: If the chunk size is not valid
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"Invalid chunk size ({chunk_size})")
+        return ParallelUtils.__Chunks(iter(elems), chunk_size)
+
+    @staticmethod
+    def __Chunks(elems_itr: Iterator[Any],
+                 chunk_size: int) -> Iterator[List[Any]]:
+        """
+        Split elements in chunks (the last one can be shorter).
+
+        Args:
+            elems_itr (Iterator): Elements iterator
+            chunk_size (int)    : Chunk size
+
+        Returns:
+            Iterator[list]: Chunks iterator
+        """
+        while True:
+            chunk = list(itertools.islice(elems_itr, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    @staticmethod
+    def MapChunks(fct: Callable[..., ResultType],
+                  chunks: Iterable[ChunkType],
+                  workers: int,
+                  *args: Any) -> Iterator[Tuple[ChunkType, ResultType]]:
+        """
+        Call the function on each chunk, i.e. fct(*args, chunk), by using a pool of worker processes.
+        Results are returned in the same order of the chunks and only a bounded number of chunks is submitted
+        at once, so that memory usage does not depend on the number of chunks.
+        If the number of workers is 1, the function is called in the current process.
+        The function and the arguments shall be picklable.
+
+        Args:
+            fct (function)   : Function
+            chunks (Iterable): Chunks
+            workers (int)    : Number of worker processes
+            *args            : Arguments passed to the function before the chunk
+
+        Returns:
+            Iterator[tuple]: Chunk (index 0) and its result (index 1)
+        """
+        if workers == 1:
+            for chunk in chunks:
+                yield chunk, fct(*args, chunk)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending: Deque[Tuple[ChunkType, Future]] = deque()
+            try:
+                for chunk in chunks:
+                    pending.append((chunk, executor.submit(fct, *args, chunk)))
+                    if len(pending) >= workers * ParallelUtilsConst.QUEUED_CHUNKS_PER_WORKER:
+                        done_chunk, fut = pending.popleft()
+                        yield done_chunk, fut.result()
+                while pending:
+                    done_chunk, fut = pending.popleft()
+                    yield done_chunk, fut.result()
+            finally:
+                # Avoid computing chunks that will not be consumed (e.g. if the caller stops iterating)
+                for _, fut in pending:
+                    fut.cancel()
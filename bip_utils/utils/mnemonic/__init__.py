@@ -3,6 +3,9 @@ from bip_utils.utils.mnemonic.mnemonic import Mnemonic, MnemonicLanguages
 from bip_utils.utils.mnemonic.mnemonic_decoder_base import MnemonicDecoderBase
 from bip_utils.utils.mnemonic.mnemonic_encoder_base import MnemonicEncoderBase
 from bip_utils.utils.mnemonic.mnemonic_ex import MnemonicChecksumError
+from bip_utils.utils.mnemonic.mnemonic_recovery_base import (
+    MnemonicRecoveryBase, MnemonicRecoveryConst, MnemonicRecoveryResult, MnemonicRecoveryUtils
+)
 from bip_utils.utils.mnemonic.mnemonic_utils import (
     MnemonicUtils, MnemonicWordsList, MnemonicWordsListFileReader, MnemonicWordsListFinderBase,
     MnemonicWordsListGetterBase
@@ -23,8 +23,16 @@
 # Imports
 import os
 import secrets
+from typing import Iterator
 
-from bip_utils.utils.misc import IntegerUtils
+from bip_utils.utils.misc import BytesUtils, IntegerUtils
+
+
+class EntropyGeneratorConst:
+    """Class container for entropy generator constants."""
+
+    # Byte length of the random pool used when generating multiple entropies
+    POOL_BYTE_LEN: int = 4096
 
 
 class EntropyGenerator:
@@ -55,3 +63,49 @@ class EntropyGenerator:
         return (os.urandom(self.m_bit_len // 8)
                 if self.m_bit_len % 8 == 0
                 else IntegerUtils.ToBytes(secrets.randbits(self.m_bit_len)))
+
+    def GenerateMany(self,
+                     count: int) -> Iterator[bytes]:
+        """
+        Generate multiple random entropy bytes.
+        Random bytes are read in large chunks from the OS random generator into a pool, which is then split
+        in the single entropies.
+
+        Args:
+            count (int): Number of entropies to generate
+
+        Returns:
+            Iterator[bytes]: Iterator of generated entropy bytes
+
+        Raises:
+            ValueError: If the count is not valid
+        """
+        if count < 0:
+            raise ValueError(f"Invalid entropies count ({count})")
+        return self.__GenerateMany(count)
+
+    def __GenerateMany(self,
+                       count: int) -> Iterator[bytes]:
+        """
+        Generate multiple random entropy bytes.
+
+        Args:
+            count (int): Number of entropies to generate
+
+        Returns:
+            Iterator[bytes]: Iterator of generated entropy bytes
+        """
+        byte_len = (self.m_bit_len + 7) // 8
+        exceeding_bit_len = byte_len * 8 - self.m_bit_len
+        pool_entropies_num = max(1, EntropyGeneratorConst.POOL_BYTE_LEN // byte_len)
+
+        while count > 0:
+            entropies_num = min(count, pool_entropies_num)
+            pool = os.urandom(entropies_num * byte_len)
+            for i in range(entropies_num):
+                entropy_bytes = pool[i * byte_len:(i + 1) * byte_len]
+                # Same of Generate: discard the exceeding bits if the bit length is not a multiple of 8
+                yield (entropy_bytes
+                       if exceeding_bit_len == 0
+                       else IntegerUtils.ToBytes(BytesUtils.ToInteger(entropy_bytes) >> exceeding_bit_len))
+            count -= entropies_num
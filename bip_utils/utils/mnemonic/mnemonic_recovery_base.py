@@ -0,0 +1,320 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Module for mnemonic recovery base class."""
+
+# Imports
+import itertools
+from abc import ABC, abstractmethod
+from typing import Callable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Type
+
+from bip_utils.utils.misc import ParallelUtils
+from bip_utils.utils.mnemonic.mnemonic import Mnemonic, MnemonicLanguages
+from bip_utils.utils.mnemonic.mnemonic_utils import MnemonicWordsList, MnemonicWordsListGetterBase
+
+
+class MnemonicRecoveryConst:
+    """Class container for mnemonic recovery constants."""
+
+    # Placeholder for unknown words
+    UNKNOWN_WORD: str = "?"
+    # Default maximum edit distance for replacing misspelled words
+    DEF_MAX_EDIT_DIST: int = 2
+    # Default number of candidates sent to a worker at once
+    DEF_CHUNK_SIZE: int = 64
+
+
+class MnemonicRecoveryResult(NamedTuple):
+    """Mnemonic recovery result class."""
+
+    mnemonic: Mnemonic
+    seed_bytes: bytes
+    tested_num: int
+
+
+class MnemonicRecoveryUtils:
+    """Class container for mnemonic recovery utility functions."""
+
+    @staticmethod
+    def EditDistance(word_1: str,
+                     word_2: str) -> int:
+        """
+        Compute the edit (i.e. Levenshtein) distance between two words.
+
+        Args:
+            word_1 (str): Word 1
+            word_2 (str): Word 2
+
+        Returns:
+            int: Edit distance
+        """
+        prev_row = list(range(len(word_2) + 1))
+        for i, c_1 in enumerate(word_1, 1):
+            curr_row = [i]
+            for j, c_2 in enumerate(word_2, 1):
+                curr_row.append(min(prev_row[j] + 1,
+                                    curr_row[j - 1] + 1,
+                                    prev_row[j - 1] + (c_1 != c_2)))
+            prev_row = curr_row
+        return prev_row[-1]
+
+    @staticmethod
+    def SimilarWordsIndexes(word: str,
+                            words_list: MnemonicWordsList,
+                            max_edit_dist: int) -> List[int]:
+        """
+        Get the indexes of the words list entries within the specified edit distance from a word.
+
+        Args:
+            word (str)                           : Word
+            words_list (MnemonicWordsList object): Words list
+            max_edit_dist (int)                  : Maximum edit distance
+
+        Returns:
+            list[int]: Word indexes, sorted by edit distance
+        """
+        dists = []
+        for idx in range(words_list.Length()):
+            list_word = words_list.GetWordAtIdx(idx)
+            # Words whose length differs too much cannot be within the distance
+            if abs(len(list_word) - len(word)) > max_edit_dist:
+                continue
+            dist = MnemonicRecoveryUtils.EditDistance(word, list_word)
+            if dist <= max_edit_dist:
+                dists.append((dist, idx))
+        return [idx for _, idx in sorted(dists)]
+
+
+class _MnemonicRecoveryWorker:
+    """Class container for mnemonic recovery worker functions."""
+
+    @staticmethod
+    def TestCandidates(seed_fct: Callable[[str], bytes],
+                       check_fct: Callable[[bytes], bool],
+                       mnemonics: List[str]) -> Optional[Tuple[int, bytes]]:
+        """
+        Test a chunk of candidates.
+
+        Args:
+            seed_fct (function)  : Function for generating the seed from a mnemonic
+            check_fct (function) : Function for checking the seed
+            mnemonics (list[str]): Candidate mnemonics
+
+        Returns:
+            tuple[int, bytes]: Index of the correct candidate (index 0) and seed bytes (index 1),
+                               None if no candidate is correct
+        """
+        for i, mnemonic in enumerate(mnemonics):
+            seed_bytes = seed_fct(mnemonic)
+            if check_fct(seed_bytes):
+                return i, seed_bytes
+        return None
+
+
+class MnemonicRecoveryBase(ABC):
+    """
+    Mnemonic recovery base class.
+    It recovers a mnemonic with unknown or misspelled words, by enumerating the candidate words for each
+    position, filtering the candidate mnemonics by checksum and testing the seed of the remaining ones.
+    """
+
+    m_words_list: MnemonicWordsList
+    m_words_idx: List[List[int]]
+
+    def __init__(self,
+                 mnemonic: Sequence[str],
+                 lang: MnemonicLanguages,
+                 words_list_getter_cls: Type[MnemonicWordsListGetterBase],
+                 max_edit_dist: int) -> None:
+        """
+        Construct class.
+
+        Args:
+            mnemonic (list[str])                               : Normalized mnemonic words
+            lang (MnemonicLanguages)                           : Language
+            words_list_getter_cls (MnemonicWordsListGetterBase): Words list getter class type
+            max_edit_dist (int)                                : Maximum edit distance for replacing misspelled words
+
+        Raises:
+            TypeError: If the language is not of the correct enum
+            ValueError: If the mnemonic or maximum edit distance is not valid
+        """
+        if max_edit_dist < 0:
+            raise ValueError(f"Invalid maximum edit distance ({max_edit_dist})")
+
+        self.m_words_list = words_list_getter_cls.Instance().GetByLanguage(lang)
+        self.m_words_idx = [self.__WordCandidatesIndexes(word, max_edit_dist) for word in mnemonic]
+
+    def CandidatesNum(self) -> int:
+        """
+        Get the number of candidate mnemonics before checksum filtering.
+
+        Returns:
+            int: Number of candidate mnemonics
+        """
+        candidates_num = 1
+        for words_idx in self.m_words_idx:
+            candidates_num *= len(words_idx)
+        return candidates_num
+
+    def GenerateCandidates(self) -> Iterator[Mnemonic]:
+        """
+        Generate the candidate mnemonics with a valid checksum.
+
+        Returns:
+            Iterator[Mnemonic]: Iterator of candidate mnemonics
+        """
+        for words_idx in self._GenerateValidIndexes():
+            yield self._MnemonicFromList(self.__IndexesToWords(words_idx))
+
+    def Recover(self,
+                check_fct: Callable[[bytes], bool],
+                workers: Optional[int] = None,
+                chunk_size: int = MnemonicRecoveryConst.DEF_CHUNK_SIZE,
+                progress_fct: Optional[Callable[[int], None]] = None) -> Optional[MnemonicRecoveryResult]:
+        """
+        Recover the mnemonic by testing the seed of each candidate with a valid checksum.
+        If more worker processes are used, the check function shall be picklable (e.g. a module-level function
+        or a functools.partial of it).
+
+        Args:
+            check_fct (function)             : Function called with the seed bytes of a candidate, it shall
+                                               return true if the seed is the target one (e.g. if it derives
+                                               a known address or extended public key)
+            workers (int, optional)          : Number of worker processes (default: CPU count),
+                                               1 for testing candidates in the current process
+            chunk_size (int, optional)       : Number of candidates sent to a worker at once
+            progress_fct (function, optional): Function called with the number of tested candidates after each chunk
+
+        Returns:
+            MnemonicRecoveryResult object: Recovery result, None if no candidate is correct
+
+        Raises:
+            ValueError: If the parameters are not valid
+        """
+        workers = ParallelUtils.WorkersNum(workers)
+        chunks = ParallelUtils.Chunks(
+            (" ".join(self.__IndexesToWords(words_idx)) for words_idx in self._GenerateValidIndexes()),
+            chunk_size
+        )
+
+        tested_num = 0
+        for chunk, res in ParallelUtils.MapChunks(_MnemonicRecoveryWorker.TestCandidates,
+                                                  chunks,
+                                                  workers,
+                                                  self._SeedFunction(),
+                                                  check_fct):
+            if res is not None:
+                idx, seed_bytes = res
+                return MnemonicRecoveryResult(self._MnemonicFromList(chunk[idx].split(" ")),
+                                              seed_bytes,
+                                              tested_num + idx + 1)
+
+            tested_num += len(chunk)
+            if progress_fct is not None:
+                progress_fct(tested_num)
+
+        return None
+
+    def _ProductIndexes(self,
+                        positions: Sequence[int]) -> Iterator[Tuple[Tuple[int, int], ...]]:
+        """
+        Generate all the combinations of candidate word indexes for the specified positions.
+
+        Args:
+            positions (list[int]): Word positions
+
+        Returns:
+            Iterator[tuple]: Iterator of tuples of (position, word index)
+        """
+        return itertools.product(*[[(pos, idx) for idx in self.m_words_idx[pos]] for pos in positions])
+
+    def __WordCandidatesIndexes(self,
+                                word: str,
+                                max_edit_dist: int) -> List[int]:
+        """
+        Get the candidate word indexes for a mnemonic word.
+
+        Args:
+            word (str)         : Mnemonic word
+            max_edit_dist (int): Maximum edit distance for replacing misspelled words
+
+        Returns:
+            list[int]: Candidate word indexes
+
+        Raises:
+            ValueError: If no candidate can be found for the word
+        """
+        if word == MnemonicRecoveryConst.UNKNOWN_WORD:
+            return list(range(self.m_words_list.Length()))
+
+        try:
+            return [self.m_words_list.GetWordIdx(word)]
+        except ValueError:
+            pass
+
+        words_idx = MnemonicRecoveryUtils.SimilarWordsIndexes(word, self.m_words_list, max_edit_dist)
+        if len(words_idx) == 0:
+            raise ValueError(f"No similar word found for misspelled word \"{word}\"")
+        return words_idx
+
+    def __IndexesToWords(self,
+                         words_idx: List[int]) -> List[str]:
+        """
+        Get a list of words from a list of indexes.
+
+        Args:
+            words_idx (list[int]): List of indexes
+
+        Returns:
+            list[str]: List of words
+        """
+        return [self.m_words_list.GetWordAtIdx(idx) for idx in words_idx]
+
+    @abstractmethod
+    def _GenerateValidIndexes(self) -> Iterator[List[int]]:
+        """
+        Generate the word indexes of the candidate mnemonics with a valid checksum.
+
+        Returns:
+            Iterator[list[int]]: Iterator of word indexes
+        """
+
+    @abstractmethod
+    def _SeedFunction(self) -> Callable[[str], bytes]:
+        """
+        Get the (picklable) function for generating the seed from a candidate mnemonic string.
+
+        Returns:
+            function: Seed function
+        """
+
+    @staticmethod
+    @abstractmethod
+    def _MnemonicFromList(mnemonic_list: List[str]) -> Mnemonic:
+        """
+        Get a mnemonic object from a list of words.
+
+        Args:
+            mnemonic_list (list[str]): Mnemonic words
+
+        Returns:
+            Mnemonic object: Mnemonic object
+        """
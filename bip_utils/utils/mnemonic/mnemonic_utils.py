@@ -23,8 +23,9 @@
 # Imports
 from __future__ import annotations
 
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple, Type
+from typing import Dict, List, Tuple, Type
 
 from bip_utils.utils.misc import BytesUtils, IntegerUtils
 from bip_utils.utils.mnemonic.mnemonic import Mnemonic, MnemonicLanguages
@@ -188,15 +189,22 @@ class MnemonicWordsListFileReader:
 
 
 class MnemonicWordsListGetterBase(ABC):
-    """Mnemonic words list getter base class."""
+    """
+    Mnemonic words list getter base class.
+    It is safe to use it from multiple threads: the global instance is created only once for each class and each
+    words list is loaded from file only once.
+    """
 
+    m_lock: threading.Lock
     m_words_lists: Dict[MnemonicLanguages, MnemonicWordsList]
 
-    # Global instance
-    __instance: Optional[MnemonicWordsListGetterBase] = None
+    # Global instances (one for each child class)
+    __instances: Dict[Type[MnemonicWordsListGetterBase], MnemonicWordsListGetterBase] = {}
+    __instances_lock: threading.Lock = threading.Lock()
 
     def __init__(self):
         """Construct class."""
+        self.m_lock = threading.Lock()
         self.m_words_lists = {}
 
     @abstractmethod
@@ -237,13 +245,15 @@ class MnemonicWordsListGetterBase(ABC):
         """
 
         # Only load words list for a specific language the first time it is requested
+        # (the lock is taken only when loading, so that getting an already loaded words list never waits)
         try:
             return self.m_words_lists[lang]
         except KeyError:
-            self.m_words_lists[lang] = MnemonicWordsListFileReader.LoadFile(file_name,
-                                                                            words_num)
-
-            return self.m_words_lists[lang]
+            with self.m_lock:
+                if lang not in self.m_words_lists:
+                    self.m_words_lists[lang] = MnemonicWordsListFileReader.LoadFile(file_name,
+                                                                                    words_num)
+                return self.m_words_lists[lang]
 
     @classmethod
     def Instance(cls) -> MnemonicWordsListGetterBase:
@@ -253,9 +263,13 @@ class MnemonicWordsListGetterBase(ABC):
         Returns:
             MnemonicWordsListGetterBase object: MnemonicWordsListGetterBase object
         """
-        if cls.__instance is None:
-            cls.__instance = cls()
-        return cls.__instance
+        try:
+            return MnemonicWordsListGetterBase.__instances[cls]
+        except KeyError:
+            with MnemonicWordsListGetterBase.__instances_lock:
+                if cls not in MnemonicWordsListGetterBase.__instances:
+                    MnemonicWordsListGetterBase.__instances[cls] = cls()
+                return MnemonicWordsListGetterBase.__instances[cls]
 
 
 class MnemonicWordsListFinderBase(ABC):
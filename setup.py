@@ -125,6 +125,15 @@ setuptools.setup(
         ":python_version == '3.7'": [
             "typing_extensions",
         ],
+        "cryptography": [
+            "cryptography>=2.5",
+        ],
+        "numpy": [
+            "numpy",
+        ],
+        "arrow": [
+            "pyarrow",
+        ],
         "develop": load_requirements("requirements-dev.txt"),
     },
     packages=setuptools.find_packages(exclude=["*tests*"]),
@@ -22,9 +22,9 @@
 import binascii
 
 from bip_utils import (
-    AdaShelleyAddr, AdaShelleyAddrDecoder, AdaShelleyAddrEncoder, AdaShelleyAddrNetworkTags, AdaShelleyRewardAddr,
-    AdaShelleyRewardAddrDecoder, AdaShelleyRewardAddrEncoder, AdaShelleyStakingAddr, AdaShelleyStakingAddrDecoder,
-    AdaShelleyStakingAddrEncoder
+    AdaShelleyAddr, AdaShelleyAddrDecoder, AdaShelleyAddrEncoder, AdaShelleyAddrNetworkTags,
+    AdaShelleyEnterpriseAddrDecoder, AdaShelleyEnterpriseAddrEncoder, AdaShelleyRewardAddr, AdaShelleyRewardAddrDecoder,
+    AdaShelleyRewardAddrEncoder, AdaShelleyStakingAddr, AdaShelleyStakingAddrDecoder, AdaShelleyStakingAddrEncoder
 )
 from tests.addr.test_addr_base import AddrBaseTests
 from tests.addr.test_addr_const import TEST_ED25519_ADDR_INVALID_KEY_TYPES
@@ -121,6 +121,40 @@ TEST_VECT_REWARD_ADDRESS = [
     },
 ]
 
+# Some random public keys for enterprise addresses (the first ones are from CIP-0019)
+TEST_VECT_ENTERPRISE_ADDRESS = [
+    {
+        "pub_key": b"73fea80d424276ad0978d4fe5310e8bc2d485f5f6bb3bf87612989f112ad5a7d",
+        "address_dec": b"9493315cd92eb5d8c4304e67b7e16ae36d61d34502694657811a2c8e",
+        "address_params": {},
+        "address": "addr1vx2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzers66hrl8",
+    },
+    {
+        "pub_key": b"73fea80d424276ad0978d4fe5310e8bc2d485f5f6bb3bf87612989f112ad5a7d",
+        "address_dec": b"9493315cd92eb5d8c4304e67b7e16ae36d61d34502694657811a2c8e",
+        "address_params": {
+            "net_tag": AdaShelleyAddrNetworkTags.TESTNET,
+        },
+        "address": "addr_test1vz2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzerspjrlsz",
+    },
+    {
+        "pub_key": b"01f9256746c79ad5ba163ae677e3e3477471f0c3f8e1b5012c7a09f862e3972d",
+        "address_dec": b"0ea494eb8231e7070bd0d697af52425e043e0a9c07b0125e01dcd24c",
+        "address_params": {
+            "net_tag": AdaShelleyAddrNetworkTags.MAINNET,
+        },
+        "address": "addr1vy82f98tsgc7wpct6rtf0t6jgf0qg0s2nsrmqyj7q8wdynqr9r0n5",
+    },
+    {
+        "pub_key": b"3bac00235a132984c939cdbb1e65bdd8421a59b5e98ebb46dc35bc7dd58f5d1e",
+        "address_dec": b"785d2ac12adb2afdf2c046fed50c7c1bb474b74b0307b740551a1b61",
+        "address_params": {
+            "net_tag": AdaShelleyAddrNetworkTags.TESTNET,
+        },
+        "address": "addr_test1vpu962kp9tdj4l0jcpr0a4gv0sdmga9hfvps0d6q25dpkcg2mgsw3",
+    },
+]
+
 # Tests for decoding with invalid strings for addresses
 TEST_VECT_DEC_INVALID_ADDRESS = [
     # Invalid HRP
@@ -140,6 +174,23 @@ TEST_VECT_DEC_INVALID_ADDRESS = [
     "addr1qyxk0wdpkpjfuqrzj72j5k3qd7yn0wvzw33jxdjxuehf4gu5g30cfhwdxlme2j43uwuc7mhkdq06xyh0cwtvlj3cvfh367gwpduu2",
 ]
 
+# Tests for decoding with invalid strings for enterprise addresses
+TEST_VECT_DEC_INVALID_ENTERPRISE_ADDRESS = [
+    # Invalid HRP
+    "adr1vy82f98tsgc7wpct6rtf0t6jgf0qg0s2nsrmqyj7q8wdynquya3t3",
+    # Invalid checksum
+    "addr1vy82f98tsgc7wpct6rtf0t6jgf0qg0s2nsrmqyj7q8wdynqr9r0n6",
+    # Invalid header type
+    "addr1wy82f98tsgc7wpct6rtf0t6jgf0qg0s2nsrmqyj7q8wdynq2dl0y5",
+    # Invalid network tag
+    "addr1vq82f98tsgc7wpct6rtf0t6jgf0qg0s2nsrmqyj7q8wdynqrhn7nn",
+    # Base address
+    "addr1qy82f98tsgc7wpct6rtf0t6jgf0qg0s2nsrmqyj7q8wdynrzaps0ja8tu5qaglxl5pgcf70try8realspu89340mm3hq6jjmds",
+    # Invalid lengths
+    "addr1vy82f98tsgc7wpct6rtf0t6jgf0qg0s2nsrmqyj7q8wdysruc8l",
+    "addr1vy82f98tsgc7wpct6rtf0t6jgf0qg0s2nsrmqyj7q8wdynqqts69m7",
+]
+
 # Tests for decoding with invalid strings for reward addresses
 TEST_VECT_DEC_INVALID_REWARD_ADDRESS = [
     # Invalid HRP
@@ -168,11 +219,13 @@ class AdaShelleyAddrTests(AddrBaseTests):
     def test_encode_key(self):
         self._test_encode_key(AdaShelleyAddrEncoder, Ed25519KholawPublicKey, TEST_VECT_ADDRESS)
         self._test_encode_key(AdaShelleyStakingAddrEncoder, Ed25519KholawPublicKey, TEST_VECT_REWARD_ADDRESS)
+        self._test_encode_key(AdaShelleyEnterpriseAddrEncoder, Ed25519KholawPublicKey, TEST_VECT_ENTERPRISE_ADDRESS)
 
     # Test decode address
     def test_decode_addr(self):
         self._test_decode_addr(AdaShelleyAddrDecoder, TEST_VECT_ADDRESS)
         self._test_decode_addr(AdaShelleyStakingAddrDecoder, TEST_VECT_REWARD_ADDRESS)
+        self._test_decode_addr(AdaShelleyEnterpriseAddrDecoder, TEST_VECT_ENTERPRISE_ADDRESS)
 
     # Test invalid decoding
     def test_invalid_dec(self):
@@ -188,6 +241,11 @@ class AdaShelleyAddrTests(AddrBaseTests):
             {},
             TEST_VECT_DEC_INVALID_REWARD_ADDRESS
         )
+        self._test_invalid_dec(
+            AdaShelleyEnterpriseAddrDecoder,
+            {},
+            TEST_VECT_DEC_INVALID_ENTERPRISE_ADDRESS
+        )
 
     # Test invalid keys
     def test_invalid_keys(self):
@@ -205,6 +263,12 @@ class AdaShelleyAddrTests(AddrBaseTests):
             TEST_ED25519_ADDR_INVALID_KEY_TYPES,
             TEST_VECT_ED25519_PUB_KEY_INVALID
         )
+        self._test_invalid_keys(
+            AdaShelleyEnterpriseAddrEncoder,
+            {},
+            TEST_ED25519_ADDR_INVALID_KEY_TYPES,
+            TEST_VECT_ED25519_PUB_KEY_INVALID
+        )
 
     # Test invalid parameters
     def test_invalid_params(self):
@@ -239,6 +303,21 @@ class AdaShelleyAddrTests(AddrBaseTests):
             TypeError
         )
 
+        self._test_invalid_params_dec(
+            AdaShelleyEnterpriseAddrDecoder,
+            {
+                "net_tag": 0,
+            },
+            TypeError
+        )
+        self._test_invalid_params_enc(
+            AdaShelleyEnterpriseAddrEncoder,
+            {
+                "net_tag": 0,
+            },
+            TypeError
+        )
+
     # Test reward address class
     def test_staking_addr_cls(self):
         self.assertTrue(AdaShelleyRewardAddrDecoder is AdaShelleyStakingAddrDecoder)
@@ -19,6 +19,8 @@
 # THE SOFTWARE.
 
 # Imports
+import binascii
+
 from bip_utils import AlgoAddr, AlgoAddrDecoder, AlgoAddrEncoder
 from tests.addr.test_addr_base import AddrBaseTests
 from tests.addr.test_addr_const import TEST_ED25519_ADDR_INVALID_KEY_TYPES
@@ -89,6 +91,25 @@ class AlgoAddrTests(AddrBaseTests):
     def test_invalid_dec(self):
         self._test_invalid_dec(AlgoAddrDecoder, {}, TEST_VECT_DEC_INVALID)
 
+    # Test encode/decode many
+    def test_encode_decode_many(self):
+        pub_keys = [Ed25519PublicKey.FromBytes(binascii.unhexlify(test["pub_key"])) for test in TEST_VECT]
+        addrs = [test["address"] for test in TEST_VECT]
+
+        self.assertEqual(addrs, AlgoAddrEncoder.EncodeKeyMany(pub_keys))
+        self.assertEqual(addrs,
+                         AlgoAddrEncoder.EncodeKeyMany([pub_key.RawCompressed().ToBytes() for pub_key in pub_keys]))
+        self.assertEqual([binascii.unhexlify(test["address_dec"]) for test in TEST_VECT],
+                         AlgoAddrDecoder.DecodeAddrMany(addrs))
+
+        self.assertRaises(ValueError, AlgoAddrDecoder.DecodeAddrMany, addrs + TEST_VECT_DEC_INVALID)
+
+    # Test is valid many
+    def test_is_valid_many(self):
+        addrs = [test["address"] for test in TEST_VECT]
+        self.assertEqual([True] * len(addrs) + [False] * len(TEST_VECT_DEC_INVALID),
+                         AlgoAddrDecoder.IsValidMany(addrs + TEST_VECT_DEC_INVALID))
+
     # Test invalid keys
     def test_invalid_keys(self):
         self._test_invalid_keys(
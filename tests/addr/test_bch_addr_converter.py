@@ -21,7 +21,7 @@
 # Imports
 import unittest
 
-from bip_utils import BchAddrConverter
+from bip_utils import Base58ChecksumError, BchAddrConverter, BchAddrConverterResult, Bech32ChecksumError
 
 
 # Some random addresses
@@ -58,13 +58,147 @@ TEST_VECT = [
     },
 ]
 
+# Tests for legacy conversion
+TEST_VECT_LEGACY = [
+    {
+        "address": "bitcoincash:qpm2qsznhks23z7629mms6s4cwef74vcwvy22gdx6a",
+        "legacy_address": "1BpEi6DfDAUFd7GtittLSdBeYJvcoaVggu",
+        "new_hrp": "ecash",
+        "conv_address": "ecash:qpm2qsznhks23z7629mms6s4cwef74vcwva87rkuu2",
+    },
+    {
+        "address": "bitcoincash:ppm2qsznhks23z7629mms6s4cwef74vcwvn0h829pq",
+        "legacy_address": "3CWFddi6m4ndiGyKqzYvsFYagqDLPVMTzC",
+        "new_hrp": "ecash",
+        "conv_address": "ecash:ppm2qsznhks23z7629mms6s4cwef74vcwv2zrv3l8h",
+    },
+    {
+        "address": "bchtest:qpm2qsznhks23z7629mms6s4cwef74vcwvqcw003ap",
+        "legacy_address": "mrLC19Je2BuWQDkWSTriGYPyQJXKkkBmCx",
+        "new_hrp": "bchtest",
+        "conv_address": "bchtest:qpm2qsznhks23z7629mms6s4cwef74vcwvqcw003ap",
+    },
+    {
+        "address": "simpleledger:qzg7fqptr7sxtgngrskvrh5qgm28ycx4v5wcac3h4h",
+        "legacy_address": "1EJQiKXg9LhHMJuahvFB2XCsUPXKpXbNSG",
+        "new_hrp": "simpleledger",
+        "conv_address": "simpleledger:qzg7fqptr7sxtgngrskvrh5qgm28ycx4v5wcac3h4h",
+    },
+]
+
+# Tests for invalid conversions
+TEST_VECT_CONV_INVALID = [
+    # Invalid checksum
+    {
+        "address": "bitcoincash:qpm2qsznhks23z7629mms6s4cwef74vcwvy22gdx6q",
+        "exception": Bech32ChecksumError,
+    },
+    {
+        "address": "1BpEi6DfDAUFd7GtittLSdBeYJvcoaVggv",
+        "exception": Base58ChecksumError,
+    },
+    # Invalid encoding
+    {
+        "address": "bitcoincash:qpm2qsznhks23z7629mms6s4cwef74vcwvy22gdx6i",
+        "exception": ValueError,
+    },
+    {
+        "address": "0BpEi6DfDAUFd7GtittLSdBeYJvcoaVggu",
+        "exception": ValueError,
+    },
+    # Invalid legacy length
+    {
+        "address": "111111111116xtCH8",
+        "exception": ValueError,
+    },
+    # Unknown legacy net version
+    {
+        "address": "LW3ByJXVHpiJsuy3u2sdieFQkXHtuk93Yi",
+        "exception": ValueError,
+    },
+]
+
 
 #
 # Tests
-#
 class BchAddrConverterTests(unittest.TestCase):
     # Run all tests in test vector
     def test_vector(self):
         for test in TEST_VECT:
             conv_addr = BchAddrConverter.Convert(test["address"], test["new_hrp"], test["new_net_ver"])
             self.assertEqual(test["conv_address"], conv_addr)
+
+    # Test legacy conversion
+    def test_legacy(self):
+        for test in TEST_VECT_LEGACY:
+            self.assertEqual(test["legacy_address"], BchAddrConverter.ToLegacy(test["address"]))
+            self.assertEqual(test["legacy_address"], BchAddrConverter.ToLegacy(test["legacy_address"]))
+            self.assertEqual(test["conv_address"], BchAddrConverter.Convert(test["legacy_address"], test["new_hrp"]))
+            self.assertEqual(test["conv_address"], BchAddrConverter.Convert(test["address"], test["new_hrp"]))
+
+        # Net version specified
+        self.assertEqual("mrLC19Je2BuWQDkWSTriGYPyQJXKkkBmCx",
+                         BchAddrConverter.ToLegacy("ergon:qpm2qsznhks23z7629mms6s4cwef74vcwv93ll4gts", b"\x6f"))
+        self.assertEqual("ergon:qpm2qsznhks23z7629mms6s4cwef74vcwv93ll4gts",
+                         BchAddrConverter.Convert("LW3ByJXVHpiJsuy3u2sdieFQkXHtuk93Yi", "ergon", b"\x00"))
+
+    # Test conversion of many addresses
+    def test_convert_many(self):
+        addrs = [test["address"] for test in TEST_VECT_LEGACY]
+        legacy_addrs = [test["legacy_address"] for test in TEST_VECT_LEGACY]
+        conv_addrs = [BchAddrConverter.Convert(addr, "ecash") for addr in addrs]
+
+        for workers in (1, 2):
+            for test in TEST_VECT:
+                results = list(BchAddrConverter.ConvertMany([test["address"]] * 3, test["new_hrp"],
+                                                            test["new_net_ver"], workers=workers, chunk_size=2))
+                self.assertEqual([BchAddrConverterResult(test["address"], test["conv_address"], None)] * 3, results)
+            # Legacy addresses and surrounding whitespaces (e.g. lines of a file) are accepted
+            self.assertEqual(
+                conv_addrs * 2,
+                [res.converted_address
+                 for res in BchAddrConverter.ConvertMany([addr + "\n" for addr in legacy_addrs] + addrs, "ecash",
+                                                         workers=workers, chunk_size=3)]
+            )
+            self.assertEqual(
+                legacy_addrs * 2,
+                [res.converted_address
+                 for res in BchAddrConverter.ToLegacyMany(addrs + [" " + addr for addr in legacy_addrs],
+                                                          workers=workers, chunk_size=3)]
+            )
+            # Blank lines (e.g. the trailing newline of a file) are skipped
+            self.assertEqual(
+                legacy_addrs,
+                [res.converted_address
+                 for res in BchAddrConverter.ToLegacyMany(["\n"] + [addr + "\n" for addr in addrs] + ["\n", ""],
+                                                          workers=workers, chunk_size=2)]
+            )
+
+    # Test invalid conversions
+    def test_invalid_conv(self):
+        for test in TEST_VECT_CONV_INVALID:
+            self.assertRaises(test["exception"], BchAddrConverter.Convert, test["address"], "ecash")
+            self.assertRaises(test["exception"], BchAddrConverter.ToLegacy, test["address"])
+
+        # Invalid addresses are reported without stopping the conversion of the other ones
+        valid_addr = TEST_VECT_LEGACY[0]["address"]
+        for conv_results in (
+            BchAddrConverter.ConvertMany([test["address"] for test in TEST_VECT_CONV_INVALID] + [valid_addr],
+                                         "ecash", chunk_size=2),
+            BchAddrConverter.ToLegacyMany([test["address"] for test in TEST_VECT_CONV_INVALID] + [valid_addr],
+                                          chunk_size=2),
+        ):
+            results = list(conv_results)
+            self.assertEqual(len(TEST_VECT_CONV_INVALID) + 1, len(results))
+            for test, res in zip(TEST_VECT_CONV_INVALID, results):
+                self.assertEqual(test["address"], res.address)
+                self.assertIsNone(res.converted_address)
+                self.assertTrue(res.error)
+            self.assertIsNotNone(results[-1].converted_address)
+            self.assertIsNone(results[-1].error)
+
+        # Unknown HRP
+        self.assertRaises(ValueError, BchAddrConverter.ToLegacy, "ergon:qre0s25cd0y33c28dwn4yqmgv0el64ydsvrv45yggc")
+        # Invalid parameters
+        self.assertRaises(ValueError, BchAddrConverter.ConvertMany, [], "ecash", workers=0)
+        self.assertRaises(ValueError, BchAddrConverter.ToLegacyMany, [], chunk_size=0)
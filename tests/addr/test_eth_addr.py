@@ -19,6 +19,8 @@
 # THE SOFTWARE.
 
 # Imports
+import binascii
+
 from bip_utils import EthAddr, EthAddrDecoder, EthAddrEncoder
 from tests.addr.test_addr_base import AddrBaseTests
 from tests.addr.test_addr_const import TEST_SECP256K1_ADDR_INVALID_KEY_TYPES
@@ -63,6 +65,18 @@ TEST_VECT = [
     },
 ]
 
+# Tests for checksum encoding (from EIP-55)
+TEST_VECT_CHKSUM_ENC = [
+    "0x52908400098527886E0F7030069857D2E4169EE7",
+    "0x8617E340B3D01FA5F11F306F4090FD50E238070D",
+    "0xde709f2102306220921060314715629080e2fb77",
+    "0x27b1fdb04752bbc536007a920d24acb045561c26",
+    "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed",
+    "0xfB6916095ca1df60bB79Ce92cE3Ea74c37c5d359",
+    "0xdbF03B407c01E7cD3CBea99509d93f8DDDC8C6FB",
+    "0xD1220A0cf47c7B9Be7A2E6BA89F429762e7b9aDb",
+]
+
 # Tests for decoding with invalid strings
 TEST_VECT_DEC_INVALID = [
     # Invalid prefix
@@ -72,6 +86,9 @@ TEST_VECT_DEC_INVALID = [
     # Invalid lengths
     "0xA2cA1D082016421489b7891091CA1CF0D2d1220",
     "0xA2cA1D082016421489b7891091CA1CF0D2d1220e1",
+    # Invalid characters
+    "0x4d46542bdA7ff01f583e8459125c91D56D2426Cg",
+    "0x4d46542bdA7ff01f583e8459125c91D56D2426C\u00e8",
 ]
 
 
@@ -91,6 +108,36 @@ class EthAddrTests(AddrBaseTests):
     def test_invalid_dec(self):
         self._test_invalid_dec(EthAddrDecoder, {}, TEST_VECT_DEC_INVALID)
 
+    # Test encode/decode many
+    def test_encode_decode_many(self):
+        for skip_chksum_enc in (False, True):
+            pub_keys = [Secp256k1PublicKey.FromBytes(binascii.unhexlify(test["pub_key"])) for test in TEST_VECT]
+            addrs = [EthAddrEncoder.EncodeKey(pub_key, skip_chksum_enc=skip_chksum_enc) for pub_key in pub_keys]
+
+            self.assertEqual(addrs, EthAddrEncoder.EncodeKeyMany(pub_keys, skip_chksum_enc=skip_chksum_enc))
+            self.assertEqual(
+                [binascii.unhexlify(test["address_dec"]) for test in TEST_VECT],
+                EthAddrDecoder.DecodeAddrMany(addrs, skip_chksum_enc=skip_chksum_enc)
+            )
+
+        self.assertRaises(ValueError, EthAddrDecoder.DecodeAddrMany, [TEST_VECT[0]["address"]] + TEST_VECT_DEC_INVALID)
+
+    # Test checksum encoding
+    def test_chksum_enc(self):
+        for addr in TEST_VECT_CHKSUM_ENC:
+            self.assertEqual(binascii.unhexlify(addr[2:]), EthAddrDecoder.DecodeAddr(addr))
+            self.assertEqual(binascii.unhexlify(addr[2:]), EthAddrDecoder.DecodeAddr(addr.lower(),
+                                                                                     skip_chksum_enc=True))
+
+        self.assertEqual([True] * len(TEST_VECT_CHKSUM_ENC), EthAddrDecoder.IsValidMany(TEST_VECT_CHKSUM_ENC))
+        self.assertEqual([False] * len(TEST_VECT_DEC_INVALID), EthAddrDecoder.IsValidMany(TEST_VECT_DEC_INVALID))
+        # Wrong case is valid only if the checksum encoding verification is skipped
+        self.assertEqual([False, True], [
+            EthAddrDecoder.IsValidMany([TEST_VECT_CHKSUM_ENC[4].swapcase().replace("0X", "0x")],
+                                       skip_chksum_enc=skip_chksum_enc)[0]
+            for skip_chksum_enc in (False, True)
+        ])
+
     # Test invalid keys
     def test_invalid_keys(self):
         self._test_invalid_keys(
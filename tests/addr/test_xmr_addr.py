@@ -22,7 +22,7 @@
 import binascii
 
 from bip_utils import (
-    CoinsConf, XmrAddr, XmrAddrDecoder, XmrAddrEncoder, XmrIntegratedAddr, XmrIntegratedAddrDecoder,
+    CoinsConf, XmrAddr, XmrAddrCodec, XmrAddrDecoder, XmrAddrEncoder, XmrIntegratedAddr, XmrIntegratedAddrDecoder,
     XmrIntegratedAddrEncoder
 )
 from bip_utils.addr.xmr_addr import XmrAddrConst
@@ -258,6 +258,70 @@ class XmrAddrTests(AddrBaseTests):
             ValueError
         )
 
+    # Test codec
+    def test_codec(self):
+        codec = XmrAddrCodec(CoinsConf.MoneroMainNet.ParamByKey("addr_net_ver"))
+        self.assertEqual(CoinsConf.MoneroMainNet.ParamByKey("addr_net_ver"), codec.NetVersion())
+
+        pub_keys = [
+            (binascii.unhexlify(test["pub_key"]), test["address_params"]["pub_vkey"]) for test in TEST_VECT
+        ]
+        addrs = [test["address"] for test in TEST_VECT]
+        addrs_dec = [binascii.unhexlify(test["address_dec"]) for test in TEST_VECT]
+        self.assertEqual(addrs, codec.EncodeMany(pub_keys))
+        self.assertEqual(addrs_dec, codec.DecodeMany(addrs))
+        for test in TEST_VECT:
+            self.assertEqual(test["address"],
+                             codec.Encode(binascii.unhexlify(test["pub_key"]), test["address_params"]["pub_vkey"]))
+            self.assertEqual(binascii.unhexlify(test["address_dec"]), codec.Decode(test["address"]))
+
+        # Integrated addresses
+        codec = XmrAddrCodec(CoinsConf.MoneroMainNet.ParamByKey("addr_int_net_ver"))
+        addrs = [test["address"] for test in TEST_VECT_INTEGRATED]
+        self.assertEqual(
+            [(binascii.unhexlify(test["address_dec"]), test["address_params"]["payment_id"])
+             for test in TEST_VECT_INTEGRATED],
+            codec.DecodeIntegratedMany(addrs)
+        )
+        for test in TEST_VECT_INTEGRATED:
+            pub_skey = binascii.unhexlify(test["pub_key"])
+            pub_vkey = test["address_params"]["pub_vkey"]
+            payment_id = test["address_params"]["payment_id"]
+
+            self.assertEqual(test["address"], codec.Encode(pub_skey, pub_vkey, payment_id))
+            self.assertEqual([test["address"]] * 2, codec.EncodeIntegratedMany(pub_skey, pub_vkey, [payment_id] * 2))
+            self.assertEqual(binascii.unhexlify(test["address_dec"]), codec.Decode(test["address"], payment_id))
+            self.assertEqual(
+                (binascii.unhexlify(test["address_dec"]), payment_id),
+                codec.DecodeIntegrated(test["address"])
+            )
+
+    # Test invalid codec calls
+    def test_invalid_codec(self):
+        codec = XmrAddrCodec(CoinsConf.MoneroMainNet.ParamByKey("addr_net_ver"))
+        for addr in TEST_VECT_DEC_INVALID:
+            self.assertRaises(ValueError, codec.Decode, addr)
+            self.assertRaises(ValueError, codec.DecodeMany, [TEST_VECT[0]["address"], addr])
+        # Skip the invalid payment ID, since no payment ID is expected
+        for addr in TEST_VECT_DEC_INTEGRATED_INVALID[:2] + TEST_VECT_DEC_INTEGRATED_INVALID[3:]:
+            self.assertRaises(ValueError, codec.DecodeIntegrated, addr)
+            self.assertRaises(ValueError, codec.DecodeIntegratedMany, [addr])
+        # Standard address decoded as integrated one
+        self.assertRaises(ValueError, codec.DecodeIntegrated, TEST_VECT[0]["address"])
+
+        codec = XmrAddrCodec(CoinsConf.MoneroMainNet.ParamByKey("addr_int_net_ver"))
+        self.assertRaises(ValueError, codec.Decode, TEST_VECT_INTEGRATED[0]["address"])
+        self.assertRaises(ValueError, codec.EncodeIntegratedMany,
+                          TEST_ED25519_MONERO_PUB_KEY,
+                          TEST_ED25519_MONERO_PUB_KEY,
+                          [b"\x00" * XmrAddrConst.PAYMENT_ID_BYTE_LEN,
+                           b"\x00" * (XmrAddrConst.PAYMENT_ID_BYTE_LEN - 1)])
+        for pub_key in TEST_VECT_ED25519_PUB_KEY_INVALID:
+            self.assertRaises(ValueError, codec.EncodeIntegratedMany,
+                              binascii.unhexlify(pub_key), TEST_ED25519_MONERO_PUB_KEY, [])
+            self.assertRaises(ValueError, codec.EncodeMany,
+                              [(TEST_ED25519_MONERO_PUB_KEY, binascii.unhexlify(pub_key))])
+
     # Test old address class
     def test_old_addr_cls(self):
         self.assertTrue(XmrAddr is XmrAddrEncoder)
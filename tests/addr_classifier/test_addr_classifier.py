@@ -0,0 +1,131 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import unittest
+
+from bip_utils import AddrClassifier, AddrClassifierResult, Bip44Coins, Bip84Coins, MoneroCoins, SubstrateCoins
+from tests.bip.bip44.test_bip44 import TEST_VECT_DEFAULT_PATH as BIP44_TEST_VECT
+from tests.bip.bip49.test_bip49 import TEST_VECT_DEFAULT_PATH as BIP49_TEST_VECT
+from tests.bip.bip84.test_bip84 import TEST_VECT_DEFAULT_PATH as BIP84_TEST_VECT
+from tests.bip.bip86.test_bip86 import TEST_VECT_DEFAULT_PATH as BIP86_TEST_VECT
+from tests.cardano.shelley.test_cardano_shelley import TEST_VECT as CARDANO_SHELLEY_TEST_VECT
+from tests.monero.test_monero import TEST_VECT as MONERO_TEST_VECT
+from tests.substrate.test_substrate import TEST_VECT as SUBSTRATE_TEST_VECT
+
+
+# Tests for valid addresses (address, coin)
+TEST_VECT = (
+    [
+        (test["default_address"], test["coin"])
+        for test_vect in (BIP44_TEST_VECT, BIP49_TEST_VECT, BIP84_TEST_VECT, BIP86_TEST_VECT)
+        for test in test_vect
+        if test["coin"] not in (Bip44Coins.MONERO_ED25519_SLIP, Bip44Coins.MONERO_SECP256K1)
+    ]
+    + [(test["master"]["address"], test["coin"]) for test in SUBSTRATE_TEST_VECT]
+    + [(test["primary_address"], test["coin"]) for test in MONERO_TEST_VECT]
+    + [
+        (addr["address"], test["coin"])
+        for test in CARDANO_SHELLEY_TEST_VECT
+        for addr in test["addresses"]
+    ]
+)
+
+# Tests for invalid addresses
+TEST_VECT_INVALID = [
+    "",
+    "1",
+    "bc1",
+    "0x",
+    "Invalid address",
+    # Invalid checksum
+    "1F1tAaz5x1HUXrCNLbtMDqcw6o5GNn4xqY",
+    "0x9858EfFD232B4033E47d90003D41EC34EcaEda95",
+    "bc1qcr8te4kr609gcawutmrza0j4xv80jy8z306fyX",
+]
+
+
+#
+# Tests
+#
+class AddrClassifierTests(unittest.TestCase):
+    # Set up class
+    @classmethod
+    def setUpClass(cls):
+        cls.m_addr_classifier = AddrClassifier()
+
+    # Test classification of valid addresses
+    def test_classify(self):
+        for addr, coin in TEST_VECT:
+            result = self.m_addr_classifier.Classify(addr)
+
+            self.assertTrue(isinstance(result, AddrClassifierResult))
+            self.assertEqual(addr, result.address)
+            self.assertTrue(coin in result.coins)
+            self.assertTrue(self.m_addr_classifier.Validate(addr, coin))
+
+    # Test classification of invalid addresses
+    def test_classify_invalid(self):
+        for addr in TEST_VECT_INVALID:
+            self.assertEqual((), self.m_addr_classifier.Classify(addr).coins)
+
+    # Test validation for a wrong coin
+    def test_validate_wrong_coin(self):
+        self.assertFalse(
+            self.m_addr_classifier.Validate("1LqBGSKuX5yYUonjxT5qGfpUsXKYYWeabA", Bip44Coins.LITECOIN)
+        )
+        self.assertFalse(
+            self.m_addr_classifier.Validate(MONERO_TEST_VECT[0]["primary_address"], MoneroCoins.MONERO_TESTNET)
+        )
+
+    # Test classification of many addresses
+    def test_validate_many(self):
+        addrs = [addr for addr, _ in TEST_VECT] + TEST_VECT_INVALID
+        lines = [f"  {addr}\n" for addr in addrs] + ["\n"]
+        exp_results = [self.m_addr_classifier.Classify(addr) for addr in addrs if addr]
+
+        for workers in (1, 2):
+            results = list(self.m_addr_classifier.ValidateMany(lines, workers=workers, chunk_size=7))
+            self.assertEqual(exp_results, results)
+
+    # Test classification of a subset of coins
+    def test_coins_subset(self):
+        coins = [Bip44Coins.BITCOIN, Bip84Coins.BITCOIN, SubstrateCoins.POLKADOT]
+        addr_classifier = AddrClassifier(coins)
+
+        self.assertEqual(tuple(coins), addr_classifier.Coins())
+        for addr, coin in TEST_VECT:
+            result = addr_classifier.Classify(addr)
+            if coin in coins:
+                self.assertEqual((coin,), result.coins)
+            else:
+                self.assertTrue(all(c in coins for c in result.coins))
+
+        self.assertRaises(ValueError, addr_classifier.Validate, TEST_VECT[0][0], Bip44Coins.LITECOIN)
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        self.assertRaises(ValueError, AddrClassifier, [Bip44Coins.MONERO_ED25519_SLIP])
+        self.assertRaises(ValueError, AddrClassifier, [Bip44Coins.MONERO_SECP256K1])
+        self.assertRaises(TypeError, AddrClassifier, ["Bitcoin"])
+
+        self.assertRaises(ValueError, self.m_addr_classifier.ValidateMany, [], workers=0)
+        self.assertRaises(ValueError, self.m_addr_classifier.ValidateMany, [], chunk_size=0)
+
@@ -0,0 +1,237 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import asyncio
+import binascii
+import threading
+import unittest
+
+from bip_utils import Bip38Decrypter, Bip38PubKeyModes, Bip39SeedGenerator, Bip44, Bip44Changes, Bip84, Bip84Coins
+from bip_utils.aio import (
+    AioBip38Decrypter, AioBip38Encrypter, AioBip39SeedGenerator, AioBip44, AioExecutor, AioExecutorTypes
+)
+
+
+# Test mnemonic
+TEST_MNEMONIC = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+# Test seed
+TEST_SEED = Bip39SeedGenerator(TEST_MNEMONIC).Generate()
+
+# Test BIP38 key
+TEST_BIP38_PRIV_KEY = binascii.unhexlify(b"cbf4b9f70470856bb4f40f80b87edb90865997ffee6df315ab166d713af433a5")
+TEST_BIP38_PASSPHRASE = "TestingOneTwoThree"
+TEST_BIP38_ENC = "6PYNKZ1EAgYgmQfmNVamxyXVWHzK5s6DGhwP4J5o44cvXdoY7sRzhtpUeo"
+
+
+# Timeout for synchronization between tests and thread executors, only reached if a test fails
+SYNC_TIMEOUT = 10
+
+
+# Class for tracking function calls in thread executors
+# Calls can be blocked until released and synchronized by a barrier, so that tests do not rely on timings
+class CallsTracker:
+    def __init__(self, blocked=False, barrier=None):
+        self.m_barrier = barrier
+        self.m_started = threading.Event()
+        self.m_released = threading.Event()
+        self.m_lock = threading.Lock()
+        self.m_calls = []
+        self.m_running = 0
+        self.m_max_running = 0
+        if not blocked:
+            self.m_released.set()
+
+    def __call__(self, val):
+        with self.m_lock:
+            self.m_calls.append(val)
+            self.m_running += 1
+            self.m_max_running = max(self.m_max_running, self.m_running)
+        self.m_started.set()
+        if self.m_barrier is not None:
+            self.m_barrier.wait(SYNC_TIMEOUT)
+        self.m_released.wait(SYNC_TIMEOUT)
+        with self.m_lock:
+            self.m_running -= 1
+        return val * 2
+
+    async def wait_started(self):
+        if not await asyncio.get_running_loop().run_in_executor(None, self.m_started.wait, SYNC_TIMEOUT):
+            raise TimeoutError("Function not started")
+
+    def release(self):
+        self.m_released.set()
+
+
+# Run a coroutine
+def run(coro):
+    return asyncio.run(coro)
+
+
+#
+# Tests
+#
+class AioTests(unittest.TestCase):
+    # Test executor
+    def test_executor(self):
+        executor = AioExecutor(max_workers=2, max_concurrency=3, coalesce=False)
+        self.assertEqual(executor.ExecutorType(), AioExecutorTypes.THREAD)
+        self.assertEqual(executor.MaxWorkers(), 2)
+        self.assertEqual(executor.MaxConcurrency(), 3)
+        self.assertFalse(executor.IsCoalescing())
+        # Concurrency defaults to the number of workers
+        self.assertEqual(AioExecutor(max_workers=2).MaxConcurrency(), 2)
+        self.assertTrue(AioExecutor.Default() is AioExecutor.Default())
+
+        self.assertRaises(TypeError, AioExecutor, 0)
+        self.assertRaises(ValueError, AioExecutor, max_workers=0)
+        self.assertRaises(ValueError, AioExecutor, max_concurrency=0)
+
+    # Test concurrency limit
+    def test_concurrency_limit(self):
+        # Calls can only complete in pairs, so the limit is reached without relying on timings
+        tracker = CallsTracker(barrier=threading.Barrier(2))
+
+        async def run_all(executor):
+            return await asyncio.gather(*[executor.Run(tracker, i) for i in range(8)])
+
+        executor = AioExecutor(max_workers=4, max_concurrency=2)
+        self.assertEqual(run(run_all(executor)), [i * 2 for i in range(8)])
+        self.assertEqual(tracker.m_max_running, 2)
+        executor.Shutdown()
+
+    # Test coalescing
+    def test_coalescing(self):
+        async def run_all(executor, tracker):
+            return await asyncio.gather(*[executor.RunCoalesced(("key", i % 2), tracker, i % 2) for i in range(6)])
+
+        tracker = CallsTracker()
+        executor = AioExecutor(max_workers=2)
+        self.assertEqual(run(run_all(executor, tracker)), [0, 2] * 3)
+        self.assertEqual(sorted(tracker.m_calls), [0, 1])
+        # Not coalesced anymore when completed
+        self.assertEqual(run(run_all(executor, tracker)), [0, 2] * 3)
+        self.assertEqual(len(tracker.m_calls), 4)
+        executor.Shutdown()
+
+        # Coalescing disabled
+        tracker = CallsTracker()
+        executor = AioExecutor(max_workers=2, coalesce=False)
+        self.assertEqual(run(run_all(executor, tracker)), [0, 2] * 3)
+        self.assertEqual(len(tracker.m_calls), 6)
+        executor.Shutdown()
+
+    # Test cancellation
+    def test_cancellation(self):
+        async def cancel_waiting(executor, tracker):
+            running = asyncio.ensure_future(executor.Run(tracker, 1))
+            waiting = asyncio.ensure_future(executor.Run(tracker, 2))
+            # The first function is running and blocked, so the second one is waiting
+            await tracker.wait_started()
+            waiting.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiting
+            tracker.release()
+            return await running
+
+        async def cancel_coalesced(executor, tracker):
+            futures = [asyncio.ensure_future(executor.RunCoalesced("key", tracker, 3)) for _ in range(2)]
+            await tracker.wait_started()
+            # The computation goes on, since another caller is waiting for it
+            futures[0].cancel()
+            tracker.release()
+            return await futures[1]
+
+        executor = AioExecutor(max_workers=1)
+        # The waiting function is never called
+        tracker = CallsTracker(blocked=True)
+        self.assertEqual(run(cancel_waiting(executor, tracker)), 2)
+        self.assertEqual(tracker.m_calls, [1])
+
+        tracker = CallsTracker(blocked=True)
+        self.assertEqual(run(cancel_coalesced(executor, tracker)), 6)
+        self.assertEqual(tracker.m_calls, [3])
+        executor.Shutdown()
+
+    # Test BIP39 seed generation
+    def test_bip39(self):
+        async def generate(executor):
+            return await asyncio.gather(
+                *[AioBip39SeedGenerator.Generate(TEST_MNEMONIC, passphrase, executor=executor)
+                  for passphrase in ("", "", "test")]
+            )
+
+        seeds = run(generate(None))
+        self.assertEqual(seeds, [TEST_SEED, TEST_SEED, Bip39SeedGenerator(TEST_MNEMONIC).Generate("test")])
+
+        # Process executor
+        with AioExecutor(AioExecutorTypes.PROCESS, max_workers=2) as executor:
+            self.assertEqual(run(generate(executor)), seeds)
+
+        # Invalid mnemonic
+        self.assertRaises(ValueError, run, AioBip39SeedGenerator.Generate("abandon"))
+
+    # Test BIP38
+    def test_bip38(self):
+        priv_key_enc = run(AioBip38Encrypter.EncryptNoEc(TEST_BIP38_PRIV_KEY, TEST_BIP38_PASSPHRASE))
+        self.assertEqual(priv_key_enc, TEST_BIP38_ENC)
+        self.assertEqual(run(AioBip38Decrypter.DecryptNoEc(priv_key_enc, TEST_BIP38_PASSPHRASE)),
+                         (TEST_BIP38_PRIV_KEY, Bip38PubKeyModes.COMPRESSED))
+
+        priv_key_enc = run(AioBip38Encrypter.GeneratePrivateKeyEc(TEST_BIP38_PASSPHRASE))
+        self.assertEqual(run(AioBip38Decrypter.DecryptEc(priv_key_enc, TEST_BIP38_PASSPHRASE)),
+                         Bip38Decrypter.DecryptEc(priv_key_enc, TEST_BIP38_PASSPHRASE))
+
+    # Test BIP44
+    def test_bip44(self):
+        bip_obj = Bip84.FromSeed(TEST_SEED, Bip84Coins.BITCOIN)
+        chg_obj = bip_obj.Purpose().Coin().Account(0).Change(Bip44Changes.CHAIN_EXT)
+        addrs = [chg_obj.AddressIndex(i).PublicKey().ToAddress() for i in range(10)]
+
+        # Extended key parsing
+        ex_key_str = chg_obj.PublicKey().ToExtended()
+        self.assertEqual(run(AioBip44.FromExtendedKey(Bip84, ex_key_str, Bip84Coins.BITCOIN)).PublicKey().ToExtended(),
+                         ex_key_str)
+        # Default path
+        self.assertEqual(run(AioBip44.DeriveDefaultPath(bip_obj)).PublicKey().ToAddress(), addrs[0])
+
+        # Addresses range
+        for chunk_size in (1, 3, 10, 64):
+            self.assertEqual(run(AioBip44.AddressesRange(Bip84, ex_key_str, Bip84Coins.BITCOIN, 0, 10,
+                                                         chunk_size=chunk_size)),
+                             addrs)
+        self.assertEqual(run(AioBip44.AddressesRange(Bip84, ex_key_str, Bip84Coins.BITCOIN, 4, 7)), addrs[4:7])
+        self.assertEqual(run(AioBip44.AddressesRange(Bip84, ex_key_str, Bip84Coins.BITCOIN, 5, 5)), [])
+        with AioExecutor(AioExecutorTypes.PROCESS, max_workers=2) as executor:
+            self.assertEqual(run(AioBip44.AddressesRange(Bip84, ex_key_str, Bip84Coins.BITCOIN, 0, 10,
+                                                         executor=executor,
+                                                         chunk_size=4)),
+                             addrs)
+            # Bip44Base objects require a thread executor
+            self.assertRaises(ValueError, run, AioBip44.DeriveDefaultPath(bip_obj, executor))
+            self.assertRaises(ValueError, run, AioBip44.FromExtendedKey(Bip84, ex_key_str, Bip84Coins.BITCOIN,
+                                                                        executor))
+
+        # Invalid parameters
+        self.assertRaises(ValueError, run, AioBip44.AddressesRange(Bip84, ex_key_str, Bip84Coins.BITCOIN, -1, 2))
+        self.assertRaises(ValueError, run, AioBip44.AddressesRange(Bip84, ex_key_str, Bip84Coins.BITCOIN, 3, 2))
+        self.assertRaises(ValueError, run, AioBip44.AddressesRange(Bip84, ex_key_str, Bip84Coins.BITCOIN, 0, 2,
+                                                                   chunk_size=0))
+        self.assertRaises(TypeError, run, AioBip44.AddressesRange(Bip44, ex_key_str, Bip84, 0, 2))
@@ -197,6 +197,20 @@ class AlgorandMnemonicTests(unittest.TestCase):
             self.assertRaises(ValueError, AlgorandMnemonicGenerator().FromWordsNumber, test_words_num - 1)
             self.assertRaises(ValueError, AlgorandMnemonicGenerator().FromWordsNumber, test_words_num + 1)
 
+
+    # Test generation of multiple mnemonics
+    def test_generate_many(self):
+        for test_words_num in AlgorandWordsNum:
+            mnemonics = list(AlgorandMnemonicGenerator().GenerateMany(50, test_words_num))
+            self.assertEqual(50, len(mnemonics))
+            for mnemonic in mnemonics:
+                self.assertEqual(mnemonic.WordsCount(), test_words_num)
+                self.assertTrue(AlgorandMnemonicValidator().IsValid(mnemonic))
+
+        self.assertEqual([], list(AlgorandMnemonicGenerator().GenerateMany(0, AlgorandWordsNum.WORDS_NUM_25)))
+        self.assertRaises(ValueError, AlgorandMnemonicGenerator().GenerateMany, -1, AlgorandWordsNum.WORDS_NUM_25)
+        self.assertRaises(ValueError, AlgorandMnemonicGenerator().GenerateMany, 1, AlgorandWordsNum.WORDS_NUM_25 + 1)
+
     # Tests invalid mnemonic
     def test_invalid_mnemonic(self):
         for test in TEST_VECT_MNEMONIC_INVALID:
@@ -86,6 +86,21 @@ TEST_VECT = [
     }
 ]
 
+# Tests for invalid strings (Monero-specific)
+TEST_VECT_XMR_DEC_INVALID = [
+    # Invalid last block length
+    "1",
+    "1111",
+    "11111111111" "11111111",
+    # Block overflow
+    "zz",
+    "zzzzzzzzzzz",
+    "11111111111" "zzzzzzzzzzz",
+    # Invalid characters
+    "0000000000000",
+    "11111111111" "Il",
+]
+
 
 #
 # Tests
@@ -105,5 +120,5 @@ class Base58XmrTests(unittest.TestCase):
 
     # Test invalid calls to decode
     def test_invalid_decode(self):
-        for test in TEST_VECT_DEC_INVALID:
+        for test in TEST_VECT_DEC_INVALID + TEST_VECT_XMR_DEC_INVALID:
             self.assertRaises(ValueError, Base58XmrDecoder.Decode, test)
@@ -168,3 +168,32 @@ class Bip38EcTests(unittest.TestCase):
         self.assertRaises(ValueError, Bip38EcKeysGenerator.GenerateIntermediatePassphrase, "", Bip38EcConst.LOT_NUM_MAX_VAL + 1, Bip38EcConst.SEQ_NUM_MIN_VAL)
         self.assertRaises(ValueError, Bip38EcKeysGenerator.GenerateIntermediatePassphrase, "", Bip38EcConst.LOT_NUM_MIN_VAL, Bip38EcConst.SEQ_NUM_MIN_VAL - 1)
         self.assertRaises(ValueError, Bip38EcKeysGenerator.GenerateIntermediatePassphrase, "", Bip38EcConst.LOT_NUM_MIN_VAL, Bip38EcConst.SEQ_NUM_MAX_VAL + 1)
+
+    # Test generation of multiple keys from the same intermediate passphrase
+    def test_generate_multiple(self):
+        passphrase = "TestingOneTwoThree"
+        int_pass = Bip38EcKeysGenerator.GenerateIntermediatePassphrase(passphrase, 100000, 1)
+
+        for workers, chunk_size in ((1, 256), (2, 2)):
+            encs = list(Bip38EcKeysGenerator.GeneratePrivateKeys(int_pass, 5, Bip38PubKeyModes.UNCOMPRESSED, workers, chunk_size))
+            self.assertEqual(5, len(encs))
+            self.assertEqual(5, len(set(encs)))
+            # Decrypting is slow, so only check the first and last key
+            for enc in (encs[0], encs[-1]):
+                _, pub_key_mode = Bip38Decrypter.DecryptEc(enc, passphrase)
+                self.assertEqual(Bip38PubKeyModes.UNCOMPRESSED, pub_key_mode)
+
+        self.assertEqual([], list(Bip38EcKeysGenerator.GeneratePrivateKeys(int_pass, 0, workers=1)))
+
+    # Test invalid for generation of multiple keys
+    def test_generate_multiple_invalid(self):
+        int_pass = Bip38EcKeysGenerator.GenerateIntermediatePassphrase("")
+
+        for ex, tests in TEST_VECT_INT_PASS_INVALID.items():
+            for test in tests:
+                with self.assertRaises(ex):
+                    Bip38EcKeysGenerator.GeneratePrivateKeys(test, 1)
+
+        self.assertRaises(ValueError, Bip38EcKeysGenerator.GeneratePrivateKeys, int_pass, -1)
+        self.assertRaises(ValueError, Bip38EcKeysGenerator.GeneratePrivateKeys, int_pass, 1, Bip38PubKeyModes.COMPRESSED, 0)
+        self.assertRaises(ValueError, Bip38EcKeysGenerator.GeneratePrivateKeys, int_pass, 1, Bip38PubKeyModes.COMPRESSED, 1, 0)
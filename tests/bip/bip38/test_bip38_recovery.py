@@ -0,0 +1,176 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import binascii
+import json
+import os
+import tempfile
+import unittest
+
+from bip_utils import (
+    Bip38MaskCandidates, Bip38MutationCandidates, Bip38MutationRules, Bip38PassphraseRecovery, Bip38PubKeyModes,
+    Bip38WordlistCandidates
+)
+
+
+# Some encrypted keys from BIP38 page (a wrong candidate costs a full scrypt, so keep tests small)
+TEST_VECT_RECOVERY = [
+    # Without EC multiplication
+    {
+        "encrypted": "6PYNKZ1EAgYgmQfmNVamxyXVWHzK5s6DGhwP4J5o44cvXdoY7sRzhtpUeo",
+        "is_ec": False,
+        "passphrase": "TestingOneTwoThree",
+        "pub_key_mode": Bip38PubKeyModes.COMPRESSED,
+        "priv_key_bytes": b"cbf4b9f70470856bb4f40f80b87edb90865997ffee6df315ab166d713af433a5",
+    },
+    # With EC multiplication
+    {
+        "encrypted": "6PfLGnQs6VZnrNpmVKfjotbnQuaJK4KZoPFrAjx1JMJUa1Ft8gnf5WxfKd",
+        "is_ec": True,
+        "passphrase": "Satoshi",
+        "pub_key_mode": Bip38PubKeyModes.UNCOMPRESSED,
+        "priv_key_bytes": b"c2c8036df268f498099350718c4a3ef3984d2be84618c2650f5171dcc5eb660a",
+    },
+]
+
+# Tests for masks
+TEST_VECT_MASK = [
+    {"mask": "ab?d", "custom_charsets": None, "count": 10, "first": "ab0", "last": "ab9"},
+    {"mask": "?1?1", "custom_charsets": {"1": "xy"}, "count": 4, "first": "xx", "last": "yy"},
+    {"mask": "a??", "custom_charsets": None, "count": 1, "first": "a?", "last": "a?"},
+    {"mask": "?u?l", "custom_charsets": None, "count": 26 * 26, "first": "Aa", "last": "Zz"},
+]
+
+# Tests for invalid masks
+TEST_VECT_MASK_INVALID = [
+    "abc?",
+    "?x",
+]
+
+
+#
+# Tests
+#
+class Bip38RecoveryTests(unittest.TestCase):
+    # Test recovery
+    def test_recovery(self):
+        for test in TEST_VECT_RECOVERY:
+            recovery = Bip38PassphraseRecovery(test["encrypted"])
+            self.assertEqual(test["is_ec"], recovery.IsEc())
+
+            res = recovery.Recover(Bip38WordlistCandidates(["wrong", test["passphrase"], "never_tested"]),
+                                   workers=1)
+            self.assertEqual(test["passphrase"], res.passphrase)
+            self.assertEqual(test["priv_key_bytes"], binascii.hexlify(res.priv_key_bytes))
+            self.assertEqual(test["pub_key_mode"], res.pub_key_mode)
+            self.assertEqual(2, res.tested_num)
+
+    # Test recovery using worker processes
+    def test_recovery_workers(self):
+        test = TEST_VECT_RECOVERY[0]
+        progress = []
+
+        recovery = Bip38PassphraseRecovery(test["encrypted"])
+        res = recovery.Recover(
+            Bip38MutationCandidates(Bip38WordlistCandidates(["eerhTowTenOgnitseT"]),
+                                    [Bip38MutationRules.Identity, Bip38MutationRules.Reverse]),
+            workers=2,
+            chunk_size=1,
+            progress_fct=progress.append
+        )
+        self.assertEqual(test["passphrase"], res.passphrase)
+        self.assertEqual(2, res.tested_num)
+        self.assertEqual([1], progress)
+
+    # Test not found
+    def test_not_found(self):
+        recovery = Bip38PassphraseRecovery(TEST_VECT_RECOVERY[0]["encrypted"])
+        self.assertIsNone(recovery.Recover(Bip38WordlistCandidates(["wrong"]), workers=1))
+        self.assertIsNone(recovery.TestPassphrase("wrong"))
+
+    # Test checkpoint
+    def test_checkpoint(self):
+        test = TEST_VECT_RECOVERY[0]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            checkpoint_file = os.path.join(tmp_dir, "checkpoint.json")
+            with open(checkpoint_file, "w") as fout:
+                json.dump({"priv_key_enc": test["encrypted"], "tested_num": 3}, fout)
+
+            # The first 3 candidates shall be skipped
+            recovery = Bip38PassphraseRecovery(test["encrypted"])
+            res = recovery.Recover(Bip38MaskCandidates("TestingOneTwoThre?1", {"1": "bcde"}),
+                                   workers=1,
+                                   checkpoint_file=checkpoint_file)
+            self.assertEqual(test["passphrase"], res.passphrase)
+            self.assertEqual(4, res.tested_num)
+            with open(checkpoint_file, "r") as fin:
+                self.assertEqual(4, json.load(fin)["tested_num"])
+
+            # Checkpoint of another key
+            recovery = Bip38PassphraseRecovery(TEST_VECT_RECOVERY[1]["encrypted"])
+            self.assertRaises(ValueError, recovery.Recover, Bip38WordlistCandidates([]), 1, 1, checkpoint_file)
+
+    # Test wordlist from file
+    def test_wordlist_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "words.txt")
+            with open(file_path, "w") as fout:
+                fout.write("first\nsecond\r\nthird")
+
+            candidates_gen = Bip38WordlistCandidates.FromFile(file_path)
+            self.assertIsNone(candidates_gen.Count())
+            self.assertEqual(["first", "second", "third"], list(candidates_gen.Generate()))
+
+    # Test mask
+    def test_mask(self):
+        for test in TEST_VECT_MASK:
+            candidates_gen = Bip38MaskCandidates(test["mask"], test["custom_charsets"])
+            candidates = list(candidates_gen.Generate())
+
+            self.assertEqual(test["count"], candidates_gen.Count())
+            self.assertEqual(test["count"], len(candidates))
+            self.assertEqual(test["first"], candidates[0])
+            self.assertEqual(test["last"], candidates[-1])
+
+        for test in TEST_VECT_MASK_INVALID:
+            self.assertRaises(ValueError, Bip38MaskCandidates, test)
+
+    # Test mutation
+    def test_mutation(self):
+        candidates_gen = Bip38MutationCandidates(
+            Bip38WordlistCandidates(["Test", "sea"]),
+            [Bip38MutationRules.Identity, Bip38MutationRules.Lower, Bip38MutationRules.Upper,
+             Bip38MutationRules.Reverse, Bip38MutationRules.Leet, Bip38MutationRules.AppendDigit]
+        )
+        candidates = list(candidates_gen.Generate())
+
+        self.assertEqual(["Test", "test", "TEST", "tseT", "7357"] + [f"Test{i}" for i in range(10)]
+                         + ["sea", "SEA", "aes", "534"] + [f"sea{i}" for i in range(10)],
+                         candidates)
+        self.assertRaises(ValueError, Bip38MutationCandidates, Bip38WordlistCandidates([]), [])
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        recovery = Bip38PassphraseRecovery(TEST_VECT_RECOVERY[0]["encrypted"])
+        self.assertRaises(ValueError, recovery.Recover, Bip38WordlistCandidates([]), 1, 0)
+        self.assertRaises(ValueError, recovery.Recover, Bip38WordlistCandidates([]), -1)
+        self.assertRaises(ValueError, recovery.Recover, Bip38WordlistCandidates([]), 1, 1, None, 0)
@@ -21,11 +21,13 @@
 # Imports
 import binascii
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from bip_utils import (
-    Bip39EntropyBitLen, Bip39EntropyGenerator, Bip39Languages, Bip39MnemonicDecoder, Bip39MnemonicGenerator,
-    Bip39MnemonicValidator, Bip39SeedGenerator, Bip39WordsNum, MnemonicChecksumError
+    Bip39EntropyBitLen, Bip39EntropyGenerator, Bip39Languages, Bip39Mnemonic, Bip39MnemonicDecoder,
+    Bip39MnemonicGenerator, Bip39MnemonicValidator, Bip39SeedGenerator, Bip39WordsNum, MnemonicChecksumError
 )
+from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39WordsListGetter
 
 
 # Tests from BIP39 page
@@ -417,6 +419,58 @@ class Bip39Tests(unittest.TestCase):
             self.assertRaises(ValueError, Bip39MnemonicGenerator().FromWordsNumber, test_words_num - 1)
             self.assertRaises(ValueError, Bip39MnemonicGenerator().FromWordsNumber, test_words_num + 1)
 
+
+    # Test generation of multiple mnemonics
+    def test_generate_many(self):
+        for test_words_num in Bip39WordsNum:
+            # More mnemonics than the ones fitting a single entropy pool
+            mnemonics = list(Bip39MnemonicGenerator().GenerateMany(300, test_words_num))
+            self.assertEqual(300, len(mnemonics))
+            self.assertEqual(300, len({mnemonic.ToStr() for mnemonic in mnemonics}))
+            for mnemonic in mnemonics:
+                self.assertEqual(mnemonic.WordsCount(), test_words_num)
+                self.assertTrue(Bip39MnemonicValidator().IsValid(mnemonic))
+
+        self.assertEqual([], list(Bip39MnemonicGenerator().GenerateMany(0, Bip39WordsNum.WORDS_NUM_12)))
+        self.assertRaises(ValueError, Bip39MnemonicGenerator().GenerateMany, -1, Bip39WordsNum.WORDS_NUM_12)
+        self.assertRaises(ValueError, Bip39MnemonicGenerator().GenerateMany, 1, Bip39WordsNum.WORDS_NUM_12 + 1)
+
+    # Test generation of multiple seeds
+    def test_generate_many_seeds(self):
+        mnemonics = [test["mnemonic"] for test in TEST_VECT if "lang" not in test]
+        exp_seeds = [test["seed"] for test in TEST_VECT if "lang" not in test]
+
+        for workers in (1, 2):
+            seeds = Bip39SeedGenerator.GenerateMany(mnemonics, TEST_PASSPHRASE, workers=workers, chunk_size=3)
+            self.assertEqual(exp_seeds, [binascii.hexlify(seed) for seed in seeds])
+        # Mnemonic objects and specified language
+        seeds = Bip39SeedGenerator.GenerateMany([Bip39Mnemonic.FromString(mnemonic) for mnemonic in mnemonics],
+                                                TEST_PASSPHRASE,
+                                                Bip39Languages.ENGLISH,
+                                                workers=1)
+        self.assertEqual(exp_seeds, [binascii.hexlify(seed) for seed in seeds])
+
+        # Invalid mnemonic
+        self.assertRaises(ValueError, list,
+                          Bip39SeedGenerator.GenerateMany([TEST_VECT_MNEMONIC_INVALID[0]["mnemonic"]], workers=1))
+        # Invalid parameters
+        self.assertRaises(ValueError, Bip39SeedGenerator.GenerateMany, mnemonics, workers=0)
+        self.assertRaises(ValueError, Bip39SeedGenerator.GenerateMany, mnemonics, chunk_size=0)
+
+    # Tests words list getter from multiple threads
+    def test_words_list_getter_threads(self):
+        langs = list(Bip39Languages) * 8
+        words_list_getter = Bip39WordsListGetter()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            instances = list(executor.map(lambda _: Bip39WordsListGetter.Instance(), range(16)))
+            words_lists = list(executor.map(words_list_getter.GetByLanguage, langs))
+
+        # Same global instance and words lists loaded only once
+        self.assertTrue(all(instance is Bip39WordsListGetter.Instance() for instance in instances))
+        for lang, words_list in zip(langs, words_lists):
+            self.assertTrue(words_list is words_list_getter.GetByLanguage(lang))
+            self.assertEqual(words_list.Length(), 2048)
+
     # Tests invalid mnemonic
     def test_invalid_mnemonic(self):
         for test in TEST_VECT_MNEMONIC_INVALID:
@@ -0,0 +1,134 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import functools
+import operator
+import unittest
+
+from bip_utils import (
+    Bip39Languages, Bip39MnemonicRecovery, Bip39MnemonicValidator, Bip39SeedGenerator, MnemonicRecoveryResult
+)
+from bip_utils.utils.mnemonic import MnemonicRecoveryUtils
+
+
+# Test mnemonics
+TEST_MNEMONIC_12 = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+TEST_MNEMONIC_24 = "hamster diagram private dutch cause delay private meat slide toddler razor book happy fancy gospel " \
+                   "tennis maple dilemma loan word shrug inflict delay length"
+TEST_PASSPHRASE = "TREZOR"
+
+# Tests for recovery
+TEST_VECT = [
+    # Last word unknown
+    {
+        "mnemonic": "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon ?",
+        "exp_mnemonic": TEST_MNEMONIC_12,
+        "exp_candidates_num": 2048,
+        "exp_valid_num": 128,
+    },
+    # First word unknown
+    {
+        "mnemonic": "? abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about",
+        "exp_mnemonic": TEST_MNEMONIC_12,
+        "exp_candidates_num": 2048,
+        "exp_valid_num": None,
+    },
+    # Misspelled words
+    {
+        "mnemonic": "abandn abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abuot",
+        "exp_mnemonic": TEST_MNEMONIC_12,
+        "exp_candidates_num": None,
+        "exp_valid_num": None,
+    },
+    # Last word unknown (24 words)
+    {
+        "mnemonic": TEST_MNEMONIC_24.rsplit(" ", 1)[0] + " ?",
+        "exp_mnemonic": TEST_MNEMONIC_24,
+        "exp_candidates_num": 2048,
+        "exp_valid_num": 8,
+    },
+]
+
+
+#
+# Tests
+#
+class Bip39MnemonicRecoveryTests(unittest.TestCase):
+    # Run all tests in test vector
+    def test_vector(self):
+        for test in TEST_VECT:
+            recovery = Bip39MnemonicRecovery(test["mnemonic"], passphrase=TEST_PASSPHRASE)
+
+            if test["exp_candidates_num"] is not None:
+                self.assertEqual(test["exp_candidates_num"], recovery.CandidatesNum())
+
+            candidates = list(recovery.GenerateCandidates())
+            if test["exp_valid_num"] is not None:
+                self.assertEqual(test["exp_valid_num"], len(candidates))
+            self.assertIn(test["exp_mnemonic"], [candidate.ToStr() for candidate in candidates])
+            for candidate in candidates:
+                self.assertTrue(Bip39MnemonicValidator(Bip39Languages.ENGLISH).IsValid(candidate))
+
+            seed_bytes = Bip39SeedGenerator(test["exp_mnemonic"]).Generate(TEST_PASSPHRASE)
+            res = recovery.Recover(functools.partial(operator.eq, seed_bytes), workers=1)
+
+            self.assertTrue(isinstance(res, MnemonicRecoveryResult))
+            self.assertEqual(test["exp_mnemonic"], res.mnemonic.ToStr())
+            self.assertEqual(seed_bytes, res.seed_bytes)
+            self.assertTrue(0 < res.tested_num <= len(candidates))
+
+    # Test recovery with more workers and progress
+    def test_recover_workers(self):
+        progress = []
+        recovery = Bip39MnemonicRecovery(TEST_MNEMONIC_24.rsplit(" ", 1)[0].split(" ") + ["?"])
+        seed_bytes = Bip39SeedGenerator(TEST_MNEMONIC_24).Generate()
+
+        res = recovery.Recover(functools.partial(operator.eq, seed_bytes),
+                               workers=2,
+                               chunk_size=1,
+                               progress_fct=progress.append)
+        self.assertEqual(TEST_MNEMONIC_24, res.mnemonic.ToStr())
+        self.assertEqual(list(range(1, res.tested_num)), progress)
+
+        # Not found
+        self.assertIsNone(recovery.Recover(functools.partial(operator.eq, b""), workers=1))
+
+    # Test edit distance
+    def test_edit_distance(self):
+        self.assertEqual(0, MnemonicRecoveryUtils.EditDistance("abandon", "abandon"))
+        self.assertEqual(1, MnemonicRecoveryUtils.EditDistance("abandn", "abandon"))
+        self.assertEqual(2, MnemonicRecoveryUtils.EditDistance("abuot", "about"))
+        self.assertEqual(3, MnemonicRecoveryUtils.EditDistance("", "abc"))
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        # Invalid words number
+        self.assertRaises(ValueError, Bip39MnemonicRecovery, TEST_MNEMONIC_12 + " ?")
+        # No similar word
+        self.assertRaises(ValueError, Bip39MnemonicRecovery, "zzzzzzzz " + TEST_MNEMONIC_12.split(" ", 1)[1])
+        # Invalid edit distance
+        self.assertRaises(ValueError, Bip39MnemonicRecovery, TEST_MNEMONIC_12, max_edit_dist=-1)
+        # Invalid language
+        self.assertRaises(TypeError, Bip39MnemonicRecovery, TEST_MNEMONIC_12, 0)
+        # Invalid workers or chunk size
+        recovery = Bip39MnemonicRecovery(TEST_MNEMONIC_12)
+        self.assertRaises(ValueError, recovery.Recover, bool, workers=0)
+        self.assertRaises(ValueError, recovery.Recover, bool, chunk_size=0)
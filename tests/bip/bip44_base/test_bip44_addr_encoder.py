@@ -0,0 +1,110 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import binascii
+import unittest
+
+from bip_utils import (
+    Bip44, Bip44AddrEncoder, Bip44Changes, Bip44Coins, Bip49, Bip84, Bip86, Cip1852Conf, EllipticCurveTypes
+)
+from bip_utils.bip.conf.bip44 import Bip44Conf
+from tests.bip.bip44.test_bip44 import TEST_VECT_DEFAULT_PATH as BIP44_TEST_VECT
+from tests.bip.bip49.test_bip49 import TEST_VECT_DEFAULT_PATH as BIP49_TEST_VECT
+from tests.bip.bip84.test_bip84 import TEST_VECT_DEFAULT_PATH as BIP84_TEST_VECT
+from tests.bip.bip86.test_bip86 import TEST_VECT_DEFAULT_PATH as BIP86_TEST_VECT
+from tests.ecc.test_ecc import TEST_ED25519_PUB_KEY, TEST_SECP256K1_PUB_KEY
+
+
+# Tests for all BIP specifications
+TEST_VECT = [
+    (Bip44, BIP44_TEST_VECT),
+    (Bip49, BIP49_TEST_VECT),
+    (Bip84, BIP84_TEST_VECT),
+    (Bip86, BIP86_TEST_VECT),
+]
+
+# Tests for invalid secp256k1 public keys bytes
+TEST_VECT_SECP256K1_INVALID_KEYS = [
+    # Invalid length
+    TEST_SECP256K1_PUB_KEY.RawCompressed().ToBytes()[:-1],
+    TEST_SECP256K1_PUB_KEY.RawUncompressed().ToBytes() + b"\x00",
+    # Invalid prefix
+    b"\x04" + TEST_SECP256K1_PUB_KEY.RawCompressed().ToBytes()[1:],
+    b"\x02" + TEST_SECP256K1_PUB_KEY.RawUncompressed().ToBytes()[1:],
+]
+
+
+#
+# Tests
+#
+class Bip44AddrEncoderTests(unittest.TestCase):
+    # Test encoding of default path addresses
+    def test_default_path(self):
+        for bip_cls, test_vect in TEST_VECT:
+            for test in test_vect:
+                bip_obj_ctx = bip_cls.FromSeed(binascii.unhexlify(test["seed"]), test["coin"]).DeriveDefaultPath()
+                if test["coin"] in (Bip44Coins.MONERO_ED25519_SLIP, Bip44Coins.MONERO_SECP256K1):
+                    self.assertRaises(ValueError, Bip44AddrEncoder, bip_obj_ctx.CoinConf())
+                    continue
+
+                addr_encoder = Bip44AddrEncoder(bip_obj_ctx.CoinConf())
+                pub_key = bip_obj_ctx.PublicKey().Bip32Key()
+
+                self.assertTrue(addr_encoder.CoinConf() is bip_obj_ctx.CoinConf())
+                self.assertEqual(test["default_address"], addr_encoder.Encode(pub_key))
+
+                # Coins whose address depends on the chain code require a Bip32PublicKey object
+                if addr_encoder.CoinConf().AddrParamsHaveFctCalls():
+                    self.assertRaises(ValueError, addr_encoder.Encode, pub_key.KeyObject())
+                    self.assertRaises(ValueError, addr_encoder.Encode, pub_key.RawCompressed().ToBytes())
+                    continue
+
+                self.assertEqual(test["default_address"], addr_encoder.Encode(pub_key.KeyObject()))
+                self.assertEqual(test["default_address"], addr_encoder.Encode(pub_key.RawCompressed().ToBytes()))
+                if pub_key.CurveType() in (EllipticCurveTypes.NIST256P1, EllipticCurveTypes.SECP256K1):
+                    self.assertEqual(test["default_address"],
+                                     addr_encoder.Encode(pub_key.RawUncompressed().ToBytes()))
+
+    # Test many addresses encoding
+    def test_encode_many(self):
+        for coin in (Bip44Coins.BITCOIN, Bip44Coins.BITCOIN_CASH, Bip44Coins.COSMOS, Bip44Coins.ETHEREUM,
+                     Bip44Coins.ALGORAND, Bip44Coins.CARDANO_BYRON_ICARUS):
+            bip44_mst_ctx = Bip44.FromSeed(binascii.unhexlify(BIP44_TEST_VECT[0]["seed"]), coin)
+            bip44_chg_ctx = bip44_mst_ctx.Purpose().Coin().Account(0).Change(Bip44Changes.CHAIN_EXT)
+            pub_keys = [bip44_chg_ctx.AddressIndex(i).PublicKey() for i in range(5)]
+
+            self.assertEqual(
+                [pub_key.ToAddress() for pub_key in pub_keys],
+                Bip44AddrEncoder(bip44_chg_ctx.CoinConf()).EncodeMany(pub_key.Bip32Key() for pub_key in pub_keys)
+            )
+        self.assertEqual([], Bip44AddrEncoder(Bip44Conf.BitcoinMainNet).EncodeMany([]))
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        # Coins whose address cannot be computed from a single public key
+        self.assertRaises(ValueError, Bip44AddrEncoder, Cip1852Conf.CardanoIcarusMainNet)
+        self.assertRaises(ValueError, Bip44AddrEncoder, Bip44Conf.MoneroSecp256k1)
+
+        addr_encoder = Bip44AddrEncoder(Bip44Conf.BitcoinMainNet)
+        for pub_key_bytes in TEST_VECT_SECP256K1_INVALID_KEYS:
+            self.assertRaises(ValueError, addr_encoder.Encode, pub_key_bytes)
+            self.assertRaises(ValueError, addr_encoder.EncodeMany, [pub_key_bytes])
+        self.assertRaises(TypeError, addr_encoder.Encode, TEST_ED25519_PUB_KEY)
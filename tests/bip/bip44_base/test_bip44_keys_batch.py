@@ -0,0 +1,191 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import binascii
+import os
+import tempfile
+import unittest
+from array import array
+
+from bip_utils import Bip44, Bip44Changes, Bip44Coins, Bip44DepthError, Bip44KeysBatch, Bip84, Bip84Coins, Hash160
+from tests.bip.bip44_base.test_bip44_addr_encoder import TEST_VECT
+
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+# Test seed
+TEST_SEED = binascii.unhexlify(TEST_VECT[0][1][0]["seed"])
+# Test range
+TEST_START = 3
+TEST_STOP = 8
+
+
+# Get a change level object
+def change_obj(bip_cls, coin):
+    return bip_cls.FromSeed(TEST_SEED, coin).Purpose().Coin().Account(0).Change(Bip44Changes.CHAIN_EXT)
+
+
+#
+# Tests
+#
+class Bip44KeysBatchTests(unittest.TestCase):
+    # Test derivation against single addresses
+    def test_derive(self):
+        for bip_cls, test_vect in TEST_VECT:
+            for test in test_vect:
+                bip_obj_ctx = change_obj(bip_cls, test["coin"])
+                if test["coin"] in (Bip44Coins.MONERO_ED25519_SLIP, Bip44Coins.MONERO_SECP256K1):
+                    self.assertRaises(ValueError, bip_obj_ctx.AddressesRange, TEST_START, TEST_STOP)
+                    continue
+
+                batch = bip_obj_ctx.AddressesRange(TEST_START, TEST_STOP, chunk_size=2)
+                self.__test_batch(batch, bip_obj_ctx)
+
+    # Test derivation with worker processes
+    def test_derive_workers(self):
+        for coin in (Bip44Coins.BITCOIN, Bip44Coins.SOLANA):
+            bip_obj_ctx = change_obj(Bip44, coin)
+            self.__test_batch(bip_obj_ctx.AddressesRange(TEST_START, TEST_STOP, workers=2, chunk_size=2),
+                              bip_obj_ctx)
+
+        # Public-only objects
+        bip_obj_ctx = change_obj(Bip84, Bip84Coins.BITCOIN)
+        pub_obj_ctx = Bip84.FromExtendedKey(bip_obj_ctx.PublicKey().ToExtended(), Bip84Coins.BITCOIN)
+        self.__test_batch(pub_obj_ctx.AddressesRange(TEST_START, TEST_STOP, workers=2), bip_obj_ctx)
+
+    # Test buffers
+    def test_buffers(self):
+        batch = change_obj(Bip84, Bip84Coins.BITCOIN).AddressesRange(TEST_START, TEST_STOP)
+        count = TEST_STOP - TEST_START
+
+        self.assertEqual(batch.IndexesBuffer().tolist(), list(range(TEST_START, TEST_STOP)))
+        self.assertEqual(batch.PublicKeysBuffer().nbytes, count * 33)
+        self.assertEqual(batch.ChainCodesBuffer().nbytes, count * 32)
+        self.assertEqual(batch.Hash160sBuffer().nbytes, count * 20)
+        self.assertEqual(batch.PublicKeysBuffer()[33:66].tobytes(), batch.PublicKey(1))
+        self.assertTrue(batch.PublicKeysBuffer().readonly)
+
+        offsets = batch.AddressesOffsetsBuffer().tolist()
+        self.assertEqual(len(offsets), count + 1)
+        self.assertEqual(batch.AddressesDataBuffer()[offsets[1]:offsets[2]].tobytes().decode(), batch.Address(1))
+        self.assertEqual(b"".join(addr.encode() for addr in batch.Addresses()), batch.AddressesDataBuffer().tobytes())
+
+    # Test empty batch
+    def test_empty(self):
+        batch = change_obj(Bip84, Bip84Coins.BITCOIN).AddressesRange(TEST_START, TEST_START)
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(batch.PublicKeys(), [])
+        self.assertEqual(batch.Addresses(), [])
+        self.assertEqual(batch.AddressesOffsetsBuffer().tolist(), [0])
+
+    # Test NumPy export
+    @unittest.skipIf(not NUMPY_AVAILABLE, "numpy library not installed")
+    def test_numpy(self):
+        batch = change_obj(Bip84, Bip84Coins.BITCOIN).AddressesRange(TEST_START, TEST_STOP)
+        cols = batch.ToNumpy()
+
+        self.assertEqual(cols["index"].tolist(), list(range(TEST_START, TEST_STOP)))
+        self.assertEqual(cols["public_key"].dtype, np.dtype("S33"))
+        self.assertEqual(cols["chain_code"].dtype, np.dtype("S32"))
+        self.assertEqual(cols["hash160"].dtype, np.dtype("S20"))
+        self.assertEqual(cols["public_key"].tobytes(), batch.PublicKeysBuffer().tobytes())
+        self.assertEqual(cols["hash160"][2].tobytes(), batch.Hash160(2))
+        self.assertEqual([addr.decode() for addr in cols["address"]], batch.Addresses())
+        # No copy
+        self.assertFalse(cols["public_key"].flags.owndata)
+
+    # Test Arrow export and writers
+    @unittest.skipIf(not PYARROW_AVAILABLE, "pyarrow library not installed")
+    def test_arrow(self):
+        batch = change_obj(Bip84, Bip84Coins.BITCOIN).AddressesRange(TEST_START, TEST_STOP)
+        table = batch.ToArrow()
+
+        self.assertEqual(table.column_names, ["index", "public_key", "chain_code", "hash160", "address"])
+        self.assertEqual(table.column("index").to_pylist(), list(range(TEST_START, TEST_STOP)))
+        self.assertEqual(table.column("public_key").to_pylist(), batch.PublicKeys())
+        self.assertEqual(table.column("address").to_pylist(), batch.Addresses())
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "batch.parquet")
+            batch.WriteParquet(file_path)
+            self.assertTrue(pq.read_table(file_path).equals(table))
+
+            file_path = os.path.join(tmp_dir, "batch.arrow")
+            batch.WriteArrowIpc(file_path)
+            with pa.OSFile(file_path, "rb") as source:
+                self.assertTrue(pa.ipc.open_file(source).read_all().equals(table))
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        bip_obj_ctx = change_obj(Bip84, Bip84Coins.BITCOIN)
+        self.assertRaises(Bip44DepthError, bip_obj_ctx.AddressIndex(0).AddressesRange, 0, 1)
+        self.assertRaises(Bip44DepthError, Bip84.FromSeed(TEST_SEED, Bip84Coins.BITCOIN).AddressesRange, 0, 1)
+        self.assertRaises(ValueError, bip_obj_ctx.AddressesRange, -1, 1)
+        self.assertRaises(ValueError, bip_obj_ctx.AddressesRange, 2, 1)
+        self.assertRaises(ValueError, bip_obj_ctx.AddressesRange, 0, 1, 0)
+        self.assertRaises(ValueError, bip_obj_ctx.AddressesRange, 0, 1, 1, 0)
+
+        batch = bip_obj_ctx.AddressesRange(TEST_START, TEST_STOP)
+        for i in (TEST_STOP - TEST_START, -(TEST_STOP - TEST_START) - 1):
+            self.assertRaises(IndexError, batch.PublicKey, i)
+            self.assertRaises(IndexError, batch.Address, i)
+        self.assertEqual(batch.PublicKey(-1), batch.PublicKey(TEST_STOP - TEST_START - 1))
+
+        # Inconsistent buffers
+        self.assertRaises(ValueError, Bip44KeysBatch, array("I", [0]), 33, b"\x00" * 32, b"\x00" * 32, b"\x00" * 20,
+                          array("i", [0, 1]), b"a")
+        self.assertRaises(ValueError, Bip44KeysBatch, array("I", [0]), 33, b"\x00" * 33, b"\x00" * 32, b"\x00" * 20,
+                          array("i", [0, 2]), b"a")
+
+    # Test a batch against the single addresses
+    def __test_batch(self, batch, bip_obj_ctx):
+        self.assertEqual(len(batch), TEST_STOP - TEST_START)
+        self.assertEqual(batch.Count(), TEST_STOP - TEST_START)
+
+        addrs = []
+        pub_keys = []
+        for i, addr_idx in enumerate(range(TEST_START, TEST_STOP)):
+            pub_key = bip_obj_ctx.AddressIndex(addr_idx).PublicKey()
+            pub_key_bytes = pub_key.RawCompressed().ToBytes()
+
+            self.assertEqual(batch.Index(i), addr_idx)
+            self.assertEqual(batch.PublicKey(i), pub_key_bytes)
+            self.assertEqual(batch.ChainCode(i), pub_key.ChainCode().ToBytes())
+            self.assertEqual(batch.Hash160(i), Hash160.QuickDigest(pub_key_bytes))
+            self.assertEqual(batch.Address(i), pub_key.ToAddress())
+            addrs.append(pub_key.ToAddress())
+            pub_keys.append(pub_key_bytes)
+
+        self.assertEqual(batch.PublicKeyLength(), len(pub_keys[0]))
+        self.assertEqual(batch.Addresses(), addrs)
+        self.assertEqual(batch.PublicKeys(), pub_keys)
@@ -0,0 +1,103 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import binascii
+import unittest
+
+from bip_utils import AdaByronIcarusAddrEncoder, Bip32Slip10Ed25519, CardanoByronLegacy, CardanoByronLegacyScanner
+from tests.cardano.byron.test_cardano_byron_legacy import TEST_SEED_1, TEST_SEED_2, TEST_VECT
+
+
+# Invalid addresses
+TEST_VECT_INVALID_ADDR = [
+    # Empty
+    "",
+    # Not Base58
+    "DdzFFzCqrhsvhr2H1sncDochxM3RA3PjwacMrftSEaHmzBYNQKwBhbt6hyjfk1czqWRANSphdiirkr75t5K6mHrZX4gzTLQhQFRstheO",
+    # Invalid CRC
+    "DdzFFzCqrhsvhr2H1sncDochxM3RA3PjwacMrftSEaHmzBYNQKwBhbt6hyjfk1czqWRANSphdiirkr75t5K6mHrZX4gzTLQhQFRstheB",
+    # Not an address
+    "Hello",
+]
+
+
+#
+# Tests
+#
+class CardanoByronLegacyScannerTests(unittest.TestCase):
+    # Test single address scan
+    def test_scan_address(self):
+        for test in TEST_VECT:
+            byron_legacy = CardanoByronLegacy.FromSeed(binascii.unhexlify(test["seed"]))
+            scanner = CardanoByronLegacyScanner(binascii.unhexlify(test["hd_path_key"]))
+
+            for i, test_addr in enumerate(test["addresses"]):
+                self.assertEqual(f"m/0'/{i}'", scanner.ScanAddress(test_addr["address"]).ToStr())
+                self.assertEqual(byron_legacy.HdPathFromAddress(test_addr["address"]).ToStr(),
+                                 scanner.ScanAddress(test_addr["address"]).ToStr())
+
+        scanner = CardanoByronLegacyScanner.FromByronLegacy(CardanoByronLegacy.FromSeed(TEST_SEED_1))
+        # Address of another wallet
+        self.assertIsNone(scanner.ScanAddress(CardanoByronLegacy.FromSeed(TEST_SEED_2).GetAddress(0, 0)))
+        # Icarus address (no HD path)
+        self.assertIsNone(scanner.ScanAddress(self.__icarus_address()))
+        # Invalid addresses
+        for addr in TEST_VECT_INVALID_ADDR:
+            self.assertIsNone(scanner.ScanAddress(addr))
+
+    # Test addresses scan
+    def test_scan(self):
+        byron_legacy = CardanoByronLegacy.FromSeed(TEST_SEED_1)
+        byron_legacy_other = CardanoByronLegacy.FromSeed(TEST_SEED_2)
+
+        addresses = []
+        exp_matches = []
+        for i in range(10):
+            addr = byron_legacy.GetAddress(i % 2, i)
+            addresses += [
+                f"  {addr}\n",
+                byron_legacy_other.GetAddress(0, i) + "\n",
+                "\n",
+            ]
+            exp_matches.append((addr, f"m/{i % 2}'/{i}'"))
+        addresses += [self.__icarus_address()] + TEST_VECT_INVALID_ADDR
+
+        scanner = CardanoByronLegacyScanner.FromByronLegacy(byron_legacy)
+        for workers in (1, 2):
+            matches = scanner.Scan(iter(addresses), workers=workers, chunk_size=4)
+            self.assertEqual(exp_matches, [(addr, hd_path.ToStr()) for addr, hd_path in matches])
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        self.assertRaises(ValueError, CardanoByronLegacyScanner, b"\x00" * 31)
+        self.assertRaises(ValueError, CardanoByronLegacyScanner, b"\x00" * 33)
+
+        scanner = CardanoByronLegacyScanner.FromByronLegacy(CardanoByronLegacy.FromSeed(TEST_SEED_1))
+        self.assertRaises(ValueError, scanner.Scan, [], chunk_size=0)
+        self.assertRaises(ValueError, scanner.Scan, [], workers=0)
+
+    # Get an Icarus address
+    @staticmethod
+    def __icarus_address():
+        return AdaByronIcarusAddrEncoder.EncodeKey(
+            Bip32Slip10Ed25519.FromSeed(TEST_SEED_1).PublicKey().KeyObject(),
+            chain_code=Bip32Slip10Ed25519.FromSeed(TEST_SEED_1).ChainCode().ToBytes()
+        )
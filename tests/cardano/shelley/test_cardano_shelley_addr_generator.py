@@ -0,0 +1,100 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import unittest
+
+from bip_utils import (
+    AdaShelleyAddrNetworkTags, AdaShelleyEnterpriseAddrEncoder, Bip44, Bip44Changes, Bip44Coins, CardanoShelley,
+    CardanoShelleyAddrGenerator, CardanoShelleyAddrs, Cip1852, Cip1852Coins
+)
+from tests.cardano.shelley.test_cardano_shelley import TEST_VECT
+
+
+#
+# Tests
+#
+class CardanoShelleyAddrGeneratorTests(unittest.TestCase):
+    # Run all tests in test vector
+    def test_vector(self):
+        for test in TEST_VECT:
+            cip1852_acc = Cip1852.FromExtendedKey(test["ex_acc"], test["coin"])
+            addr_gen = CardanoShelleyAddrGenerator(cip1852_acc)
+
+            self.assertEqual(test["staking"]["address"], addr_gen.StakingAddress())
+            self.assertEqual(test["staking"]["address"], addr_gen.RewardAddress())
+
+            addrs = list(addr_gen.Addresses(0, len(test["addresses"])))
+            self.assertEqual(len(test["addresses"]), len(addrs))
+            for idx, addr in enumerate(addrs):
+                self.assertTrue(isinstance(addr, CardanoShelleyAddrs))
+                self.assertEqual(idx, addr.addr_idx)
+                self.assertEqual(test["addresses"][idx]["address"], addr.base_address)
+                self.assertEqual(test["staking"]["address"], addr.reward_address)
+
+    # Test against CardanoShelley class
+    def test_cardano_shelley(self):
+        for coin in (Cip1852Coins.CARDANO_ICARUS, Cip1852Coins.CARDANO_ICARUS_TESTNET):
+            cip1852_acc = Cip1852.FromSeed(b"\x00" * 64, coin).Purpose().Coin().Account(0)
+            addr_gen = CardanoShelleyAddrGenerator(cip1852_acc)
+            shelley_acc_ctx = CardanoShelley.FromCip1852Object(cip1852_acc)
+            net_tag = cip1852_acc.CoinConf().AddrParams()["net_tag"]
+
+            for change_type in Bip44Changes:
+                shelley_chg_ctx = shelley_acc_ctx.Change(change_type)
+                for workers in (1, 2):
+                    addrs = list(addr_gen.Addresses(5, 6, change_type, workers=workers, chunk_size=4))
+
+                    self.assertEqual(list(range(5, 11)), [addr.addr_idx for addr in addrs])
+                    for addr in addrs:
+                        pub_keys = shelley_chg_ctx.AddressIndex(addr.addr_idx).PublicKeys()
+                        self.assertEqual(pub_keys.ToAddress(), addr.base_address)
+                        self.assertEqual(
+                            AdaShelleyEnterpriseAddrEncoder.EncodeKey(pub_keys.AddressKey().KeyObject(),
+                                                                      net_tag=net_tag),
+                            addr.enterprise_address
+                        )
+                        self.assertEqual(pub_keys.ToRewardAddress(), addr.reward_address)
+
+            # Public-only account
+            cip1852_acc.Bip32Object().ConvertToPublic()
+            self.assertEqual(list(addr_gen.Addresses(0, 3)),
+                             list(CardanoShelleyAddrGenerator(cip1852_acc).Addresses(0, 3)))
+
+        self.assertEqual(AdaShelleyAddrNetworkTags.TESTNET, net_tag)
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        cip1852_mst = Cip1852.FromSeed(b"\x00" * 64, Cip1852Coins.CARDANO_ICARUS)
+        addr_gen = CardanoShelleyAddrGenerator(cip1852_mst.Purpose().Coin().Account(0))
+
+        self.assertRaises(ValueError, CardanoShelleyAddrGenerator, Bip44.FromSeed(b"\x00" * 64, Bip44Coins.BITCOIN))
+        self.assertRaises(ValueError, CardanoShelleyAddrGenerator, cip1852_mst)
+        self.assertRaises(ValueError, CardanoShelleyAddrGenerator, cip1852_mst.Purpose().Coin())
+        self.assertRaises(ValueError, CardanoShelleyAddrGenerator,
+                          cip1852_mst.Purpose().Coin().Account(0).Change(Bip44Changes.CHAIN_EXT))
+
+        self.assertRaises(TypeError, addr_gen.Addresses, 0, 1, 0)
+        self.assertRaises(ValueError, addr_gen.Addresses, -1, 1)
+        self.assertRaises(ValueError, addr_gen.Addresses, 0, -1)
+        self.assertRaises(ValueError, addr_gen.Addresses, 2**31 - 1, 2)
+        self.assertRaises(ValueError, addr_gen.Addresses, 0, 1, workers=0)
+        self.assertRaises(ValueError, addr_gen.Addresses, 0, 1, chunk_size=0)
+        self.assertEqual([], list(addr_gen.Addresses(0, 0)))
@@ -0,0 +1,227 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import csv
+import io
+import json
+import unittest
+
+from bip_utils import (
+    Bip39SeedGenerator, Bip44Changes, Bip49, Bip49Coins, Bip84, Bip84Coins, CardanoIcarusSeedGenerator, CardanoShelley,
+    Cip1852, Cip1852Coins, Monero, MoneroCoins, Substrate, SubstrateAddrConverter, SubstrateBip39SeedGenerator,
+    SubstrateCoins
+)
+from bip_utils.cli import Cli, CliConst, CliDeriveRecord, CliOutputFormats, CliProgress, CliWriter
+
+
+# Test mnemonic
+TEST_MNEMONIC = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about"
+# Test Monero seed
+TEST_MONERO_SEED = b"\x01" * 32
+
+# Test addresses
+TEST_BTC_ADDR = "bc1qcr8te4kr609gcawutmrza0j4xv80jy8z306fyu"
+TEST_DOT_ADDR = "1H946gSKhhSKfnXR8ekj9EDH4DCzfSB8zAVfG3GtfauiuaQ"
+TEST_BCH_ADDR = "bitcoincash:qp90dvzptg759efdcd93s4dkdw0vuhlkmqlch7letq"
+TEST_BCH_LEGACY_ADDR = "17qNXQwQYRfNQrSZGkDEe3VBfVmudfY5mV"
+
+
+# Run the command line interface and return exit code, stdout and stderr
+def run_cli(argv, stdin_str=""):
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    ret = Cli.Main(argv, io.StringIO(stdin_str), stdout, stderr)
+    return ret, stdout.getvalue(), stderr.getvalue()
+
+
+# Run the command line interface and return the NDJSON records
+def run_cli_ndjson(test, argv, stdin_str=""):
+    ret, out, _ = run_cli(argv + ["--quiet"], stdin_str)
+    test.assertEqual(ret, CliConst.EXIT_OK)
+    return [json.loads(line) for line in out.splitlines()]
+
+
+#
+# Tests
+#
+class CliTests(unittest.TestCase):
+    # Test derive for BIP specifications
+    def test_derive_bip(self):
+        chg_obj = (Bip84.FromSeed(Bip39SeedGenerator(TEST_MNEMONIC).Generate(), Bip84Coins.BITCOIN)
+                   .Purpose().Coin().Account(1).Change(Bip44Changes.CHAIN_INT))
+
+        for workers in (1, 2):
+            records = run_cli_ndjson(self, ["derive", "--spec", "bip84", "--coin", "bitcoin", "--account", "1",
+                                            "--change", "1", "--start", "5", "--count", "7", "--chunk-size", "3",
+                                            "--workers", str(workers)],
+                                     TEST_MNEMONIC + "\n")
+            self.assertEqual([record["address_index"] for record in records], list(range(5, 12)))
+            for record in records:
+                addr_obj = chg_obj.AddressIndex(record["address_index"])
+                self.assertEqual(record["path"], f"m/84'/0'/1'/1/{record['address_index']}")
+                self.assertEqual(record["address"], addr_obj.PublicKey().ToAddress())
+                self.assertEqual(record["public_key"], addr_obj.PublicKey().RawCompressed().ToHex())
+
+    # Test derive from seed and extended keys
+    def test_derive_bip_sources(self):
+        seed_bytes = Bip39SeedGenerator(TEST_MNEMONIC).Generate("pass")
+        acc_obj = Bip49.FromSeed(seed_bytes, Bip49Coins.LITECOIN).Purpose().Coin().Account(0)
+        chg_obj = acc_obj.Change(Bip44Changes.CHAIN_EXT)
+        exp_addrs = [chg_obj.AddressIndex(i).PublicKey().ToAddress() for i in range(3)]
+
+        argv = ["derive", "--spec", "bip49", "--coin", "litecoin", "--count", "3"]
+        records = run_cli_ndjson(self, argv + ["--mnemonic", TEST_MNEMONIC, "--passphrase", "pass"])
+        self.assertEqual([record["address"] for record in records], exp_addrs)
+        self.assertEqual(records[0]["path"], "m/49'/2'/0'/0/0")
+
+        records = run_cli_ndjson(self, argv + ["--seed", seed_bytes.hex()])
+        self.assertEqual([record["address"] for record in records], exp_addrs)
+
+        records = run_cli_ndjson(self, argv + ["--ex-key", acc_obj.PublicKey().ToExtended()])
+        self.assertEqual([record["address"] for record in records], exp_addrs)
+        self.assertEqual(records[2]["path"], "0/2")
+
+        records = run_cli_ndjson(self, argv + ["--ex-key", chg_obj.PrivateKey().ToExtended()])
+        self.assertEqual([record["address"] for record in records], exp_addrs)
+        self.assertEqual(records[2]["path"], "2")
+
+    # Test derive for Cardano
+    def test_derive_cardano(self):
+        seed_bytes = CardanoIcarusSeedGenerator(TEST_MNEMONIC).Generate()
+        shelley_obj = CardanoShelley.FromCip1852Object(
+            Cip1852.FromSeed(seed_bytes, Cip1852Coins.CARDANO_ICARUS).Purpose().Coin().Account(0)
+        ).Change(Bip44Changes.CHAIN_EXT)
+
+        records = run_cli_ndjson(self, ["derive", "--spec", "cip1852", "--coin", "cardano_icarus", "--count", "3",
+                                        "--mnemonic", TEST_MNEMONIC])
+        for i, record in enumerate(records):
+            self.assertEqual(record["path"], f"m/1852'/1815'/0'/0/{i}")
+            self.assertEqual(record["address"], shelley_obj.AddressIndex(i).PublicKeys().ToAddress())
+
+    # Test derive for Substrate
+    def test_derive_substrate(self):
+        substrate_obj = Substrate.FromSeed(SubstrateBip39SeedGenerator(TEST_MNEMONIC).Generate(),
+                                           SubstrateCoins.POLKADOT)
+
+        records = run_cli_ndjson(self, ["derive", "--spec", "substrate", "--coin", "polkadot", "--start", "2",
+                                        "--count", "5", "--chunk-size", "2", "--mnemonic", TEST_MNEMONIC])
+        self.assertEqual([record["path"] for record in records], [f"/{i}" for i in range(2, 7)])
+        self.assertEqual([record["address"] for record in records],
+                         list(substrate_obj.ChildAddressesRange(2, 7)))
+
+    # Test derive for Monero
+    def test_derive_monero(self):
+        monero = Monero.FromSeed(TEST_MONERO_SEED, MoneroCoins.MONERO_STAGENET)
+
+        for account in (0, 1):
+            records = run_cli_ndjson(self, ["derive", "--spec", "monero", "--coin", "monero_stagenet", "--count", "4",
+                                            "--account", str(account), "--seed", TEST_MONERO_SEED.hex()])
+            for i, record in enumerate(records):
+                self.assertEqual(record["path"], f"{account}/{i}")
+                self.assertEqual(record["address"], monero.Subaddress(i, account))
+
+    # Test derive errors
+    def test_derive_errors(self):
+        for argv in (
+            ["--spec", "bip84", "--coin", "ethereum", "--mnemonic", TEST_MNEMONIC],
+            ["--spec", "bip84", "--coin", "bitcoin", "--mnemonic", "invalid mnemonic"],
+            ["--spec", "bip84", "--coin", "bitcoin", "--mnemonic", TEST_MNEMONIC, "--change", "2"],
+            ["--spec", "bip84", "--coin", "bitcoin", "--mnemonic", TEST_MNEMONIC, "--count", "-1"],
+            ["--spec", "bip84", "--coin", "bitcoin", "--mnemonic", TEST_MNEMONIC, "--workers", "-1"],
+            ["--spec", "bip84", "--coin", "bitcoin", "--ex-key", "xpub"],
+            ["--spec", "substrate", "--coin", "polkadot", "--ex-key", "xpub"],
+            ["--spec", "monero", "--coin", "monero_mainnet", "--mnemonic", TEST_MNEMONIC, "--passphrase", "pass"],
+        ):
+            ret, out, err = run_cli(["derive"] + argv)
+            self.assertEqual(ret, CliConst.EXIT_ERR)
+            self.assertEqual(out, "")
+            self.assertTrue(err.startswith(f"{CliConst.PROG_NAME}: error:"))
+
+    # Test validate
+    def test_validate(self):
+        stdin_str = f"{TEST_BTC_ADDR}\n\n  invalid  \n{TEST_DOT_ADDR}\n"
+
+        records = run_cli_ndjson(self, ["validate", "--workers", "2", "--chunk-size", "1"], stdin_str)
+        self.assertEqual(records, [
+            {"address": TEST_BTC_ADDR, "valid": True, "coins": ["bip84:BITCOIN"]},
+            {"address": "invalid", "valid": False, "coins": []},
+            {"address": TEST_DOT_ADDR, "valid": True, "coins": ["bip44:POLKADOT_ED25519_SLIP", "substrate:POLKADOT"]},
+        ])
+
+        records = run_cli_ndjson(self, ["validate", "--coins", "substrate:polkadot", "substrate:kusama"], stdin_str)
+        self.assertEqual([record["coins"] for record in records], [[], [], ["substrate:POLKADOT"]])
+
+        ret, _, _ = run_cli(["validate", "--coins", "bitcoin"], stdin_str)
+        self.assertEqual(ret, CliConst.EXIT_ERR)
+
+    # Test convert
+    def test_convert(self):
+        records = run_cli_ndjson(self, ["convert", "--to", "substrate", "--coin", "kusama"], f"{TEST_DOT_ADDR}\nxx\n")
+        self.assertEqual(records[0], {
+            "address": TEST_DOT_ADDR,
+            "converted": SubstrateAddrConverter.Convert(TEST_DOT_ADDR, SubstrateCoins.KUSAMA),
+            "error": None,
+        })
+        self.assertEqual(records[1]["address"], "xx")
+        self.assertIsNone(records[1]["converted"])
+        self.assertIsNotNone(records[1]["error"])
+
+        records = run_cli_ndjson(self, ["convert", "--to", "bch_legacy"], TEST_BCH_ADDR)
+        self.assertEqual(records[0]["converted"], TEST_BCH_LEGACY_ADDR)
+        records = run_cli_ndjson(self, ["convert", "--to", "bch", "--hrp", "ecash", "--workers", "2"],
+                                 TEST_BCH_LEGACY_ADDR)
+        self.assertEqual(records[0]["converted"], "ecash:qp90dvzptg759efdcd93s4dkdw0vuhlkmqx4r4yrdh")
+
+        for argv in (["--to", "bch"], ["--to", "substrate"], ["--to", "substrate", "--coin", "bitcoin"]):
+            ret, _, _ = run_cli(["convert"] + argv, TEST_BCH_ADDR)
+            self.assertEqual(ret, CliConst.EXIT_ERR)
+
+    # Test CSV format and progress
+    def test_csv_and_progress(self):
+        ret, out, err = run_cli(["derive", "--spec", "bip84", "--coin", "bitcoin", "--count", "2", "--format", "csv",
+                                 "--mnemonic", TEST_MNEMONIC])
+        self.assertEqual(ret, CliConst.EXIT_OK)
+        rows = list(csv.reader(io.StringIO(out)))
+        self.assertEqual(rows[0], list(CliDeriveRecord._fields))
+        self.assertEqual(rows[1][:3], ["0", "m/84'/0'/0'/0/0", TEST_BTC_ADDR])
+        self.assertEqual(len(rows), 3)
+        self.assertTrue(err.startswith("[bip_utils] done: 2 records"))
+
+        # Lists, booleans and None values
+        stream = io.StringIO()
+        writer = CliWriter(stream, CliOutputFormats.CSV)
+        writer.Write(CliDeriveRecord(0, None, True, ["a", "b"]))
+        self.assertEqual(stream.getvalue(), "address_index,path,address,public_key\n0,,true,a;b\n")
+        self.assertRaises(TypeError, CliWriter, stream, "csv")
+
+        # Periodic progress
+        stream = io.StringIO()
+        progress = CliProgress(stream, interval=0.0)
+        progress.Update(3)
+        progress.Update()
+        self.assertEqual(progress.RecordsNum(), 4)
+        self.assertEqual(len(stream.getvalue().splitlines()), 2)
+        self.assertTrue(stream.getvalue().startswith("[bip_utils] progress: 3 records"))
+
+        progress = CliProgress(None)
+        progress.Update()
+        progress.Finish()
+        self.assertEqual(progress.RecordsNum(), 1)
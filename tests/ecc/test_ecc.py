@@ -38,9 +38,26 @@ from bip_utils import (
     Sr25519PrivateKey, Sr25519PublicKey
 )
 from bip_utils.ecc.conf import EccConf
+from bip_utils.ecc.nist256p1 import nist256p1_keys, nist256p1_point
+from bip_utils.ecc.nist256p1.nist256p1_keys_ecdsa import (
+    Nist256p1PointEcdsa, Nist256p1PrivateKeyEcdsa, Nist256p1PublicKeyEcdsa
+)
 from bip_utils.utils.misc import IntegerUtils
 
 
+# Check if cryptography library is available for nist256p1
+try:
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    from bip_utils.ecc.nist256p1.nist256p1_keys_cryptography import (
+        Nist256p1PointCryptography, Nist256p1PrivateKeyCryptography, Nist256p1PublicKeyCryptography
+    )
+    CRYPTOGRAPHY_AVAILABLE = True
+except ImportError:
+    CRYPTOGRAPHY_AVAILABLE = False
+NIST256P1_USE_CRYPTOGRAPHY = CRYPTOGRAPHY_AVAILABLE and EccConf.USE_CRYPTOGRAPHY
+
+
 # ed25519 order and generator
 ED25519_ORDER = 2**252 + 27742317777372353535851937790883648493
 ED25519_GENERATOR_X = 15112221349535400772501151409588531511454012693041857206046113283949847762202
@@ -422,6 +439,43 @@ class EccTests(unittest.TestCase):
         self.assertTrue(issubclass(Ed25519MoneroPoint, Ed25519Point))
         self.assertEqual(Ed25519MoneroPoint.CurveType(), EllipticCurveTypes.ED25519_MONERO)
 
+    # Test public keys computation from many private keys
+    def test_ed25519_public_keys_from_private(self):
+        for priv_key_cls, priv_key_len in ((Ed25519PrivateKey, 32),
+                                           (Ed25519Blake2bPrivateKey, 32),
+                                           (Ed25519KholawPrivateKey, 64),
+                                           (Ed25519MoneroPrivateKey, 32)):
+            # Public keys are returned without prefix
+            priv_keys_bytes = [
+                binascii.unhexlify(f"{i:02x}" * priv_key_len) for i in range(1, 16)
+            ]
+            pub_keys_bytes = priv_key_cls.PublicKeysFromPrivate(priv_keys_bytes)
+            self.assertEqual(len(pub_keys_bytes), len(priv_keys_bytes))
+            for priv_key_bytes, pub_key_bytes in zip(priv_keys_bytes, pub_keys_bytes):
+                self.assertEqual(
+                    pub_key_bytes,
+                    priv_key_cls.FromBytes(priv_key_bytes).PublicKey().RawCompressed().ToBytes()[-32:]
+                )
+            self.assertEqual(priv_key_cls.PublicKeysFromPrivate([]), [])
+
+        # Test vectors
+        self.assertEqual(Ed25519PrivateKey.PublicKeysFromPrivate([TEST_ED25519_PRIV_KEY_BYTES]),
+                         [TEST_ED25519_COMPR_PUB_KEY_BYTES[1:]])
+        self.assertEqual(Ed25519Blake2bPrivateKey.PublicKeysFromPrivate([TEST_ED25519_BLAKE2B_PRIV_KEY_BYTES]),
+                         [TEST_ED25519_BLAKE2B_COMPR_PUB_KEY_BYTES[1:]])
+        self.assertEqual(Ed25519KholawPrivateKey.PublicKeysFromPrivate([TEST_ED25519_KHOLAW_PRIV_KEY_BYTES]),
+                         [TEST_ED25519_KHOLAW_COMPR_PUB_KEY_BYTES[1:]])
+        self.assertEqual(Ed25519MoneroPrivateKey.PublicKeysFromPrivate([TEST_ED25519_MONERO_PRIV_KEY_BYTES]),
+                         [TEST_ED25519_MONERO_COMPR_PUB_KEY_BYTES])
+
+        # Invalid keys
+        for test in TEST_VECT_ED25519_PRIV_KEY_INVALID:
+            self.assertRaises(ValueError, Ed25519PrivateKey.PublicKeysFromPrivate, [binascii.unhexlify(test)])
+            self.assertRaises(ValueError, Ed25519Blake2bPrivateKey.PublicKeysFromPrivate, [binascii.unhexlify(test)])
+            self.assertRaises(ValueError, Ed25519KholawPrivateKey.PublicKeysFromPrivate, [binascii.unhexlify(test)])
+        for test in TEST_VECT_ED25519_MONERO_PRIV_KEY_INVALID:
+            self.assertRaises(ValueError, Ed25519MoneroPrivateKey.PublicKeysFromPrivate, [binascii.unhexlify(test)])
+
     # Test Nist256p1 class
     def test_nist256p1(self):
         # Curve
@@ -432,6 +486,10 @@ class EccTests(unittest.TestCase):
         self.assertTrue(Nist256p1.PointClass() is Nist256p1Point)
         self.assertTrue(Nist256p1.PublicKeyClass() is Nist256p1PublicKey)
         self.assertTrue(Nist256p1.PrivateKeyClass() is Nist256p1PrivateKey)
+        # Compatibility modules
+        self.assertTrue(nist256p1_point.Nist256p1Point is Nist256p1Point)
+        self.assertTrue(nist256p1_keys.Nist256p1PublicKey is Nist256p1PublicKey)
+        self.assertTrue(nist256p1_keys.Nist256p1PrivateKey is Nist256p1PrivateKey)
 
         #
         # Public key
@@ -445,7 +503,7 @@ class EccTests(unittest.TestCase):
         self.assertTrue(isinstance(pub_key.RawCompressed(), DataBytes))
         self.assertTrue(isinstance(pub_key.RawUncompressed(), DataBytes))
         self.assertTrue(isinstance(pub_key.Point(), Nist256p1Point))
-        self.assertTrue(isinstance(pub_key.UnderlyingObject(), ecdsa.VerifyingKey))
+        self.assertTrue(isinstance(pub_key.UnderlyingObject(), ec.EllipticCurvePublicKey if NIST256P1_USE_CRYPTOGRAPHY else ecdsa.VerifyingKey))
         self.assertEqual(pub_key.RawCompressed().ToBytes(), TEST_NIST256P1_COMPR_PUB_KEY_BYTES)
         self.assertEqual(pub_key.RawUncompressed().ToBytes(), TEST_NIST256P1_UNCOMPR_PUB_KEY_BYTES)
         # From uncompressed
@@ -468,7 +526,7 @@ class EccTests(unittest.TestCase):
         priv_key = Nist256p1PrivateKey.FromBytes(TEST_NIST256P1_PRIV_KEY_BYTES)
         self.assertTrue(isinstance(priv_key.Raw(), DataBytes))
         self.assertTrue(isinstance(priv_key.PublicKey(), Nist256p1PublicKey))
-        self.assertTrue(isinstance(priv_key.UnderlyingObject(), ecdsa.SigningKey))
+        self.assertTrue(isinstance(priv_key.UnderlyingObject(), ec.EllipticCurvePrivateKey if NIST256P1_USE_CRYPTOGRAPHY else ecdsa.SigningKey))
         self.assertEqual(priv_key.Raw().ToBytes(), TEST_NIST256P1_PRIV_KEY_BYTES)
         self.assertEqual(priv_key.PublicKey().RawCompressed().ToBytes(), TEST_NIST256P1_COMPR_PUB_KEY_BYTES)
 
@@ -481,7 +539,7 @@ class EccTests(unittest.TestCase):
         self.assertTrue(isinstance(point.Raw(), DataBytes))
         self.assertTrue(isinstance(point.RawDecoded(), DataBytes))
         self.assertTrue(isinstance(point.RawEncoded(), DataBytes))
-        self.assertTrue(isinstance(point.UnderlyingObject(), ellipticcurve.PointJacobi))
+        self.assertTrue(isinstance(point.UnderlyingObject(), ec.EllipticCurvePublicKey if NIST256P1_USE_CRYPTOGRAPHY else ellipticcurve.PointJacobi))
         self.assertEqual(point.X(), TEST_NIST256P1_POINT_COORD["x"])
         self.assertEqual(point.Y(), TEST_NIST256P1_POINT_COORD["y"])
         self.assertEqual(point.Raw().ToBytes(), TEST_NIST256P1_POINT_DEC_BYTES)
@@ -514,6 +572,52 @@ class EccTests(unittest.TestCase):
         self.assertEqual(point.Y(), TEST_NIST256P1_POINT_COORD["y"])
         self.assertEqual(point.Raw().ToBytes(), TEST_NIST256P1_POINT_DEC_BYTES)
 
+    # Test Nist256p1 cryptography backend against the ecdsa one
+    @unittest.skipIf(not CRYPTOGRAPHY_AVAILABLE, "cryptography library not installed")
+    def test_nist256p1_backends(self):
+        backends = (
+            (Nist256p1PointEcdsa, Nist256p1PublicKeyEcdsa, Nist256p1PrivateKeyEcdsa),
+            (Nist256p1PointCryptography, Nist256p1PublicKeyCryptography, Nist256p1PrivateKeyCryptography),
+        )
+        generators = [point_cls.FromCoordinates(generator_256.x(), generator_256.y()) for point_cls, _, _ in backends]
+
+        for point_cls, pub_key_cls, priv_key_cls in backends:
+            # Keys
+            priv_key = priv_key_cls.FromBytes(TEST_NIST256P1_PRIV_KEY_BYTES)
+            self.assertEqual(priv_key.Raw().ToBytes(), TEST_NIST256P1_PRIV_KEY_BYTES)
+            self.assertEqual(priv_key.PublicKey().RawCompressed().ToBytes(), TEST_NIST256P1_COMPR_PUB_KEY_BYTES)
+            self.assertEqual(priv_key.PublicKey().RawUncompressed().ToBytes(), TEST_NIST256P1_UNCOMPR_PUB_KEY_BYTES)
+            for pub_key_bytes in (TEST_NIST256P1_COMPR_PUB_KEY_BYTES, TEST_NIST256P1_UNCOMPR_PUB_KEY_BYTES):
+                pub_key = pub_key_cls.FromBytes(pub_key_bytes)
+                self.assertEqual(pub_key.RawCompressed().ToBytes(), TEST_NIST256P1_COMPR_PUB_KEY_BYTES)
+                self.assertEqual(pub_key.RawUncompressed().ToBytes(), TEST_NIST256P1_UNCOMPR_PUB_KEY_BYTES)
+
+            # Points
+            for point_bytes in (TEST_NIST256P1_POINT_DEC_BYTES, TEST_NIST256P1_POINT_ENC_BYTES):
+                point = point_cls.FromBytes(point_bytes)
+                self.assertEqual(point.RawDecoded().ToBytes(), TEST_NIST256P1_POINT_DEC_BYTES)
+                self.assertEqual(point.RawEncoded().ToBytes(), TEST_NIST256P1_POINT_ENC_BYTES)
+            self.assertEqual((point + point).X(), TEST_NIST256P1_POINT_COORD_ADD["x"])
+            self.assertEqual((point * 2).Y(), TEST_NIST256P1_POINT_COORD_MUL["y"])
+
+            # Invalid keys
+            for test in TEST_VECT_NIST256P1_PUB_KEY_INVALID:
+                self.assertRaises(ValueError, pub_key_cls.FromBytes, binascii.unhexlify(test))
+            for test in TEST_VECT_NIST256P1_PRIV_KEY_INVALID:
+                self.assertRaises(ValueError, priv_key_cls.FromBytes, binascii.unhexlify(test))
+
+        # Same results for generator and generic point operations
+        for i in range(1, 20):
+            scalar = i * 0x1234567890ABCDEF1234567890ABCDEF1234567890ABCDEF
+            res = []
+            for generator in generators:
+                point = generator * scalar
+                res.append((point.Raw().ToBytes(),
+                            (point + generator).Raw().ToBytes(),
+                            (point + point).Raw().ToBytes(),
+                            (point * (scalar + i)).Raw().ToBytes()))
+            self.assertEqual(res[0], res[1])
+
     # Test Secp256k1 class
     def test_secp256k1(self):
         # Curve
@@ -0,0 +1,118 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from ecdsa.ecdsa import curve_256, curve_secp256k1, generator_256, generator_secp256k1
+
+from bip_utils.ecc.ecdsa.ecdsa_gen_table import EcdsaGeneratorTable
+
+
+# Curves to be tested
+TEST_CURVES = [
+    (curve_secp256k1, generator_secp256k1),
+    (curve_256, generator_256),
+]
+
+# Scalars, including the ones giving edge cases in signed windows
+TEST_SCALARS = [
+    1, 2, 127, 128, 129, 255, 256, 0x8080, 0x7F80FF,
+    0x80 << 248,
+    2**256 - 1,
+    0x4DF8B4A5A5B6D94BD0F4BFC9E8A3E94A3D0BEB5EC2FE90D1A6C1F2D4A7D39B21,
+    0xE44C51393E98A691439F74C2060138FA2BCEFAE59AB277BD81907C93FB16FCE1,
+]
+
+
+# Tests
+class EcdsaGeneratorTableTests(unittest.TestCase):
+    # Test multiplication
+    def test_multiply(self):
+        for curve, generator in TEST_CURVES:
+            table = self.__new_table(curve, generator)
+            self.assertFalse(table.IsBuilt())
+
+            for scalar in TEST_SCALARS + [generator.order() - 1, generator.order() + 5]:
+                point = generator * scalar
+                self.assertEqual(table.Multiply(scalar), (point.x(), point.y()))
+            self.assertTrue(table.IsBuilt())
+
+            # Point at infinity
+            self.assertRaises(ValueError, table.Multiply, 0)
+            self.assertRaises(ValueError, table.Multiply, generator.order())
+
+            table.Clear()
+            self.assertFalse(table.IsBuilt())
+
+    # Test multiplication from multiple threads
+    def test_multiply_threads(self):
+        curve, generator = TEST_CURVES[0]
+        table = self.__new_table(curve, generator)
+
+        # Count the table computations
+        compute_fct = table._EcdsaGeneratorTable__Compute
+        compute_calls = []
+
+        def compute():
+            compute_calls.append(None)
+            return compute_fct()
+
+        table._EcdsaGeneratorTable__Compute = compute
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            points = list(executor.map(table.Multiply, TEST_SCALARS))
+
+        self.assertEqual(len(compute_calls), 1)
+        for scalar, point in zip(TEST_SCALARS, points):
+            point_exp = generator * scalar
+            self.assertEqual(point, (point_exp.x(), point_exp.y()))
+
+    # Test save and load
+    def test_save_load(self):
+        curve, generator = TEST_CURVES[0]
+
+        table = self.__new_table(curve, generator)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "table.bin")
+            table.Save(file_path)
+
+            table_loaded = self.__new_table(curve, generator)
+            table_loaded.Load(file_path)
+            self.assertTrue(table_loaded.IsBuilt())
+            for scalar in TEST_SCALARS:
+                self.assertEqual(table_loaded.Multiply(scalar), table.Multiply(scalar))
+
+            # Wrong curve
+            curve_other, generator_other = TEST_CURVES[1]
+            self.assertRaises(ValueError, self.__new_table(curve_other, generator_other).Load, file_path)
+
+            # Corrupted file
+            with open(file_path, "r+b") as fout:
+                fout.seek(100)
+                fout.write(b"\x00\x01\x02\x03")
+            self.assertRaises(ValueError, self.__new_table(curve, generator).Load, file_path)
+
+    # Create a new table
+    @staticmethod
+    def __new_table(curve, generator):
+        return EcdsaGeneratorTable(curve.p(), curve.a(), generator.order(), generator.x(), generator.y())
@@ -203,6 +203,20 @@ class ElectrumV1MnemonicTests(unittest.TestCase):
             self.assertRaises(ValueError, ElectrumV1MnemonicGenerator().FromWordsNumber, test_words_num - 1)
             self.assertRaises(ValueError, ElectrumV1MnemonicGenerator().FromWordsNumber, test_words_num + 1)
 
+
+    # Test generation of multiple mnemonics
+    def test_generate_many(self):
+        for test_words_num in ElectrumV1WordsNum:
+            mnemonics = list(ElectrumV1MnemonicGenerator().GenerateMany(50, test_words_num))
+            self.assertEqual(50, len(mnemonics))
+            for mnemonic in mnemonics:
+                self.assertEqual(mnemonic.WordsCount(), test_words_num)
+                self.assertTrue(ElectrumV1MnemonicValidator().IsValid(mnemonic))
+
+        self.assertEqual([], list(ElectrumV1MnemonicGenerator().GenerateMany(0, ElectrumV1WordsNum.WORDS_NUM_12)))
+        self.assertRaises(ValueError, ElectrumV1MnemonicGenerator().GenerateMany, -1, ElectrumV1WordsNum.WORDS_NUM_12)
+        self.assertRaises(ValueError, ElectrumV1MnemonicGenerator().GenerateMany, 1, ElectrumV1WordsNum.WORDS_NUM_12 + 1)
+
     # Tests invalid mnemonic
     def test_invalid_mnemonic(self):
         for test in TEST_VECT_MNEMONIC_INVALID:
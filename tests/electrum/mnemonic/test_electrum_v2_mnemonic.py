@@ -240,6 +240,20 @@ class ElectrumV2MnemonicTests(unittest.TestCase):
             self.assertRaises(ValueError, ElectrumV2MnemonicGenerator(ElectrumV2MnemonicTypes.STANDARD).FromWordsNumber, test_words_num - 1)
             self.assertRaises(ValueError, ElectrumV2MnemonicGenerator(ElectrumV2MnemonicTypes.STANDARD).FromWordsNumber, test_words_num + 1)
 
+
+    # Test generation of multiple mnemonics
+    def test_generate_many(self):
+        for test_words_num in ElectrumV2WordsNum:
+            mnemonics = list(ElectrumV2MnemonicGenerator(ElectrumV2MnemonicTypes.STANDARD).GenerateMany(10, test_words_num))
+            self.assertEqual(10, len(mnemonics))
+            for mnemonic in mnemonics:
+                self.assertEqual(mnemonic.WordsCount(), test_words_num)
+                self.assertTrue(ElectrumV2MnemonicValidator(ElectrumV2MnemonicTypes.STANDARD).IsValid(mnemonic))
+
+        self.assertEqual([], list(ElectrumV2MnemonicGenerator(ElectrumV2MnemonicTypes.STANDARD).GenerateMany(0, ElectrumV2WordsNum.WORDS_NUM_12)))
+        self.assertRaises(ValueError, ElectrumV2MnemonicGenerator(ElectrumV2MnemonicTypes.STANDARD).GenerateMany, -1, ElectrumV2WordsNum.WORDS_NUM_12)
+        self.assertRaises(ValueError, ElectrumV2MnemonicGenerator(ElectrumV2MnemonicTypes.STANDARD).GenerateMany, 1, ElectrumV2WordsNum.WORDS_NUM_12 + 1)
+
     # Tests invalid mnemonic
     def test_invalid_mnemonic(self):
         for test in TEST_VECT_MNEMONIC_INVALID:
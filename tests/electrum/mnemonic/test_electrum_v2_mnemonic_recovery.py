@@ -0,0 +1,82 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import binascii
+import functools
+import operator
+import unittest
+
+from bip_utils import (
+    ElectrumV2Languages, ElectrumV2MnemonicRecovery, ElectrumV2MnemonicTypes, ElectrumV2MnemonicValidator,
+    MnemonicRecoveryResult
+)
+
+
+# Tests for recovery
+TEST_VECT = [
+    # Unknown word
+    {
+        "mnemonic": "buddy immune recycle material point ? easily order diesel globe differ awkward",
+        "mnemonic_type": ElectrumV2MnemonicTypes.STANDARD,
+        "exp_mnemonic": "buddy immune recycle material point hotel easily order diesel globe differ awkward",
+        "exp_seed": b"f0757e2a00a3e70c5042ffb688a9049e0a627f870addef552db6ffde05e8e58db162387a3d257d27e8697c3ba6225a5a9c3ed91571b9db1fdbef6df701d4b381",
+    },
+    # Misspelled word (any type)
+    {
+        "mnemonic": "stone aware venture warfare egg urge dignity vesel atom slot marble humble",
+        "mnemonic_type": None,
+        "exp_mnemonic": "stone aware venture warfare egg urge dignity vessel atom slot marble humble",
+        "exp_seed": b"82344b5c5fbb817563932bfa4ad649b405215d02d3403b1fe1405fdde82d53471191d2d9342c3a2f06f631d6d23eb7d52df816a132168d081c0cf7b3b13a3e20",
+    },
+]
+
+
+#
+# Tests
+#
+class ElectrumV2MnemonicRecoveryTests(unittest.TestCase):
+    # Run all tests in test vector
+    def test_vector(self):
+        for test in TEST_VECT:
+            recovery = ElectrumV2MnemonicRecovery(test["mnemonic"], test["mnemonic_type"], ElectrumV2Languages.ENGLISH)
+
+            candidates = list(recovery.GenerateCandidates())
+            self.assertIn(test["exp_mnemonic"], [candidate.ToStr() for candidate in candidates])
+            # The version filter shall discard most of the candidates
+            self.assertLess(len(candidates), recovery.CandidatesNum())
+            for candidate in candidates:
+                self.assertTrue(ElectrumV2MnemonicValidator(test["mnemonic_type"]).IsValid(candidate))
+
+            seed_bytes = binascii.unhexlify(test["exp_seed"])
+            for workers in (1, 2):
+                res = recovery.Recover(functools.partial(operator.eq, seed_bytes), workers=workers, chunk_size=2)
+
+                self.assertTrue(isinstance(res, MnemonicRecoveryResult))
+                self.assertEqual(test["exp_mnemonic"], res.mnemonic.ToStr())
+                self.assertEqual(seed_bytes, res.seed_bytes)
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        mnemonic = TEST_VECT[0]["mnemonic"]
+
+        self.assertRaises(ValueError, ElectrumV2MnemonicRecovery, mnemonic + " ?")
+        self.assertRaises(TypeError, ElectrumV2MnemonicRecovery, mnemonic, 0)
+        self.assertRaises(TypeError, ElectrumV2MnemonicRecovery, mnemonic, ElectrumV2MnemonicTypes.STANDARD, 0)
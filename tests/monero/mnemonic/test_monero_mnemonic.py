@@ -344,6 +344,20 @@ class MoneroMnemonicTests(unittest.TestCase):
             if test_words_num + 1 not in monero_int_words_num:
                 self.assertRaises(ValueError, MoneroMnemonicGenerator().FromWordsNumber, test_words_num + 1)
 
+
+    # Test generation of multiple mnemonics
+    def test_generate_many(self):
+        for test_words_num in MoneroWordsNum:
+            mnemonics = list(MoneroMnemonicGenerator().GenerateMany(50, test_words_num))
+            self.assertEqual(50, len(mnemonics))
+            for mnemonic in mnemonics:
+                self.assertEqual(mnemonic.WordsCount(), test_words_num)
+                self.assertTrue(MoneroMnemonicValidator().IsValid(mnemonic))
+
+        self.assertEqual([], list(MoneroMnemonicGenerator().GenerateMany(0, MoneroWordsNum.WORDS_NUM_25)))
+        self.assertRaises(ValueError, MoneroMnemonicGenerator().GenerateMany, -1, MoneroWordsNum.WORDS_NUM_25)
+        self.assertRaises(ValueError, MoneroMnemonicGenerator().GenerateMany, 1, MoneroWordsNum.WORDS_NUM_25 + 1)
+
     # Tests invalid mnemonic
     def test_invalid_mnemonic(self):
         for test in TEST_VECT_MNEMONIC_INVALID:
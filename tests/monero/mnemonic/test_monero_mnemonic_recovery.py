@@ -0,0 +1,84 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import binascii
+import functools
+import operator
+import unittest
+
+from bip_utils import MnemonicRecoveryResult, MoneroLanguages, MoneroMnemonicRecovery, MoneroMnemonicValidator
+
+
+# Tests for recovery
+TEST_VECT = [
+    # Unknown checksum word
+    {
+        "mnemonic": "niece bifocals uttered robot romance gaze faxed perfect laptop fall hold strained ?",
+        "exp_mnemonic": "niece bifocals uttered robot romance gaze faxed perfect laptop fall hold strained bifocals",
+        "exp_seed": b"fbd0bad023e0b398be458ad3979e396d",
+        "exp_valid_num": 1,
+    },
+    # Unknown word
+    {
+        "mnemonic": "zigzags dapper purged rover ? coal tender jackets whale twang sapling tender dapper",
+        "exp_mnemonic": "zigzags dapper purged rover erosion coal tender jackets whale twang sapling tender dapper",
+        "exp_seed": b"e52b3282686b5fe58043098990a06718",
+        "exp_valid_num": None,
+    },
+    # Misspelled word (no checksum)
+    {
+        "mnemonic": "zigzags dapper purged rover erosoin coal tender jackets whale twang sapling tender",
+        "exp_mnemonic": "zigzags dapper purged rover erosion coal tender jackets whale twang sapling tender",
+        "exp_seed": b"e52b3282686b5fe58043098990a06718",
+        "exp_valid_num": None,
+    },
+]
+
+
+#
+# Tests
+#
+class MoneroMnemonicRecoveryTests(unittest.TestCase):
+    # Run all tests in test vector
+    def test_vector(self):
+        for test in TEST_VECT:
+            recovery = MoneroMnemonicRecovery(test["mnemonic"], MoneroLanguages.ENGLISH)
+
+            candidates = list(recovery.GenerateCandidates())
+            if test["exp_valid_num"] is not None:
+                self.assertEqual(test["exp_valid_num"], len(candidates))
+            self.assertIn(test["exp_mnemonic"], [candidate.ToStr() for candidate in candidates])
+            for candidate in candidates:
+                self.assertTrue(MoneroMnemonicValidator(MoneroLanguages.ENGLISH).IsValid(candidate))
+
+            seed_bytes = binascii.unhexlify(test["exp_seed"])
+            res = recovery.Recover(functools.partial(operator.eq, seed_bytes), workers=1)
+
+            self.assertTrue(isinstance(res, MnemonicRecoveryResult))
+            self.assertEqual(test["exp_mnemonic"], res.mnemonic.ToStr())
+            self.assertEqual(seed_bytes, res.seed_bytes)
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        mnemonic = TEST_VECT[0]["mnemonic"]
+
+        self.assertRaises(ValueError, MoneroMnemonicRecovery, mnemonic + " ?")
+        self.assertRaises(TypeError, MoneroMnemonicRecovery, mnemonic, 0)
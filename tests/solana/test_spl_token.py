@@ -19,6 +19,7 @@
 # THE SOFTWARE.
 
 # Imports
+import itertools
 import unittest
 
 from bip_utils import SplToken
@@ -65,6 +66,30 @@ class SplTokenTests(unittest.TestCase):
             pda = SplToken.GetAssociatedTokenAddress(test["wallet_address"], test["token_mint_address"])
             self.assertEqual(test["pda"], pda)
 
+    # Test associated token addresses
+    def test_associated_token_addresses(self):
+        wallet_addrs = list(dict.fromkeys(test["wallet_address"] for test in TEST_VECT))
+        token_mint_addrs = list(dict.fromkeys(test["token_mint_address"] for test in TEST_VECT))
+        exp_pdas = [
+            SplToken.GetAssociatedTokenAddress(wallet_addr, token_mint_addr)
+            for wallet_addr, token_mint_addr in itertools.product(wallet_addrs, token_mint_addrs)
+        ]
+
+        self.assertEqual(exp_pdas, list(SplToken.GetAssociatedTokenAddresses(wallet_addrs, token_mint_addrs)))
+        self.assertEqual(exp_pdas, list(SplToken.GetAssociatedTokenAddresses(wallet_addrs,
+                                                                             token_mint_addrs,
+                                                                             chunk_size=3)))
+        self.assertEqual(exp_pdas, list(SplToken.GetAssociatedTokenAddresses(wallet_addrs,
+                                                                             token_mint_addrs,
+                                                                             SplTokenConst.DEF_TOKEN_PROGRAM_ID,
+                                                                             workers=2,
+                                                                             chunk_size=4)))
+        for test in TEST_VECT:
+            self.assertTrue(
+                test["pda"] in SplToken.GetAssociatedTokenAddresses([test["wallet_address"]], token_mint_addrs)
+            )
+        self.assertEqual([], list(SplToken.GetAssociatedTokenAddresses(wallet_addrs, [])))
+
     # Test invalid parameters
     def test_invalid_params(self):
         # GetAssociatedTokenAddress
@@ -96,3 +121,28 @@ class SplTokenTests(unittest.TestCase):
         self.assertRaises(ValueError, SplToken.FindPda, ["\x00" for _ in range(SplTokenConst.SEEDS_MAX_NUM + 1)], "")
         self.assertRaises(ValueError, SplToken.FindPda, ["\x00", "\x00" * 33, "\x00"], "")
         self.assertRaises(ValueError, SplToken.FindPda, ["\x00", "\x00"], "kkqJgedV2iZeiLdU9qa8SFT5Zv13JRorbW87bjAnkb")
+        # GetAssociatedTokenAddresses
+        self.assertRaises(ValueError,
+                          SplToken.GetAssociatedTokenAddresses,
+                          ["7UVttrLkRkZFn4FsTuihX5zCJ1ounF5Ts8CkSqPGN2Dh",
+                           "kkqJgedV2iZeiLdU9qa8SFT5Zv13JRorbW87bjAnkb"],
+                          ["7UVttrLkRkZFn4FsTuihX5zCJ1ounF5Ts8CkSqPGN2Dh"])
+        self.assertRaises(ValueError,
+                          SplToken.GetAssociatedTokenAddresses,
+                          ["7UVttrLkRkZFn4FsTuihX5zCJ1ounF5Ts8CkSqPGN2Dh"],
+                          ["kkqJgedV2iZeiLdU9qa8SFT5Zv13JRorbW87bjAnkb"])
+        self.assertRaises(ValueError,
+                          SplToken.GetAssociatedTokenAddresses,
+                          ["7UVttrLkRkZFn4FsTuihX5zCJ1ounF5Ts8CkSqPGN2Dh"],
+                          ["7UVttrLkRkZFn4FsTuihX5zCJ1ounF5Ts8CkSqPGN2Dh"],
+                          "kkqJgedV2iZeiLdU9qa8SFT5Zv13JRorbW87bjAnkb")
+        self.assertRaises(ValueError,
+                          SplToken.GetAssociatedTokenAddresses,
+                          ["7UVttrLkRkZFn4FsTuihX5zCJ1ounF5Ts8CkSqPGN2Dh"],
+                          ["7UVttrLkRkZFn4FsTuihX5zCJ1ounF5Ts8CkSqPGN2Dh"],
+                          workers=0)
+        self.assertRaises(ValueError,
+                          SplToken.GetAssociatedTokenAddresses,
+                          ["7UVttrLkRkZFn4FsTuihX5zCJ1ounF5Ts8CkSqPGN2Dh"],
+                          ["7UVttrLkRkZFn4FsTuihX5zCJ1ounF5Ts8CkSqPGN2Dh"],
+                          chunk_size=0)
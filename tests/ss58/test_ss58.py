@@ -22,7 +22,7 @@
 import binascii
 import unittest
 
-from bip_utils import SS58ChecksumError, SS58Decoder, SS58Encoder
+from bip_utils import SS58ChecksumError, SS58Codec, SS58Decoder, SS58Encoder
 from bip_utils.ss58.ss58 import SS58Const
 
 
@@ -60,6 +60,13 @@ TEST_VECT = [
     },
 ]
 
+# Test vector for strings with a non-canonical format encoding (format 0 encoded as 0x40 0x00)
+TEST_VECT_NON_CANONICAL = {
+    "raw": b"facc4de5b7745215ec8255c743f044d2a94ef72b2fb6d8e22c35ffbc3ac8ac9e",
+    "ss58_format": 0,
+    "encode": "VBtjCfsaxFHpCHh82qY8hRBpmPBrKSk2dkkjG7qdk8dBkNGYF",
+}
+
 # Tests for SS58 decode with invalid strings
 TEST_VECT_DEC_INVALID = [
     # Invalid data length
@@ -100,6 +107,14 @@ class SS58Tests(unittest.TestCase):
             self.assertEqual((test["ss58_format"], test["raw"]),
                              (ss58_format, binascii.hexlify(dec)))
 
+    # Test decoder with non-canonical format bytes
+    def test_decoder_non_canonical(self):
+        test = TEST_VECT_NON_CANONICAL
+        raw = binascii.unhexlify(test["raw"])
+
+        self.assertEqual((test["ss58_format"], raw), SS58Decoder.Decode(test["encode"]))
+        self.assertEqual(raw, SS58Codec.FromFormat(test["ss58_format"]).Decode(test["encode"]))
+
     # Test encoder
     def test_encoder(self):
         for test in TEST_VECT:
@@ -121,3 +136,38 @@ class SS58Tests(unittest.TestCase):
     def test_invalid_decode(self):
         for test in TEST_VECT_DEC_INVALID:
             self.assertRaises(test["ex"], SS58Decoder.Decode, test["enc"])
+
+    # Test codec
+    def test_codec(self):
+        for test in TEST_VECT:
+            codec = SS58Codec.FromFormat(test["ss58_format"])
+            raw = binascii.unhexlify(test["raw"])
+
+            self.assertEqual(test["ss58_format"], codec.Format())
+            self.assertTrue(codec is SS58Codec.FromFormat(test["ss58_format"]))
+            self.assertEqual(test["encode"], codec.Encode(raw))
+            self.assertEqual(raw, codec.Decode(test["encode"]))
+            self.assertEqual([test["encode"]] * 2, codec.EncodeMany([raw, raw]))
+            self.assertEqual([raw] * 2, codec.DecodeMany([test["encode"], test["encode"]]))
+            # Re-encode from all other formats
+            self.assertEqual([test["encode"]] * len(TEST_VECT),
+                             codec.ReencodeMany([SS58Encoder.Encode(raw, t["ss58_format"]) for t in TEST_VECT]))
+            self.assertEqual(test["encode"], codec.Reencode(test["encode"]))
+
+    # Test invalid codec calls
+    def test_invalid_codec(self):
+        data_len = SS58Const.DATA_BYTE_LEN
+
+        self.assertRaises(ValueError, SS58Codec, SS58Const.FORMAT_MAX_VAL + 1)
+        self.assertRaises(ValueError, SS58Codec, -1)
+        for reserved_format in SS58Const.RESERVED_FORMATS:
+            self.assertRaises(ValueError, SS58Codec, reserved_format)
+
+        codec = SS58Codec(0)
+        self.assertRaises(ValueError, codec.Encode, (data_len - 1) * b"\x00")
+        self.assertRaises(ValueError, codec.EncodeMany, [data_len * b"\x00", (data_len + 1) * b"\x00"])
+        # Format different from the codec one
+        self.assertRaises(ValueError, codec.Decode, TEST_VECT[1]["encode"])
+        for test in TEST_VECT_DEC_INVALID:
+            self.assertRaises(test["ex"], codec.Decode, test["enc"])
+            self.assertRaises(test["ex"], codec.Reencode, test["enc"])
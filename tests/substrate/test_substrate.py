@@ -24,7 +24,7 @@ import unittest
 
 from bip_utils import (
     Sr25519PrivateKey, Sr25519PublicKey, Substrate, SubstrateCoins, SubstrateKeyError, SubstratePath, SubstratePathElem,
-    SubstratePrivateKey, SubstratePublicKey
+    SubstratePathError, SubstratePrivateKey, SubstratePublicKey
 )
 from bip_utils.substrate.conf import SubstrateCoinConf
 from bip_utils.substrate.substrate import SubstrateConst
@@ -584,6 +584,34 @@ class SubstrateTests(unittest.TestCase):
         substrate_ctx.ConvertToPublic()
         self.__test_public_derivation(test_vect, substrate_ctx)
 
+    # Test derivation of children ranges
+    def test_children_range(self):
+        for test in TEST_VECT:
+            substrate_ctx = Substrate.FromSeedAndPath(binascii.unhexlify(test["seed"]), "//hard", test["coin"])
+            start, stop = 250, 260
+
+            pub_keys = [
+                substrate_ctx.ChildKey(f"/{i}").PublicKey().RawCompressed().ToBytes() for i in range(start, stop)
+            ]
+            addrs = [substrate_ctx.ChildKey(f"/{i}").PublicKey().ToAddress() for i in range(start, stop)]
+
+            self.assertEqual(pub_keys, list(substrate_ctx.ChildPublicKeysRange(start, stop)))
+            self.assertEqual(addrs, list(substrate_ctx.ChildAddressesRange(start, stop)))
+            self.assertEqual(addrs, list(substrate_ctx.ChildAddressesRange(start, stop, chunk_size=3)))
+            self.assertEqual(addrs, list(substrate_ctx.ChildAddressesRange(start, stop, workers=2, chunk_size=4)))
+            self.assertEqual([], list(substrate_ctx.ChildAddressesRange(start, start)))
+
+            # Public-only object
+            substrate_ctx.ConvertToPublic()
+            self.assertEqual(addrs, list(substrate_ctx.ChildAddressesRange(start, stop)))
+
+        substrate_ctx = Substrate.FromSeed(TEST_SEED, SubstrateCoins.POLKADOT)
+        self.assertRaises(SubstratePathError, substrate_ctx.ChildAddressesRange, -1, 5)
+        self.assertRaises(SubstratePathError, substrate_ctx.ChildAddressesRange, 5, 4)
+        self.assertRaises(SubstratePathError, substrate_ctx.ChildAddressesRange, 0, 2**256 + 1)
+        self.assertRaises(ValueError, substrate_ctx.ChildAddressesRange, 0, 5, 0)
+        self.assertRaises(ValueError, substrate_ctx.ChildAddressesRange, 0, 5, 1, 0)
+
     # Test addresses of other coins
     def test_coins_addr(self):
         for test in TEST_VECT_ADDR:
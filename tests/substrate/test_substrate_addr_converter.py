@@ -0,0 +1,87 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# Imports
+import binascii
+import unittest
+
+from bip_utils import (
+    SS58ChecksumError, SS58Encoder, SubstrateAddrConverter, SubstrateCoins, SubstrateSr25519AddrEncoder
+)
+from bip_utils.substrate.conf import SubstrateConfGetter
+
+
+# Public key for testing
+TEST_PUB_KEY = binascii.unhexlify(b"66933bd1f37070ef87bd1198af3dacceb095237f803f3d32b173e6b425ed7972")
+
+# Tests for invalid addresses
+TEST_VECT_ADDR_INVALID = [
+    # Invalid checksum
+    {
+        "addr": "111111111111111111111111111111111D1n",
+        "ex": SS58ChecksumError,
+    },
+    # Invalid data length
+    {
+        "addr": "111111111111111111111111111111117dG",
+        "ex": ValueError,
+    },
+]
+
+
+#
+# Tests
+#
+class SubstrateAddrConverterTests(unittest.TestCase):
+    # Test conversion
+    def test_convert(self):
+        addrs = {
+            coin_type: SubstrateSr25519AddrEncoder.EncodeKey(
+                TEST_PUB_KEY, ss58_format=SubstrateConfGetter.GetConfig(coin_type).SS58Format()
+            )
+            for coin_type in SubstrateCoins
+        }
+
+        for coin_type, addr in addrs.items():
+            # Convert
+            self.assertEqual(addr, SubstrateAddrConverter.Convert(addrs[SubstrateCoins.POLKADOT], coin_type))
+            self.assertEqual([addr] * len(addrs), SubstrateAddrConverter.ConvertMany(addrs.values(), coin_type))
+            # Convert to all
+            self.assertEqual(addrs, SubstrateAddrConverter.ConvertToAll(addr))
+            self.assertEqual(
+                {SubstrateCoins.KUSAMA: addrs[SubstrateCoins.KUSAMA]},
+                SubstrateAddrConverter.ConvertToAll(addr, [SubstrateCoins.KUSAMA])
+            )
+
+        # Address with a format not belonging to any coin
+        self.assertEqual(addrs, SubstrateAddrConverter.ConvertToAll(SS58Encoder.Encode(TEST_PUB_KEY, 100)))
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        addr = SS58Encoder.Encode(TEST_PUB_KEY, 0)
+
+        self.assertRaises(TypeError, SubstrateAddrConverter.Convert, addr, 0)
+        self.assertRaises(TypeError, SubstrateAddrConverter.ConvertMany, [addr], 0)
+        self.assertRaises(TypeError, SubstrateAddrConverter.ConvertToAll, addr, [SubstrateCoins.KUSAMA, 0])
+
+        for test in TEST_VECT_ADDR_INVALID:
+            self.assertRaises(test["ex"], SubstrateAddrConverter.Convert, test["addr"], SubstrateCoins.POLKADOT)
+            self.assertRaises(test["ex"], SubstrateAddrConverter.ConvertMany, [addr, test["addr"]],
+                              SubstrateCoins.POLKADOT)
+            self.assertRaises(test["ex"], SubstrateAddrConverter.ConvertToAll, test["addr"])
@@ -188,6 +188,18 @@ class SubstratePathTests(unittest.TestCase):
             self.assertEqual(test["is_hard"], path_elem.IsHard())
             self.assertEqual(test["is_hard"], not path_elem.IsSoft())
 
+    # Test chain codes of integer ranges
+    def test_int_chain_codes(self):
+        for start, stop in ((0, 300), (65530, 65540), (2**32 - 2, 2**32 + 2), (2**256 - 2, 2**256), (5, 5)):
+            self.assertEqual(
+                [SubstratePathElem(f"/{i}").ChainCode() for i in range(start, stop)],
+                SubstratePathElem.IntChainCodes(start, stop)
+            )
+
+        self.assertRaises(SubstratePathError, SubstratePathElem.IntChainCodes, -1, 5)
+        self.assertRaises(SubstratePathError, SubstratePathElem.IntChainCodes, 5, 4)
+        self.assertRaises(SubstratePathError, SubstratePathElem.IntChainCodes, 0, 2**256 + 1)
+
     # Test add element
     def test_add_elem(self):
         path = SubstratePath()
@@ -0,0 +1,115 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import unittest
+
+from bip_utils.utils.misc import Base32Decoder, Base32Encoder
+
+
+# Custom alphabet (Nano)
+TEST_CUSTOM_ALPHABET = "13456789abcdefghijkmnopqrstuwxyz"
+
+# Test vector (RFC 4648)
+TEST_VECT = [
+    {
+        "data": b"",
+        "encode": "",
+        "encode_custom": "",
+    },
+    {
+        "data": b"f",
+        "encode": "MY======",
+        "encode_custom": "er======",
+    },
+    {
+        "data": b"fo",
+        "encode": "MZXQ====",
+        "encode_custom": "esqi====",
+    },
+    {
+        "data": b"foo",
+        "encode": "MZXW6===",
+        "encode_custom": "esqpy===",
+    },
+    {
+        "data": b"foob",
+        "encode": "MZXW6YQ=",
+        "encode_custom": "esqpyri=",
+    },
+    {
+        "data": "fooba",
+        "encode": "MZXW6YTB",
+        "encode_custom": "esqpyrm3",
+    },
+    {
+        "data": b"foobar",
+        "encode": "MZXW6YTBOI======",
+        "encode_custom": "esqpyrm3ga======",
+    },
+]
+
+# Tests for decoding with invalid strings
+TEST_VECT_DEC_INVALID = [
+    # Invalid characters
+    "MZXW6YT1",
+    "mzxw6ytb",
+    "MZ=W6YTB",
+    "MZXW6YTé",
+    # Invalid lengths
+    "M",
+    "MZX",
+    "MZXW6Y",
+    "MZXW6YTBO",
+    # Invalid padding
+    "MZXW6YQ==",
+    "MZXW6YTB========",
+]
+
+
+#
+# Tests
+#
+class Base32Tests(unittest.TestCase):
+    # Test encode
+    def test_encode(self):
+        for test in TEST_VECT:
+            self.assertEqual(test["encode"], Base32Encoder.Encode(test["data"]))
+            self.assertEqual(test["encode"].rstrip("="), Base32Encoder.EncodeNoPadding(test["data"]))
+            self.assertEqual(test["encode_custom"], Base32Encoder.Encode(test["data"], TEST_CUSTOM_ALPHABET))
+            self.assertEqual(test["encode_custom"].rstrip("="),
+                             Base32Encoder.EncodeNoPadding(test["data"], TEST_CUSTOM_ALPHABET))
+
+    # Test decode
+    def test_decode(self):
+        for test in TEST_VECT:
+            data = test["data"] if isinstance(test["data"], bytes) else test["data"].encode()
+
+            self.assertEqual(data, Base32Decoder.Decode(test["encode"]))
+            self.assertEqual(data, Base32Decoder.Decode(test["encode"].rstrip("=")))
+            self.assertEqual(data, Base32Decoder.Decode(test["encode_custom"], TEST_CUSTOM_ALPHABET))
+            self.assertEqual(data, Base32Decoder.Decode(test["encode_custom"].rstrip("="), TEST_CUSTOM_ALPHABET))
+
+    # Test invalid decoding
+    def test_invalid_dec(self):
+        for test in TEST_VECT_DEC_INVALID:
+            self.assertRaises(ValueError, Base32Decoder.Decode, test)
+        # Characters of the standard alphabet are not valid for the custom one
+        self.assertRaises(ValueError, Base32Decoder.Decode, "MZXW6YTB", TEST_CUSTOM_ALPHABET)
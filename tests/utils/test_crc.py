@@ -0,0 +1,72 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# Imports
+import binascii
+import unittest
+
+from bip_utils import Crc32, XModemCrc
+
+
+# Test vector
+TEST_VECT = [
+    {
+        "data": b"",
+        "crc32": b"00000000",
+        "xmodem": b"0000",
+    },
+    {
+        "data": b"123456789",
+        "crc32": b"cbf43926",
+        "xmodem": b"31c3",
+    },
+    {
+        "data": "123456789",
+        "crc32": b"cbf43926",
+        "xmodem": b"31c3",
+    },
+    {
+        "data": b"The quick brown fox jumps over the lazy dog",
+        "crc32": b"414fa339",
+        "xmodem": b"f0c8",
+    },
+]
+
+
+#
+# Tests
+#
+class CrcTests(unittest.TestCase):
+    # Test CRC32
+    def test_crc32(self):
+        self.assertEqual(4, Crc32.DigestSize())
+        for test in TEST_VECT:
+            self.assertEqual(test["crc32"], binascii.hexlify(Crc32.QuickDigest(test["data"])))
+            self.assertEqual(int(test["crc32"], 16), Crc32.QuickIntDigest(test["data"]))
+        self.assertEqual([binascii.unhexlify(test["crc32"]) for test in TEST_VECT],
+                         Crc32.QuickDigestMany(test["data"] for test in TEST_VECT))
+
+    # Test XMODEM-CRC
+    def test_xmodem(self):
+        self.assertEqual(2, XModemCrc.DigestSize())
+        for test in TEST_VECT:
+            self.assertEqual(test["xmodem"], binascii.hexlify(XModemCrc.QuickDigest(test["data"])))
+            self.assertEqual(int(test["xmodem"], 16), XModemCrc.QuickIntDigest(test["data"]))
+        self.assertEqual([binascii.unhexlify(test["xmodem"]) for test in TEST_VECT],
+                         XModemCrc.QuickDigestMany(test["data"] for test in TEST_VECT))
@@ -0,0 +1,124 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import binascii
+import hashlib
+import unittest
+
+from Crypto.Hash import RIPEMD160
+
+from bip_utils import (
+    Blake2b, Blake2b160, Blake2b256, DoubleSha256, Hash160, HashBackendConst, HashBackendRegistry, Kekkak256, Ripemd160,
+    Sha3_256, Sha256, Sha512, Sha512_256
+)
+
+
+# Test vector
+TEST_VECT = [
+    {
+        "data": b"abc",
+        "digests": {
+            Blake2b160: b"384264f676f39536840523f284921cdc68b6846b",
+            Blake2b256: b"bddd813c634239723171ef3fee98579b94964e3bb1cb3e427262c8c068d52319",
+            DoubleSha256: b"4f8b42c22dd3729b519ba6f68d2da7cc5b2d606d05daed5ad5128cc03e6c6358",
+            Hash160: b"bb1be98c142444d7a56aa3981c3942a978e4dc33",
+            Kekkak256: b"4e03657aea45a94fc7d47ba826c8d667c0d1e6e33a64a036ec44f58fa12d6c45",
+            Ripemd160: b"8eb208f7e05d987a9b044a8e98c6b087f15a0bfc",
+            Sha256: b"ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad",
+            Sha3_256: b"3a985da74fe225b2045c172d6bd390bd855f086e3e9d525b46bfe24511431532",
+            Sha512: b"ddaf35a193617abacc417349ae20413112e6fa4e89a97ea20a9eeee64b55d39a"
+                    b"2192992a274fc1a836ba3c23a3feebbd454d4423643ce80e2a9ac94fa54ca49f",
+            Sha512_256: b"53048e2681941ef99b2e29b76b4c7dabe4c2d0c634fc6d46e0e2f13107e7af23",
+        },
+    },
+    {
+        "data": "The quick brown fox jumps over the lazy dog",
+        "digests": {
+            Blake2b160: b"3c523ed102ab45a37d54f5610d5a983162fde84f",
+            Blake2b256: b"01718cec35cd3d796dd00020e0bfecb473ad23457d063b75eff29c0ffa2e58a9",
+            DoubleSha256: b"6d37795021e544d82b41850edf7aabab9a0ebe274e54a519840c4666f35b3937",
+            Hash160: b"0e3397b4abc7a382b3ea2365883c3c7ca5f07600",
+            Kekkak256: b"4d741b6f1eb29cb2a9b9911c82f56fa8d73b04959d3d9d222895df6c0b28aa15",
+            Ripemd160: b"37f332f68db77bd9d7edd4969571ad671cf9dd3b",
+            Sha256: b"d7a8fbb307d7809469ca9abcb0082e4f8d5651e46d3cdb762d02d0bf37c9e592",
+            Sha3_256: b"69070dda01975c8c120c3aada1b282394e7f032fa9cf32f4cb2259a0897dfc04",
+            Sha512: b"07e547d9586f6a73f73fbac0435ed76951218fb7d0c8d788a309d785436bbb64"
+                    b"2e93a252a954f23912547d1e8a3b5ed6e1bfd7097821233fa0538f3db854fee6",
+            Sha512_256: b"dd9d67b371519c339ed8dbd25af90e976a1eeefd4ad3d889005e532fc5bef04d",
+        },
+    },
+]
+
+
+#
+# Tests
+#
+class HashTests(unittest.TestCase):
+    # Test digests
+    def test_digests(self):
+        for hash_cls in TEST_VECT[0]["digests"]:
+            for test in TEST_VECT:
+                self.assertEqual(test["digests"][hash_cls], binascii.hexlify(hash_cls.QuickDigest(test["data"])))
+            self.assertEqual([binascii.unhexlify(test["digests"][hash_cls]) for test in TEST_VECT],
+                             hash_cls.QuickDigestMany(test["data"] for test in TEST_VECT))
+            self.assertEqual([], hash_cls.QuickDigestMany([]))
+            self.assertEqual(len(hash_cls.QuickDigest(b"")), hash_cls.DigestSize())
+
+    # Test BLAKE2b with parameters
+    def test_blake2b(self):
+        data = [b"data", "other data"]
+        self.assertEqual([Blake2b.QuickDigest(d, 20, b"key", b"salt") for d in data],
+                         Blake2b.QuickDigestMany(data, 20, b"key", b"salt"))
+        self.assertEqual([Blake2b256.QuickDigest(d, "key", "salt") for d in data],
+                         Blake2b256.QuickDigestMany(data, "key", "salt"))
+
+    # Test backend registry
+    def test_backend_registry(self):
+        backends = HashBackendRegistry.Backends()
+        self.assertEqual(set(HashBackendConst.PROBE_DIGESTS), set(backends))
+        for algo_name, backend_name in backends.items():
+            self.assertEqual(backend_name, HashBackendRegistry.Backend(algo_name))
+            self.assertTrue(backend_name in (HashBackendConst.HASHLIB, HashBackendConst.PYCRYPTODOME))
+
+        ripemd160_backend = HashBackendRegistry.Backend("ripemd160")
+        ripemd160_new_fct = HashBackendRegistry.NewFunction("ripemd160")
+        try:
+            # Not working backends are not selected
+            self.assertFalse(HashBackendRegistry.Register("ripemd160", "wrong", hashlib.sha1))
+            self.assertFalse(HashBackendRegistry.Register("ripemd160", "unsupported",
+                                                          lambda data: hashlib.new("invalid", data)))
+            self.assertEqual(ripemd160_backend, HashBackendRegistry.Backend("ripemd160"))
+            # Working backends are selected
+            self.assertTrue(HashBackendRegistry.Register("ripemd160", HashBackendConst.PYCRYPTODOME, RIPEMD160.new))
+            self.assertEqual(HashBackendConst.PYCRYPTODOME, HashBackendRegistry.Backend("ripemd160"))
+            self.assertTrue(HashBackendRegistry.NewFunction("ripemd160") is RIPEMD160.new)
+            self.assertEqual(TEST_VECT[0]["digests"][Ripemd160], binascii.hexlify(Ripemd160.QuickDigest(b"abc")))
+        finally:
+            HashBackendRegistry.Register("ripemd160", ripemd160_backend, ripemd160_new_fct)
+        self.assertTrue(HashBackendRegistry.NewFunction("ripemd160") is ripemd160_new_fct)
+
+    # Test invalid parameters
+    def test_invalid_params(self):
+        self.assertRaises(ValueError, HashBackendRegistry.Backend, "invalid")
+        self.assertRaises(ValueError, HashBackendRegistry.NewFunction, "invalid")
+        self.assertRaises(ValueError, HashBackendRegistry.Register, "invalid", "invalid", hashlib.sha256)
+        self.assertRaises(TypeError, Sha256.QuickDigestMany, [0])
+        self.assertRaises(TypeError, Ripemd160.QuickDigestMany, [0])
@@ -0,0 +1,139 @@
+# Copyright (c) 2022 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import json
+import unittest
+
+from bip_utils import (
+    Base58Encoder, Bip32Slip10Secp256k1, Blake2b256, Hash160, Instrumentation, InstrumentationSession, Scrypt,
+    Secp256k1, Sha256
+)
+from bip_utils.utils.misc import InstrumentationConst
+
+
+# Generic seed for testing
+TEST_SEED = b"\x00" * 32
+
+
+#
+# Tests
+#
+class InstrumentationTests(unittest.TestCase):
+    # Disable instrumentation after each test, in case of failures
+    def tearDown(self):
+        Instrumentation.Disable()
+        Instrumentation.Reset()
+
+    # Test enable/disable
+    def test_enable_disable(self):
+        orig_attrs = {method_name: Sha256.__dict__[method_name] for method_name in ("QuickDigest", "QuickDigestMany")}
+
+        self.assertFalse(Instrumentation.IsEnabled())
+        Instrumentation.Enable()
+        self.assertTrue(Instrumentation.IsEnabled())
+        # Enabling twice has no effect
+        Instrumentation.Enable()
+        self.assertTrue(Instrumentation.IsEnabled())
+        self.assertFalse(Sha256.__dict__["QuickDigest"] is orig_attrs["QuickDigest"])
+
+        Instrumentation.Disable()
+        self.assertFalse(Instrumentation.IsEnabled())
+        # Original attributes are restored
+        for method_name, attr in orig_attrs.items():
+            self.assertTrue(Sha256.__dict__[method_name] is attr)
+
+        # Nothing is recorded when disabled
+        Instrumentation.Reset()
+        Sha256.QuickDigest(b"data")
+        self.assertEqual({}, Instrumentation.Snapshot())
+
+    # Test recorded data
+    def test_record(self):
+        with Instrumentation.Session() as session:
+            self.assertTrue(isinstance(session, InstrumentationSession))
+            Sha256.QuickDigest(b"data")
+            Sha256.QuickDigestMany([b"data", b"data"])
+            Hash160.QuickDigest(b"data")
+            Blake2b256.QuickDigest(b"data")
+            Base58Encoder.CheckEncode(b"data")
+            Scrypt.DeriveKey(b"password", b"salt", 32, 16, 1, 1)
+            Bip32Slip10Secp256k1.FromSeed(TEST_SEED).DerivePath("m/0/1")
+            _ = Secp256k1.Generator() * 2
+            # Data can be got inside the scope
+            self.assertTrue("hash.Sha256.QuickDigest" in session.Snapshot())
+
+        self.assertFalse(Instrumentation.IsEnabled())
+
+        snapshot = session.Snapshot()
+        self.assertEqual(snapshot, Instrumentation.Snapshot())
+        self.assertEqual(1, snapshot["hash.Sha256.QuickDigestMany"]["count"])
+        # Also called by BIP32 for computing fingerprints
+        self.assertTrue(snapshot["hash.Hash160.QuickDigest"]["count"] >= 1)
+        self.assertEqual(1, snapshot["hash.Blake2b.QuickDigest"]["count"])
+        self.assertEqual(1, snapshot["codec.Base58Encoder.CheckEncode"]["count"])
+        self.assertEqual(1, snapshot["codec.Base58Encoder.Encode"]["count"])
+        self.assertEqual(1, snapshot["kdf.Scrypt.DeriveKey"]["count"])
+        self.assertEqual(1, snapshot["bip32.Bip32Base.FromSeed"]["count"])
+        self.assertEqual(1, snapshot["bip32.Bip32Base.DerivePath"]["count"])
+        self.assertEqual(2, snapshot["bip32.Bip32Base.ChildKey"]["count"])
+        # Called directly, by HASH160 and by Base58 checksum (double SHA256)
+        self.assertTrue(snapshot["hash.Sha256.QuickDigest"]["count"] >= 3)
+        self.assertTrue(any(op_name.startswith(InstrumentationConst.ECC_CATEGORY + ".")
+                            and op_name.endswith(".__mul__") for op_name in snapshot))
+
+        for stats in snapshot.values():
+            self.assertTrue(stats["count"] > 0)
+            self.assertTrue(stats["time"] >= 0.0)
+        # Times are inclusive
+        self.assertTrue(snapshot["bip32.Bip32Base.DerivePath"]["time"] >= snapshot["bip32.Bip32Base.ChildKey"]["time"])
+
+        # JSON
+        self.assertEqual(snapshot, json.loads(session.SnapshotJson()))
+        self.assertEqual(snapshot, json.loads(Instrumentation.SnapshotJson(indent=2)))
+
+        # Reset
+        Instrumentation.Reset()
+        self.assertEqual({}, Instrumentation.Snapshot())
+        self.assertEqual(snapshot, session.Snapshot())
+
+    # Test nested sessions
+    def test_nested_sessions(self):
+        with Instrumentation.Session():
+            Sha256.QuickDigest(b"data")
+            with Instrumentation.Session(reset=False) as session:
+                Sha256.QuickDigest(b"data")
+            # Still enabled, since it was enabled before the inner session
+            self.assertTrue(Instrumentation.IsEnabled())
+            self.assertEqual(2, session.Snapshot()["hash.Sha256.QuickDigest"]["count"])
+        self.assertFalse(Instrumentation.IsEnabled())
+
+    # Test that results are not changed
+    def test_results(self):
+        digest = Sha256.QuickDigest(b"data")
+        pub_key = Bip32Slip10Secp256k1.FromSeed(TEST_SEED).DerivePath("m/0'/1").PublicKey().RawCompressed()
+        with Instrumentation.Session():
+            self.assertEqual(digest, Sha256.QuickDigest(b"data"))
+            self.assertEqual(pub_key,
+                             Bip32Slip10Secp256k1.FromSeed(TEST_SEED).DerivePath("m/0'/1").PublicKey().RawCompressed())
+        # Exceptions are propagated
+        with Instrumentation.Session() as session:
+            self.assertRaises(TypeError, Sha256.QuickDigest, 0)
+        self.assertEqual(1, session.Snapshot()["hash.Sha256.QuickDigest"]["count"])
@@ -0,0 +1,126 @@
+# Copyright (c) 2021 Emanuele Bellocchia
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# Imports
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from bip_utils.utils.misc import MemoUtils
+
+
+# Class for testing cached methods
+class MemoTest:
+    def __init__(self, val):
+        self.m_val = val
+        self.m_calls_num = 0
+        self.m_lock = threading.Lock()
+
+    @MemoUtils.CachedMethod
+    def Value(self):
+        """Get value."""
+        with self.m_lock:
+            self.m_calls_num += 1
+        if self.m_val < 0:
+            raise ValueError("Invalid value")
+        return [self.m_val]
+
+    @MemoUtils.CachedArgsMethod(max_size=4)
+    def Multiply(self, factor, offset=0):
+        """Multiply value."""
+        with self.m_lock:
+            self.m_calls_num += 1
+        if factor < 0:
+            raise ValueError("Invalid factor")
+        return [self.m_val * factor + offset]
+
+
+#
+# Tests
+#
+class MemoUtilsTests(unittest.TestCase):
+    # Test cached method
+    def test_cached_method(self):
+        obj = MemoTest(1)
+        res = obj.Value()
+        self.assertEqual(res, [1])
+        self.assertTrue(obj.Value() is res)
+        self.assertEqual(obj.m_calls_num, 1)
+        # Name and docstring are kept
+        self.assertEqual(MemoTest.Value.__name__, "Value")
+        self.assertEqual(MemoTest.Value.__doc__, "Get value.")
+
+        # Results are not shared among objects
+        obj_other = MemoTest(2)
+        self.assertEqual(obj_other.Value(), [2])
+        self.assertEqual(obj.Value(), [1])
+        self.assertEqual(obj_other.m_calls_num, 1)
+
+    # Test that exceptions are not cached
+    def test_exception(self):
+        obj = MemoTest(-1)
+        self.assertRaises(ValueError, obj.Value)
+        self.assertRaises(ValueError, obj.Value)
+        self.assertEqual(obj.m_calls_num, 2)
+
+    # Test cached method from multiple threads
+    def test_threads(self):
+        obj = MemoTest(3)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: obj.Value(), range(64)))
+
+        # All threads get the same object
+        self.assertTrue(all(res is results[0] for res in results))
+        self.assertTrue(obj.Value() is results[0])
+
+    # Test cached method with arguments
+    def test_cached_args_method(self):
+        obj = MemoTest(2)
+        res = obj.Multiply(3)
+        self.assertEqual(res, [6])
+        self.assertTrue(obj.Multiply(3) is res)
+        self.assertEqual(obj.Multiply(3, offset=1), [7])
+        self.assertTrue(obj.Multiply(3, offset=1) is obj.Multiply(3, offset=1))
+        self.assertEqual(obj.m_calls_num, 2)
+        # Name and docstring are kept
+        self.assertEqual(MemoTest.Multiply.__name__, "Multiply")
+        self.assertEqual(MemoTest.Multiply.__doc__, "Multiply value.")
+
+        # Results are not shared among objects
+        obj_other = MemoTest(5)
+        self.assertEqual(obj_other.Multiply(3), [15])
+        self.assertEqual(obj.Multiply(3), [6])
+
+        # Exceptions are not cached
+        self.assertRaises(ValueError, obj.Multiply, -1)
+        self.assertRaises(ValueError, obj.Multiply, -1)
+        self.assertEqual(obj.m_calls_num, 4)
+
+    # Test that results are not stored beyond the maximum size
+    def test_cached_args_method_max_size(self):
+        obj = MemoTest(1)
+        for i in range(8):
+            self.assertEqual(obj.Multiply(i), [i])
+        self.assertEqual(obj.m_calls_num, 8)
+
+        # The first results are still cached, the following ones are computed again
+        res = [obj.Multiply(i) for i in range(8)]
+        self.assertEqual(res, [[i] for i in range(8)])
+        self.assertEqual(obj.m_calls_num, 12)